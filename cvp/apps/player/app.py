@@ -16,9 +16,13 @@ from pygame.image import load as load_image
 from pygame.key import ScancodeWrapper, get_pressed
 
 from cvp.assets.icons import get_default_icon_path
+from cvp.chrono.profiler import get_frame_profiler
 from cvp.config.sections.proxies.graphic import ForceEglProxy, UseAccelerateProxy
 from cvp.context.autofixer import AutoFixer
 from cvp.context.context import Context
+from cvp.fonts.ranges_cache import RangesCache
+from cvp.gl.yuv import has_yuv_converter
+from cvp.imgui.fonts.atlas import GlyphAtlas, default_base_ranges, set_glyph_atlas
 from cvp.imgui.fonts.mapper import FontMapper
 from cvp.imgui.push_style_var import default_style_colors
 from cvp.logging.logging import event_logger, logger, msg_logger, profile_logger
@@ -40,6 +44,7 @@ from cvp.windows.onvif import OnvifManager
 from cvp.windows.overlay import OverlayWindow
 from cvp.windows.preference import PreferenceManager
 from cvp.windows.process import ProcessManager
+from cvp.windows.profiler import ProfilerWindow
 from cvp.windows.stitching import StitchingWindow
 from cvp.windows.toast import ToastWindow
 from cvp.windows.window import WindowManager
@@ -52,8 +57,14 @@ class PlayerApplication:
     def __init__(self, context: Context):
         self._context = context
         self._windows = WindowMapper()
-        self._fonts = FontMapper()
+        self._glyph_atlas: Optional[GlyphAtlas] = None
+        if context.config.font.dynamic_atlas:
+            self._glyph_atlas = GlyphAtlas(default_base_ranges())
+        set_glyph_atlas(self._glyph_atlas)
+        ranges_cache = RangesCache(context.home.cache.fonts_dirpath)
+        self._fonts = FontMapper(ranges_cache, self._glyph_atlas)
         self._profiler = ProfileLogging(profile_logger)
+        self._frame_profiler = get_frame_profiler()
         self._world = World(self._context)
 
         self._flow = FlowWindow(self._context, self._fonts)
@@ -65,6 +76,7 @@ class PlayerApplication:
         self._overlay = OverlayWindow(self._context)
         self._pref_manager = PreferenceManager(self._context)
         self._process_manager = ProcessManager(self._context)
+        self._profiler_window = ProfilerWindow(self._context, self._frame_profiler)
         self._stitching = StitchingWindow(self._context)
         self._tetrix = TetrixWindow(self._context)
         self._glyph_world = GlyphWorldWindow(self._context)
@@ -238,6 +250,10 @@ class PlayerApplication:
 
         GL.glClearColor(0, 0, 0, 1)
 
+        # Checked before any ffmpeg is spawned, so planar output is only
+        # requested when the media windows can convert it.
+        self._context.pm.planar_supported = has_yuv_converter()
+
         self._world.on_create()
         self._world.on_window_resized(size[0], size[1])
 
@@ -251,6 +267,7 @@ class PlayerApplication:
             self._overlay,
             self._pref_manager,
             self._process_manager,
+            self._profiler_window,
             self._stitching,
             self._tetrix,
             self._glyph_world,
@@ -273,25 +290,39 @@ class PlayerApplication:
         imgui.save_ini_settings_to_disk(str(self.home.gui_ini))
 
         self._context.save_graphs()
+        self._context.teardown_logging()
 
         del self._renderer
         pygame.quit()
 
     def on_process(self) -> None:
+        zone = self._frame_profiler.zone
         while not self._context.is_done():
-            with self._profiler:
+            # Sampling costs a few microseconds per zone, so only while shown.
+            self._frame_profiler.enabled = self._profiler_window.opened
+
+            with self._profiler, self._frame_profiler.frame():
                 try:
-                    for event in pygame.event.get():
-                        self.on_event(event)
+                    with zone("events"):
+                        for event in pygame.event.get():
+                            self.on_event(event)
 
-                    for msg in self._context.mq.get():
-                        self.on_msg(msg)
+                    with zone("msgs"):
+                        for msg in self._context.mq.get():
+                            self.on_msg(msg)
 
                     self.on_keyboard_shortcut(get_pressed())
-                    self.on_tick()
+
+                    with zone("tick"):
+                        self.on_tick()
+
+                    with zone("fonts"):
+                        self.on_fonts()
+
                     self.on_frame()
 
-                    self.on_next()
+                    with zone("next"):
+                        self.on_next()
                 finally:
                     self.on_after()
 
@@ -337,27 +368,40 @@ class PlayerApplication:
     def on_tick(self) -> None:
         self._renderer.do_tick()
 
+    def on_fonts(self) -> None:
+        if self._fonts.rebuild_atlas():
+            self._renderer.refresh_font_texture()
+
     def on_frame(self) -> None:
+        zone = self._frame_profiler.zone
         imgui.new_frame()
         try:
             GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
 
             self.on_main_menu()
             self.on_popups()
-            self._windows.do_process()
+
+            with zone("windows"):
+                self._windows.do_process(self._frame_profiler)
+
+            with zone("scheduler"):
+                self._context.scheduler.update()
 
             if self.debug:
                 self.on_metrics_window()
                 self.on_style_editor_window()
                 self.on_demo_window()
 
-            self._world.on_process(imgui.get_io().delta_time)
+            with zone("world"):
+                self._world.on_process(imgui.get_io().delta_time)
         finally:
             # Cannot use `screen.fill((1, 1, 1))` because pygame's screen does not
             # support fill() on OpenGL surfaces
-            imgui.render()
-            self._renderer.render(imgui.get_draw_data())
-            pygame.display.flip()
+            with zone("imgui.render"):
+                imgui.render()
+                self._renderer.render(imgui.get_draw_data())
+            with zone("display.flip"):
+                pygame.display.flip()
 
     def on_next(self) -> None:
         self._windows.do_next()
@@ -391,6 +435,8 @@ class PlayerApplication:
 
         if imgui.menu_item("Overlay", None, self._overlay.opened)[0]:
             self._overlay.flip_opened()
+        if imgui.menu_item("Profiler", None, self._profiler_window.opened)[0]:
+            self._profiler_window.flip_opened()
 
         imgui.separator()
         imgui.menu_item("Management", None, False, False)
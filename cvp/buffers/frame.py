@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC, abstractmethod
-from io import BytesIO
+from io import BufferedIOBase, BytesIO
 from typing import IO, Callable, Optional
 
+from cvp.buffers.ring import FrameRing
 from cvp.types.override import override
 
 
@@ -85,3 +86,67 @@ class FrameBuffer(FrameInterface):
     def on_frame(self, data: bytes) -> None:
         if self._target is not None:
             self._target(data)
+
+
+class FrameRingBuffer:
+    """
+    Reads frames from the pipe directly into the slots of a :class:`FrameRing`.
+    """
+
+    _view: Optional[memoryview]
+
+    def __init__(
+        self,
+        pipe: BufferedIOBase,
+        ring: FrameRing,
+        on_frame: Optional[Callable[[memoryview], None]] = None,
+    ):
+        self._pipe = pipe
+        self._ring = ring
+        self._on_frame = on_frame
+        self._view = None
+        self._offset = 0
+
+    @property
+    def ring(self):
+        return self._ring
+
+    @property
+    def frame_size(self):
+        return self._ring.frame_size
+
+    @property
+    def remain(self) -> int:
+        return self._offset
+
+    def clear_remain(self) -> None:
+        if self._view is not None:
+            self._ring.cancel_write()
+            self._view = None
+        self._offset = 0
+
+    def flush(self) -> None:
+        self._pipe.flush()
+
+    def read(self) -> int:
+        if self._view is None:
+            self._view = self._ring.begin_write()
+            self._offset = 0
+
+        size = self._pipe.readinto(self._view[self._offset :])
+        if not size:
+            return 0
+
+        self._offset += size
+        if self._offset == self._ring.frame_size:
+            if self._on_frame is not None:
+                self._on_frame(self._view)
+            self._view = None
+            self._offset = 0
+            self._ring.end_write()
+
+        return size
+
+    def read_eof(self) -> None:
+        while self.read():
+            pass
@@ -2,9 +2,11 @@
 
 import os
 from abc import ABC, abstractmethod
+from codecs import getincrementaldecoder
 from collections import deque
 from io import StringIO
 from os import PathLike
+from time import monotonic
 from typing import BinaryIO, Deque, Optional, Union
 from weakref import finalize
 
@@ -41,7 +43,9 @@ class LinesBase(LinesInterface, ABC):
     def __init__(self, path: Union[str, PathLike[str]], encoding="utf-8"):
         self._path = path
         self._encoding = encoding
+        self._decoder = getincrementaldecoder(encoding)(errors="replace")
         self._cursor = 0
+        self._polled = 0.0
         self._file = None
         self._finalizer = None
 
@@ -88,14 +92,36 @@ class LinesBase(LinesInterface, ABC):
             return 0
 
     def update_safe(self) -> int:
-        size = self.get_filesize()
-        if size <= self._cursor:
+        if self._file is None:
+            if self.get_filesize() <= self._cursor:
+                return 0
+            self.open()
+
+        return self.update_to_end()
+
+    def poll(self, interval: float) -> int:
+        """Updates at most once per ``interval`` seconds, for per-frame callers."""
+        now = monotonic()
+        if now - self._polled < interval:
             return 0
 
+        self._polled = now
+        return self.update_safe()
+
+    def update_to_end(self) -> int:
+        # The file is only appended, so reading to the end of the open file
+        # returns the new data without a stat call.
         if self.closed:
-            self.open()
+            raise ValueError("The file is closed")
 
-        return self.update_to_index(size)
+        assert self._file is not None
+        data = self._file.read()
+        if not data:
+            return 0
+
+        self.write(self._decoder.decode(data))
+        self._cursor += len(data)
+        return len(data)
 
     def update(self) -> int:
         return self.update_to_index(self.get_filesize())
@@ -114,7 +140,7 @@ class LinesBase(LinesInterface, ABC):
         assert 0 < size
         assert self._file is not None
         data = self._file.read(size)
-        self.write(str(data, encoding=self._encoding))
+        self.write(self._decoder.decode(data))
         self._cursor = index
         return size
 
@@ -226,6 +252,7 @@ class LinesDeque(LinesBase):
         self._lines = deque(maxlen=maxlen)
         self._lines.append(str())
         self._separator = separator
+        self._value: Optional[str] = None
 
     @property
     def lines(self):
@@ -233,24 +260,30 @@ class LinesDeque(LinesBase):
 
     @override
     def getvalue(self) -> str:
+        if self._value is not None:
+            return self._value
+
         if len(self._lines) == 0:
-            return str()
-        if len(self._lines) == 1:
-            return self._lines[0]
-
-        assert len(self._lines) >= 2
-        buffer = StringIO()
-        buffer.write(self._lines[0])
-        for i in range(1, len(self._lines)):
-            buffer.write(self._separator)
-            buffer.write(self._lines[i])
-        return buffer.getvalue()
+            self._value = str()
+        elif len(self._lines) == 1:
+            self._value = self._lines[0]
+        else:
+            assert len(self._lines) >= 2
+            buffer = StringIO()
+            buffer.write(self._lines[0])
+            for i in range(1, len(self._lines)):
+                buffer.write(self._separator)
+                buffer.write(self._lines[i])
+            self._value = buffer.getvalue()
+        return self._value
 
     @override
     def write(self, text: str) -> None:
         if not text:
             return
 
+        self._value = None
+
         index = text.find(self._separator)
         if index >= 0:
             self._lines[-1] += text[0:index]
@@ -261,3 +294,124 @@ class LinesDeque(LinesBase):
         else:
             assert index == -1
             self._lines[-1] += text
+
+
+class LinesRing(LinesBase):
+    """
+    Complete lines in a deque, plus the incomplete last line.
+
+    Appending and evicting a line are O(1), so a chatty writer does not copy
+    the whole buffer on every write. Lines longer than ``newline_size`` are
+    wrapped, and the oldest lines are evicted once the text exceeds
+    ``maxsize`` characters or ``maxlen`` lines. The joined text is only built
+    again after a change.
+    """
+
+    _lines: Deque[str]
+    _value: Optional[str]
+
+    def __init__(
+        self,
+        path: Union[str, PathLike[str]],
+        encoding="utf-8",
+        maxsize: Optional[int] = None,
+        newline_size: Optional[int] = None,
+        maxlen: Optional[int] = None,
+        separator="\n",
+        zero_width_space="\\",
+    ):
+        super().__init__(path, encoding)
+        self._lines = deque()
+        self._last = str()
+        self._size = 0
+        self._maxsize = maxsize
+        self._newline_size = newline_size
+        self._maxlen = maxlen
+        self._separator = separator
+        self._zero_width_space = zero_width_space
+        self._value = None
+        self._version = 0
+
+    @property
+    def lines(self):
+        return self._lines
+
+    @property
+    def last(self):
+        return self._last
+
+    @property
+    def size(self) -> int:
+        """Number of characters of the joined text."""
+        return self._size + len(self._last)
+
+    @property
+    def version(self) -> int:
+        """Incremented on every change, for callers that cache derived data."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._lines) + 1
+
+    def __getitem__(self, index: int) -> str:
+        if index == len(self._lines) or index == -1:
+            return self._last
+        return self._lines[index]
+
+    def _push(self, line: str) -> None:
+        self._lines.append(line)
+        self._size += len(line) + len(self._separator)
+
+    def _extend_last(self, text: str) -> None:
+        if self._newline_size is None:
+            self._last += text
+            return
+
+        while text:
+            remain = self._newline_size - len(self._last)
+            if len(text) <= remain:
+                self._last += text
+                return
+
+            self._push(self._last + text[:remain] + self._zero_width_space)
+            self._last = str()
+            text = text[remain:]
+
+    def _evict(self) -> None:
+        if self._maxlen is not None:
+            while self._lines and len(self._lines) + 1 > self._maxlen:
+                line = self._lines.popleft()
+                self._size -= len(line) + len(self._separator)
+
+        if self._maxsize is not None:
+            while self._lines and self.size > self._maxsize:
+                line = self._lines.popleft()
+                self._size -= len(line) + len(self._separator)
+            if len(self._last) > self._maxsize:
+                self._last = self._last[len(self._last) - self._maxsize :]
+
+    @override
+    def getvalue(self) -> str:
+        if self._value is None:
+            self._lines.append(self._last)
+            try:
+                self._value = self._separator.join(self._lines)
+            finally:
+                self._lines.pop()
+        return self._value
+
+    @override
+    def write(self, text: str) -> None:
+        if not text:
+            return
+
+        first, *others = text.split(self._separator)
+        self._extend_last(first)
+        for line in others:
+            self._push(self._last)
+            self._last = str()
+            self._extend_last(line)
+
+        self._evict()
+        self._value = None
+        self._version += 1
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from threading import Lock
+from time import monotonic
+from typing import Deque, List, NamedTuple, Optional
+
+DISCARD_INDEX = -1
+ARRIVAL_SAMPLES = 240
+
+
+class FrameArrivals:
+    """The :func:`time.monotonic` times of the latest frames, to measure rates."""
+
+    _times: Deque[float]
+
+    def __init__(self, maxlen=ARRIVAL_SAMPLES):
+        if maxlen < 2:
+            raise ValueError("Max length must be at least 2")
+        self._times = deque(maxlen=maxlen)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._times)
+
+    def append(self, timestamp: float) -> None:
+        with self._lock:
+            self._times.append(timestamp)
+
+    def rate(self, window: float, now: Optional[float] = None) -> float:
+        """
+        Frames per second between the frames that arrived in the last ``window``
+        seconds. It falls to zero when nothing arrived during the window.
+        """
+
+        if window <= 0:
+            raise ValueError("Window must be greater than zero")
+
+        begin = (monotonic() if now is None else now) - window
+        with self._lock:
+            recent = [t for t in self._times if t >= begin]
+
+        if len(recent) < 2:
+            return 0.0
+
+        elapsed = recent[-1] - recent[0]
+        return (len(recent) - 1) / elapsed if elapsed > 0 else 0.0
+
+
+class _ReadyFrame(NamedTuple):
+    slot: int
+    sequence: int
+    timestamp: float
+
+
+class FrameView:
+    __slots__ = ("_ring", "_index", "_sequence", "_data", "_timestamp")
+
+    def __init__(
+        self,
+        ring: "FrameRing",
+        index: int,
+        sequence: int,
+        data: memoryview,
+        timestamp=0.0,
+    ):
+        self._ring: Optional[FrameRing] = ring
+        self._index = index
+        self._sequence = sequence
+        self._data = data
+        self._timestamp = timestamp
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def sequence(self):
+        return self._sequence
+
+    @property
+    def data(self) -> memoryview:
+        return self._data
+
+    @property
+    def timestamp(self) -> float:
+        """The :func:`time.monotonic` time the frame was completely written."""
+        return self._timestamp
+
+    @property
+    def released(self) -> bool:
+        return self._ring is None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def tobytes(self) -> bytes:
+        return self._data.tobytes()
+
+    def release(self) -> None:
+        if self._ring is not None:
+            self._ring.release(self._index)
+            self._ring = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} index={self._index} sequence={self._sequence}"
+            f" released={self.released}>"
+        )
+
+
+class FrameRing:
+    """
+    Preallocated frame slots shared by a single writer and its readers.
+
+    The writer fills a slot in-place (e.g. with ``readinto``) between
+    :meth:`begin_write` and :meth:`end_write`. Readers receive read-only views
+    through :meth:`dequeue` and must release them so the slot can be recycled.
+    When more than ``maxsize`` frames are pending, the oldest one is dropped.
+    """
+
+    _ready: Deque[_ReadyFrame]
+    _free: Deque[int]
+    _writing: Optional[int]
+
+    def __init__(self, frame_size: int, maxsize=2, *, spare=2):
+        if frame_size <= 0:
+            raise ValueError("Frame size must be greater than zero")
+        if maxsize <= 0:
+            raise ValueError("Max size must be greater than zero")
+        if spare < 1:
+            raise ValueError("Spare slots must be at least 1")
+
+        slot_count = maxsize + spare
+        self._frame_size = frame_size
+        self._maxsize = maxsize
+        self._buffers: List[bytearray] = [
+            bytearray(frame_size) for _ in range(slot_count)
+        ]
+        self._views = [memoryview(b) for b in self._buffers]
+        self._readonly_views = [v.toreadonly() for v in self._views]
+        self._refs = [0 for _ in range(slot_count)]
+        self._discard: Optional[memoryview] = None
+
+        self._free = deque(range(slot_count))
+        self._ready = deque()
+        self._writing = None
+        self._sequence = 0
+        self._produced = 0
+        self._consumed = 0
+        self._dropped = 0
+        self._arrivals = FrameArrivals()
+        self._lock = Lock()
+
+    @property
+    def frame_size(self):
+        return self._frame_size
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @property
+    def slot_count(self):
+        return len(self._buffers)
+
+    @property
+    def sequence(self):
+        return self._sequence
+
+    @property
+    def produced(self):
+        """Frames completely written, including the dropped ones."""
+        return self._produced
+
+    @property
+    def consumed(self):
+        """Frames dequeued by the readers."""
+        return self._consumed
+
+    @property
+    def dropped(self):
+        return self._dropped
+
+    @property
+    def arrivals(self):
+        """Completely written frames, including the dropped ones."""
+        return self._arrivals
+
+    @property
+    def writing(self) -> bool:
+        return self._writing is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ready)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def _discard_view(self) -> memoryview:
+        if self._discard is None:
+            self._discard = memoryview(bytearray(self._frame_size))
+        return self._discard
+
+    def _drop_oldest(self) -> Optional[int]:
+        try:
+            dropped = self._ready.popleft()
+        except IndexError:
+            return None
+        else:
+            self._dropped += 1
+            return dropped.slot
+
+    def begin_write(self) -> memoryview:
+        """
+        Returns the writable view of the next slot to fill.
+        If every slot is held by readers, a discard buffer is returned instead
+        and the frame is counted as dropped by :meth:`end_write`.
+        """
+
+        with self._lock:
+            if self._writing is not None:
+                raise BufferError("Frame slot is already being written")
+
+            if self._free:
+                index = self._free.popleft()
+            else:
+                dropped_index = self._drop_oldest()
+                index = dropped_index if dropped_index is not None else DISCARD_INDEX
+
+            self._writing = index
+
+        if index == DISCARD_INDEX:
+            return self._discard_view()
+        else:
+            return self._views[index]
+
+    def end_write(self) -> Optional[int]:
+        with self._lock:
+            index = self._writing
+            if index is None:
+                raise BufferError("No frame slot is being written")
+
+            self._writing = None
+            self._produced += 1
+            timestamp = monotonic()
+            self._arrivals.append(timestamp)
+
+            if index == DISCARD_INDEX:
+                self._dropped += 1
+                return None
+
+            if len(self._ready) >= self._maxsize:
+                dropped_index = self._drop_oldest()
+                assert dropped_index is not None
+                self._free.append(dropped_index)
+
+            self._sequence += 1
+            self._ready.append(_ReadyFrame(index, self._sequence, timestamp))
+            return self._sequence
+
+    def cancel_write(self) -> None:
+        with self._lock:
+            index = self._writing
+            if index is None:
+                return
+
+            self._writing = None
+            if index != DISCARD_INDEX:
+                self._free.append(index)
+
+    def write(self, data: bytes) -> Optional[int]:
+        if len(data) != self._frame_size:
+            size = len(data)
+            raise ValueError(f"Data size must be {self._frame_size} bytes: {size}")
+
+        view = self.begin_write()
+        view[:] = data
+        return self.end_write()
+
+    def dequeue(self) -> FrameView:
+        """
+        Pops the oldest pending frame.
+        The returned view holds its slot until :meth:`FrameView.release` is called.
+
+        :raises IndexError: If there are no pending frames.
+        """
+
+        with self._lock:
+            ready = self._ready.popleft()
+            self._refs[ready.slot] += 1
+            self._consumed += 1
+
+        data = self._readonly_views[ready.slot]
+        return FrameView(self, ready.slot, ready.sequence, data, ready.timestamp)
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            refs = self._refs[index]
+            if refs <= 0:
+                raise BufferError(f"Frame slot {index} is not held")
+
+            self._refs[index] = refs - 1
+            if refs == 1:
+                self._free.append(index)
+
+    def clear(self) -> None:
+        with self._lock:
+            while self._ready:
+                self._free.append(self._ready.popleft().slot)
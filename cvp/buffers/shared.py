@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+
+import os
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from time import time
+from typing import Dict, Final, NamedTuple, Optional, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from cvp.types.buffer import BufferLike
+
+SHARED_FRAME_MAGIC: Final[bytes] = b"CVPF"
+SHARED_FRAME_VERSION: Final[int] = 1
+SHARED_FRAME_ALIGNMENT: Final[int] = 64
+SHARED_FRAME_READ_RETRIES: Final[int] = 8
+PIX_FMT_SIZE: Final[int] = 16
+
+RING_HEADER_DTYPE: Final[np.dtype] = np.dtype(
+    [
+        ("magic", "S4"),
+        ("version", "<u4"),
+        ("slot_count", "<u4"),
+        ("reserved", "<u4"),
+        ("frame_size", "<u8"),
+        ("latest", "<u8"),
+    ],
+    align=True,
+)
+
+SLOT_HEADER_DTYPE: Final[np.dtype] = np.dtype(
+    [
+        ("lock", "<u8"),
+        ("sequence", "<u8"),
+        ("timestamp", "<f8"),
+        ("width", "<u4"),
+        ("height", "<u4"),
+        ("channels", "<u4"),
+        ("pix_fmt", f"S{PIX_FMT_SIZE}"),
+    ],
+    align=True,
+)
+
+
+def _align(value: int, alignment=SHARED_FRAME_ALIGNMENT) -> int:
+    return (value + alignment - 1) // alignment * alignment
+
+
+def start_resource_tracker() -> None:
+    # Must be called before the worker processes are forked. Otherwise, each
+    # worker starts its own tracker, which unlinks every shared memory block the
+    # worker attached to when it exits.
+    if os.name == "posix":
+        resource_tracker.ensure_running()
+
+
+class SharedFrameHeader(NamedTuple):
+    sequence: int
+    timestamp: float
+    width: int
+    height: int
+    channels: int
+    pix_fmt: str
+
+
+class SharedFrame(NamedTuple):
+    header: SharedFrameHeader
+    data: Union[bytearray, memoryview]
+
+
+class SharedFrameLayout(NamedTuple):
+    slot_count: int
+    frame_size: int
+
+    @property
+    def slot_headers_offset(self) -> int:
+        return _align(RING_HEADER_DTYPE.itemsize)
+
+    @property
+    def slots_offset(self) -> int:
+        headers_size = SLOT_HEADER_DTYPE.itemsize * self.slot_count
+        return _align(self.slot_headers_offset + headers_size)
+
+    @property
+    def slot_stride(self) -> int:
+        return _align(self.frame_size)
+
+    @property
+    def size(self) -> int:
+        return self.slots_offset + self.slot_stride * self.slot_count
+
+    def slot_offset(self, slot: int) -> int:
+        return self.slots_offset + self.slot_stride * slot
+
+
+class SharedFrameRing:
+    """
+    Frame slots in a shared memory block, written by a single producer and read
+    by any number of processes without locks.
+
+    Every slot is guarded by a sequence lock: the writer makes the slot's
+    ``lock`` counter odd, copies the frame and its header, then makes it even
+    again. A reader copies the slot and accepts it only if the counter was even
+    and unchanged around the copy, so a frame overwritten during the copy is
+    detected instead of returned torn. Frame ``n`` lives in slot
+    ``n % slot_count``; readers that fall behind by more than ``slot_count``
+    frames get a :class:`BufferError`.
+
+    Pickling a ring only sends its name, so it can be passed to functions
+    submitted to a process pool, where it is attached on first use.
+    """
+
+    _shm: Optional[SharedMemory]
+    _ring: NDArray[np.void]
+    _slots: NDArray[np.void]
+
+    def __init__(self, shm: SharedMemory, owner: bool):
+        self._shm = shm
+        self._owner = owner
+
+        self._ring = np.ndarray((), dtype=RING_HEADER_DTYPE, buffer=shm.buf)
+        if not owner:
+            if bytes(self._ring["magic"]) != SHARED_FRAME_MAGIC:
+                raise ValueError(f"Not a shared frame ring: '{shm.name}'")
+            if int(self._ring["version"]) != SHARED_FRAME_VERSION:
+                raise ValueError(f"Unsupported shared frame ring: '{shm.name}'")
+
+        self._layout = SharedFrameLayout(
+            slot_count=int(self._ring["slot_count"]),
+            frame_size=int(self._ring["frame_size"]),
+        )
+        self._slots = np.ndarray(
+            (self._layout.slot_count,),
+            dtype=SLOT_HEADER_DTYPE,
+            buffer=shm.buf,
+            offset=self._layout.slot_headers_offset,
+        )
+        self._views = [
+            shm.buf[offset : offset + self._layout.frame_size]
+            for offset in map(self._layout.slot_offset, range(self._layout.slot_count))
+        ]
+
+    @classmethod
+    def create(cls, frame_size: int, slot_count=4, name: Optional[str] = None):
+        if frame_size <= 0:
+            raise ValueError("Frame size must be greater than zero")
+        if slot_count < 2:
+            raise ValueError("Slot count must be at least 2")
+
+        layout = SharedFrameLayout(slot_count, frame_size)
+        shm = SharedMemory(name=name, create=True, size=layout.size)
+
+        header: NDArray[np.void] = np.ndarray(
+            (), dtype=RING_HEADER_DTYPE, buffer=shm.buf
+        )
+        header["magic"] = SHARED_FRAME_MAGIC
+        header["version"] = SHARED_FRAME_VERSION
+        header["slot_count"] = slot_count
+        header["reserved"] = 0
+        header["frame_size"] = frame_size
+        header["latest"] = 0
+        del header
+
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str):
+        return cls(SharedMemory(name=name, create=False), owner=False)
+
+    def __reduce__(self):
+        return attach_shared_frame_ring, (self.name,)
+
+    @property
+    def name(self) -> str:
+        assert self._shm is not None
+        return self._shm.name
+
+    @property
+    def owner(self) -> bool:
+        return self._owner
+
+    @property
+    def closed(self) -> bool:
+        return self._shm is None
+
+    @property
+    def layout(self):
+        return self._layout
+
+    @property
+    def slot_count(self) -> int:
+        return self._layout.slot_count
+
+    @property
+    def frame_size(self) -> int:
+        return self._layout.frame_size
+
+    @property
+    def latest(self) -> int:
+        return int(self._ring["latest"])
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+
+        # Every export of the mapped buffer must be released before closing.
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        del self._ring
+        del self._slots
+
+        shm = self._shm
+        self._shm = None
+        shm.close()
+        if self._owner:
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(
+        self,
+        data: BufferLike,
+        width: int,
+        height: int,
+        channels: int,
+        pix_fmt: str,
+        timestamp: Optional[float] = None,
+    ) -> int:
+        if not self._owner:
+            raise ValueError("Only the owner of the ring can write frames")
+
+        # NumPy arrays support the buffer protocol, but their stubs do not say so.
+        source = memoryview(data)  # type: ignore[arg-type]
+        with source, source.cast("B") as pixels:
+            if pixels.nbytes != self._layout.frame_size:
+                size = pixels.nbytes
+                raise ValueError(f"Data size must be {self.frame_size} bytes: {size}")
+
+            sequence = self.latest + 1
+            slot = sequence % self._layout.slot_count
+            header = self._slots[slot]
+
+            header["lock"] += 1  # odd: the slot is being written
+            self._views[slot][:] = pixels
+            header["sequence"] = sequence
+            header["timestamp"] = time() if timestamp is None else timestamp
+            header["width"] = width
+            header["height"] = height
+            header["channels"] = channels
+            header["pix_fmt"] = pix_fmt.encode()[:PIX_FMT_SIZE]
+            header["lock"] += 1  # even: the slot is stable
+
+        self._ring["latest"] = sequence
+        return sequence
+
+    def read(
+        self,
+        sequence: int,
+        out: Optional[Union[bytearray, memoryview]] = None,
+    ) -> SharedFrame:
+        """
+        Copies the frame of the given sequence number.
+
+        :raises IndexError: If the frame has not been written yet.
+        :raises BufferError: If the frame was overwritten by a newer one.
+        """
+
+        if sequence <= 0 or self.latest < sequence:
+            raise IndexError(f"Frame {sequence} has not been written yet")
+
+        if out is None:
+            out = bytearray(self._layout.frame_size)
+        elif len(out) != self._layout.frame_size:
+            raise ValueError(f"Output size must be {self.frame_size} bytes")
+
+        slot = sequence % self._layout.slot_count
+        header = self._slots[slot]
+
+        for _ in range(SHARED_FRAME_READ_RETRIES):
+            begin = int(header["lock"])
+            if begin % 2 == 1:
+                continue
+
+            if int(header["sequence"]) != sequence:
+                break
+
+            out[:] = self._views[slot]
+            result = SharedFrameHeader(
+                sequence=sequence,
+                timestamp=float(header["timestamp"]),
+                width=int(header["width"]),
+                height=int(header["height"]),
+                channels=int(header["channels"]),
+                pix_fmt=bytes(header["pix_fmt"]).decode(),
+            )
+
+            if int(header["lock"]) == begin:
+                return SharedFrame(result, out)
+
+        raise BufferError(f"Frame {sequence} was overwritten")
+
+    def read_latest(
+        self,
+        out: Optional[Union[bytearray, memoryview]] = None,
+    ) -> SharedFrame:
+        """
+        :raises IndexError: If no frame has been written yet.
+        """
+
+        for _ in range(SHARED_FRAME_READ_RETRIES):
+            try:
+                return self.read(self.latest, out)
+            except BufferError:
+                continue
+
+        raise BufferError("The writer is too fast to read the latest frame")
+
+
+_attached_rings: Dict[str, SharedFrameRing] = dict()
+
+
+def attach_shared_frame_ring(name: str) -> SharedFrameRing:
+    # Worker processes keep their mapping, so repeated tasks do not re-attach.
+    attached = _attached_rings.get(name)
+    if attached is not None and not attached.closed:
+        return attached
+
+    ring = SharedFrameRing.attach(name)
+    _attached_rings[name] = ring
+    return ring
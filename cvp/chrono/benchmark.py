@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+import tracemalloc
+from math import ceil
+from os import PathLike
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Final, List, NamedTuple, Sequence, Union
+
+import orjson
+
+_NS_PER_SECOND: Final[float] = 1_000_000_000.0
+_NS_PER_MS: Final[float] = 1_000_000.0
+_BYTES_PER_MB: Final[float] = 1024.0 * 1024.0
+
+ALLOCATION_SAMPLES: Final[int] = 100
+"""Calls traced by :mod:`tracemalloc`, which is too slow to trace every call."""
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of the ``values``, with ``q`` in ``[0, 100]``."""
+    if not values:
+        return 0.0
+    if not 0 <= q <= 100:
+        raise ValueError("The 'q' argument must be in the range [0, 100]")
+
+    ordered = sorted(values)
+    rank = max(ceil(q / 100.0 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    iterations: int
+    seconds: float
+    items: int
+    """Units of work done, e.g. frames or lines."""
+
+    nbytes: int
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+    allocated: int
+    """Peak bytes allocated by a single iteration."""
+
+    retained: int
+    """Bytes still allocated after the traced iterations, e.g. leaks or caches."""
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.nbytes / _BYTES_PER_MB / self.seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        result = self._asdict()
+        result["items_per_second"] = self.items_per_second
+        result["megabytes_per_second"] = self.megabytes_per_second
+        return result
+
+    def __str__(self):
+        return (
+            f"{self.name}: {self.items_per_second:.01f}/s"
+            f" {self.megabytes_per_second:.01f}MB/s"
+            f" p50={self.p50_ms:.03f}ms p99={self.p99_ms:.03f}ms"
+            f" max={self.max_ms:.03f}ms"
+            f" alloc={self.allocated}B retained={self.retained}B"
+        )
+
+
+def summarize(
+    name: str,
+    durations_ns: Sequence[int],
+    *,
+    items: int,
+    nbytes: int,
+    seconds: float,
+    allocated=0,
+    retained=0,
+) -> BenchmarkResult:
+    durations_ms = [d / _NS_PER_MS for d in durations_ns]
+    return BenchmarkResult(
+        name=name,
+        iterations=len(durations_ns),
+        seconds=seconds,
+        items=items,
+        nbytes=nbytes,
+        p50_ms=percentile(durations_ms, 50),
+        p99_ms=percentile(durations_ms, 99),
+        max_ms=max(durations_ms, default=0.0),
+        allocated=allocated,
+        retained=retained,
+    )
+
+
+def trace_allocations(func: Callable[[], Any], iterations: int):
+    """
+    Returns the peak bytes allocated by a single call, and the bytes still
+    allocated after all the calls.
+    """
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+
+    try:
+        begin = tracemalloc.get_traced_memory()[0]
+        peak = 0
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            func()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+        retained = max(tracemalloc.get_traced_memory()[0] - begin, 0)
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return peak, retained
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    iterations: int,
+    *,
+    warmup=0,
+    items_per_call=1,
+    bytes_per_call=0,
+    allocation_samples=ALLOCATION_SAMPLES,
+) -> BenchmarkResult:
+    """
+    Times each call of ``func``, then traces the allocations of a few more
+    calls separately so the tracing does not skew the latencies.
+    """
+
+    if iterations < 1:
+        raise ValueError("The 'iterations' argument must be at least 1")
+
+    for _ in range(warmup):
+        func()
+
+    durations: List[int] = list()
+    begin = perf_counter_ns()
+    for _ in range(iterations):
+        call_begin = perf_counter_ns()
+        func()
+        durations.append(perf_counter_ns() - call_begin)
+    seconds = (perf_counter_ns() - begin) / _NS_PER_SECOND
+
+    allocated, retained = 0, 0
+    if allocation_samples > 0:
+        allocated, retained = trace_allocations(func, allocation_samples)
+
+    return summarize(
+        name,
+        durations,
+        items=iterations * items_per_call,
+        nbytes=iterations * bytes_per_call,
+        seconds=seconds,
+        allocated=allocated,
+        retained=retained,
+    )
+
+
+class Regression(NamedTuple):
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """How much worse the current value is, e.g. ``0.25`` for 25%."""
+        if self.metric == "items_per_second":
+            return 1.0 - self.current / self.baseline if self.baseline > 0 else 0.0
+        return self.current / self.baseline - 1.0 if self.baseline > 0 else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.name}: {self.metric} {self.baseline:.03f} -> {self.current:.03f}"
+            f" ({self.ratio * 100.0:+.01f}% worse)"
+        )
+
+
+def load_baseline(path: Union[str, PathLike[str]]) -> Dict[str, Dict[str, Any]]:
+    with open(path, "rb") as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    result = dict()
+    for line in lines:
+        item = orjson.loads(line)
+        result[item["name"]] = item
+    return result
+
+
+def find_regressions(
+    results: Sequence[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    max_regression: float,
+) -> List[Regression]:
+    """
+    Compares the throughput and the p99 latency of the results with the baseline.
+    Benchmarks missing from the baseline are not compared.
+    """
+
+    if max_regression < 0:
+        raise ValueError("The 'max_regression' argument must not be negative")
+
+    regressions: List[Regression] = list()
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+
+        candidates = (
+            Regression(
+                result.name,
+                "items_per_second",
+                float(previous["items_per_second"]),
+                result.items_per_second,
+            ),
+            Regression(result.name, "p99_ms", float(previous["p99_ms"]), result.p99_ms),
+        )
+        regressions.extend(c for c in candidates if c.ratio > max_regression)
+    return regressions
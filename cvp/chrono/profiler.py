@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+import os
+from collections import deque
+from contextlib import nullcontext
+from os import PathLike
+from threading import get_ident
+from time import perf_counter_ns
+from typing import Any, Deque, Dict, Final, List, NamedTuple, Optional, Tuple, Union
+
+import orjson
+
+from cvp.variables import FRAME_PROFILER_MAX_FRAMES
+
+_NULL_ZONE: Final[nullcontext] = nullcontext()
+_NS_PER_US: Final[float] = 1_000.0
+_NS_PER_MS: Final[float] = 1_000_000.0
+
+
+class ZoneSample(NamedTuple):
+    name: str
+    depth: int
+    begin: int
+    """Nanoseconds, from :func:`time.perf_counter_ns`."""
+
+    end: int
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.begin) / _NS_PER_MS
+
+
+class FrameSample(NamedTuple):
+    number: int
+    begin: int
+    end: int
+    zones: Tuple[ZoneSample, ...]
+    """Zones in the order they ended; children end before their parents."""
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.begin) / _NS_PER_MS
+
+
+class ZoneStats(NamedTuple):
+    name: str
+    samples: int
+    mean_ms: float
+    max_ms: float
+
+
+class _Zone:
+    __slots__ = ("_profiler", "_name")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._profiler.push(self._name)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profiler.pop()
+
+
+class _Frame:
+    __slots__ = ("_profiler",)
+
+    def __init__(self, profiler: "FrameProfiler"):
+        self._profiler = profiler
+
+    def __enter__(self):
+        self._profiler.begin_frame()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profiler.end_frame()
+
+
+class FrameProfiler:
+    """
+    Hierarchical zones of the render loop, kept for the latest frames.
+
+    Zones are only recorded on the thread that began the frame, between
+    :meth:`begin_frame` and :meth:`end_frame`. While disabled, :meth:`zone`
+    returns a shared no-op context manager.
+    """
+
+    _frames: Deque[FrameSample]
+    _stack: List[Tuple[str, int]]
+    _zones: List[ZoneSample]
+    _zone_cache: Dict[str, _Zone]
+
+    def __init__(self, max_frames=FRAME_PROFILER_MAX_FRAMES, enabled=False):
+        self._frames = deque(maxlen=max_frames)
+        self._enabled = enabled
+        self._paused = False
+        self._index = 0
+        self._frame_begin = 0
+        self._thread = 0
+        self._recording = False
+        self._stack = list()
+        self._zones = list()
+        self._zone_cache = dict()
+        self._frame_context = _Frame(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+
+    @property
+    def paused(self) -> bool:
+        """Keeps the recorded frames, for inspection."""
+        return self._paused
+
+    @paused.setter
+    def paused(self, value: bool) -> None:
+        self._paused = value
+
+    @property
+    def frames(self):
+        return self._frames
+
+    @property
+    def latest(self) -> Optional[FrameSample]:
+        return self._frames[-1] if self._frames else None
+
+    def clear(self) -> None:
+        self._frames.clear()
+
+    def begin_frame(self) -> None:
+        self._recording = self._enabled and not self._paused
+        if not self._recording:
+            return
+
+        self._thread = get_ident()
+        self._stack.clear()
+        self._zones = list()
+        self._frame_begin = perf_counter_ns()
+
+    def end_frame(self) -> None:
+        if not self._recording:
+            return
+
+        while self._stack:
+            self.pop()
+
+        end = perf_counter_ns()
+        zones = tuple(self._zones)
+        self._frames.append(FrameSample(self._index, self._frame_begin, end, zones))
+        self._index += 1
+        self._recording = False
+
+    def frame(self):
+        return self._frame_context
+
+    def push(self, name: str) -> None:
+        if self._recording and get_ident() == self._thread:
+            self._stack.append((name, perf_counter_ns()))
+
+    def pop(self) -> None:
+        if self._recording and get_ident() == self._thread and self._stack:
+            end = perf_counter_ns()
+            name, begin = self._stack.pop()
+            self._zones.append(ZoneSample(name, len(self._stack), begin, end))
+
+    def zone(self, name: str):
+        if not self._recording:
+            return _NULL_ZONE
+
+        result = self._zone_cache.get(name)
+        if result is None:
+            result = self._zone_cache[name] = _Zone(self, name)
+        return result
+
+    def stats(self) -> List[ZoneStats]:
+        """Durations per zone name over the recorded frames, slowest first."""
+        totals: Dict[str, List[float]] = dict()
+        for frame in self._frames:
+            for zone in frame.zones:
+                totals.setdefault(zone.name, list()).append(zone.duration_ms)
+
+        result = [
+            ZoneStats(name, len(values), sum(values) / len(values), max(values))
+            for name, values in totals.items()
+        ]
+        result.sort(key=lambda s: s.mean_ms, reverse=True)
+        return result
+
+    def chrome_trace_events(self) -> List[Dict[str, Any]]:
+        """Complete events of the Trace Event Format, viewable in chrome://tracing."""
+        pid = os.getpid()
+        tid = self._thread
+        events: List[Dict[str, Any]] = list()
+        for frame in self._frames:
+            events.append(
+                {
+                    "name": f"Frame #{frame.number}",
+                    "cat": "frame",
+                    "ph": "X",
+                    "ts": frame.begin / _NS_PER_US,
+                    "dur": (frame.end - frame.begin) / _NS_PER_US,
+                    "pid": pid,
+                    "tid": tid,
+                }
+            )
+            for zone in frame.zones:
+                events.append(
+                    {
+                        "name": zone.name,
+                        "cat": "zone",
+                        "ph": "X",
+                        "ts": zone.begin / _NS_PER_US,
+                        "dur": (zone.end - zone.begin) / _NS_PER_US,
+                        "pid": pid,
+                        "tid": tid,
+                    }
+                )
+        return events
+
+    def dumps_chrome_trace(self) -> bytes:
+        data = {"traceEvents": self.chrome_trace_events(), "displayTimeUnit": "ms"}
+        return orjson.dumps(data)
+
+    def save_chrome_trace(self, path: Union[str, PathLike[str]]) -> None:
+        with open(path, "wb") as f:
+            f.write(self.dumps_chrome_trace())
+
+
+_frame_profiler = FrameProfiler()
+
+
+def get_frame_profiler() -> FrameProfiler:
+    return _frame_profiler
+
+
+def profile_zone(name: str):
+    """A zone of the frame profiler of the application, for the render thread."""
+    return _frame_profiler.zone(name)
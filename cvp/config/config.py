@@ -24,9 +24,10 @@ from cvp.config.sections.layout import LayoutConfig, LayoutManagerConfig
 from cvp.config.sections.logging import LoggingConfig
 from cvp.config.sections.media import MediaManagerConfig, MediaWindowConfig
 from cvp.config.sections.onvif import OnvifConfig, OnvifManagerConfig
-from cvp.config.sections.overlay import OverlayWindowConfig
+from cvp.config.sections.overlay import OverlayWindowConfig, ProfilerWindowConfig
 from cvp.config.sections.preference import PreferenceManagerConfig as PrefManagerConfig
 from cvp.config.sections.process import ProcessManagerConfig
+from cvp.config.sections.scheduler import StreamSchedulerConfig
 from cvp.config.sections.stitching import StitchingAuiConfig
 from cvp.config.sections.toast import ToastWindowConfig
 from cvp.config.sections.window import WindowManagerConfig
@@ -62,9 +63,13 @@ class Config:
     onvif_manager: OnvifManagerConfig = field(default_factory=OnvifManagerConfig)
     onvifs: List[OnvifConfig] = field(default_factory=list)
     overlay_window: OverlayWindowConfig = field(default_factory=OverlayWindowConfig)
+    profiler_window: ProfilerWindowConfig = field(default_factory=ProfilerWindowConfig)
     preference_manager: PrefManagerConfig = field(default_factory=PrefManagerConfig)
     process_manager: ProcessManagerConfig = field(default_factory=ProcessManagerConfig)
     stitching_aui: StitchingAuiConfig = field(default_factory=StitchingAuiConfig)
+    stream_scheduler: StreamSchedulerConfig = field(
+        default_factory=StreamSchedulerConfig,
+    )
     tetrix_window: TetrixWindowConfig = field(default_factory=TetrixWindowConfig)
     toast_window: ToastWindowConfig = field(default_factory=ToastWindowConfig)
     window_manager: WindowManagerConfig = field(default_factory=WindowManagerConfig)
@@ -12,3 +12,7 @@ class FFmpegConfig:
     logging_maxsize: int = STREAM_LOGGING_MAXSIZE
     logging_encoding: str = "utf-8"
     logging_newline_size: int = STREAM_LOGGING_NEWLINE_SIZE
+    pixel_format: str = "rgb24"
+    """Planar formats like 'yuv420p' are converted on the GPU, when it supports it."""
+    shared_frame_slots: int = 0
+    """Number of shared memory slots published for worker processes (0 disables)."""
@@ -31,6 +31,8 @@ class FontConfig:
     medium_icon_size: int = MEDIUM_ICON_FONT_SIZE
     large_icon_size: int = LARGE_ICON_FONT_SIZE
     load_all: bool = False
+    dynamic_atlas: bool = False
+    """Bake only the base glyphs at startup, and the others once they are drawn."""
 
     @property
     def normal_text_size_pixels(self):
@@ -3,8 +3,16 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from cvp.variables import LOGGING_ASYNC_QUEUE_SIZE
+
 
 @dataclass
 class LoggingConfig:
     config_path: Optional[str] = None
     root_severity: Optional[str] = None
+
+    async_queue: bool = False
+    """Format and write the records of the cvp loggers on a background thread."""
+
+    async_queue_size: int = LOGGING_ASYNC_QUEUE_SIZE
+    """Records kept while the background thread is busy; the oldest are dropped."""
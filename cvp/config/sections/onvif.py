@@ -8,7 +8,13 @@ from uuid import uuid4
 from cvp.config.sections.bases.manager import ManagerWindowConfig
 from cvp.palette.basic import GREEN, RED, YELLOW
 from cvp.types.colors import RGBA
-from cvp.variables import API_SELECT_WIDTH, MAX_API_SELECT_WIDTH, MIN_API_SELECT_WIDTH
+from cvp.variables import (
+    API_SELECT_WIDTH,
+    MAX_API_SELECT_WIDTH,
+    MIN_API_SELECT_WIDTH,
+    ONVIF_BULK_MAX_CONCURRENCY,
+    ONVIF_BULK_MAX_PER_HOST,
+)
 
 
 @unique
@@ -47,6 +53,9 @@ class OnvifConfig:
 class OnvifManagerConfig(ManagerWindowConfig):
     preload: bool = False
 
+    bulk_max_concurrency: int = ONVIF_BULK_MAX_CONCURRENCY
+    bulk_max_per_host: int = ONVIF_BULK_MAX_PER_HOST
+
     api_select_width: float = API_SELECT_WIDTH
     min_api_select_width: float = MIN_API_SELECT_WIDTH
     max_api_select_width: float = MAX_API_SELECT_WIDTH
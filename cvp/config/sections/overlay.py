@@ -70,3 +70,15 @@ class OverlayWindowConfig(WindowConfig):
     @property
     def is_bottom_side(self):
         return not self.is_top_side
+
+
+@dataclass
+class ProfilerWindowConfig(OverlayWindowConfig):
+    anchor: Anchor = Anchor.TopRight
+    alpha: float = 0.6
+    timeline_width: float = 360.0
+    zone_height: float = 16.0
+    frame_budget: float = 1000.0 / 60.0
+    """Milliseconds the timeline spans, unless the frame is longer."""
+
+    stats_count: int = 10
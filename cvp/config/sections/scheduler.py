@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass
+
+from cvp.variables import (
+    STREAM_SCHEDULER_HIDDEN_FPS,
+    STREAM_SCHEDULER_HIDDEN_TIMEOUT,
+    STREAM_SCHEDULER_HYSTERESIS,
+    STREAM_SCHEDULER_INTERVAL,
+    STREAM_SCHEDULER_MAX_BANDWIDTH,
+    STREAM_SCHEDULER_MIN_FPS,
+    STREAM_SCHEDULER_MIN_WIDTH,
+    STREAM_SCHEDULER_NOMINAL_FPS,
+    STREAM_SCHEDULER_TINY_WIDTH,
+)
+
+
+@dataclass
+class StreamSchedulerConfig:
+    enable: bool = False
+    max_bandwidth: int = STREAM_SCHEDULER_MAX_BANDWIDTH
+    """Total bytes per second of raw frames allowed over all pipes."""
+
+    nominal_fps: float = STREAM_SCHEDULER_NOMINAL_FPS
+    min_fps: float = STREAM_SCHEDULER_MIN_FPS
+    hidden_fps: float = STREAM_SCHEDULER_HIDDEN_FPS
+    min_width: int = STREAM_SCHEDULER_MIN_WIDTH
+    tiny_width: int = STREAM_SCHEDULER_TINY_WIDTH
+    hidden_timeout: float = STREAM_SCHEDULER_HIDDEN_TIMEOUT
+    interval: float = STREAM_SCHEDULER_INTERVAL
+    hysteresis: float = STREAM_SCHEDULER_HYSTERESIS
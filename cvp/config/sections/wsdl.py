@@ -2,7 +2,36 @@
 
 from dataclasses import dataclass
 
+from cvp.variables import (
+    WSDL_CACHE_MAX_ENTRIES,
+    WSDL_CACHE_STALE_WHILE_REVALIDATE,
+    WSDL_CACHE_STATIC_TTL,
+    WSDL_CACHE_VOLATILE_TTL,
+    WSDL_DOCUMENT_MAX_AGE,
+    WSDL_OPERATION_TIMEOUT,
+    WSDL_POOL_MAXSIZE,
+)
+
 
 @dataclass
 class WsdlConfig:
     no_cache: bool = False
+    operation_timeout: float = WSDL_OPERATION_TIMEOUT
+    """Timeout of each operation request in seconds. Use 0 for no timeout."""
+
+    pool_maxsize: int = WSDL_POOL_MAXSIZE
+
+    cache_static_ttl: float = WSDL_CACHE_STATIC_TTL
+    """Seconds the responses of device information queries stay fresh."""
+
+    cache_volatile_ttl: float = WSDL_CACHE_VOLATILE_TTL
+    """Seconds the responses of status queries stay fresh. Use 0 to disable."""
+
+    cache_stale_while_revalidate: float = WSDL_CACHE_STALE_WHILE_REVALIDATE
+    """Seconds an expired information response is used while it is refreshed."""
+
+    cache_max_entries: int = WSDL_CACHE_MAX_ENTRIES
+    """Responses kept on disk per device."""
+
+    document_max_age: float = WSDL_DOCUMENT_MAX_AGE
+    """Seconds before a cached WSDL or XSD document is revalidated. Use 0 for never."""
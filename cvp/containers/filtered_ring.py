@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+from threading import RLock
+from typing import Callable, Generic, List, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+Predicate = Callable[[_T], bool]
+
+_COMPACT_THRESHOLD = 1024
+
+
+class FilteredRing(Generic[_T]):
+    """
+    The latest ``maxlen`` items, with an index of the items that match a
+    predicate.
+
+    The predicate is evaluated once per item, when it is appended, so reading
+    the filtered items does not depend on the size of the history. Changing
+    the predicate rescans the items once. Items are addressed by a sequence
+    number, and both the items and the index support O(1) access by position.
+    Appends may come from any thread.
+    """
+
+    _items: List[Optional[_T]]
+    _matches: List[int]
+
+    def __init__(self, maxlen: int, predicate: Optional[Predicate] = None):
+        if maxlen < 1:
+            raise ValueError("The 'maxlen' argument must be at least 1")
+
+        self._maxlen = maxlen
+        self._items = [None] * maxlen
+        self._begin = 0
+        self._end = 0
+        self._predicate = predicate
+        self._matches = list()
+        self._matches_begin = 0
+        self._lock = RLock()
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def predicate(self) -> Optional[Predicate]:
+        return self._predicate
+
+    @property
+    def total(self) -> int:
+        """Number of items ever appended."""
+        return self._end
+
+    def __len__(self) -> int:
+        return self._end - self._begin
+
+    @property
+    def filtered_count(self) -> int:
+        return len(self._matches) - self._matches_begin
+
+    def _item(self, sequence: int) -> _T:
+        item = self._items[sequence % self._maxlen]
+        assert item is not None
+        return item
+
+    def _matches_item(self, item: _T) -> bool:
+        return self._predicate is None or self._predicate(item)
+
+    def _drop_evicted_matches(self) -> None:
+        matches = self._matches
+        begin = self._matches_begin
+        while begin < len(matches) and matches[begin] < self._begin:
+            begin += 1
+
+        if begin >= _COMPACT_THRESHOLD and begin * 2 >= len(matches):
+            del matches[:begin]
+            begin = 0
+        self._matches_begin = begin
+
+    def append(self, item: _T) -> None:
+        with self._lock:
+            if self._end - self._begin == self._maxlen:
+                self._begin += 1
+                self._drop_evicted_matches()
+
+            self._items[self._end % self._maxlen] = item
+            if self._matches_item(item):
+                self._matches.append(self._end)
+            self._end += 1
+
+    def __getitem__(self, index: int) -> _T:
+        with self._lock:
+            if not 0 <= index < len(self):
+                raise IndexError("Index out of range")
+            return self._item(self._begin + index)
+
+    def filtered(self, index: int) -> _T:
+        with self._lock:
+            if not 0 <= index < self.filtered_count:
+                raise IndexError("Index out of range")
+            return self._item(self._matches[self._matches_begin + index])
+
+    def filtered_range(self, begin: int, end: int) -> List[_T]:
+        """Matched items in ``[begin, end)``, clamped to the current count."""
+        with self._lock:
+            begin = max(0, begin) + self._matches_begin
+            end = min(end + self._matches_begin, len(self._matches))
+            return [self._item(self._matches[i]) for i in range(begin, end)]
+
+    def set_predicate(self, predicate: Optional[Predicate]) -> None:
+        with self._lock:
+            self._predicate = predicate
+            self._matches = [
+                sequence
+                for sequence in range(self._begin, self._end)
+                if self._matches_item(self._item(sequence))
+            ]
+            self._matches_begin = 0
+
+    def resize(self, maxlen: int) -> None:
+        """Changes the capacity, keeping the latest items."""
+        if maxlen < 1:
+            raise ValueError("The 'maxlen' argument must be at least 1")
+
+        with self._lock:
+            begin = max(self._begin, self._end - maxlen)
+            items: List[Optional[_T]] = [None] * maxlen
+            for sequence in range(begin, self._end):
+                items[sequence % maxlen] = self._item(sequence)
+
+            self._maxlen = maxlen
+            self._items = items
+            self._begin = begin
+            self._drop_evicted_matches()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items = [None] * self._maxlen
+            self._begin = self._end
+            self._matches = list()
+            self._matches_begin = 0
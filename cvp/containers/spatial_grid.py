@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+from math import floor
+from typing import Dict, Generic, Iterator, List, Set, Tuple, TypeVar
+
+from cvp.types.shapes import Rect
+from cvp.variables import FLOW_SPATIAL_CELL_SIZE
+
+_KT = TypeVar("_KT")
+
+Cell = Tuple[int, int]
+
+
+def normalize_rect(rect: Rect) -> Rect:
+    x1, y1, x2, y2 = rect
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+def intersect_rects(a: Rect, b: Rect) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class SpatialGrid(Generic[_KT]):
+    """
+    Uniform grid of axis-aligned bounding boxes.
+
+    Unlike a bulk-loaded tree, items can be inserted, moved and removed one by
+    one; only the cells covered by the old and new boxes are touched.
+    """
+
+    _rects: Dict[_KT, Rect]
+    _cells: Dict[Cell, Set[_KT]]
+
+    def __init__(self, cell_size=FLOW_SPATIAL_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError("The 'cell_size' argument must be greater than zero")
+
+        self._cell_size = cell_size
+        self._rects = dict()
+        self._cells = dict()
+
+    @property
+    def cell_size(self):
+        return self._cell_size
+
+    @property
+    def cell_count(self) -> int:
+        return len(self._cells)
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, key: _KT) -> bool:
+        return key in self._rects
+
+    def __iter__(self) -> Iterator[_KT]:
+        return iter(self._rects)
+
+    def get(self, key: _KT):
+        return self._rects.get(key)
+
+    def _cell_index(self, value: float) -> int:
+        return floor(value / self._cell_size)
+
+    def _cover(self, rect: Rect) -> Iterator[Cell]:
+        x1, y1, x2, y2 = rect
+        cx1 = self._cell_index(x1)
+        cy1 = self._cell_index(y1)
+        cx2 = self._cell_index(x2)
+        cy2 = self._cell_index(y2)
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                yield cx, cy
+
+    def _link(self, key: _KT, rect: Rect) -> None:
+        for cell in self._cover(rect):
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                self._cells[cell] = {key}
+            else:
+                bucket.add(key)
+
+    def _unlink(self, key: _KT, rect: Rect) -> None:
+        for cell in self._cover(rect):
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                continue
+            bucket.discard(key)
+            if not bucket:
+                del self._cells[cell]
+
+    def insert(self, key: _KT, rect: Rect) -> None:
+        rect = normalize_rect(rect)
+        previous = self._rects.get(key)
+        if previous is not None:
+            if previous == rect:
+                return
+            self._unlink(key, previous)
+
+        self._rects[key] = rect
+        self._link(key, rect)
+
+    def remove(self, key: _KT) -> bool:
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return False
+
+        self._unlink(key, rect)
+        return True
+
+    def clear(self) -> None:
+        self._rects.clear()
+        self._cells.clear()
+
+    def query_point(self, x: float, y: float) -> List[_KT]:
+        bucket = self._cells.get((self._cell_index(x), self._cell_index(y)))
+        if not bucket:
+            return list()
+
+        result = list()
+        for key in bucket:
+            x1, y1, x2, y2 = self._rects[key]
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                result.append(key)
+        return result
+
+    def query_rect(self, rect: Rect) -> Set[_KT]:
+        rect = normalize_rect(rect)
+        x1, y1, x2, y2 = rect
+        columns = self._cell_index(x2) - self._cell_index(x1) + 1
+        rows = self._cell_index(y2) - self._cell_index(y1) + 1
+        if len(self._rects) < columns * rows:
+            # Scanning every item is cheaper than visiting every covered cell.
+            items = self._rects.items()
+            return {key for key, r in items if intersect_rects(r, rect)}
+
+        candidates: Set[_KT] = set()
+        for cell in self._cover(rect):
+            if bucket := self._cells.get(cell):
+                candidates.update(bucket)
+        return {key for key in candidates if intersect_rects(self._rects[key], rect)}
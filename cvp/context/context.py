@@ -11,7 +11,9 @@ from cvp.flow.datas.graph import Graph
 from cvp.flow.manager import FlowManager
 from cvp.logging.logging import (
     convert_level_number,
+    disable_async_logging,
     dumps_default_logging_config,
+    enable_async_logging,
     loads_logging_config,
     logger,
     set_root_level,
@@ -19,6 +21,7 @@ from cvp.logging.logging import (
 from cvp.msgs.msg_queue import MsgQueue
 from cvp.onvif.manager import OnvifManager
 from cvp.process.manager import ProcessManager
+from cvp.process.scheduler import StreamScheduler
 from cvp.resources.download.archive import DownloadArchive
 from cvp.resources.download.links.tuples import LinkInfo
 from cvp.resources.download.runner import DownloadRunner
@@ -66,6 +69,9 @@ class Context:
             set_root_level(level)
             logger.log(level, f"Changed root severity: {root_severity}")
 
+        if self._config.logging.async_queue:
+            enable_async_logging(self._config.logging.async_queue_size)
+
         thread_workers = self._config.concurrency.thread_workers
         thread_name_prefix = self._config.concurrency.thread_name_prefix
         process_workers = self._config.concurrency.process_workers
@@ -78,6 +84,12 @@ class Context:
             process_workers=process_workers,
         )
 
+        self._stream_scheduler = StreamScheduler(
+            pm=self._process_manager,
+            config=self._config.stream_scheduler,
+            pixel_format=lambda: self._process_manager.pixel_format,
+        )
+
         if self.config.graphic.force_egl is not None:
             force_egl = self.config.graphic.force_egl_environ
             os.environ[SDL_VIDEO_X11_FORCE_EGL] = force_egl
@@ -89,8 +101,8 @@ class Context:
             logger.info(f"Update environ: {PYOPENGL_USE_ACCELERATE}={use_accelerate}")
 
         if self._config.onvif_manager.preload:
-            logger.info("Preload ONVIF declarations")
-            OnvifManager.preload_onvif_declarations()
+            logger.info("Preload ONVIF declarations in the background")
+            OnvifManager.preload_onvif_declarations_in_background()
 
         self._onvif_manager = OnvifManager(
             onvif_configs=self._config.onvifs,
@@ -114,6 +126,10 @@ class Context:
     def pm(self):
         return self._process_manager
 
+    @property
+    def scheduler(self):
+        return self._stream_scheduler
+
     @property
     def mq(self):
         return self._msg_queue
@@ -165,6 +181,11 @@ class Context:
         timeout = self._config.process_manager.teardown_timeout
         self._process_manager.teardown(timeout)
 
+    @staticmethod
+    def teardown_logging() -> None:
+        # Flushes the records still in the queue of the asynchronous logging.
+        disable_async_logging()
+
     def save_config(self) -> None:
         self._config.write_yaml(self._home.cvp_yml)
         logger.info(f"Save the config file: '{str(self._home.cvp_yml)}'")
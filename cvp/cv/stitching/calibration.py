@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+
+import json
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from io import BytesIO
+from typing import Any, Dict, List, Sequence, Tuple
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+from cvp.cv.stitching.errors import (
+    CameraParamsAdjustError,
+    HomographyEstimateError,
+    NeedMoreImagesError,
+)
+from cvp.cv.stitching.props import StitcherProps
+from cvp.cv.stitching.types import BLEND_FEATHER, BLEND_MULTIBAND
+from cvp.variables import STITCH_CALIBRATION_VERSION
+
+_GAIN_PROBE_LEVEL = 128.0
+_SCALE_TOLERANCE = 1e-1
+
+
+def _megapixel_scale(mega_pixel: float, pixels: int) -> float:
+    if mega_pixel <= 0:
+        return 1.0
+    return min(1.0, float(np.sqrt(mega_pixel * 1e6 / pixels)))
+
+
+def compose_megapixel_scale(mega_pixel: float, pixels: int) -> float:
+    """
+    Scales close to 1 compose the full size images, as the images themselves
+    are not resized within :data:`_SCALE_TOLERANCE`.
+    """
+    scale = _megapixel_scale(mega_pixel, pixels)
+    return 1.0 if abs(scale - 1.0) <= _SCALE_TOLERANCE else scale
+
+
+def scaled_size(size: Tuple[int, int], scale: float) -> Tuple[int, int]:
+    return int(round(size[0] * scale)), int(round(size[1] * scale))
+
+
+def _resize(image: NDArray, scale: float) -> NDArray:
+    if abs(scale - 1.0) <= _SCALE_TOLERANCE:
+        return image
+    return cv2.resize(
+        src=image,
+        dsize=None,
+        fx=scale,
+        fy=scale,
+        interpolation=cv2.INTER_LINEAR_EXACT,
+    )
+
+
+def _scaled_k(camera, scale: float) -> NDArray:
+    k = camera.K().astype(np.float32)
+    k[0, 0] *= scale
+    k[0, 2] *= scale
+    k[1, 1] *= scale
+    k[1, 2] *= scale
+    return k
+
+
+def calibration_key(
+    names: Sequence[str],
+    sizes: Sequence[Tuple[int, int]],
+    props: StitcherProps,
+) -> str:
+    """The calibration only holds for the same rig and the same parameters."""
+    params = asdict(props)
+    params.pop("drift_check_interval")
+    params.pop("drift_ratio")
+    document = dict(
+        version=STITCH_CALIBRATION_VERSION,
+        names=list(names),
+        sizes=[list(size) for size in sizes],
+        props=params,
+    )
+    return sha256(json.dumps(document, sort_keys=True).encode()).hexdigest()
+
+
+def find_features(images: Sequence[NDArray], props: StitcherProps):
+    finder = props.create_features_finder()
+    pixels = images[0].shape[0] * images[0].shape[1]
+    if props.work_mega_pixel < 0:
+        work_scale = 1.0
+    else:
+        work_scale = _megapixel_scale(props.work_mega_pixel, pixels)
+
+    features = list()
+    for image in images:
+        work_image = image if props.work_mega_pixel < 0 else _resize(image, work_scale)
+        features.append(cv2.detail.computeImageFeatures2(finder, work_image))
+    return work_scale, features
+
+
+def match_features(features: List[Any], props: StitcherProps) -> List[Any]:
+    matcher = props.get_matcher()
+    pairwise = matcher.apply2(features)
+    matcher.collectGarbage()
+    return pairwise
+
+
+def pair_confidence(
+    pairwise: List[Any],
+    count: int,
+    pairs: Sequence[Tuple[int, int]],
+) -> float:
+    if not pairs:
+        return 0.0
+    values = [pairwise[i * count + j].confidence for i, j in pairs]
+    return float(np.mean(values))
+
+
+@dataclass
+class StitchCamera:
+    index: int
+    """Index of the source image."""
+
+    corner: Tuple[int, int]
+    """Top-left corner of the warped image, relative to the panorama."""
+
+    xmap: NDArray
+    ymap: NDArray
+
+    weight: NDArray
+    """Normalized blend weight with the exposure gain, per pixel and channel."""
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.xmap.shape[1], self.xmap.shape[0]
+
+
+@dataclass
+class StitchCalibration:
+    """
+    Result of the registration, seam and blend steps for a fixed camera rig.
+
+    Composing a panorama from a new set of frames only remaps each frame with
+    the precomputed warp maps and accumulates it with the precomputed weights.
+    """
+
+    key: str
+    names: List[str]
+    sizes: List[Tuple[int, int]]
+    """Sizes of the source images as ``(width, height)``."""
+
+    compose_scale: float
+    work_scale: float
+    panorama_size: Tuple[int, int]
+    cameras: List[StitchCamera]
+
+    pairs: List[Tuple[int, int]]
+    """Matched pairs of the source images used to measure the drift."""
+
+    confidence: float
+    """Mean match confidence of the pairs at the calibration time."""
+
+    @property
+    def indices(self) -> List[int]:
+        return [camera.index for camera in self.cameras]
+
+    def validate(self, frames: Sequence[NDArray]) -> None:
+        if len(frames) != len(self.sizes):
+            count = len(self.sizes)
+            raise ValueError(f"The calibration requires {count} frames: {len(frames)}")
+        for i, (frame, size) in enumerate(zip(frames, self.sizes)):
+            if (frame.shape[1], frame.shape[0]) != size:
+                raise ValueError(f"The size of frame {i} must be {size}")
+
+    def compose(self, frames: Sequence[NDArray]) -> NDArray[np.uint8]:
+        self.validate(frames)
+
+        width, height = self.panorama_size
+        canvas = np.zeros((height, width, 3), np.float32)
+
+        for camera in self.cameras:
+            # The warp maps were built for exactly this size.
+            frame = frames[camera.index]
+            size = scaled_size(self.sizes[camera.index], self.compose_scale)
+            if (frame.shape[1], frame.shape[0]) == size:
+                image = frame
+            else:
+                image = cv2.resize(
+                    frame, dsize=size, interpolation=cv2.INTER_LINEAR_EXACT
+                )
+            warped = cv2.remap(
+                image,
+                camera.xmap,
+                camera.ymap,
+                cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_REFLECT,
+            )
+            x, y = camera.corner
+            w, h = camera.size
+            canvas[y : y + h, x : x + w] += warped * camera.weight
+
+        return np.clip(canvas, 0, 255).astype(np.uint8)
+
+    def measure_confidence(
+        self,
+        frames: Sequence[NDArray],
+        props: StitcherProps,
+    ) -> float:
+        self.validate(frames)
+        _, features = find_features(frames, props)
+        pairwise = match_features(features, props)
+        return pair_confidence(pairwise, len(frames), self.pairs)
+
+    def to_bytes(self) -> bytes:
+        meta = dict(
+            version=STITCH_CALIBRATION_VERSION,
+            key=self.key,
+            names=self.names,
+            sizes=self.sizes,
+            compose_scale=self.compose_scale,
+            work_scale=self.work_scale,
+            panorama_size=self.panorama_size,
+            indices=self.indices,
+            corners=[camera.corner for camera in self.cameras],
+            pairs=self.pairs,
+            confidence=self.confidence,
+        )
+        arrays: Dict[str, NDArray] = dict(meta=np.array(json.dumps(meta)))
+        for i, camera in enumerate(self.cameras):
+            arrays[f"xmap{i}"] = camera.xmap
+            arrays[f"ymap{i}"] = camera.ymap
+            arrays[f"weight{i}"] = camera.weight
+
+        buffer = BytesIO()
+        np.savez(buffer, **arrays)  # type: ignore[arg-type]
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        with np.load(BytesIO(data), allow_pickle=False) as arrays:
+            meta = json.loads(str(arrays["meta"]))
+            if meta["version"] != STITCH_CALIBRATION_VERSION:
+                raise ValueError(f"Unsupported calibration version: {meta['version']}")
+
+            cameras = list()
+            for i, (index, corner) in enumerate(zip(meta["indices"], meta["corners"])):
+                camera = StitchCamera(
+                    index=index,
+                    corner=(corner[0], corner[1]),
+                    xmap=arrays[f"xmap{i}"],
+                    ymap=arrays[f"ymap{i}"],
+                    weight=arrays[f"weight{i}"],
+                )
+                cameras.append(camera)
+
+        return cls(
+            key=meta["key"],
+            names=meta["names"],
+            sizes=[(w, h) for w, h in meta["sizes"]],
+            compose_scale=meta["compose_scale"],
+            work_scale=meta["work_scale"],
+            panorama_size=(meta["panorama_size"][0], meta["panorama_size"][1]),
+            cameras=cameras,
+            pairs=[(i, j) for i, j in meta["pairs"]],
+            confidence=meta["confidence"],
+        )
+
+
+def _blend_weight(
+    mask: NDArray[np.uint8],
+    blend_key: str,
+    blend_width: float,
+) -> NDArray[np.float32]:
+    if blend_width < 1 or blend_key not in (BLEND_FEATHER, BLEND_MULTIBAND):
+        return (mask > 0).astype(np.float32)
+
+    # Same weights as 'cv2.detail.FeatherBlender'.
+    distance = cv2.distanceTransform(mask, cv2.DIST_L1, 3)
+    return np.clip(distance / blend_width, 0.0, 1.0).astype(np.float32)
+
+
+def calibrate(
+    images: Sequence[NDArray],
+    names: Sequence[str],
+    props: StitcherProps,
+) -> StitchCalibration:
+    if len(images) != len(names):
+        raise ValueError("The number of images and names must be the same")
+    if len(images) < 2:
+        raise ValueError("At least two images are required")
+
+    sizes = [(image.shape[1], image.shape[0]) for image in images]
+    pixels = sizes[0][0] * sizes[0][1]
+
+    work_scale, features = find_features(images, props)
+    seam_scale = _megapixel_scale(props.seam_mega_pixel, pixels)
+    seam_work_aspect = seam_scale / work_scale
+
+    pairwise = match_features(features, props)
+    count = len(images)
+    indices = cv2.detail.leaveBiggestComponent(features, pairwise, props.conf_thresh)
+    indices = [int(i) for i in np.asarray(indices).ravel()]
+    if len(indices) < 2:
+        raise NeedMoreImagesError
+
+    pairs = [
+        (i, j)
+        for i in indices
+        for j in indices
+        if i < j and pairwise[i * count + j].confidence > props.conf_thresh
+    ]
+    confidence = pair_confidence(pairwise, count, pairs)
+
+    subset_features = [features[i] for i in indices]
+    if len(indices) == count:
+        subset_pairwise = pairwise
+    else:
+        subset_pairwise = match_features(subset_features, props)
+
+    estimator = props.create_estimator()
+    ok, cameras = estimator.apply(subset_features, subset_pairwise, None)
+    if not ok:
+        raise HomographyEstimateError
+
+    for camera in cameras:
+        camera.R = camera.R.astype(np.float32)
+
+    adjuster = props.create_bundle_adjuster()
+    ok, cameras = adjuster.apply(subset_features, subset_pairwise, cameras)
+    if not ok:
+        raise CameraParamsAdjustError
+
+    warped_image_scale = float(np.median([camera.focal for camera in cameras]))
+
+    if props.wave_correct is not None:
+        rotations = [np.copy(camera.R) for camera in cameras]
+        corrected = cv2.detail.waveCorrect(rotations, props.wave_correct)
+        for camera, rotation in zip(cameras, corrected):
+            camera.R = rotation
+
+    # Seams and exposure gains are estimated at the seam resolution.
+    seam_warper = cv2.PyRotationWarper(
+        props.warp_key, warped_image_scale * seam_work_aspect
+    )
+    seam_corners = list()
+    seam_images = list()
+    seam_masks = list()
+    for camera, index in zip(cameras, indices):
+        image = _resize(images[index], seam_scale)
+        mask = 255 * np.ones(image.shape[:2], np.uint8)
+        k = _scaled_k(camera, seam_work_aspect)
+        corner, warped = seam_warper.warp(
+            image, k, camera.R, cv2.INTER_LINEAR, cv2.BORDER_REFLECT
+        )
+        _, warped_mask = seam_warper.warp(
+            mask, k, camera.R, cv2.INTER_NEAREST, cv2.BORDER_CONSTANT
+        )
+        seam_corners.append(corner)
+        seam_images.append(warped)
+        seam_masks.append(warped_mask)
+
+    compensator = props.get_compensator()
+    compensator.feed(corners=seam_corners, images=seam_images, masks=seam_masks)
+    seam_images_f = [image.astype(np.float32) for image in seam_images]
+    seams = props.seam_finder.find(seam_images_f, seam_corners, seam_masks)
+    seams = [seam.get() if isinstance(seam, cv2.UMat) else seam for seam in seams]
+
+    compose_scale = compose_megapixel_scale(props.compose_mega_pixel, pixels)
+    compose_work_aspect = compose_scale / work_scale
+    warper = cv2.PyRotationWarper(
+        props.warp_key, warped_image_scale * compose_work_aspect
+    )
+
+    corners: List[Tuple[int, int]] = list()
+    maps: List[Tuple[NDArray, NDArray]] = list()
+    masks: List[NDArray] = list()
+    for i, (camera, index) in enumerate(zip(cameras, indices)):
+        size = scaled_size(sizes[index], compose_scale)
+        k = _scaled_k(camera, compose_work_aspect)
+        roi, xmap, ymap = warper.buildMaps(size, k, camera.R)
+        compose_mask = cv2.remap(
+            np.full((size[1], size[0]), 255, np.uint8),
+            xmap,
+            ymap,
+            cv2.INTER_NEAREST,
+            borderMode=cv2.BORDER_CONSTANT,
+        )
+        seam_mask = cv2.resize(
+            cv2.dilate(seams[i], np.empty(0)),
+            dsize=(compose_mask.shape[1], compose_mask.shape[0]),
+            interpolation=cv2.INTER_LINEAR_EXACT,
+        )
+        corners.append((int(roi[0]), int(roi[1])))
+        maps.append((xmap, ymap))
+        masks.append(cv2.bitwise_and(seam_mask, compose_mask))
+
+    left = min(x for x, _ in corners)
+    top = min(y for _, y in corners)
+    right = max(x + m[0].shape[1] for (x, _), m in zip(corners, maps))
+    bottom = max(y + m[0].shape[0] for (_, y), m in zip(corners, maps))
+    panorama_size = right - left, bottom - top
+
+    blend_width = np.sqrt(panorama_size[0] * panorama_size[1])
+    blend_width *= props.blend_strength / 100
+
+    weights = [_blend_weight(mask, props.blend_key, blend_width) for mask in masks]
+    total = np.zeros((panorama_size[1], panorama_size[0]), np.float32)
+    for (x, y), weight in zip(corners, weights):
+        h, w = weight.shape
+        total[y - top : y - top + h, x - left : x - left + w] += weight
+    total[total == 0] = 1.0
+
+    result = list()
+    for i, ((x, y), (xmap, ymap), weight) in enumerate(zip(corners, maps, weights)):
+        h, w = weight.shape
+        x -= left
+        y -= top
+        normalized = weight / total[y : y + h, x : x + w]
+
+        # The gain of the exposure compensator is folded into the weight.
+        probe = np.full((h, w, 3), _GAIN_PROBE_LEVEL, np.uint8)
+        compensator.apply(i, (x + left, y + top), probe, masks[i])
+        gain = probe.astype(np.float32) / _GAIN_PROBE_LEVEL
+
+        camera_weight = (gain * normalized[..., np.newaxis]).astype(np.float32)
+        result.append(StitchCamera(indices[i], (x, y), xmap, ymap, camera_weight))
+
+    return StitchCalibration(
+        key=calibration_key(names, sizes, props),
+        names=list(names),
+        sizes=sizes,
+        compose_scale=compose_scale,
+        work_scale=work_scale,
+        panorama_size=panorama_size,
+        cameras=result,
+        pairs=pairs,
+        confidence=confidence,
+    )
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+from typing import Optional
+
+import cv2
+
+
+class StitchError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class StitchOk(StitchError):
+    def __init__(self, message: Optional[str] = None):
+        super().__init__(
+            cv2.Stitcher_OK,
+            message if message else "Stitch successful",
+        )
+
+
+class NeedMoreImagesError(StitchError):
+    def __init__(self, message: Optional[str] = None):
+        super().__init__(
+            cv2.Stitcher_ERR_NEED_MORE_IMGS,
+            message if message else "Need more images",
+        )
+
+
+class HomographyEstimateError(StitchError):
+    def __init__(self, message: Optional[str] = None):
+        super().__init__(
+            cv2.Stitcher_ERR_HOMOGRAPHY_EST_FAIL,
+            message if message else "Homography estimate fail",
+        )
+
+
+class CameraParamsAdjustError(StitchError):
+    def __init__(self, message: Optional[str] = None):
+        super().__init__(
+            cv2.Stitcher_ERR_CAMERA_PARAMS_ADJUST_FAIL,
+            message if message else "Camera params adjust fail",
+        )
@@ -132,6 +132,12 @@ class StitcherProps:
     use_cuda: bool = False
     """Try to use CUDA. The default value is no. All default values are for CPU mode."""
 
+    drift_check_interval: int = 30
+    """Composed frames between two match confidence checks. Use 0 to disable."""
+
+    drift_ratio: float = 0.5
+    """Recalibrate when the match confidence drops below this ratio."""
+
     @property
     def stitcher_mode(self):
         key = STITCHER_MODE_KEYS[self.stitcher_mode_index]
@@ -1,53 +1,39 @@
 # -*- coding: utf-8 -*-
 
 from collections import OrderedDict
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 import cv2
 import numpy as np
 from numpy.typing import NDArray
 
+from cvp.cv.stitching.calibration import (
+    StitchCalibration,
+    calibrate,
+    calibration_key,
+    compose_megapixel_scale,
+)
+from cvp.cv.stitching.errors import (
+    CameraParamsAdjustError,
+    HomographyEstimateError,
+    NeedMoreImagesError,
+    StitchError,
+    StitchOk,
+)
 from cvp.cv.stitching.parts import StitcherPart
 from cvp.cv.stitching.props import StitcherProps
 from cvp.cv.stitching.types import BLEND_FEATHER, BLEND_MULTIBAND
+from cvp.logging.logging import logger
+from cvp.resources.subdirs.cache import Cache
 
-
-class StitchError(Exception):
-    def __init__(self, status: int, message: str):
-        super().__init__(message)
-        self.status = status
-
-
-class StitchOk(StitchError):
-    def __init__(self, message: Optional[str] = None):
-        super().__init__(
-            cv2.Stitcher_OK,
-            message if message else "Stitch successful",
-        )
-
-
-class NeedMoreImagesError(StitchError):
-    def __init__(self, message: Optional[str] = None):
-        super().__init__(
-            cv2.Stitcher_ERR_NEED_MORE_IMGS,
-            message if message else "Need more images",
-        )
-
-
-class HomographyEstimateError(StitchError):
-    def __init__(self, message: Optional[str] = None):
-        super().__init__(
-            cv2.Stitcher_ERR_HOMOGRAPHY_EST_FAIL,
-            message if message else "Homography estimate fail",
-        )
-
-
-class CameraParamsAdjustError(StitchError):
-    def __init__(self, message: Optional[str] = None):
-        super().__init__(
-            cv2.Stitcher_ERR_CAMERA_PARAMS_ADJUST_FAIL,
-            message if message else "Camera params adjust fail",
-        )
+__all__ = [
+    "CameraParamsAdjustError",
+    "HomographyEstimateError",
+    "NeedMoreImagesError",
+    "StitchError",
+    "StitchOk",
+    "Stitcher",
+]
 
 
 class Stitcher:
@@ -59,12 +45,16 @@ class Stitcher:
 
     parts: OrderedDict[str, StitcherPart]
     result: Optional[NDArray]
+    calibration: Optional[StitchCalibration]
 
-    def __init__(self, props: StitcherProps):
+    def __init__(self, props: StitcherProps, cache: Optional[Cache] = None):
         self.props = props
         self.stitcher = cv2.Stitcher.create(self.props.stitcher_mode)
         self.parts = OrderedDict()
         self.result = None
+        self.cache = cache
+        self.calibration = None
+        self.composed_frames = 0
 
     def clear_images(self) -> None:
         self.parts.clear()
@@ -88,6 +78,80 @@ class Stitcher:
     def change_mode(self) -> None:
         self.stitcher = cv2.Stitcher.create(self.props.stitcher_mode)
 
+    def frame_names(self, count: int) -> List[str]:
+        if len(self.parts) == count:
+            return self.keys
+        return [str(i) for i in range(count)]
+
+    def frames_key(self, frames: Sequence[NDArray]) -> str:
+        names = self.frame_names(len(frames))
+        sizes = [(frame.shape[1], frame.shape[0]) for frame in frames]
+        return calibration_key(names, sizes, self.props)
+
+    def calibrate(self, frames: Optional[Sequence[NDArray]] = None):
+        images = self.images if frames is None else list(frames)
+        calibration = calibrate(images, self.frame_names(len(images)), self.props)
+        if self.cache is not None:
+            self.cache.save_stitching(calibration.key, calibration.to_bytes())
+
+        self.calibration = calibration
+        self.composed_frames = 0
+        return calibration
+
+    def load_calibration(self, key: str) -> Optional[StitchCalibration]:
+        if self.cache is None or not self.cache.has_stitching(key):
+            return None
+
+        try:
+            calibration = StitchCalibration.from_bytes(self.cache.load_stitching(key))
+        except BaseException as e:
+            logger.error(f"Failed to load the stitching calibration '{key}': {e}")
+            return None
+
+        self.calibration = calibration
+        self.composed_frames = 0
+        return calibration
+
+    def is_drifted(self, frames: Sequence[NDArray]) -> bool:
+        assert self.calibration is not None
+        interval = self.props.drift_check_interval
+        if interval <= 0 or self.composed_frames == 0:
+            return False
+        if self.composed_frames % interval != 0:
+            return False
+
+        confidence = self.calibration.measure_confidence(frames, self.props)
+        threshold = self.calibration.confidence * self.props.drift_ratio
+        if confidence >= threshold:
+            return False
+
+        logger.warning(
+            f"The match confidence of the stitching calibration dropped"
+            f" from {self.calibration.confidence:.03f} to {confidence:.03f}"
+        )
+        return True
+
+    def compose(self, frames: Sequence[NDArray]) -> NDArray:
+        """
+        Stitches a set of frames of a fixed camera rig.
+
+        The rig is calibrated on the first call (or loaded from the cache), then
+        every call only remaps and blends the frames. The calibration is redone
+        when the rig or the props change, or when the match confidence drifts.
+        """
+
+        key = self.frames_key(frames)
+        if self.calibration is None or self.calibration.key != key:
+            if self.load_calibration(key) is None:
+                self.calibrate(frames)
+        elif self.is_drifted(frames):
+            self.calibrate(frames)
+
+        assert self.calibration is not None
+        self.result = self.calibration.compose(frames)
+        self.composed_frames += 1
+        return self.result
+
     def stitch(self) -> NDArray:
         status, self.result = self.stitcher.stitch(self.images)
         if status == cv2.Stitcher_OK:
@@ -273,8 +337,7 @@ class Stitcher:
             pixels = height * width
 
             if not is_compose_scale_set:
-                if compose_mega_pixel > 0:
-                    compose_scale = min(1.0, np.sqrt(compose_mega_pixel * 1e6 / pixels))
+                compose_scale = compose_megapixel_scale(compose_mega_pixel, pixels)
                 is_compose_scale_set = True
                 compose_work_aspect = compose_scale / work_scale
                 warped_image_scale *= compose_work_aspect
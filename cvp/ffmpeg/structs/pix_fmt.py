@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
 from io import StringIO
 from subprocess import check_output
-from typing import Final, List, NamedTuple, Sequence
+from typing import Dict, Final, List, NamedTuple, Sequence
 
 # noinspection SpellCheckingInspection
 _FFMPEG_PIX_FMTS_STDOUT_SAMPLE = """
@@ -225,6 +226,8 @@ FFMPEG_PIX_FMTS_HEADER_LINES: Final[Sequence[str]] = (
 )
 """Skip unnecessary header lines in `ffmpeg -hide_banner -pix_fmts` command."""
 
+FFMPEG_PIX_FMTS_SEPARATOR: Final[str] = "-----"
+
 
 class PixFmt(NamedTuple):
     supported_input_format: bool
@@ -274,8 +277,11 @@ def parse_fix_fmts_output(text: str) -> List[PixFmt]:
     begin = len(FFMPEG_PIX_FMTS_HEADER_LINES)
     lines = lines[begin:]
 
+    if lines and lines[0] == FFMPEG_PIX_FMTS_SEPARATOR:
+        lines = lines[1:]
+
     # [IMPORTANT] Do not use strip
-    return [PixFmt.from_format_line(line) for line in lines]
+    return [PixFmt.from_format_line(line) for line in lines if line]
 
 
 def inspect_pix_fmts(ffmpeg="ffmpeg") -> List[PixFmt]:
@@ -295,3 +301,17 @@ def find_pix_fmt(pixel_format: str, ffmpeg="ffmpeg") -> PixFmt:
 
 def find_bits_per_pixel(pixel_format: str, ffmpeg="ffmpeg") -> int:
     return find_pix_fmt(pixel_format, ffmpeg).bits_per_pixel
+
+
+@lru_cache
+def default_pix_fmts() -> Dict[str, PixFmt]:
+    # [IMPORTANT] Only the leading newline of the sample is removed.
+    pix_fmts = parse_fix_fmts_output(_FFMPEG_PIX_FMTS_STDOUT_SAMPLE.lstrip("\n"))
+    return {pix_fmt.name: pix_fmt for pix_fmt in pix_fmts}
+
+
+def find_default_pix_fmt(pixel_format: str) -> PixFmt:
+    try:
+        return default_pix_fmts()[pixel_format]
+    except KeyError:
+        raise IndexError(f"Not found pixel format: {pixel_format}")
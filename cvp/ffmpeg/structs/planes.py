@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Final, NamedTuple, Tuple
+
+from cvp.ffmpeg.structs.pix_fmt import find_default_pix_fmt
+
+
+class PlaneLayout(NamedTuple):
+    width_shift: int
+    """Horizontal subsampling (log2) of the plane."""
+
+    height_shift: int
+    """Vertical subsampling (log2) of the plane."""
+
+    channels: int
+    """Number of interleaved 8-bit samples per pixel of the plane."""
+
+
+class PlaneShape(NamedTuple):
+    width: int
+    height: int
+    channels: int
+
+    @property
+    def size(self):
+        return self.width * self.height * self.channels
+
+
+_LUMA: Final[PlaneLayout] = PlaneLayout(0, 0, 1)
+_CHROMA_420: Final[PlaneLayout] = PlaneLayout(1, 1, 1)
+_CHROMA_422: Final[PlaneLayout] = PlaneLayout(1, 0, 1)
+_CHROMA_444: Final[PlaneLayout] = PlaneLayout(0, 0, 1)
+_INTERLEAVED_CHROMA_420: Final[PlaneLayout] = PlaneLayout(1, 1, 2)
+
+PLANAR_LAYOUTS: Final[Dict[str, Tuple[PlaneLayout, ...]]] = {
+    "yuv420p": (_LUMA, _CHROMA_420, _CHROMA_420),
+    "yuvj420p": (_LUMA, _CHROMA_420, _CHROMA_420),
+    "yuv422p": (_LUMA, _CHROMA_422, _CHROMA_422),
+    "yuvj422p": (_LUMA, _CHROMA_422, _CHROMA_422),
+    "yuv444p": (_LUMA, _CHROMA_444, _CHROMA_444),
+    "yuvj444p": (_LUMA, _CHROMA_444, _CHROMA_444),
+    "nv12": (_LUMA, _INTERLEAVED_CHROMA_420),
+    "nv21": (_LUMA, _INTERLEAVED_CHROMA_420),
+}
+"""8-bit planar formats whose planes are written back to back by rawvideo."""
+
+FULL_RANGE_PIX_FMTS: Final[Tuple[str, ...]] = ("yuvj420p", "yuvj422p", "yuvj444p")
+
+
+def ceil_rshift(value: int, shift: int) -> int:
+    # Same as the AV_CEIL_RSHIFT macro of FFmpeg.
+    return -((-value) >> shift)
+
+
+def is_planar(pixel_format: str) -> bool:
+    return pixel_format in PLANAR_LAYOUTS
+
+
+def packed_channels(pixel_format: str) -> int:
+    pix_fmt = find_default_pix_fmt(pixel_format)
+    if pix_fmt.bitstream_format or pix_fmt.hardware_accelerated_format:
+        raise ValueError(f"Unsupported pixel format: {pixel_format}")
+    if pix_fmt.bits_per_pixel <= 0 or pix_fmt.bits_per_pixel % 8 != 0:
+        raise ValueError(f"Not a byte-aligned packed pixel format: {pixel_format}")
+    return pix_fmt.bits_per_pixel // 8
+
+
+def plane_shapes(
+    pixel_format: str,
+    width: int,
+    height: int,
+) -> Tuple[PlaneShape, ...]:
+    layouts = PLANAR_LAYOUTS.get(pixel_format)
+    if layouts is None:
+        return (PlaneShape(width, height, packed_channels(pixel_format)),)
+
+    return tuple(
+        PlaneShape(
+            ceil_rshift(width, layout.width_shift),
+            ceil_rshift(height, layout.height_shift),
+            layout.channels,
+        )
+        for layout in layouts
+    )
+
+
+def frame_size(pixel_format: str, width: int, height: int) -> int:
+    return sum(plane.size for plane in plane_shapes(pixel_format, width, height))
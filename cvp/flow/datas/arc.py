@@ -1,17 +1,24 @@
 # -*- coding: utf-8 -*-
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Hashable, List, Optional, Sequence, Tuple
 from uuid import uuid4
 
+import numpy as np
+from numpy.typing import NDArray
+
 from cvp.flow.datas.anchor import Anchor
 from cvp.flow.datas.line_type import LineType
 from cvp.flow.datas.node_pin import NodePin
-from cvp.maths.bezier.casteljau.cubic import bezier_cubic_casteljau_points
+from cvp.maths.bezier.cubic import bezier_cubic_array, bezier_cubic_segments
 from cvp.types.shapes import Point, Rect
 from cvp.variables import BEZIER_CURVE_TESSELLATION_TOL
 
 
+def to_points(array: NDArray[np.float64]) -> List[Point]:
+    return [(x, y) for x, y in array.tolist()]
+
+
 @dataclass
 class Arc:
     uuid: str = field(default_factory=lambda: str(uuid4()))
@@ -29,6 +36,8 @@ class Arc:
     _hovering: bool = False
 
     _polyline: List[Point] = field(default_factory=list)
+    _polyline_key: Optional[Hashable] = None
+    _polyline_roi: Optional[Rect] = None
 
     @classmethod
     def from_connect_pair(
@@ -97,14 +106,22 @@ class Arc:
     @polyline.setter
     def polyline(self, value: List[Point]) -> None:
         self._polyline = value
+        self._polyline_key = None
+        self._polyline_roi = None
+
+    @property
+    def polyline_key(self):
+        return self._polyline_key
 
     def get_polyline_roi(self) -> Rect:
         if not self._polyline:
             raise ValueError("The 'polyline' attribute is empty")
 
-        xs = [p[0] for p in self._polyline]
-        ys = [p[1] for p in self._polyline]
-        return min(xs), min(ys), max(xs), max(ys)
+        if self._polyline_roi is None:
+            xs = [p[0] for p in self._polyline]
+            ys = [p[1] for p in self._polyline]
+            self._polyline_roi = min(xs), min(ys), max(xs), max(ys)
+        return self._polyline_roi
 
     def get_bezier_cubic_anchors(self) -> Tuple[Point, Point]:
         if len(self.polyline) < 2:
@@ -122,10 +139,35 @@ class Arc:
 
         return p1, p2
 
-    def update_polyline(self, tess_tol=BEZIER_CURVE_TESSELLATION_TOL) -> None:
-        points = self.calc_polyline(tess_tol)
+    def calc_polyline_key(self, tess_tol=BEZIER_CURVE_TESSELLATION_TOL) -> Hashable:
+        # The polyline only depends on the pin positions, the anchors, the line
+        # type and the tolerance, so an unchanged key means a valid polyline.
+        match self.line_type:
+            case LineType.linear:
+                return self.line_type, tuple(self.calc_linear_polyline())
+            case LineType.bezier_cubic:
+                return self.line_type, tess_tol, self.calc_bezier_cubic_controls()
+            case _:
+                assert False, "Inaccessible section"
+
+    def is_polyline_expired(self, tess_tol=BEZIER_CURVE_TESSELLATION_TOL) -> bool:
+        if not self._polyline:
+            return True
+        return self._polyline_key != self.calc_polyline_key(tess_tol)
+
+    def set_polyline(
+        self,
+        points: Sequence[Point],
+        key: Optional[Hashable] = None,
+    ) -> None:
         self._polyline.clear()
         self._polyline.extend(points)
+        self._polyline_key = key
+        self._polyline_roi = None
+
+    def update_polyline(self, tess_tol=BEZIER_CURVE_TESSELLATION_TOL) -> None:
+        points = self.calc_polyline(tess_tol)
+        self.set_polyline(points, self.calc_polyline_key(tess_tol))
 
     def calc_polyline(self, tess_tol=BEZIER_CURVE_TESSELLATION_TOL) -> List[Point]:
         match self.line_type:
@@ -158,10 +200,7 @@ class Arc:
 
         return [sp, ep]
 
-    def calc_bezier_cubic_polyline(
-        self,
-        tess_tol=BEZIER_CURVE_TESSELLATION_TOL,
-    ) -> List[Point]:
+    def calc_bezier_cubic_controls(self) -> Tuple[Point, Point, Point, Point]:
         points = self.calc_linear_polyline()
         assert 2 == len(points)
         sx, sy = sp = points[0]
@@ -170,4 +209,12 @@ class Arc:
         p2 = sx + sax, sy + say
         eax, eay = self.end_anchor.point
         p3 = ex + eax, ey + eay
-        return bezier_cubic_casteljau_points(sp, p2, p3, ep, tess_tol)
+        return sp, p2, p3, ep
+
+    def calc_bezier_cubic_polyline(
+        self,
+        tess_tol=BEZIER_CURVE_TESSELLATION_TOL,
+    ) -> List[Point]:
+        controls = self.calc_bezier_cubic_controls()
+        num_segments = int(bezier_cubic_segments(controls, tess_tol))
+        return to_points(bezier_cubic_array(controls, num_segments))
@@ -1,30 +1,50 @@
 # -*- coding: utf-8 -*-
 
 from dataclasses import dataclass, field, fields
-from math import sqrt
-from typing import Final, List, Optional, Sequence, Set, Union
+from math import ceil, log2, sqrt
+from typing import (
+    Dict,
+    Final,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
 
+import numpy as np
 import shapely
 
 from cvp.flow.datas.action import Action
 from cvp.flow.datas.anchor import Anchor
-from cvp.flow.datas.arc import Arc
+from cvp.flow.datas.arc import Arc, to_points
 from cvp.flow.datas.connect_pair import ConnectPair
 from cvp.flow.datas.dtype import DataType
 from cvp.flow.datas.node import Node
 from cvp.flow.datas.node_pin import NodePin
 from cvp.flow.datas.pin import Pin
 from cvp.flow.datas.selected_items import SelectableAny, SelectedItems
+from cvp.flow.datas.spatial import GraphSpatialIndex
 from cvp.flow.datas.stream import Stream
 from cvp.flow.datas.style import Style
 from cvp.flow.datas.view import View
+from cvp.maths.bezier.cubic import bezier_cubic_batch
 from cvp.types.colors import RGBA
-from cvp.types.shapes import Point, Size
+from cvp.types.shapes import Point, Rect, Size
 
 DEFAULT_GRAPH_COLOR: Final[RGBA] = 0.5, 0.5, 0.5, 1.0
 
 
+def zoom_level_scale(zoom: float) -> float:
+    if zoom <= 0:
+        return 1.0
+    return 2.0 ** ceil(log2(zoom))
+
+
 @dataclass
 class Graph:
     uuid: str = field(default_factory=lambda: str(uuid4()))
@@ -38,6 +58,7 @@ class Graph:
     style: Style = field(default_factory=Style)
 
     _selected_items: SelectedItems = field(default_factory=SelectedItems)
+    _spatial_index: GraphSpatialIndex = field(default_factory=GraphSpatialIndex)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Graph):
@@ -53,6 +74,14 @@ class Graph:
     def selected_items(self):
         return self._selected_items
 
+    @property
+    def spatial_index(self) -> GraphSpatialIndex:
+        self._spatial_index.sync(self.nodes, self.arcs)
+        return self._spatial_index
+
+    def update_node_bounds(self, node: Node) -> None:
+        self._spatial_index.update_node(node)
+
     @property
     def selected_arc_only(self) -> Optional[Arc]:
         return self._selected_items.selected_arc_only
@@ -92,15 +121,40 @@ class Graph:
 
     def find_hovering_node_with_mouse(self, mouse: Point) -> Optional[Node]:
         mx, my = mouse
-        for node in self.nodes:
+        candidates = list()
+        for node in self.spatial_index.nodes_at(mouse):
             x1, y1, x2, y2 = node.node_roi
             left = min(x1, x2)
             right = max(x1, x2)
             top = min(y1, y2)
             bottom = max(y1, y2)
             if left <= mx <= right and top <= my <= bottom:
-                return node
-        return None
+                candidates.append(node)
+
+        if len(candidates) >= 2:
+            # Overlapping nodes: keep the first one in the order of the graph.
+            return min(candidates, key=self.nodes.index)
+        return candidates[0] if candidates else None
+
+    def find_nodes_in_roi(self, roi: Rect) -> List[Node]:
+        x1, y1, x2, y2 = roi
+        left = min(x1, x2)
+        right = max(x1, x2)
+        top = min(y1, y2)
+        bottom = max(y1, y2)
+
+        candidates = self.spatial_index.nodes_in(roi)
+        result = list()
+        for node in self.nodes:
+            if node.uuid not in candidates:
+                continue
+
+            nx1, ny1, nx2, ny2 = node.node_roi
+            x_in = left <= nx1 <= right or left <= nx2 <= right
+            y_in = top <= ny1 <= bottom or top <= ny2 <= bottom
+            if x_in and y_in:
+                result.append(node)
+        return result
 
     def find_hovering_node(self) -> Optional[Node]:
         for node in self.nodes:
@@ -128,7 +182,7 @@ class Graph:
         distance_tolerance: float,
     ) -> Optional[Arc]:
         mp = shapely.Point(mouse)
-        for arc in self.arcs:
+        for arc in self.spatial_index.arcs_near(mouse, distance_tolerance):
             distance = shapely.LineString(arc.polyline).distance(mp)
             if distance <= distance_tolerance:
                 return arc
@@ -269,17 +323,24 @@ class Graph:
         if dx == 0 and dy == 0:
             return
 
+        arcs = {arc.uuid: arc for arc in self.arcs}
+        moved_arcs: Dict[str, Arc] = dict()
+
         for node in self.nodes:
             if not node.selected:
                 continue
 
             x, y = node.node_pos
             node.node_pos = x + dx, y + dy
+            self._spatial_index.update_node(node)
 
             for pin in node.pins:
                 for arc_uuid in pin.arcs:
-                    if arc := self.find_arc(arc_uuid):
-                        self.update_arc_polyline(arc, force=True)
+                    if arc := arcs.get(arc_uuid):
+                        moved_arcs[arc_uuid] = arc
+
+        # Only the arcs touching the moved nodes are tessellated, in one batch.
+        self.tessellate_arcs(moved_arcs.values())
 
     def move_on_selected_anchor(self, delta: Size) -> None:
         dx, dy = delta
@@ -374,23 +435,47 @@ class Graph:
         else:
             return True
 
-    def update_arcs_polyline(self, *, force=False) -> None:
-        for arc in self.arcs:
-            self.update_arc_polyline(arc, force=force)
-
-    def update_arc_polyline(self, arc: Arc, *, force=False) -> None:
-        if not force and arc.polyline:
+    @property
+    def tess_tol(self) -> float:
+        # The tolerance is given in screen pixels, so the arcs get more segments
+        # when zoomed in. The zoom is quantized to powers of 2 so that zooming
+        # does not re-tessellate the arcs on every frame.
+        return self.style.bezier_curve_tess_tol / zoom_level_scale(self.view.zoom)
+
+    def tessellate_arcs(self, arcs: Iterable[Arc], *, force=False) -> None:
+        tess_tol = self.tess_tol
+        expired: List[Tuple[Arc, Hashable]] = list()
+
+        for arc in arcs:
+            if arc.output is None:
+                self.update_arc_output(arc)
+            if arc.input is None:
+                self.update_arc_input(arc)
+
+            key = arc.calc_polyline_key(tess_tol)
+            if force or not arc.polyline or arc.polyline_key != key:
+                expired.append((arc, key))
+
+        if not expired:
             return
 
-        if arc.output is None:
-            self.update_arc_output(arc)
+        curves = [(a, k) for a, k in expired if a.is_bezier_cubic_line_type]
+        if curves:
+            controls = np.array([a.calc_bezier_cubic_controls() for a, _ in curves])
+            polylines = bezier_cubic_batch(controls, tess_tol)
+            for (arc, key), polyline in zip(curves, polylines):
+                arc.set_polyline(to_points(polyline), key)
 
-        if arc.input is None:
-            self.update_arc_input(arc)
+        for arc, key in expired:
+            if not arc.is_bezier_cubic_line_type:
+                arc.set_polyline(arc.calc_polyline(tess_tol), key)
+            self._spatial_index.update_arc(arc)
 
-        assert arc.output is not None
-        assert arc.input is not None
-        arc.update_polyline(self.style.bezier_curve_tess_tol)
+    def update_arcs_polyline(self, *, force=False) -> None:
+        self.tessellate_arcs(self.arcs, force=force)
+
+    def update_arc_polyline(self, arc: Arc, *, force=False) -> None:
+        self.tessellate_arcs((arc,), force=force)
 
     def connect_pins(
         self,
@@ -402,8 +487,9 @@ class Graph:
         if not no_reorder:
             out_conn, in_conn = self.reorder_connectable_pins(out_conn, in_conn)
 
-        arc = Arc.from_connect_pair(out_conn, in_conn, self.style.bezier_curve_tess_tol)
+        arc = Arc.from_connect_pair(out_conn, in_conn, self.tess_tol)
         self.arcs.append(arc)
+        self._spatial_index.update_arc(arc)
         out_conn.pin.arcs.append(arc.uuid)
         in_conn.pin.arcs.append(arc.uuid)
 
@@ -434,6 +520,7 @@ class Graph:
         if arc.output:
             arc.output.pin.arcs.remove(arc.uuid)
         self.arcs.remove(arc)
+        self._spatial_index.remove_arc(arc)
 
     def remove_selected_arcs(self) -> None:
         for arc in self.find_selected_arcs():
@@ -445,6 +532,7 @@ class Graph:
                 if arc := self.find_arc(arc_uuid):
                     self.remove_arc(arc)
         self.nodes.remove(node)
+        self._spatial_index.remove_node(node)
 
     def remove_selected_nodes(self) -> None:
         for node in self.find_selected_nodes():
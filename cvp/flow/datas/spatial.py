@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, List, Optional, Set
+
+from cvp.containers.spatial_grid import SpatialGrid
+from cvp.flow.datas.arc import Arc
+from cvp.flow.datas.node import Node
+from cvp.types.shapes import Point, Rect
+from cvp.variables import FLOW_SPATIAL_CELL_SIZE
+
+
+def node_bounds(node: Node) -> Rect:
+    # Pin icons may stick out of the node, so they are included in the bounds.
+    x1, y1, x2, y2 = node.node_roi
+    left, top = min(x1, x2), min(y1, y2)
+    right, bottom = max(x1, x2), max(y1, y2)
+
+    nx, ny = node.node_pos
+    for pin in node.pins:
+        px1, py1, px2, py2 = pin.icon_roi
+        left = min(left, nx + px1, nx + px2)
+        top = min(top, ny + py1, ny + py2)
+        right = max(right, nx + px1, nx + px2)
+        bottom = max(bottom, ny + py1, ny + py2)
+
+    return left, top, right, bottom
+
+
+def arc_bounds(arc: Arc) -> Optional[Rect]:
+    return arc.get_polyline_roi() if arc.polyline else None
+
+
+class GraphSpatialIndex:
+    """
+    Bounding boxes of the nodes (including their pins) and the arc polylines
+    of a graph, keyed by UUID, for hover and selection queries.
+    """
+
+    _nodes: Dict[str, Node]
+    _arcs: Dict[str, Arc]
+
+    def __init__(self, cell_size=FLOW_SPATIAL_CELL_SIZE):
+        self._node_grid = SpatialGrid[str](cell_size)
+        self._arc_grid = SpatialGrid[str](cell_size)
+        self._nodes = dict()
+        self._arcs = dict()
+
+    @property
+    def node_grid(self):
+        return self._node_grid
+
+    @property
+    def arc_grid(self):
+        return self._arc_grid
+
+    def clear(self) -> None:
+        self._node_grid.clear()
+        self._arc_grid.clear()
+        self._nodes.clear()
+        self._arcs.clear()
+
+    def update_node(self, node: Node) -> None:
+        self._nodes[node.uuid] = node
+        self._node_grid.insert(node.uuid, node_bounds(node))
+
+    def remove_node(self, node: Node) -> None:
+        self._nodes.pop(node.uuid, None)
+        self._node_grid.remove(node.uuid)
+
+    def update_arc(self, arc: Arc) -> None:
+        self._arcs[arc.uuid] = arc
+        bounds = arc_bounds(arc)
+        if bounds is None:
+            self._arc_grid.remove(arc.uuid)
+        else:
+            self._arc_grid.insert(arc.uuid, bounds)
+
+    def remove_arc(self, arc: Arc) -> None:
+        self._arcs.pop(arc.uuid, None)
+        self._arc_grid.remove(arc.uuid)
+
+    def sync(self, nodes: List[Node], arcs: List[Arc]) -> None:
+        # Cheap check for items added to or removed from the lists directly.
+        if len(self._nodes) != len(nodes):
+            self._node_grid.clear()
+            self._nodes.clear()
+            for node in nodes:
+                self.update_node(node)
+
+        if len(self._arcs) != len(arcs):
+            self._arc_grid.clear()
+            self._arcs.clear()
+            for arc in arcs:
+                self.update_arc(arc)
+
+    def nodes_at(self, point: Point) -> List[Node]:
+        return [self._nodes[k] for k in self._node_grid.query_point(*point)]
+
+    def nodes_in(self, rect: Rect) -> Set[str]:
+        return self._node_grid.query_rect(rect)
+
+    def arcs_near(self, point: Point, tolerance: float) -> List[Arc]:
+        x, y = point
+        rect = x - tolerance, y - tolerance, x + tolerance, y + tolerance
+        return [self._arcs[k] for k in self._arc_grid.query_rect(rect)]
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, NamedTuple, Tuple
+
+from cvp.flow.datas.graph import Graph
+from cvp.flow.datas.node import Node
+from cvp.flow.datas.pin import Pin
+
+
+class DataSource(NamedTuple):
+    node: str
+    """UUID of the node that produces the value."""
+
+    pin: str
+    """Name of the output data pin."""
+
+
+@dataclass
+class PlanStep:
+    node: Node
+    inputs: Dict[str, DataSource] = field(default_factory=dict)
+    """Connected input data pins, by pin name."""
+
+    predecessors: List[str] = field(default_factory=list)
+    successors: List[str] = field(default_factory=list)
+    level: int = 0
+
+    @property
+    def uuid(self):
+        return self.node.uuid
+
+
+@dataclass
+class FlowPlan:
+    signature: Hashable
+    steps: Dict[str, PlanStep]
+    """Steps in topological order, by node UUID."""
+
+    @property
+    def order(self) -> List[str]:
+        return list(self.steps.keys())
+
+    @property
+    def levels(self) -> List[List[str]]:
+        # Nodes of the same level do not depend on each other.
+        result: List[List[str]] = list()
+        for step in self.steps.values():
+            while len(result) <= step.level:
+                result.append(list())
+            result[step.level].append(step.uuid)
+        return result
+
+    @property
+    def roots(self) -> List[str]:
+        return [step.uuid for step in self.steps.values() if not step.predecessors]
+
+
+def graph_signature(graph: Graph) -> Hashable:
+    # Only the nodes and the connections of the pins affect the plan.
+    return tuple(
+        (node.uuid, tuple((pin.name, pin.stream, tuple(pin.arcs)) for pin in node.pins))
+        for node in graph.nodes
+    )
+
+
+def compile_graph(graph: Graph) -> FlowPlan:
+    outputs: Dict[str, Tuple[Node, Pin]] = dict()
+    inputs: Dict[str, Tuple[Node, Pin]] = dict()
+
+    for node in graph.nodes:
+        for pin in node.output_pins:
+            for arc_uuid in pin.arcs:
+                outputs[arc_uuid] = node, pin
+        for pin in node.input_pins:
+            for arc_uuid in pin.arcs:
+                inputs[arc_uuid] = node, pin
+
+    steps = {node.uuid: PlanStep(node) for node in graph.nodes}
+
+    for arc_uuid, (in_node, in_pin) in inputs.items():
+        output = outputs.get(arc_uuid)
+        if output is None:
+            raise ValueError(f"Could not find the output pin of the arc: {arc_uuid}")
+
+        out_node, out_pin = output
+        if out_node.uuid == in_node.uuid:
+            raise ValueError(f"The node '{in_node.name}' is connected to itself")
+
+        in_step = steps[in_node.uuid]
+        out_step = steps[out_node.uuid]
+
+        if in_pin.is_data_action:
+            in_step.inputs[in_pin.name] = DataSource(out_node.uuid, out_pin.name)
+
+        if out_node.uuid not in in_step.predecessors:
+            in_step.predecessors.append(out_node.uuid)
+            out_step.successors.append(in_node.uuid)
+
+    # Kahn's algorithm, keeping the order of the graph nodes between siblings.
+    remains = {uuid: len(step.predecessors) for uuid, step in steps.items()}
+    ready = [uuid for uuid, count in remains.items() if count == 0]
+    ordered: Dict[str, PlanStep] = dict()
+
+    while ready:
+        uuid = ready.pop(0)
+        step = steps[uuid]
+        ordered[uuid] = step
+
+        for successor_uuid in step.successors:
+            successor = steps[successor_uuid]
+            successor.level = max(successor.level, step.level + 1)
+            remains[successor_uuid] -= 1
+            if remains[successor_uuid] == 0:
+                ready.append(successor_uuid)
+
+    if len(ordered) != len(steps):
+        cycle = [steps[uuid].node.name for uuid in steps if uuid not in ordered]
+        raise ValueError(f"The flow graph has a cycle: {cycle}")
+
+    return FlowPlan(graph_signature(graph), ordered)
@@ -1,5 +1,282 @@
 # -*- coding: utf-8 -*-
 
+from collections import deque
+from concurrent.futures import CancelledError, Executor, Future
+from dataclasses import dataclass
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from cvp.flow.datas.graph import Graph
+from cvp.flow.datas.node import Node
+from cvp.flow.plan import FlowPlan, PlanStep, compile_graph, graph_signature
+from cvp.process.manager import ProcessManager
+
+PinValues = Dict[str, Any]
+FlowInputs = Mapping[str, Mapping[str, Any]]
+FlowResult = Dict[str, PinValues]
+NodeCallable = Callable[[PinValues], Optional[Mapping[str, Any]]]
+
+
+@dataclass
+class NodeBinding:
+    fn: NodeCallable
+    process: bool = False
+    """Run in the process pool; ``fn`` and the pin values must be picklable."""
+
+
+class _Execution:
+    """
+    Runs one pass of a plan. Every node is submitted as soon as all of its
+    predecessors are done, so independent branches run concurrently.
+
+    :meth:`cancel` stops the pass between node steps: queued nodes are
+    cancelled, running nodes finish, and no successor is submitted.
+    """
+
+    _nodes: Set[Future]
+
+    def __init__(self, runner: "FlowRunner", plan: FlowPlan, inputs: FlowInputs):
+        self._runner = runner
+        self._plan = plan
+        self._inputs = inputs
+        self._results: FlowResult = dict()
+        self._remains = {k: len(s.predecessors) for k, s in plan.steps.items()}
+        self._pending = len(plan.steps)
+        self._lock = Lock()
+        self._future: Future[FlowResult] = Future()
+        self._nodes = set()
+        self._cancelled = False
+
+    @property
+    def future(self):
+        return self._future
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            nodes = list(self._nodes)
+        for node in nodes:
+            node.cancel()
+        self._fail(CancelledError())
+
+    def start(self) -> Future[FlowResult]:
+        self._future.set_running_or_notify_cancel()
+        if not self._plan.steps:
+            self._future.set_result(self._results)
+            return self._future
+
+        for uuid in self._plan.roots:
+            self._submit(self._plan.steps[uuid])
+        return self._future
+
+    def _collect(self, step: PlanStep) -> PinValues:
+        values: PinValues = dict(self._inputs.get(step.node.name, dict()))
+        values.update(self._inputs.get(step.uuid, dict()))
+        for pin_name, source in step.inputs.items():
+            values[pin_name] = self._results[source.node].get(source.pin)
+
+        for pin in step.node.data_inputs:
+            if pin.required and values.get(pin.name) is None:
+                node_name = step.node.name
+                raise ValueError(f"Required pin '{node_name}.{pin.name}' has no value")
+
+        return values
+
+    def _submit(self, step: PlanStep) -> None:
+        try:
+            with self._lock:
+                if self._cancelled:
+                    return
+                values = self._collect(step)
+                future = self._runner.submit_node(step.node, values)
+                self._nodes.add(future)
+        except BaseException as e:
+            self._fail(e)
+        else:
+            future.add_done_callback(lambda f: self._on_done(step, f))
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            if self._future.done():
+                return
+            self._future.set_exception(error)
+
+    def _on_done(self, step: PlanStep, future: Future) -> None:
+        with self._lock:
+            self._nodes.discard(future)
+
+        if self._future.done():
+            return
+
+        try:
+            outputs = future.result()
+        except BaseException as e:
+            self._fail(e)
+            return
+
+        ready = list()
+        with self._lock:
+            self._results[step.uuid] = dict(outputs) if outputs else dict()
+            self._pending -= 1
+            for successor in step.successors:
+                self._remains[successor] -= 1
+                if self._remains[successor] == 0:
+                    ready.append(self._plan.steps[successor])
+            finished = self._pending == 0
+
+        if finished:
+            if not self._future.done():
+                self._future.set_result(self._results)
+            return
+
+        for successor_step in ready:
+            self._submit(successor_step)
+
 
 class FlowRunner:
-    pass
+    """
+    Executes flow graphs as dataflow pipelines.
+
+    Each node is bound to a callable (by node UUID or by node name) that
+    receives its input data pins by pin name and returns its output data pins.
+    Flow arcs only order the nodes, data arcs also carry the values.
+    """
+
+    _bindings: Dict[str, NodeBinding]
+    _plans: Dict[str, FlowPlan]
+
+    def __init__(
+        self,
+        thread_pool: Executor,
+        process_pool: Optional[Executor] = None,
+    ):
+        self._thread_pool = thread_pool
+        self._process_pool = process_pool
+        self._bindings = dict()
+        self._plans = dict()
+
+    @classmethod
+    def from_process_manager(cls, pm: ProcessManager):
+        return cls(pm.thread_pool, pm.process_pool)
+
+    @property
+    def bindings(self):
+        return self._bindings
+
+    def bind(self, key: str, fn: NodeCallable, *, process=False) -> None:
+        if process and self._process_pool is None:
+            raise ValueError("The process pool is not available")
+        self._bindings[key] = NodeBinding(fn, process)
+
+    def unbind(self, key: str) -> None:
+        self._bindings.pop(key, None)
+
+    def find_binding(self, node: Node) -> NodeBinding:
+        binding = self._bindings.get(node.uuid)
+        if binding is None:
+            binding = self._bindings.get(node.name)
+        if binding is None:
+            raise KeyError(f"No callable is bound to the node: '{node.name}'")
+        return binding
+
+    def submit_node(self, node: Node, values: PinValues) -> Future:
+        binding = self.find_binding(node)
+        if binding.process:
+            assert self._process_pool is not None
+            return self._process_pool.submit(binding.fn, values)
+        else:
+            return self._thread_pool.submit(binding.fn, values)
+
+    def compile(self, graph: Graph) -> FlowPlan:
+        # The plan is reused until the nodes or their connections change.
+        plan = self._plans.get(graph.uuid)
+        if plan is not None and plan.signature == graph_signature(graph):
+            return plan
+
+        plan = compile_graph(graph)
+        for step in plan.steps.values():
+            self.find_binding(step.node)
+
+        self._plans[graph.uuid] = plan
+        return plan
+
+    def invalidate(self, graph: Optional[Graph] = None) -> None:
+        if graph is None:
+            self._plans.clear()
+        else:
+            self._plans.pop(graph.uuid, None)
+
+    def submit(
+        self,
+        graph: Graph,
+        inputs: Optional[FlowInputs] = None,
+    ) -> Future[FlowResult]:
+        return self.execute(graph, inputs).future
+
+    def execute(
+        self,
+        graph: Graph,
+        inputs: Optional[FlowInputs] = None,
+    ) -> _Execution:
+        """Like :meth:`submit`, but the pass can be cancelled between node steps."""
+        plan = self.compile(graph)
+        execution = _Execution(self, plan, inputs if inputs else dict())
+        execution.start()
+        return execution
+
+    def run(
+        self,
+        graph: Graph,
+        inputs: Optional[FlowInputs] = None,
+        timeout: Optional[float] = None,
+    ) -> FlowResult:
+        return self.submit(graph, inputs).result(timeout)
+
+    def stream(
+        self,
+        graph: Graph,
+        frames: Iterable[FlowInputs],
+        max_inflight=2,
+    ) -> Iterator[Tuple[FlowInputs, FlowResult]]:
+        """
+        Runs the graph once per frame, overlapping up to ``max_inflight`` frames.
+
+        The frames are pulled from the iterable only when a slot is free, so a
+        slow pipeline applies back-pressure to the source instead of queuing
+        frames without bound. Results are yielded in the order of the frames.
+        When the stream is closed early or fails, the passes still in flight
+        are cancelled.
+        """
+
+        if max_inflight < 1:
+            raise ValueError("The 'max_inflight' argument must be at least 1")
+
+        inflight: Deque[Tuple[FlowInputs, _Execution]] = deque()
+        try:
+            for frame in frames:
+                inflight.append((frame, self.execute(graph, frame)))
+                if len(inflight) >= max_inflight:
+                    oldest, execution = inflight.popleft()
+                    yield oldest, execution.future.result()
+
+            while inflight:
+                oldest, execution = inflight.popleft()
+                yield oldest, execution.future.result()
+        finally:
+            for _, execution in inflight:
+                execution.cancel()
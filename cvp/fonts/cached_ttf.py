@@ -2,7 +2,7 @@
 
 from typing import Sequence
 
-from cvp.fonts.ranges import CodepointRange
+from cvp.fonts.ranges import CodepointRange, CodepointRangeIndex
 from cvp.fonts.ttf import TTF
 
 
@@ -10,6 +10,7 @@ class CachedTTF:
     def __init__(self, ttf: TTF, ranges: Sequence[CodepointRange], size: int):
         self._ttf = ttf
         self._ranges = list(ranges if ranges else ())
+        self._index = CodepointRangeIndex(self._ranges)
         self._size = size
 
     @property
@@ -25,7 +26,4 @@ class CachedTTF:
         return self._size
 
     def has_codepoint(self, codepoint: int) -> bool:
-        for begin, end in self._ranges:
-            if begin <= codepoint <= end:
-                return True
-        return False
+        return codepoint in self._index
@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
 
+from bisect import bisect_right
 from os import PathLike
-from typing import Final, List, NamedTuple, Sequence, SupportsIndex, Tuple, Union
+from typing import (
+    Final,
+    Iterable,
+    List,
+    NamedTuple,
+    Sequence,
+    SupportsIndex,
+    Tuple,
+    Union,
+)
 
 UNICODE_SINGLE_BLOCK_SIZE: Final[int] = 0x100
 COMMENT_PREFIX: Final[str] = "#"
@@ -33,6 +43,47 @@ class CodepointRange(NamedTuple):
         return result
 
 
+class CodepointRangeIndex:
+    """
+    Sorted and merged ranges, searched by bisection instead of a linear scan.
+    """
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]]):
+        self._begins: List[int] = list()
+        self._ends: List[int] = list()
+
+        for begin, end in sorted((min(r), max(r)) for r in ranges):
+            if self._ends and begin <= self._ends[-1] + 1:
+                self._ends[-1] = max(self._ends[-1], end)
+            else:
+                self._begins.append(begin)
+                self._ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self._begins)
+
+    def __iter__(self):
+        return (CodepointRange(b, e) for b, e in zip(self._begins, self._ends))
+
+    def __contains__(self, codepoint: int) -> bool:
+        index = bisect_right(self._begins, codepoint) - 1
+        return index >= 0 and codepoint <= self._ends[index]
+
+    def intersect(self, ranges: Iterable[Tuple[int, int]]) -> List[CodepointRange]:
+        """The parts of the ``ranges`` inside this index, in the given order."""
+        result = list()
+        for r in ranges:
+            begin, end = min(r), max(r)
+            index = max(bisect_right(self._begins, begin) - 1, 0)
+            while index < len(self._begins) and self._begins[index] <= end:
+                b = max(begin, self._begins[index])
+                e = min(end, self._ends[index])
+                if b <= e:
+                    result.append(CodepointRange(b, e))
+                index += 1
+        return result
+
+
 def read_ranges(path: Union[str, PathLike[str]]) -> List[CodepointRange]:
     result = list()
     with open(path, "rt") as file:
@@ -47,6 +98,10 @@ def read_ranges(path: Union[str, PathLike[str]]) -> List[CodepointRange]:
     return result
 
 
+def format_ranges(ranges: Sequence[CodepointRange]) -> str:
+    return "".join(f"0x{begin:06x} 0x{end:06x}\n" for begin, end in ranges)
+
+
 def flatten_ranges(ranges: Sequence[CodepointRange]) -> List[int]:
     result = list()
     for begin, end in ranges:
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import os
+from os import PathLike
+from pathlib import Path
+from tempfile import mkstemp
+from threading import Lock
+from typing import Dict, List, Tuple, Union
+
+from cvp.fonts.ranges import CodepointRange, format_ranges, read_ranges
+from cvp.fonts.ttf import TTF
+from cvp.hashfunc.checksum import Method
+from cvp.hashfunc.files import file_checksum
+from cvp.logging.logging import logger
+from cvp.variables import CODEPOINT_RANGES_EXTENSION
+
+_FileKey = Tuple[str, int, int]
+
+
+def file_digest(path: Union[str, PathLike[str]]) -> str:
+    return file_checksum(Method.sha256, path)
+
+
+class RangesCache:
+    """
+    Glyph ranges of font files, stored by the SHA-256 of the font file.
+
+    Computing the ranges walks the whole character map of the font, which is
+    slow for the CJK fonts. The digests are remembered per path, size and
+    modification time, so a font file is hashed once per process.
+    """
+
+    _digests: Dict[_FileKey, str]
+
+    def __init__(self, prefix: Union[str, PathLike[str]]):
+        self._prefix = prefix
+        self._digests = dict()
+        self._lock = Lock()
+
+    @property
+    def prefix(self):
+        return self._prefix
+
+    def digest(self, path: Union[str, PathLike[str]]) -> str:
+        stat = os.stat(path)
+        key = os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+        with self._lock:
+            result = self._digests.get(key)
+            if result is None:
+                result = self._digests[key] = file_digest(path)
+            return result
+
+    def ranges_path(self, digest: str) -> Path:
+        return Path(self._prefix, digest + CODEPOINT_RANGES_EXTENSION)
+
+    def write(self, digest: str, ranges: List[CodepointRange]) -> None:
+        path = self.ranges_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = mkstemp(prefix=path.name, dir=path.parent)
+        try:
+            with os.fdopen(fd, "wt") as f:
+                f.write(format_ranges(ranges))
+            os.replace(temp, path)
+        except BaseException:
+            os.remove(temp)
+            raise
+
+    def get_ranges(self, ttf: TTF) -> List[CodepointRange]:
+        digest = self.digest(ttf.path)
+        path = self.ranges_path(digest)
+
+        try:
+            return read_ranges(path)
+        except FileNotFoundError:
+            pass
+        except BaseException as e:  # noqa
+            logger.warning(f"Broken glyph ranges cache '{str(path)}': {e}")
+
+        ranges = ttf.get_glyph_ranges()
+        try:
+            self.write(digest, ranges)
+        except BaseException as e:  # noqa
+            logger.error(f"Failed to write the glyph ranges cache '{str(path)}': {e}")
+        return ranges
@@ -4,18 +4,23 @@ import os
 from io import StringIO
 from os import PathLike
 from pathlib import Path
+from threading import Lock
 from typing import Dict, List, Optional, Union
 
 from fontTools.ttLib import TTFont
 
-from cvp.fonts.ranges import CodepointRange, read_ranges
+from cvp.fonts.ranges import CodepointRange, format_ranges, read_ranges
 from cvp.variables import CODEPOINT_RANGES_EXTENSION
 
 
 class TTF:
+    _cmap: Optional[Dict[int, str]]
+
     def __init__(self, path: Path, ttf: TTFont):
         self._path = path
         self._ttf = ttf
+        self._cmap = None
+        self._cmap_lock = Lock()
 
     @classmethod
     def from_filepath(cls, path: Union[str, PathLike[str]]):
@@ -36,14 +41,19 @@ class TTF:
         return self._ttf
 
     def get_best_camp(self) -> Dict[int, str]:
-        return self._ttf.getBestCmap()
+        """The character map, decoded once. Do not modify the returned dict."""
+        if self._cmap is None:
+            # The tables of fontTools are decoded lazily and are not thread-safe.
+            with self._cmap_lock:
+                if self._cmap is None:
+                    self._cmap = self._ttf.getBestCmap()
+        return self._cmap
 
     def get_character_map(self) -> Dict[int, str]:
-        items = self._ttf["cmap"].getBestCmap().items()
-        return {codepoint: glyph_name for codepoint, glyph_name in items}
+        return dict(self.get_best_camp())
 
     def get_codepoints(self, *, sorting=False, reverse=False) -> List[int]:
-        result = list(self.get_character_map().keys())
+        result = list(self.get_best_camp().keys())
         if sorting:
             result.sort(reverse=reverse)
         return result
@@ -83,10 +93,7 @@ class TTF:
     def write_ranges(self, path: Union[str, PathLike[str]]) -> int:
         path = path if isinstance(path, Path) else Path(path)
         assert isinstance(path, Path)
-        buffer = StringIO()
-        for begin, end in self.get_glyph_ranges():
-            buffer.write(f"0x{begin:06x} 0x{end:06x}\n")
-        return path.write_text(buffer.getvalue())
+        return path.write_text(format_ranges(self.get_glyph_ranges()))
 
     def write_default_ranges(self) -> int:
         return self.write_ranges(self.get_default_ranges_path())
@@ -98,6 +105,6 @@ class TTF:
         path = path if isinstance(path, Path) else Path(path)
         assert isinstance(path, Path)
         buffer = StringIO()
-        for codepoint, glyph_name in self.get_character_map().items():
+        for codepoint, glyph_name in self.get_best_camp().items():
             buffer.write(f"0x{codepoint:06x} {glyph_name}\n")
         return path.write_text(buffer.getvalue())
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from OpenGL import GL
+
+
+def has_frame_buffer_object() -> bool:
+    return bool(GL.glGenFramebuffers)
+
+
+class FrameBufferObject:
+    def __init__(self):
+        self._fbo = 0
+        self._bound = False
+
+    @property
+    def opened(self) -> bool:
+        return self._fbo != 0
+
+    @property
+    def bound(self) -> bool:
+        return self._bound
+
+    def open(self) -> None:
+        if self._fbo != 0:
+            raise ValueError("FBO is already opened")
+
+        self._fbo = GL.glGenFramebuffers(1)
+        assert self._fbo != 0
+
+    def close(self) -> None:
+        if self._fbo == 0:
+            raise ValueError("FBO is not opened")
+
+        GL.glDeleteFramebuffers(1, self._fbo)
+        self._fbo = 0
+
+    def bind(self) -> None:
+        if self._bound:
+            raise ValueError("FBO is already bound")
+
+        GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, self._fbo)
+        self._bound = True
+
+    def release(self) -> None:
+        if not self._bound:
+            raise ValueError("FBO is not bound")
+
+        GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, 0)
+        self._bound = False
+
+    def __enter__(self):
+        self.bind()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def attach_texture(self, texture: int) -> None:
+        assert self._bound, "FBO must be bound"
+
+        GL.glFramebufferTexture2D(
+            GL.GL_FRAMEBUFFER,
+            GL.GL_COLOR_ATTACHMENT0,
+            GL.GL_TEXTURE_2D,
+            texture,
+            0,
+        )
+
+        status = GL.glCheckFramebufferStatus(GL.GL_FRAMEBUFFER)
+        if status != GL.GL_FRAMEBUFFER_COMPLETE:
+            raise ValueError(f"Incomplete framebuffer status: {status}")
@@ -1,9 +1,23 @@
 # -*- coding: utf-8 -*-
 
-from ctypes import addressof, create_string_buffer, memmove
+from contextlib import contextmanager
+from ctypes import c_ubyte
+from typing import Final, Iterator, List, Optional
 
 from OpenGL import GL
 
+from cvp.types.buffer import BufferLike
+
+DEFAULT_PBO_RING_SIZE: Final[int] = 3
+
+MAP_WRITE_FLAGS: Final[int] = (
+    GL.GL_MAP_WRITE_BIT | GL.GL_MAP_INVALIDATE_BUFFER_BIT | GL.GL_MAP_UNSYNCHRONIZED_BIT
+)
+
+
+def has_map_buffer_range() -> bool:
+    return bool(GL.glMapBufferRange)
+
 
 class PixelBufferObject:
     def __init__(self):
@@ -11,6 +25,10 @@ class PixelBufferObject:
         self._pbo = 0
         self._bound = False
 
+    @property
+    def size(self) -> int:
+        return self._size
+
     @property
     def opened(self) -> bool:
         return self._pbo != 0
@@ -69,15 +87,133 @@ class PixelBufferObject:
 
         GL.glBufferData(GL.GL_PIXEL_UNPACK_BUFFER, self._size, None, GL.GL_STREAM_DRAW)
 
-    def draw_unpack_buffer(self, pixels: bytes):
+    def orphan(self) -> None:
+        # Re-specifying the data store with NULL lets the driver hand out a new
+        # block of memory while the previous one may still be read by the GPU.
+        self.update_stream_draw()
+
+    def map_write_buffer(self) -> int:
         assert self._bound, "PBO must be bound"
 
-        buffer_ptr = GL.glMapBuffer(GL.GL_PIXEL_UNPACK_BUFFER, GL.GL_WRITE_ONLY)
+        if has_map_buffer_range():
+            buffer_ptr = GL.glMapBufferRange(
+                GL.GL_PIXEL_UNPACK_BUFFER,
+                0,
+                self._size,
+                MAP_WRITE_FLAGS,
+            )
+        else:
+            buffer_ptr = GL.glMapBuffer(GL.GL_PIXEL_UNPACK_BUFFER, GL.GL_WRITE_ONLY)
+
         if not buffer_ptr:
             raise ValueError("MapBuffer is not bound")
 
+        return buffer_ptr
+
+    def unmap_buffer(self) -> bool:
+        assert self._bound, "PBO must be bound"
+        return bool(GL.glUnmapBuffer(GL.GL_PIXEL_UNPACK_BUFFER))
+
+    @contextmanager
+    def map_unpack_buffer(self) -> Iterator[memoryview]:
+        """
+        Maps the orphaned data store and yields it as a writable memoryview,
+        so the producer can decode or ``readinto`` the pixels in-place.
+        The view is released and the buffer unmapped on exit.
+        """
+
+        assert self._bound, "PBO must be bound"
+
+        self.orphan()
+        buffer_ptr = self.map_write_buffer()
+
         try:
-            pixels_ptr = addressof(create_string_buffer(pixels, self._size))
-            memmove(buffer_ptr, pixels_ptr, self._size)
+            mapped = (c_ubyte * self._size).from_address(buffer_ptr)
+            with memoryview(mapped).cast("B") as view:
+                yield view
         finally:
-            GL.glUnmapBuffer(GL.GL_PIXEL_UNPACK_BUFFER)
+            self.unmap_buffer()
+
+    def draw_unpack_buffer(self, pixels: BufferLike):
+        # NumPy arrays support the buffer protocol, but their stubs do not say so.
+        source = memoryview(pixels)  # type: ignore[arg-type]
+        with source, source.cast("B") as data:
+            if data.nbytes != self._size:
+                raise ValueError(
+                    f"Pixels size must be {self._size} bytes: {data.nbytes}"
+                )
+
+            with self.map_unpack_buffer() as view:
+                view[:] = data
+
+
+class PixelBufferRing:
+    """
+    Rotates the pixel uploads over several PBOs.
+
+    A frame written into one PBO is transferred to the texture on the next
+    update, so the CPU copy of a frame overlaps with the GPU transfer of the
+    previous one.
+    """
+
+    _pbos: List[PixelBufferObject]
+    _pending: Optional[PixelBufferObject]
+
+    def __init__(self, count=DEFAULT_PBO_RING_SIZE):
+        if count < 2:
+            raise ValueError("The 'count' argument must be at least 2")
+
+        self._pbos = [PixelBufferObject() for _ in range(count)]
+        self._index = 0
+        self._pending = None
+
+    @property
+    def count(self) -> int:
+        return len(self._pbos)
+
+    @property
+    def size(self) -> int:
+        return self._pbos[0].size
+
+    @property
+    def opened(self) -> bool:
+        return all(pbo.opened for pbo in self._pbos)
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def open(self, size: int) -> None:
+        for pbo in self._pbos:
+            pbo.open(size)
+        self._index = 0
+        self._pending = None
+
+    def close(self) -> None:
+        for pbo in self._pbos:
+            if pbo.opened:
+                pbo.close()
+        self._pending = None
+
+    def _next(self) -> PixelBufferObject:
+        self._index = (self._index + 1) % len(self._pbos)
+        return self._pbos[self._index]
+
+    def write(self, pixels: BufferLike) -> PixelBufferObject:
+        pbo = self._next()
+        with pbo:
+            pbo.draw_unpack_buffer(pixels)
+        self._pending = pbo
+        return pbo
+
+    @contextmanager
+    def map_next(self) -> Iterator[memoryview]:
+        pbo = self._next()
+        with pbo, pbo.map_unpack_buffer() as view:
+            yield view
+        self._pending = pbo
+
+    def pop_pending(self) -> Optional[PixelBufferObject]:
+        pending = self._pending
+        self._pending = None
+        return pending
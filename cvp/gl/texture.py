@@ -1,10 +1,33 @@
 # -*- coding: utf-8 -*-
 
 from ctypes import c_void_p
-from typing import Optional
+from typing import Dict, Final, Optional
 
 from OpenGL import GL
 
+from cvp.chrono.profiler import profile_zone
+from cvp.types.buffer import BufferLike
+
+TEXTURE_UPLOAD_ZONE: Final[str] = "texture.upload"
+
+SIZED_INTERNAL_FORMATS: Final[Dict[int, int]] = {
+    GL.GL_RED: GL.GL_R8,
+    GL.GL_RG: GL.GL_RG8,
+    GL.GL_RGB: GL.GL_RGB8,
+    GL.GL_RGBA: GL.GL_RGBA8,
+}
+
+CHANNELS_TO_FORMAT: Final[Dict[int, int]] = {
+    1: GL.GL_RED,
+    2: GL.GL_RG,
+    3: GL.GL_RGB,
+    4: GL.GL_RGBA,
+}
+
+
+def has_texture_storage() -> bool:
+    return bool(GL.glTexStorage2D)
+
 
 class Texture:
     def __init__(self):
@@ -12,6 +35,8 @@ class Texture:
         self._height = 0
         self._texture = 0
         self._bound = False
+        self._immutable = False
+        self._format = GL.GL_RGB
 
     @property
     def width(self):
@@ -29,6 +54,14 @@ class Texture:
     def bound(self):
         return self._bound
 
+    @property
+    def immutable(self):
+        return self._immutable
+
+    @property
+    def format(self):
+        return self._format
+
     @property
     def opened(self) -> bool:
         return self._texture != 0
@@ -36,29 +69,46 @@ class Texture:
     def __bool__(self) -> bool:
         return self.opened
 
-    def open(self, width: int, height: int) -> None:
+    def open(
+        self,
+        width: int,
+        height: int,
+        immutable=False,
+        fmt: int = GL.GL_RGB,
+    ) -> None:
         if self._texture != 0:
             raise ValueError("Texture is already opened")
+        if fmt not in SIZED_INTERNAL_FORMATS:
+            raise ValueError(f"Unsupported texture format: {fmt}")
 
         self._width = width
         self._height = height
+        self._format = fmt
         self._texture = GL.glGenTextures(1)
         assert self._texture != 0
 
         GL.glBindTexture(GL.GL_TEXTURE_2D, self._texture)
         GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_LINEAR)
         GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_LINEAR)
-        GL.glTexImage2D(
-            GL.GL_TEXTURE_2D,
-            0,
-            GL.GL_RGB,
-            width,
-            height,
-            0,
-            GL.GL_RGB,
-            GL.GL_UNSIGNED_BYTE,
-            None,
-        )
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_S, GL.GL_CLAMP_TO_EDGE)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_T, GL.GL_CLAMP_TO_EDGE)
+        if immutable and has_texture_storage():
+            internal_format = SIZED_INTERNAL_FORMATS[fmt]
+            GL.glTexStorage2D(GL.GL_TEXTURE_2D, 1, internal_format, width, height)
+            self._immutable = True
+        else:
+            GL.glTexImage2D(
+                GL.GL_TEXTURE_2D,
+                0,
+                fmt,
+                width,
+                height,
+                0,
+                fmt,
+                GL.GL_UNSIGNED_BYTE,
+                None,
+            )
+            self._immutable = False
         GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
 
     def close(self) -> None:
@@ -92,17 +142,18 @@ class Texture:
     def _update_texture(self, fmt: int, pixels: Optional[bytes] = None) -> None:
         assert self._bound, "Texture must be bound"
 
-        GL.glTexImage2D(
-            GL.GL_TEXTURE_2D,
-            0,
-            fmt,
-            self._width,
-            self._height,
-            0,
-            fmt,
-            GL.GL_UNSIGNED_BYTE,
-            pixels,
-        )
+        with profile_zone(TEXTURE_UPLOAD_ZONE):
+            GL.glTexImage2D(
+                GL.GL_TEXTURE_2D,
+                0,
+                fmt,
+                self._width,
+                self._height,
+                0,
+                fmt,
+                GL.GL_UNSIGNED_BYTE,
+                pixels,
+            )
 
     def update_rgb_texture(self, pixels: Optional[bytes] = None) -> None:
         self._update_texture(GL.GL_RGB, pixels)
@@ -110,6 +161,42 @@ class Texture:
     def update_alpha_texture(self, pixels: Optional[bytes] = None) -> None:
         self._update_texture(GL.GL_ALPHA, pixels)
 
+    def _update_sub_image(
+        self,
+        fmt: int,
+        pixels: Optional[BufferLike],
+        offset=0,
+    ) -> None:
+        assert self._bound, "Texture must be bound"
+
+        # Rows of RGB24 frames and chroma planes are not always 4-byte aligned.
+        GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
+        with profile_zone(TEXTURE_UPLOAD_ZONE):
+            GL.glTexSubImage2D(
+                GL.GL_TEXTURE_2D,
+                0,
+                0,
+                0,
+                self._width,
+                self._height,
+                fmt,
+                GL.GL_UNSIGNED_BYTE,
+                pixels if pixels is not None else c_void_p(offset),
+            )
+
+    def update_rgb_sub_image(self, pixels: Optional[BufferLike] = None) -> None:
+        # If 'pixels' is None, the data is sourced from the bound unpack buffer.
+        self._update_sub_image(GL.GL_RGB, pixels)
+
+    def update_sub_image(
+        self,
+        pixels: Optional[BufferLike] = None,
+        offset=0,
+    ) -> None:
+        # If 'pixels' is None, the data is sourced from the bound unpack buffer,
+        # starting at 'offset' bytes.
+        self._update_sub_image(self._format, pixels, offset)
+
     def _clear_texture_sub_image_2d(self) -> None:
         assert self._bound, "Texture must be bound"
 
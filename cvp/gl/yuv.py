@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+from typing import Final, List, Sequence
+
+from OpenGL import GL
+from OpenGL.GL.shaders import compileProgram, compileShader
+
+from cvp.ffmpeg.structs.planes import FULL_RANGE_PIX_FMTS, PlaneShape
+from cvp.gl.fbo import FrameBufferObject, has_frame_buffer_object
+from cvp.gl.texture import CHANNELS_TO_FORMAT, Texture
+from cvp.types.buffer import BufferLike
+
+YUV_VERTEX_SHADER: Final[
+    str
+] = """
+#version 120
+void main()
+{
+    gl_TexCoord[0] = gl_MultiTexCoord0;
+    gl_Position = gl_Vertex;
+}
+"""
+
+YUV_FRAGMENT_SHADER: Final[
+    str
+] = """
+#version 120
+uniform sampler2D plane0;
+uniform sampler2D plane1;
+uniform sampler2D plane2;
+uniform int chroma_order;  // 0: U/V planes, 1: UV interleaved, 2: VU interleaved
+uniform int full_range;
+
+void main()
+{
+    vec2 st = gl_TexCoord[0].st;
+    float y = texture2D(plane0, st).r;
+    float u;
+    float v;
+
+    if (chroma_order == 0) {
+        u = texture2D(plane1, st).r;
+        v = texture2D(plane2, st).r;
+    } else {
+        vec2 c = texture2D(plane1, st).rg;
+        u = chroma_order == 1 ? c.r : c.g;
+        v = chroma_order == 1 ? c.g : c.r;
+    }
+
+    if (full_range == 0) {
+        y = (y - 16.0 / 255.0) * (255.0 / 219.0);
+        u = (u - 128.0 / 255.0) * (255.0 / 224.0);
+        v = (v - 128.0 / 255.0) * (255.0 / 224.0);
+    } else {
+        u = u - 0.5;
+        v = v - 0.5;
+    }
+
+    // ITU-R BT.601
+    vec3 rgb = vec3(
+        y + 1.402 * v,
+        y - 0.344136 * u - 0.714136 * v,
+        y + 1.772 * u
+    );
+    gl_FragColor = vec4(clamp(rgb, 0.0, 1.0), 1.0);
+}
+"""
+
+CHROMA_ORDER_PLANAR: Final[int] = 0
+CHROMA_ORDER_UV: Final[int] = 1
+CHROMA_ORDER_VU: Final[int] = 2
+
+
+def has_yuv_converter() -> bool:
+    return bool(GL.glCreateShader) and has_frame_buffer_object()
+
+
+def chroma_order(pixel_format: str) -> int:
+    if pixel_format == "nv12":
+        return CHROMA_ORDER_UV
+    elif pixel_format == "nv21":
+        return CHROMA_ORDER_VU
+    else:
+        return CHROMA_ORDER_PLANAR
+
+
+class YuvConverter:
+    """
+    Converts the planes of a YUV frame to an RGB texture on the GPU.
+    """
+
+    _planes: List[Texture]
+    _offsets: List[int]
+    _sizes: List[int]
+
+    def __init__(self):
+        self._planes = list()
+        self._offsets = list()
+        self._sizes = list()
+        self._fbo = FrameBufferObject()
+        self._program = 0
+        self._chroma_order = CHROMA_ORDER_PLANAR
+        self._full_range = False
+
+    @property
+    def opened(self) -> bool:
+        return self._program != 0
+
+    @property
+    def planes(self):
+        return self._planes
+
+    def open(self, pixel_format: str, planes: Sequence[PlaneShape]) -> None:
+        if self._program != 0:
+            raise ValueError("YUV converter is already opened")
+        if not 2 <= len(planes) <= 3:
+            raise ValueError(f"Unsupported number of planes: {len(planes)}")
+
+        self._program = compileProgram(
+            compileShader(YUV_VERTEX_SHADER, GL.GL_VERTEX_SHADER),
+            compileShader(YUV_FRAGMENT_SHADER, GL.GL_FRAGMENT_SHADER),
+        )
+        self._chroma_order = chroma_order(pixel_format)
+        self._full_range = pixel_format in FULL_RANGE_PIX_FMTS
+
+        offset = 0
+        for plane in planes:
+            texture = Texture()
+            texture.open(
+                plane.width,
+                plane.height,
+                immutable=True,
+                fmt=CHANNELS_TO_FORMAT[plane.channels],
+            )
+            self._planes.append(texture)
+            self._offsets.append(offset)
+            self._sizes.append(plane.size)
+            offset += plane.size
+
+        self._fbo.open()
+
+    def close(self) -> None:
+        for texture in self._planes:
+            texture.close()
+        self._planes.clear()
+        self._offsets.clear()
+        self._sizes.clear()
+
+        if self._fbo.opened:
+            self._fbo.close()
+
+        if self._program != 0:
+            GL.glDeleteProgram(self._program)
+            self._program = 0
+
+    def upload(self, pixels: BufferLike) -> None:
+        # NumPy arrays support the buffer protocol, but their stubs do not say so.
+        data = memoryview(pixels).cast("B")  # type: ignore[arg-type]
+        for texture, offset, size in zip(self._planes, self._offsets, self._sizes):
+            with texture:
+                texture.update_sub_image(data[offset : offset + size])
+
+    def upload_from_unpack_buffer(self) -> None:
+        # The pixel buffer object holding the whole frame must be bound.
+        for texture, offset in zip(self._planes, self._offsets):
+            with texture:
+                texture.update_sub_image(None, offset)
+
+    def render(self, target: Texture) -> None:
+        assert self._program != 0
+
+        GL.glPushAttrib(GL.GL_ENABLE_BIT | GL.GL_VIEWPORT_BIT)
+        try:
+            with self._fbo:
+                self._fbo.attach_texture(target.texture)
+                GL.glViewport(0, 0, target.width, target.height)
+                GL.glDisable(GL.GL_BLEND)
+                GL.glDisable(GL.GL_DEPTH_TEST)
+                GL.glDisable(GL.GL_SCISSOR_TEST)
+                self._draw()
+        finally:
+            GL.glPopAttrib()
+
+    def _draw(self) -> None:
+        GL.glUseProgram(self._program)
+        try:
+            for i, texture in enumerate(self._planes):
+                GL.glActiveTexture(GL.GL_TEXTURE0 + i)
+                GL.glBindTexture(GL.GL_TEXTURE_2D, texture.texture)
+                location = GL.glGetUniformLocation(self._program, f"plane{i}")
+                GL.glUniform1i(location, i)
+
+            order_location = GL.glGetUniformLocation(self._program, "chroma_order")
+            GL.glUniform1i(order_location, self._chroma_order)
+            range_location = GL.glGetUniformLocation(self._program, "full_range")
+            GL.glUniform1i(range_location, 1 if self._full_range else 0)
+
+            GL.glBegin(GL.GL_QUADS)
+            GL.glTexCoord2f(0.0, 0.0)
+            GL.glVertex2f(-1.0, -1.0)
+            GL.glTexCoord2f(1.0, 0.0)
+            GL.glVertex2f(+1.0, -1.0)
+            GL.glTexCoord2f(1.0, 1.0)
+            GL.glVertex2f(+1.0, +1.0)
+            GL.glTexCoord2f(0.0, 1.0)
+            GL.glVertex2f(-1.0, +1.0)
+            GL.glEnd()
+        finally:
+            for i in reversed(range(len(self._planes))):
+                GL.glActiveTexture(GL.GL_TEXTURE0 + i)
+                GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+            GL.glUseProgram(0)
@@ -3,7 +3,9 @@
 import hashlib
 import zlib
 from enum import StrEnum, auto, unique
-from typing import Callable, Dict, Final
+from typing import Callable, Dict, Final, Optional, Protocol, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
 
 
 @unique
@@ -25,10 +27,19 @@ class Method(StrEnum):
     shake_256 = auto()
 
 
+class Hasher(Protocol):
+    def update(self, data: Buffer, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
 class _Crc32:
-    def __init__(self, data: bytes):
+    def __init__(self, data: Buffer = b""):
         self._checksum = zlib.crc32(data) & 0xFFFFFFFF
 
+    def update(self, data: Buffer) -> None:
+        self._checksum = zlib.crc32(data, self._checksum) & 0xFFFFFFFF
+
     @property
     def checksum(self) -> int:
         return self._checksum
@@ -37,6 +48,29 @@ class _Crc32:
         return "{0:x}".format(self._checksum)
 
 
+class _Shake:
+    """A SHAKE hash object whose digests have a fixed ``length``, in bytes."""
+
+    def __init__(self, func: Callable, length: int, data: Buffer = b""):
+        if length < 1:
+            raise ValueError("The 'length' argument must be at least 1")
+        self._hash = func(data)
+        self._length = length
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    def update(self, data: Buffer) -> None:
+        self._hash.update(data)
+
+    def digest(self) -> bytes:
+        return self._hash.digest(self._length)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest(self._length)
+
+
 _HASH_FUNCS: Final[Dict[Method, Callable]] = {
     Method.blake2b: hashlib.blake2b,
     Method.blake2s: hashlib.blake2s,
@@ -51,10 +85,51 @@ _HASH_FUNCS: Final[Dict[Method, Callable]] = {
     Method.sha3_384: hashlib.sha3_384,
     Method.sha3_512: hashlib.sha3_512,
     Method.sha512: hashlib.sha512,
+}
+
+_SHAKE_FUNCS: Final[Dict[Method, Callable]] = {
     Method.shake_128: hashlib.shake_128,
     Method.shake_256: hashlib.shake_256,
 }
 
+SHAKE_DIGEST_SIZES: Final[Dict[Method, int]] = {
+    Method.shake_128: 32,
+    Method.shake_256: 64,
+}
+"""Default digest bytes of the SHAKE methods, as long as their SHA-3 peers."""
+
+
+def is_shake(method: Method) -> bool:
+    return method in _SHAKE_FUNCS
+
+
+def new_hasher(
+    method: Method,
+    data: Buffer = b"",
+    *,
+    length: Optional[int] = None,
+) -> Hasher:
+    """
+    A hash object of the ``method``, updated incrementally with ``update()``.
+
+    :param length: Digest bytes of the SHAKE methods. Other methods have a fixed
+        digest size and reject it.
+    """
+
+    shake = _SHAKE_FUNCS.get(method)
+    if shake is not None:
+        return _Shake(shake, length if length else SHAKE_DIGEST_SIZES[method], data)
+
+    if length is not None:
+        raise ValueError(f"The digest length of '{method}' is fixed")
+    return _HASH_FUNCS[method](data)
+
+
+def new_verifier(method: Method, hexdigest: str) -> Hasher:
+    """A hash object with the digest length of the expected ``hexdigest``."""
+    length = len(hexdigest) // 2 if is_shake(method) else None
+    return new_hasher(method, length=length)
+
 
-def checksum(method: Method, data: bytes) -> str:
-    return _HASH_FUNCS[method](data).hexdigest()
+def checksum(method: Method, data: Buffer, *, length: Optional[int] = None) -> str:
+    return new_hasher(method, data, length=length).hexdigest()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from mmap import ACCESS_READ, mmap
+from os import PathLike
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from cvp.hashfunc.checksum import Hasher, Method, new_hasher, new_verifier
+from cvp.variables import CHECKSUM_BUFFER_SIZE, CHECKSUM_MMAP_THRESHOLD
+
+_Path = Union[str, PathLike[str]]
+
+
+class FileVerification(NamedTuple):
+    path: str
+    method: Method
+    expected: str
+    actual: Optional[str]
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.actual is not None and self.actual == self.expected.lower()
+
+    def __str__(self):
+        if self.error is not None:
+            return f"'{self.path}': {self.error}"
+        result = "OK" if self.ok else "NG"
+        return f"'{self.path}': {self.method}:{self.actual} ({result})"
+
+
+def update_file(
+    hasher: Hasher,
+    path: _Path,
+    *,
+    buffer_size=CHECKSUM_BUFFER_SIZE,
+    mmap_threshold: Optional[int] = CHECKSUM_MMAP_THRESHOLD,
+) -> int:
+    """
+    Feeds the content of a file to the ``hasher``, in ``buffer_size`` chunks.
+
+    Large files are mapped into memory and hashed in place, smaller files are
+    read into a single reused buffer. :mod:`hashlib` releases the GIL while it
+    hashes a chunk, so several files can be hashed in parallel threads.
+
+    :return: The number of bytes hashed.
+    """
+
+    if buffer_size < 1:
+        raise ValueError("The 'buffer_size' argument must be at least 1")
+
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > 0 and mmap_threshold is not None and size >= mmap_threshold:
+            with mmap(f.fileno(), 0, access=ACCESS_READ) as m:
+                with memoryview(m) as view:
+                    for offset in range(0, size, buffer_size):
+                        with view[offset : offset + buffer_size] as chunk:
+                            hasher.update(chunk)
+            return size
+
+        total = 0
+        buffer = bytearray(min(buffer_size, max(size, 1)))
+        with memoryview(buffer) as view:
+            while read := f.readinto(buffer):
+                with view[:read] as chunk:
+                    hasher.update(chunk)
+                total += read
+        return total
+
+
+def file_checksum(
+    method: Method,
+    path: _Path,
+    *,
+    length: Optional[int] = None,
+    buffer_size=CHECKSUM_BUFFER_SIZE,
+    mmap_threshold: Optional[int] = CHECKSUM_MMAP_THRESHOLD,
+) -> str:
+    hasher = new_hasher(method, length=length)
+    update_file(hasher, path, buffer_size=buffer_size, mmap_threshold=mmap_threshold)
+    return hasher.hexdigest()
+
+
+def verify_file(path: _Path, method: Method, expected: str) -> FileVerification:
+    """Never raises for an unreadable file; the error is in the result instead."""
+    try:
+        hasher = new_verifier(method, expected)
+        update_file(hasher, path)
+        actual: Optional[str] = hasher.hexdigest()
+        error: Optional[BaseException] = None
+    except (OSError, ValueError) as e:
+        actual = None
+        error = e
+    return FileVerification(os.fspath(path), method, expected, actual, error)
+
+
+def _map_concurrently(
+    func,
+    items: Sequence,
+    max_workers: Optional[int],
+    executor: Optional[Executor],
+) -> List:
+    if executor is not None:
+        return list(executor.map(func, items))
+
+    if not items:
+        return list()
+
+    workers = max_workers if max_workers else min(len(items), os.cpu_count() or 1)
+    if workers <= 1 or len(items) == 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(workers, "Checksum") as pool:
+        return list(pool.map(func, items))
+
+
+def verify_files(
+    items: Iterable[Tuple[_Path, Method, str]],
+    *,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[FileVerification]:
+    """
+    Verifies the ``(path, method, expected)`` items concurrently, in order.
+
+    Without an ``executor``, a temporary thread pool of ``max_workers`` threads
+    is used, by default one per CPU.
+    """
+
+    def _verify(item: Tuple[_Path, Method, str]) -> FileVerification:
+        return verify_file(*item)
+
+    return _map_concurrently(_verify, list(items), max_workers, executor)
+
+
+def checksum_files(
+    method: Method,
+    paths: Iterable[_Path],
+    *,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[str]:
+    """The checksums of the ``paths`` hashed concurrently, in order."""
+
+    def _checksum(path: _Path) -> str:
+        return file_checksum(method, path)
+
+    return _map_concurrently(_checksum, list(paths), max_workers, executor)
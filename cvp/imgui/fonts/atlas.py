@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+from types import ModuleType
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+from cvp.fonts.glyphs import jbm, mdi
+from cvp.fonts.ranges import CodepointRange, CodepointRangeIndex
+from cvp.variables import FONT_ATLAS_BASE_RANGES
+
+
+def module_glyphs(module: ModuleType) -> List[int]:
+    """Codepoints of the single-character constants of a glyphs module."""
+    values = vars(module).values()
+    return [ord(v) for v in values if isinstance(v, str) and len(v) == 1]
+
+
+def default_base_ranges() -> List[Tuple[int, int]]:
+    result = list(FONT_ATLAS_BASE_RANGES)
+    for module in (jbm, mdi):
+        result.extend((codepoint, codepoint) for codepoint in module_glyphs(module))
+    return result
+
+
+class GlyphAtlas:
+    """
+    The codepoints baked into the imgui font atlas, grown on demand.
+
+    Only a base set is baked at startup. Text about to be drawn is passed to
+    :meth:`request`, and codepoints that a font provides but that are not baked
+    yet make the atlas :attr:`dirty`. The owner then rebuilds the fonts with
+    :meth:`bake_ranges` before the next frame begins.
+    """
+
+    _ranges: List[CodepointRange]
+    _known: Set[int]
+    _pending: Set[int]
+
+    def __init__(self, base_ranges: Iterable[Tuple[int, int]]):
+        self._ranges = [CodepointRange(min(r), max(r)) for r in base_ranges]
+        self._index = CodepointRangeIndex(self._ranges)
+        self._available_ranges: List[Tuple[int, int]] = list()
+        self._available = CodepointRangeIndex(())
+        self._known = set()
+        self._pending = set()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Incremented every time the baked codepoints grow."""
+        return self._version
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending)
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def __contains__(self, codepoint: int) -> bool:
+        return codepoint in self._index
+
+    def add_available(self, ranges: Sequence[Tuple[int, int]]) -> None:
+        """Registers the codepoints provided by a font of the atlas."""
+        self._available_ranges.extend(ranges)
+        self._available = CodepointRangeIndex(self._available_ranges)
+        self._known.clear()
+
+    def bake_ranges(self, ranges: Sequence[Tuple[int, int]]) -> List[CodepointRange]:
+        """The part of the ``ranges`` of a font to bake into the atlas."""
+        return self._index.intersect(ranges)
+
+    def request_codepoints(self, codepoints: Iterable[int]) -> bool:
+        # Most calls only see known codepoints, which is a single set difference.
+        unknown = set(codepoints).difference(self._known)
+        if not unknown:
+            return False
+
+        self._known.update(unknown)
+        wanted = [c for c in unknown if c in self._available and c not in self._index]
+        self._pending.update(wanted)
+        return bool(wanted)
+
+    def request(self, text: str) -> bool:
+        return self.request_codepoints(map(ord, text))
+
+    def request_range(self, begin: int, end: int) -> bool:
+        return self.request_codepoints(range(begin, end + 1))
+
+    def commit(self) -> bool:
+        if not self._pending:
+            return False
+
+        self._ranges.extend(CodepointRange(c, c) for c in self._pending)
+        self._index = CodepointRangeIndex(self._ranges)
+        self._ranges = list(self._index)
+        self._pending.clear()
+        self._version += 1
+        return True
+
+
+_glyph_atlas: Optional[GlyphAtlas] = None
+
+
+def get_glyph_atlas() -> Optional[GlyphAtlas]:
+    return _glyph_atlas
+
+
+def set_glyph_atlas(atlas: Optional[GlyphAtlas]) -> None:
+    global _glyph_atlas
+    _glyph_atlas = atlas
+
+
+def request_glyphs(text: str) -> None:
+    """Makes sure the glyphs of the ``text`` are baked, if the atlas is dynamic."""
+    if _glyph_atlas is not None:
+        _glyph_atlas.request(text)
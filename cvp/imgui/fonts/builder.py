@@ -10,8 +10,10 @@ from imgui.core import FontConfig, _Font
 
 from cvp.fonts.cached_ttf import CachedTTF
 from cvp.fonts.ranges import UNICODE_SINGLE_BLOCK_SIZE, CodepointRange
+from cvp.fonts.ranges_cache import RangesCache
 from cvp.fonts.ttf import TTF
 from cvp.gl.texture import Texture
+from cvp.imgui.fonts.atlas import GlyphAtlas
 from cvp.imgui.fonts.font import Font
 from cvp.imgui.fonts.glyph_ranges import create_glyph_ranges
 
@@ -20,10 +22,18 @@ class FontBuilder:
     _font: Optional[_Font]
     _ttfs: List[CachedTTF]
 
-    def __init__(self, name: str, size: int):
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        ranges_cache: Optional[RangesCache] = None,
+        atlas: Optional[GlyphAtlas] = None,
+    ):
         self._font = None
         self._name = name
         self._size = size
+        self._ranges_cache = ranges_cache
+        self._atlas = atlas
         self._merge = FontConfig(merge_mode=True)
         self._ttfs = list()
 
@@ -49,7 +59,10 @@ class FontBuilder:
         ttf = TTF.from_filepath(path)
 
         if not ranges:
-            ranges = ttf.get_glyph_ranges()
+            if self._ranges_cache is not None:
+                ranges = self._ranges_cache.get_ranges(ttf)
+            else:
+                ranges = ttf.get_glyph_ranges()
 
         if not size:
             size = self._size
@@ -61,13 +74,40 @@ class FontBuilder:
         if size < 0:
             raise ValueError("Invalid size")
 
+        if self._atlas is not None:
+            self._atlas.add_available(ranges)
+
+        self._add_font(ttf, ranges, size)
+        self._ttfs.append(CachedTTF(ttf, ranges, size))
+        return self
+
+    def _add_font(self, ttf: TTF, ranges: List[CodepointRange], size: int) -> None:
+        if self._atlas is not None:
+            baked = self._atlas.bake_ranges(ranges)
+            if not baked:
+                # imgui needs at least one glyph to create the font.
+                baked = [CodepointRange(ranges[0].begin, ranges[0].begin)]
+            ranges = baked
+
         fonts = imgui.get_io().fonts
         filename = str(ttf.path)
         config = None if self._font is None else self._merge
         glyph_ranges = create_glyph_ranges(ranges)
         self._font = fonts.add_font_from_file_ttf(filename, size, config, glyph_ranges)
-        self._ttfs.append(CachedTTF(ttf, ranges, size))
-        return self
+
+    def rebuild(self, font: Font) -> None:
+        """
+        Adds the TTFs of an existing font to the current atlas again, e.g. after
+        the glyph atlas has grown. The atlas must have been cleared before.
+        """
+
+        for cached in font.ttfs:
+            self._add_font(cached.ttf, cached.ranges, cached.size)
+        font.font = self._font
+
+        if font.texture is not None:
+            font.texture.close()
+            font.texture = self._create_font_texture()
 
     @staticmethod
     def _create_font_texture() -> Texture:
@@ -1,47 +1,87 @@
 # -*- coding: utf-8 -*-
 
+from typing import Optional
+
 from cvp.assets.fonts import (
     get_jbm_nl_nfm_r_font_path,
     get_mdi_font_path,
     get_ngc_b_font_path,
     get_ngc_font_path,
 )
+from cvp.fonts.ranges_cache import RangesCache
+from cvp.imgui.fonts.atlas import GlyphAtlas
 from cvp.imgui.fonts.builder import FontBuilder
 from cvp.imgui.fonts.font import Font
 
 
-def add_mixed_font(name: str, size: int, ngc_delta=-4, *, use_texture=False) -> Font:
+def add_mixed_font(
+    name: str,
+    size: int,
+    ngc_delta=-4,
+    *,
+    use_texture=False,
+    ranges_cache: Optional[RangesCache] = None,
+    atlas: Optional[GlyphAtlas] = None,
+) -> Font:
     jbm = get_jbm_nl_nfm_r_font_path()
     ngc = get_ngc_font_path()
-    builder = FontBuilder(name, size)
+    builder = FontBuilder(name, size, ranges_cache, atlas)
     builder.add_ttf(jbm)
     builder.add_ttf(ngc, size=size + ngc_delta)
     return builder.done(use_texture=use_texture)
 
 
-def add_jbm_font(name: str, size: int, *, use_texture=False) -> Font:
+def add_jbm_font(
+    name: str,
+    size: int,
+    *,
+    use_texture=False,
+    ranges_cache: Optional[RangesCache] = None,
+    atlas: Optional[GlyphAtlas] = None,
+) -> Font:
     jbm = get_jbm_nl_nfm_r_font_path()
-    builder = FontBuilder(name, size)
+    builder = FontBuilder(name, size, ranges_cache, atlas)
     builder.add_ttf(jbm)
     return builder.done(use_texture=use_texture)
 
 
-def add_mdi_font(name: str, size: int, *, use_texture=False) -> Font:
+def add_mdi_font(
+    name: str,
+    size: int,
+    *,
+    use_texture=False,
+    ranges_cache: Optional[RangesCache] = None,
+    atlas: Optional[GlyphAtlas] = None,
+) -> Font:
     mdi = get_mdi_font_path()
-    builder = FontBuilder(name, size)
+    builder = FontBuilder(name, size, ranges_cache, atlas)
     builder.add_ttf(mdi)
     return builder.done(use_texture=use_texture)
 
 
-def add_ngc_font(name: str, size: int, *, use_texture=False) -> Font:
+def add_ngc_font(
+    name: str,
+    size: int,
+    *,
+    use_texture=False,
+    ranges_cache: Optional[RangesCache] = None,
+    atlas: Optional[GlyphAtlas] = None,
+) -> Font:
     ngc = get_ngc_font_path()
-    builder = FontBuilder(name, size)
+    builder = FontBuilder(name, size, ranges_cache, atlas)
     builder.add_ttf(ngc)
     return builder.done(use_texture=use_texture)
 
 
-def add_ngc_b_font(name: str, size: int, *, use_texture=False) -> Font:
+def add_ngc_b_font(
+    name: str,
+    size: int,
+    *,
+    use_texture=False,
+    ranges_cache: Optional[RangesCache] = None,
+    atlas: Optional[GlyphAtlas] = None,
+) -> Font:
     ngc = get_ngc_b_font_path()
-    builder = FontBuilder(name, size)
+    builder = FontBuilder(name, size, ranges_cache, atlas)
     builder.add_ttf(ngc)
     return builder.done(use_texture=use_texture)
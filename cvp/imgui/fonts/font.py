@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
@@ -23,6 +24,7 @@ class Font:
     blocks: List[Tuple[int, int]] = field(default_factory=list)
     texture: Optional[Texture] = None
     cp_infos: Dict[int, CodepointInfo] = field(default_factory=dict)
+    prefetches: Dict[Tuple[int, int], Future] = field(default_factory=dict)
 
     def __str__(self):
         return f"{self.family} ({self.size}px)"
@@ -46,15 +48,39 @@ class Font:
         except ValueError:
             return None
 
+    def create_codepoint_info(self, codepoint: int) -> CodepointInfo:
+        ttf = self.get_cached_ttf(codepoint)
+        return CodepointInfo(codepoint, ttf.ttf if ttf is not None else None)
+
     def get_codepoint_info(self, codepoint: int) -> CodepointInfo:
         cp_info = self.cp_infos.get(codepoint)
         if cp_info is None:
-            ttf = self.get_cached_ttf(codepoint)
-            ttf = ttf.ttf if ttf is not None else None
-            cp_info = CodepointInfo(codepoint, ttf)
+            cp_info = self.create_codepoint_info(codepoint)
             self.cp_infos[codepoint] = cp_info
         return cp_info
 
+    def load_codepoint_infos(self, begin: int, end: int) -> None:
+        infos = {
+            codepoint: self.create_codepoint_info(codepoint)
+            for codepoint in range(begin, end + 1)
+            if codepoint not in self.cp_infos
+        }
+        self.cp_infos.update(infos)
+
+    def prefetch_codepoint_infos(
+        self,
+        begin: int,
+        end: int,
+        executor: Executor,
+    ) -> Future[None]:
+        """Creates the codepoint information of a whole block on the ``executor``."""
+        key = begin, end
+        future = self.prefetches.get(key)
+        if future is None:
+            future = executor.submit(self.load_codepoint_infos, begin, end)
+            self.prefetches[key] = future
+        return future
+
     def close(self) -> None:
         if self.texture is not None:
             self.texture.close()
@@ -7,7 +7,9 @@ from typing import Final, Optional, Union
 
 import imgui
 
+from cvp.fonts.ranges_cache import RangesCache
 from cvp.fonts.size import FontSize
+from cvp.imgui.fonts.atlas import GlyphAtlas
 from cvp.imgui.fonts.builder import FontBuilder
 from cvp.imgui.fonts.defaults import add_mdi_font, add_mixed_font
 from cvp.imgui.fonts.font import Font
@@ -22,6 +24,37 @@ class FontMapper(OrderedDict[str, Font]):
     __medium_icon_font_name__: Final[str] = "MediumIcon"
     __large_icon_font_name__: Final[str] = "LargeIcon"
 
+    def __init__(
+        self,
+        ranges_cache: Optional[RangesCache] = None,
+        atlas: Optional[GlyphAtlas] = None,
+    ):
+        super().__init__()
+        self._ranges_cache = ranges_cache
+        self._atlas = atlas
+
+    @property
+    def ranges_cache(self):
+        return self._ranges_cache
+
+    @property
+    def atlas(self):
+        return self._atlas
+
+    def rebuild_atlas(self) -> bool:
+        """
+        Bakes the requested glyphs into the font atlas. Must be called outside of
+        a frame, and the font texture of the renderer must be refreshed after.
+        """
+
+        if self._atlas is None or not self._atlas.commit():
+            return False
+
+        imgui.get_io().fonts.clear()
+        for font in self.values():
+            FontBuilder(font.family, font.size, atlas=self._atlas).rebuild(font)
+        return True
+
     def close(self):
         for font in self.values():
             font.close()
@@ -34,7 +67,13 @@ class FontMapper(OrderedDict[str, Font]):
         if self.__contains__(name):
             raise KeyError(f"Already exists font key: {name}")
 
-        font = add_mixed_font(name, size, use_texture=use_texture)
+        font = add_mixed_font(
+            name,
+            size,
+            use_texture=use_texture,
+            ranges_cache=self._ranges_cache,
+            atlas=self._atlas,
+        )
         self.__setitem__(name, font)
         return font
 
@@ -75,7 +114,13 @@ class FontMapper(OrderedDict[str, Font]):
         if self.__contains__(name):
             raise KeyError(f"Already exists font key: {name}")
 
-        font = add_mdi_font(name, size, use_texture=use_texture)
+        font = add_mdi_font(
+            name,
+            size,
+            use_texture=use_texture,
+            ranges_cache=self._ranges_cache,
+            atlas=self._atlas,
+        )
         self.__setitem__(name, font)
         return font
 
@@ -128,7 +173,7 @@ class FontMapper(OrderedDict[str, Font]):
 
         assert isinstance(name, str)
 
-        builder = FontBuilder(name, size)
+        builder = FontBuilder(name, size, self._ranges_cache, self._atlas)
         builder.add_ttf(filepath)
         font = builder.done(use_texture=use_texture)
 
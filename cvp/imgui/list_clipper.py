@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+from contextlib import contextmanager
+from math import ceil, floor
+from typing import Optional, Tuple
+
+import imgui
+
+
+def calc_clipped_range(
+    count: int,
+    item_height: float,
+    scroll_y: float,
+    view_height: float,
+) -> Tuple[int, int]:
+    """Range of the items of the same height visible in the scrolled view."""
+    if count <= 0 or item_height <= 0:
+        return 0, 0
+
+    begin = max(0, min(count, floor(scroll_y / item_height)))
+    end = max(begin, min(count, ceil((scroll_y + view_height) / item_height)))
+    return begin, end
+
+
+@contextmanager
+def list_clipper(count: int, item_height: Optional[float] = None):
+    """
+    Yields the indices of the visible items, and reserves the space of the
+    others, so long lists only submit what can be seen.
+
+    The pyimgui bindings do not expose ``ImGuiListClipper``.
+    """
+
+    if item_height is None:
+        item_height = imgui.get_text_line_height_with_spacing()
+
+    begin, end = calc_clipped_range(
+        count,
+        item_height,
+        imgui.get_scroll_y(),
+        imgui.get_window_height(),
+    )
+
+    if begin > 0:
+        imgui.set_cursor_pos_y(imgui.get_cursor_pos_y() + begin * item_height)
+
+    yield range(begin, end)
+
+    if end < count:
+        imgui.set_cursor_pos_y(imgui.get_cursor_pos_y() + (count - end) * item_height)
+        imgui.dummy(0, 0)
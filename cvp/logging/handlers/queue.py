@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+from copy import copy
+from logging import Handler, Logger, LogRecord, getLogger
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from threading import Lock
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+from cvp.types.override import override
+
+_ROUTE_ATTRIBUTE_NAME = "cvp_queue_route"
+
+
+class DropOldestQueue(Queue):
+    """
+    A bounded queue where :meth:`put_nowait` discards the oldest item instead
+    of raising :class:`queue.Full`. A blocking :meth:`put` still waits.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("The 'maxsize' argument must be at least 1")
+        super().__init__(maxsize)
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @override
+    def put(self, item, block=True, timeout=None):
+        if block:
+            super().put(item, block, timeout)
+            return
+
+        with self.not_full:
+            if 0 < self.maxsize <= self._qsize():
+                self._get()
+                self.unfinished_tasks -= 1
+                self._dropped += 1
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+
+class RoutedQueueHandler(QueueHandler):
+    """
+    Enqueues the records reaching a logger, tagged with the logger name, so the
+    listener passes them to the handlers of that logger only.
+    """
+
+    def __init__(self, queue: Queue, route: str):
+        super().__init__(queue)
+        self._route = route
+
+    @property
+    def route(self):
+        return self._route
+
+    @override
+    def prepare(self, record: LogRecord) -> LogRecord:
+        # Only the arguments are merged here, to free them from later changes.
+        # The formatting and the traceback are left to the listener thread.
+        result = copy(record)
+        result.msg = record.getMessage()
+        result.args = None
+        setattr(result, _ROUTE_ATTRIBUTE_NAME, self._route)
+        return result
+
+
+class RoutedQueueListener(QueueListener):
+    def __init__(self, queue: Queue, routes: Mapping[str, Sequence[Handler]]):
+        super().__init__(queue, respect_handler_level=True)
+        self._blocking_queue = queue
+        self._routes = routes
+        self.handled = 0
+
+    @override
+    def enqueue_sentinel(self) -> None:
+        # Waits for a free slot, so stopping does not drop a queued record.
+        self._blocking_queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+    @override
+    def handle(self, record: LogRecord) -> None:
+        self.handled += 1
+        for handler in self._routes.get(getattr(record, _ROUTE_ATTRIBUTE_NAME), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class AsyncLoggingStats(NamedTuple):
+    queued: int
+    handled: int
+    dropped: int
+
+
+class AsyncLogging:
+    """
+    Moves the handlers of a logger hierarchy behind a queue, so the calling
+    threads never format records nor wait for the disk or the console.
+
+    Each logger that has handlers gets a :class:`RoutedQueueHandler` instead,
+    and a single background thread runs the original handlers. When the queue
+    is full, the oldest records are dropped and counted.
+    """
+
+    _listener: Optional[RoutedQueueListener]
+    _handlers: Dict[str, List[Handler]]
+
+    def __init__(self, maxsize: int, prefix: str):
+        self._queue = DropOldestQueue(maxsize)
+        self._prefix = prefix
+        self._listener = None
+        self._handlers = dict()
+        self._lock = Lock()
+
+    @property
+    def maxsize(self) -> int:
+        return self._queue.maxsize
+
+    @property
+    def prefix(self):
+        return self._prefix
+
+    @property
+    def started(self) -> bool:
+        return self._listener is not None
+
+    @property
+    def stats(self) -> AsyncLoggingStats:
+        handled = self._listener.handled if self._listener is not None else 0
+        return AsyncLoggingStats(self._queue.qsize(), handled, self._queue.dropped)
+
+    def find_loggers(self) -> List[Logger]:
+        prefix = self._prefix + "."
+        names = [self._prefix]
+        names.extend(n for n in Logger.manager.loggerDict if n.startswith(prefix))
+        loggers = [getLogger(name) for name in names]
+        return [lg for lg in loggers if lg.handlers]
+
+    def start(self) -> None:
+        with self._lock:
+            if self._listener is not None:
+                raise ValueError("Asynchronous logging has already started")
+
+            for lg in self.find_loggers():
+                self._handlers[lg.name] = list(lg.handlers)
+                for handler in self._handlers[lg.name]:
+                    lg.removeHandler(handler)
+                lg.addHandler(RoutedQueueHandler(self._queue, lg.name))
+
+            self._listener = RoutedQueueListener(self._queue, self._handlers)
+            self._listener.start()
+
+    def stop(self) -> None:
+        """Puts the original handlers back, after the queued records are handled."""
+        with self._lock:
+            if self._listener is None:
+                return
+
+            for name, handlers in self._handlers.items():
+                lg = getLogger(name)
+                for handler in list(lg.handlers):
+                    if isinstance(handler, RoutedQueueHandler):
+                        lg.removeHandler(handler)
+                for handler in handlers:
+                    lg.addHandler(handler)
+
+            self._listener.stop()
+            self._listener = None
+            self._handlers = dict()
@@ -20,6 +20,7 @@ from os import PathLike
 from sys import stdout
 from typing import Final, Optional, Sequence, Union
 
+from cvp.logging.handlers.queue import AsyncLogging
 from cvp.logging.variables import (
     CVP_DOWNLOAD_LOGGER_NAME,
     CVP_EVENT_LOGGER_NAME,
@@ -56,6 +57,8 @@ wsdl_logger = getLogger(CVP_WSDL_LOGGER_NAME)
 
 OFF: Final[int] = CRITICAL + 100
 
+_async_logging: Optional[AsyncLogging] = None
+
 SEVERITY_NAME_CRITICAL: Final[str] = "critical"
 SEVERITY_NAME_FATAL: Final[str] = "fatal"
 SEVERITY_NAME_ERROR: Final[str] = "error"
@@ -165,9 +168,43 @@ def dumps_default_logging_config(cvp_home: Union[str, PathLike[str]]) -> str:
 
 
 def loads_logging_config(path: str) -> None:
+    # The handlers are replaced, so they are moved behind the queue again.
+    maxsize = _async_logging.maxsize if _async_logging is not None else None
+    disable_async_logging()
+
     with open(path, "rt") as f:
         logging_config.dictConfig(loads(f.read()))
 
+    if maxsize is not None:
+        enable_async_logging(maxsize)
+
+
+def get_async_logging() -> Optional[AsyncLogging]:
+    return _async_logging
+
+
+def enable_async_logging(maxsize: int) -> AsyncLogging:
+    """Runs the handlers of the ``cvp`` loggers on a background thread."""
+    global _async_logging
+    if _async_logging is not None:
+        if _async_logging.maxsize == maxsize:
+            return _async_logging
+        disable_async_logging()
+
+    result = AsyncLogging(maxsize, CVP_LOGGER_NAME)
+    result.start()
+    _async_logging = result
+    return result
+
+
+def disable_async_logging() -> None:
+    global _async_logging
+    if _async_logging is None:
+        return
+
+    _async_logging.stop()
+    _async_logging = None
+
 
 def add_default_rotate_file_logging(
     prefix: str,
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from typing import List
+from functools import lru_cache
+from typing import Final, List, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 from cvp.types.shapes import Point
 
+BEZIER_CUBIC_MAX_SEGMENTS: Final[int] = 256
+BEZIER_CUBIC_WEIGHTS_CACHE_SIZE: Final[int] = 64
+
 
 def calc_bezier_cubic(p1: Point, p2: Point, p3: Point, p4: Point, t: float) -> Point:
     u = 1.0 - t
@@ -32,3 +39,78 @@ def bezier_cubic_points(
     for i_step in range(1, num_segments + 1):
         result.append(calc_bezier_cubic(p1, p2, p3, p4, t_step * i_step))
     return result
+
+
+def bezier_cubic_weights(num_segments: int) -> NDArray[np.float64]:
+    """
+    Bernstein weights of the cubic Bezier curve at ``num_segments + 1``
+    uniform parameters, as a read-only ``(num_segments + 1, 4)`` array.
+    """
+
+    if num_segments <= 0:
+        raise ValueError("The 'num_segments' argument must be greater than 0")
+    return _bezier_cubic_weights(num_segments)
+
+
+@lru_cache(maxsize=BEZIER_CUBIC_WEIGHTS_CACHE_SIZE)
+def _bezier_cubic_weights(num_segments: int) -> NDArray[np.float64]:
+    t = np.linspace(0.0, 1.0, num_segments + 1)
+    u = 1.0 - t
+    weights = np.stack((u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t), axis=1)
+    weights.flags.writeable = False
+    return weights
+
+
+def bezier_cubic_segments(controls: ArrayLike, tess_tol: float) -> NDArray[np.int64]:
+    """
+    Number of segments needed so that the polyline of each curve deviates by
+    at most ``tess_tol`` from the curve (Wang's formula).
+
+    :param controls: Control points of the shape ``(..., 4, 2)``.
+    """
+
+    if tess_tol <= 0:
+        raise ValueError("The 'tess_tol' argument must be greater than 0")
+
+    c = np.asarray(controls, dtype=np.float64)
+    d1 = c[..., 0, :] - 2 * c[..., 1, :] + c[..., 2, :]
+    d2 = c[..., 1, :] - 2 * c[..., 2, :] + c[..., 3, :]
+    m = np.maximum(np.hypot(d1[..., 0], d1[..., 1]), np.hypot(d2[..., 0], d2[..., 1]))
+    segments = np.ceil(np.sqrt(0.75 * m / tess_tol))
+    return np.clip(segments, 1, BEZIER_CUBIC_MAX_SEGMENTS).astype(np.int64)
+
+
+def bezier_cubic_array(controls: ArrayLike, num_segments: int) -> NDArray[np.float64]:
+    """
+    :param controls: Control points of the shape ``(4, 2)`` or ``(N, 4, 2)``.
+    :return: Points of the shape ``(num_segments + 1, 2)`` or
+        ``(N, num_segments + 1, 2)``.
+    """
+
+    c = np.asarray(controls, dtype=np.float64)
+    return np.matmul(bezier_cubic_weights(num_segments), c)
+
+
+def bezier_cubic_batch(
+    controls: ArrayLike,
+    tess_tol: float,
+) -> List[NDArray[np.float64]]:
+    """
+    Tessellates many curves at once. Curves that need the same number of
+    segments are evaluated together with a single matrix product.
+
+    :param controls: Control points of the shape ``(N, 4, 2)``.
+    :return: ``N`` arrays of points, in the order of the curves.
+    """
+
+    c = np.asarray(controls, dtype=np.float64).reshape(-1, 4, 2)
+    segments = bezier_cubic_segments(c, tess_tol)
+
+    result: List[Optional[NDArray[np.float64]]] = [None] * len(c)
+    for num_segments in np.unique(segments):
+        indices = np.flatnonzero(segments == num_segments)
+        points = bezier_cubic_array(c[indices], int(num_segments))
+        for index, curve in zip(indices, points):
+            result[index] = curve
+
+    return [curve for curve in result if curve is not None]
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from time import monotonic
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import urlparse
+
+from cvp.logging.logging import onvif_logger as logger
+from cvp.onvif.client import OnvifClient
+from cvp.variables import ONVIF_BULK_MAX_CONCURRENCY, ONVIF_BULK_MAX_PER_HOST
+from cvp.wsdl.declaration import WsdlDeclaration
+
+DEVICE_SPECIFIC_SUFFIX: Final[str] = "Token"
+
+
+def is_device_specific(argument_name: str) -> bool:
+    """Tokens such as 'ProfileToken' only exist on the device that issued them."""
+    return argument_name.endswith(DEVICE_SPECIFIC_SUFFIX)
+
+
+class OnvifBulkCall(NamedTuple):
+    uuid: str
+    """UUID of the ONVIF client."""
+
+    declaration: WsdlDeclaration
+    operation: str
+    kwargs: Mapping[str, Any] = dict()
+
+
+class OnvifBulkResult(NamedTuple):
+    call: OnvifBulkCall
+    response: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class OnvifBulkRunner:
+    """
+    Calls operations on many ONVIF devices at once.
+
+    The calls run in the executor, with at most ``max_concurrency`` requests in
+    flight and at most ``max_per_host`` requests per host, so a fleet can be
+    polled without opening too many connections to a single device. The
+    results are yielded as soon as they complete.
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[str, OnvifClient],
+        executor: Executor,
+        max_concurrency=ONVIF_BULK_MAX_CONCURRENCY,
+        max_per_host=ONVIF_BULK_MAX_PER_HOST,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("The 'max_concurrency' argument must be at least 1")
+        if max_per_host < 1:
+            raise ValueError("The 'max_per_host' argument must be at least 1")
+
+        self._clients = clients
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        self._max_per_host = max_per_host
+
+    @property
+    def max_concurrency(self):
+        return self._max_concurrency
+
+    @property
+    def max_per_host(self):
+        return self._max_per_host
+
+    def host(self, call: OnvifBulkCall) -> str:
+        client = self._clients.get(call.uuid)
+        if client is None:
+            return call.uuid
+        address = client.get_address(call.declaration)
+        netloc = urlparse(address).netloc if address else str()
+        return netloc if netloc else call.uuid
+
+    def calls(
+        self,
+        declaration: WsdlDeclaration,
+        operation: str,
+        kwargs: Optional[Mapping[str, Any]] = None,
+        uuids: Optional[Iterable[str]] = None,
+    ) -> Sequence[OnvifBulkCall]:
+        keys = self._clients.keys() if uuids is None else uuids
+        args = kwargs if kwargs else dict()
+        return [OnvifBulkCall(key, declaration, operation, args) for key in keys]
+
+    def device_calls(
+        self,
+        declaration: WsdlDeclaration,
+        operation: str,
+        uuids: Optional[Iterable[str]] = None,
+    ) -> Tuple[Sequence[OnvifBulkCall], Sequence[str]]:
+        """
+        Calls with the arguments entered for each device, for operations that
+        take device-specific arguments.
+
+        :return: The calls, and the UUIDs of the devices whose arguments are
+            incomplete, which are not called.
+        """
+
+        keys = self._clients.keys() if uuids is None else uuids
+        calls = list()
+        skipped = list()
+        for key in keys:
+            client = self._clients.get(key)
+            if client is None:
+                skipped.append(key)
+                continue
+
+            arguments = client.get_wsdl(declaration)[operation].arguments
+            if not arguments.requestable:
+                skipped.append(key)
+                continue
+
+            kwargs = arguments.kwargs()
+            calls.append(OnvifBulkCall(key, declaration, operation, kwargs))
+        return calls, skipped
+
+    def call(self, call: OnvifBulkCall) -> OnvifBulkResult:
+        begin = monotonic()
+        try:
+            client = self._clients[call.uuid]
+            operation = client.get_wsdl(call.declaration)[call.operation]
+            response = operation.request(**call.kwargs)
+        except BaseException as e:
+            logger.error(f"Bulk call {call.operation} to '{call.uuid}' failed: {e}")
+            return OnvifBulkResult(call, error=e, elapsed=monotonic() - begin)
+        else:
+            return OnvifBulkResult(call, response, elapsed=monotonic() - begin)
+
+    def run(
+        self,
+        calls: Iterable[OnvifBulkCall],
+        timeout: Optional[float] = None,
+    ) -> Iterator[OnvifBulkResult]:
+        """
+        Yields the results in the order of completion.
+
+        The calls that are not done when the ``timeout`` expires are cancelled
+        and yielded with a :class:`TimeoutError`.
+        """
+
+        queues: OrderedDict[str, Deque[OnvifBulkCall]] = OrderedDict()
+        for call in calls:
+            queues.setdefault(self.host(call), deque()).append(call)
+
+        deadline = None if timeout is None else monotonic() + timeout
+        inflight: Dict[Future[OnvifBulkResult], Tuple[str, OnvifBulkCall]] = dict()
+        per_host: Dict[str, int] = defaultdict(int)
+
+        try:
+            while queues or inflight:
+                for host in list(queues.keys()):
+                    queue = queues[host]
+                    while (
+                        queue
+                        and len(inflight) < self._max_concurrency
+                        and per_host[host] < self._max_per_host
+                    ):
+                        call = queue.popleft()
+                        inflight[self._executor.submit(self.call, call)] = host, call
+                        per_host[host] += 1
+                    if not queue:
+                        del queues[host]
+
+                remaining = None
+                if deadline is not None:
+                    remaining = max(0.0, deadline - monotonic())
+
+                done, _ = wait(inflight, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+
+                for future in done:
+                    host, _ = inflight.pop(future)
+                    per_host[host] -= 1
+                    yield future.result()
+
+            for _, call in inflight.values():
+                yield OnvifBulkResult(call, error=TimeoutError("Bulk call timed out"))
+            for queue in queues.values():
+                for call in queue:
+                    error = TimeoutError("Bulk call timed out")
+                    yield OnvifBulkResult(call, error=error)
+        finally:
+            for future in inflight:
+                future.cancel()
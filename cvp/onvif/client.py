@@ -1,17 +1,19 @@
 # -*- coding: utf-8 -*-
 
 from copy import deepcopy
-from typing import Optional, ParamSpec, Sequence, TypeVar
+from threading import Lock
+from typing import Dict, Optional, ParamSpec, Sequence, TypeVar
 
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth, HTTPDigestAuth
-from zeep import Transport
 
 from cvp.config.sections.onvif import OnvifConfig
 from cvp.config.sections.wsdl import WsdlConfig
 from cvp.logging.logging import onvif_logger as logger
 from cvp.onvif.declarations import (
     ONVIF_ANALYTICS,
+    ONVIF_DECLARATIONS,
     ONVIF_DEVICEIO,
     ONVIF_DEVICEMGMT,
     ONVIF_EVENTS,
@@ -31,6 +33,8 @@ from cvp.onvif.service import OnvifServiceMapper
 from cvp.resources.home import HomeDir
 from cvp.wsdl.cache import ZeepFileCache
 from cvp.wsdl.client import WsdlClient
+from cvp.wsdl.response_cache import WsdlResponseCache
+from cvp.wsdl.transport import ZeepTransport
 from cvp.wsdl.wsse import create_username_token
 
 WsdlRequestParam = ParamSpec("WsdlRequestParam")
@@ -65,11 +69,27 @@ class OnvifClient:
         no_cache = self._wsdl_config.no_cache
         cache_dir = str(home.wsdl)
 
+        # Keep-alive connections are pooled per host and reused by every service.
+        pool_maxsize = self._wsdl_config.pool_maxsize
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        operation_timeout = self._wsdl_config.operation_timeout
+
         self._session = Session()
         self._session.verify = not onvif_config.no_verify
-        self._cache = None if no_cache else ZeepFileCache(cache_dir)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        max_age = self._wsdl_config.document_max_age
+        self._cache = None
+        if not no_cache:
+            self._cache = ZeepFileCache(
+                cache_dir, max_age=max_age if max_age > 0 else None
+            )
         self._wsse = create_username_token(username, password, use_digest)
-        self._transport = Transport(cache=self._cache, session=self._session)
+        self._transport = ZeepTransport(
+            cache=self._cache,
+            session=self._session,
+            operation_timeout=operation_timeout if operation_timeout > 0 else None,
+        )
 
         if self._wsse is not None:
             assert username is not None
@@ -94,40 +114,116 @@ class OnvifClient:
             jsons=self._home.onvifs,
         )
         self._services.update_with_cache()
+        self._responses = WsdlResponseCache(
+            jsons=self._home.onvifs,
+            uuid=self._onvif_config.uuid,
+            config=self._wsdl_config,
+        )
+
+        self._wsdls: Dict[str, WsdlClient] = dict()
+        self._wsdls_lock = Lock()
+
+    def get_wsdl(self, declaration: WsdlDeclaration) -> WsdlClient:
+        """
+        Returns the client of the service, created on first access.
+
+        Most devices only ever use a few services, so creating the clients
+        lazily keeps connecting a device cheap.
+        """
+
+        key = declaration.namespace_binding
+        with self._wsdls_lock:
+            wsdl = self._wsdls.get(key)
+            if wsdl is None:
+                if declaration is ONVIF_DEVICEMGMT:
+                    wsdl = self.create_wsdl(declaration, self._onvif_config.address)
+                else:
+                    wsdl = self.create_wsdl(declaration)
+                self._wsdls[key] = wsdl
+            return wsdl
+
+    def get_address(self, declaration: WsdlDeclaration) -> Optional[str]:
+        wsdl = self._wsdls.get(declaration.namespace_binding)
+        if wsdl is not None:
+            return wsdl.address
+        if declaration is ONVIF_DEVICEMGMT:
+            return self._onvif_config.address
+        return self._services.get_address(declaration.namespace)
+
+    @property
+    def declarations(self) -> Sequence[WsdlDeclaration]:
+        return ONVIF_DECLARATIONS
 
-        self.devicemgmt = self.create_wsdl(ONVIF_DEVICEMGMT, self._onvif_config.address)
-        self.analytics = self.create_wsdl(ONVIF_ANALYTICS)
-        self.deviceio = self.create_wsdl(ONVIF_DEVICEIO)
-        self.events = self.create_wsdl(ONVIF_EVENTS)
-        self.imaging = self.create_wsdl(ONVIF_IMAGING)
-        self.media = self.create_wsdl(ONVIF_MEDIA)
-        self.notification = self.create_wsdl(ONVIF_NOTIFICATION)
-        self.ptz = self.create_wsdl(ONVIF_PTZ)
-        self.pullpoint = self.create_wsdl(ONVIF_PULLPOINT)
-        self.receiver = self.create_wsdl(ONVIF_RECEIVER)
-        self.recording = self.create_wsdl(ONVIF_RECODING)
-        self.replay = self.create_wsdl(ONVIF_REPLAY)
-        self.search = self.create_wsdl(ONVIF_SEARCH)
-        self.subscription = self.create_wsdl(ONVIF_SUBSCRIPTION)
+    def find_declaration(self, binding: str) -> WsdlDeclaration:
+        for declaration in self.declarations:
+            if declaration.binding == binding:
+                return declaration
+        raise KeyError(f"Not found ONVIF binding: '{binding}'")
+
+    @property
+    def created_wsdls(self) -> Sequence[WsdlClient]:
+        return tuple(self._wsdls.values())
+
+    @property
+    def devicemgmt(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_DEVICEMGMT)
+
+    @property
+    def analytics(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_ANALYTICS)
+
+    @property
+    def deviceio(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_DEVICEIO)
+
+    @property
+    def events(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_EVENTS)
+
+    @property
+    def imaging(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_IMAGING)
+
+    @property
+    def media(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_MEDIA)
+
+    @property
+    def notification(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_NOTIFICATION)
+
+    @property
+    def ptz(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_PTZ)
+
+    @property
+    def pullpoint(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_PULLPOINT)
+
+    @property
+    def receiver(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_RECEIVER)
+
+    @property
+    def recording(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_RECODING)
+
+    @property
+    def replay(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_REPLAY)
+
+    @property
+    def search(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_SEARCH)
+
+    @property
+    def subscription(self) -> WsdlClient:
+        return self.get_wsdl(ONVIF_SUBSCRIPTION)
 
     @property
     def wsdls(self) -> Sequence[WsdlClient]:
-        return (
-            self.devicemgmt,
-            self.analytics,
-            self.deviceio,
-            self.events,
-            self.imaging,
-            self.media,
-            self.notification,
-            self.ptz,
-            self.pullpoint,
-            self.receiver,
-            self.recording,
-            self.replay,
-            self.search,
-            self.subscription,
-        )
+        # Creates the clients of every service.
+        return tuple(self.get_wsdl(declaration) for declaration in self.declarations)
 
     @property
     def uuid(self):
@@ -138,14 +234,13 @@ class OnvifClient:
         declaration: WsdlDeclaration,
         address: Optional[str] = None,
         *,
-        update_onvif_ns_prefixes=False
+        update_onvif_ns_prefixes=False,
     ):
         if address is None and self._services:
             address = self._services.get_address(declaration.namespace)
 
         result = WsdlClient(
-            jsons=self._home.onvifs,
-            uuid=self._onvif_config.uuid,
+            cache=self._responses,
             declaration=declaration,
             wsse=self._wsse,
             transport=self._transport,
@@ -176,12 +271,18 @@ class OnvifClient:
     def services(self):
         return self._services
 
+    @property
+    def responses(self):
+        return self._responses
+
     def update_services(self) -> None:
         response = self.devicemgmt.GetServices(IncludeCapability=False)
         self._services.update_with_response(response)
+        self._services.write_cache(response)
 
     def update_wsdl_addresses(self) -> None:
-        for wsdl in self.wsdls:
+        # The clients created later get the address from the services.
+        for wsdl in self.created_wsdls:
             address = self._services.get_address(wsdl.namespace)
             if address is None:
                 continue
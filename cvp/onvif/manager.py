@@ -1,14 +1,18 @@
 # -*- coding: utf-8 -*-
 
 from collections import OrderedDict
+from concurrent.futures import Executor
+from threading import Thread
 from typing import List
 
 from cvp.config.sections.onvif import OnvifConfig
 from cvp.config.sections.wsdl import WsdlConfig
 from cvp.logging.logging import onvif_logger as logger
+from cvp.onvif.bulk import OnvifBulkRunner
 from cvp.onvif.client import OnvifClient
 from cvp.onvif.declarations import ONVIF_DECLARATIONS
 from cvp.resources.home import HomeDir
+from cvp.variables import ONVIF_BULK_MAX_CONCURRENCY, ONVIF_BULK_MAX_PER_HOST
 
 
 class OnvifManager(OrderedDict[str, OnvifClient]):
@@ -35,6 +39,14 @@ class OnvifManager(OrderedDict[str, OnvifClient]):
             self.__setitem__(onvif_config.uuid, service)
         return service
 
+    def create_bulk_runner(
+        self,
+        executor: Executor,
+        max_concurrency=ONVIF_BULK_MAX_CONCURRENCY,
+        max_per_host=ONVIF_BULK_MAX_PER_HOST,
+    ) -> OnvifBulkRunner:
+        return OnvifBulkRunner(self, executor, max_concurrency, max_per_host)
+
     def get_synced_client(
         self,
         onvif_config: OnvifConfig,
@@ -61,5 +73,19 @@ class OnvifManager(OrderedDict[str, OnvifClient]):
 
                 logger.debug(f"{prefix} Load ONVIF schema declaration: {binding}")
                 decl.load_schema()
+
+                logger.debug(f"{prefix} Load ONVIF operation declarations: {binding}")
+                decl.load_operations()
             except BaseException as e:
                 logger.error(e)
+
+    @classmethod
+    def preload_onvif_declarations_in_background(cls) -> Thread:
+        # A client that needs a declaration still being loaded waits for it.
+        thread = Thread(
+            target=cls.preload_onvif_declarations,
+            name="OnvifPreload",
+            daemon=True,
+        )
+        thread.start()
+        return thread
@@ -54,6 +54,11 @@ class OnvifServiceMapper(Dict[str, Service]):
     def read_cache(self) -> GetServicesResponse:
         return self._jsons.read_object(*self.cache_args)
 
+    def write_cache(self, response: GetServicesResponse) -> None:
+        # Kept apart from the response cache, which only indexes its own
+        # 'responses' directory and never evicts this file.
+        self._jsons.write_object(response, *self.cache_args)
+
     def update_with_cache(self) -> None:
         if not self.has_cache():
             return
@@ -3,12 +3,14 @@
 import io
 import os
 from collections import deque
-from subprocess import DEVNULL, PIPE
-from threading import Lock, Thread
+from subprocess import DEVNULL, PIPE, TimeoutExpired
+from threading import Thread, current_thread
+from time import monotonic
 from typing import (
     IO,
     Callable,
     Deque,
+    Final,
     Mapping,
     NamedTuple,
     Optional,
@@ -17,25 +19,82 @@ from typing import (
     Union,
 )
 
-from cvp.buffers.frame import FrameBuffer
+from cvp.buffers.frame import FrameBuffer, FrameRingBuffer
+from cvp.buffers.ring import FrameArrivals, FrameRing, FrameView
+from cvp.buffers.shared import SharedFrameRing
+from cvp.ffmpeg.structs.pix_fmt import find_default_pix_fmt
+from cvp.ffmpeg.structs.planes import PlaneShape, is_planar, plane_shapes
+from cvp.logging.logging import logger
 from cvp.process.process import Process
 from cvp.process.stream import StreamBufferPair
 from cvp.types.override import override
+from cvp.variables import (
+    FRAME_LATENCY_WINDOW,
+    FRAME_RATE_WINDOW,
+    PROCESS_TEARDOWN_TIMEOUT,
+)
+
+DEFAULT_PIX_FMT: Final[str] = "rgb24"
 
 
 class FrameShape(NamedTuple):
     width: int
     height: int
     channels: int
+    pix_fmt: str = DEFAULT_PIX_FMT
+
+    @classmethod
+    def from_pix_fmt(cls, width: int, height: int, pix_fmt: str):
+        channels = find_default_pix_fmt(pix_fmt).nb_components
+        return cls(width, height, channels, pix_fmt)
+
+    @property
+    def planar(self) -> bool:
+        return is_planar(self.pix_fmt)
+
+    @property
+    def planes(self) -> Tuple[PlaneShape, ...]:
+        if self.planar:
+            return plane_shapes(self.pix_fmt, self.width, self.height)
+        else:
+            return (PlaneShape(self.width, self.height, self.channels),)
 
     @property
     def size(self):
-        return self.width * self.height * self.channels
+        return sum(plane.size for plane in self.planes)
+
+
+class FrameStats(NamedTuple):
+    produced: int
+    """Frames read from the pipe."""
+
+    consumed: int
+    """Frames taken by the consumer, e.g. the media window."""
+
+    dropped: int
+    """Frames overwritten or discarded before being consumed."""
+
+    input_fps: float
+    latency_ms: float
+    """Mean time from the arrival of a frame to its consumption."""
+
+    max_latency_ms: float
+
+    @property
+    def pending(self) -> int:
+        return max(self.produced - self.consumed - self.dropped, 0)
+
+    @property
+    def drop_ratio(self) -> float:
+        return self.dropped / self.produced if self.produced > 0 else 0.0
 
 
 class FrameReaderProcess(Process):
     _thread_error: Optional[BaseException]
-    _deque: Deque[bytes]
+    _reader: Union[FrameBuffer, FrameRingBuffer]
+    _ring: Optional[FrameRing]
+    _latest: Optional[FrameView]
+    _latencies: Deque[float]
 
     def __init__(
         self,
@@ -51,7 +110,8 @@ class FrameReaderProcess(Process):
         target: Optional[Callable[[bytes], None]] = None,
         *,
         stream_buffers: Optional[StreamBufferPair] = None,
-        teardown: Optional[Callable[..., None]] = None
+        teardown: Optional[Callable[..., None]] = None,
+        shared_slots=0,
     ):
         frame_shape = FrameShape(*frame_shape)
         frame_shape_size = frame_shape.size
@@ -82,22 +142,38 @@ class FrameReaderProcess(Process):
 
         self._thread_error = None
         self._frame_shape = frame_shape
-        self._target = target
 
-        self._deque = deque(maxlen=deque_maxsize)
-        self._mutex = Lock()
-        self._latest = bytes()
+        self._shared: Optional[SharedFrameRing] = None
+        if shared_slots > 0:
+            self._shared = SharedFrameRing.create(frame_shape_size, shared_slots)
+        self._latest = None
         self._latest_count = 0
+        self._target = target
+        self._delivered = 0
+        self._latencies = deque(maxlen=FRAME_LATENCY_WINDOW)
 
         stdout_pipe = self.stdout
         assert stdout_pipe is not None
         assert isinstance(stdout_pipe, io.BufferedReader)
 
-        self._reader = FrameBuffer(
-            pipe=stdout_pipe,
-            frame_size=self._frame_shape.size,
-            target=self._on_frame,
-        )
+        if target is not None:
+            # Frames go straight to the target, so no ring slots are allocated.
+            self._ring = None
+            self._arrivals = FrameArrivals()
+            self._reader = FrameBuffer(
+                pipe=stdout_pipe,
+                frame_size=frame_shape_size,
+                target=self._deliver,
+            )
+        else:
+            ring = FrameRing(frame_shape_size, maxsize=deque_maxsize)
+            self._ring = ring
+            self._arrivals = ring.arrivals
+            self._reader = FrameRingBuffer(
+                pipe=stdout_pipe,
+                ring=ring,
+                on_frame=self._publish if self._shared is not None else None,
+            )
 
         self._thread = Thread(
             group=None,
@@ -112,6 +188,14 @@ class FrameReaderProcess(Process):
     def reader(self):
         return self._reader
 
+    @property
+    def ring(self):
+        return self._ring
+
+    @property
+    def shared(self):
+        return self._shared
+
     @property
     def thread(self):
         return self._thread
@@ -132,6 +216,47 @@ class FrameReaderProcess(Process):
     def latest_count(self):
         return self._latest_count
 
+    @property
+    def latest_sequence(self) -> int:
+        return self._latest.sequence if self._latest is not None else 0
+
+    @property
+    def produced(self) -> int:
+        if self._ring is None:
+            return self._delivered
+        return self._ring.produced
+
+    @property
+    def consumed(self) -> int:
+        if self._ring is None:
+            return self._delivered
+        return self._ring.consumed
+
+    @property
+    def dropped(self) -> int:
+        if self._ring is None:
+            return 0
+        return self._ring.dropped
+
+    @property
+    def input_fps(self) -> float:
+        """Arrival rate of the frames read in the last :data:`FRAME_RATE_WINDOW`."""
+        return self._arrivals.rate(FRAME_RATE_WINDOW)
+
+    def frame_stats(self) -> FrameStats:
+        latencies = self._latencies
+        latency = sum(latencies) / len(latencies) if latencies else 0.0
+        max_latency = max(latencies) if latencies else 0.0
+
+        return FrameStats(
+            produced=self.produced,
+            consumed=self.consumed,
+            dropped=self.dropped,
+            input_fps=self.input_fps,
+            latency_ms=latency * 1000.0,
+            max_latency_ms=max_latency * 1000.0,
+        )
+
     def raise_if_thread_error(self):
         if self._thread_error is not None:
             raise self._thread_error
@@ -146,28 +271,81 @@ class FrameReaderProcess(Process):
         except BaseException as e:
             self._thread_error = e
 
-    def _on_frame(self, data: bytes) -> None:
-        if self._target is not None:
-            self._target(data)
-        else:
-            self.enqueue(data)
+    def _deliver(self, data: bytes) -> None:
+        self._delivered += 1
+        self._arrivals.append(monotonic())
+        assert self._target is not None
+        self._target(data)
+
+    def _publish(self, data: memoryview) -> None:
+        assert self._shared is not None
+        self._shared.write(
+            data,
+            width=self._frame_shape.width,
+            height=self._frame_shape.height,
+            channels=self._frame_shape.channels,
+            pix_fmt=self._frame_shape.pix_fmt,
+        )
+
+    def stop(self, timeout=PROCESS_TEARDOWN_TIMEOUT) -> bool:
+        """
+        Interrupts the child, kills it on timeout, then joins the reader thread.
+
+        :return: Whether the reader thread has stopped.
+        """
+
+        if self.poll() is None:
+            self.interrupt()
+            try:
+                self.wait(timeout)
+            except TimeoutExpired:
+                logger.warning(f"Timeout raised! KILL process ({self.pid})")
+                self.kill()
+                self.wait()
+
+        if self._thread.is_alive() and self._thread is not current_thread():
+            self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    @override
+    def teardown(self):
+        # The reader thread publishes into the mapped memory until it stops.
+        stopped = self.stop()
+        super().teardown()
+
+        if self._shared is not None:
+            if stopped:
+                self._shared.close()
+            else:
+                # Leaks the segment, rather than unmapping it under the writer.
+                logger.error(f"The reader thread of process ({self.pid}) is alive")
+            self._shared = None
 
     def enqueue(self, data: bytes) -> None:
-        with self._mutex:
-            self._deque.append(data)
+        if self._ring is None:
+            self._deliver(data)
+        else:
+            self._ring.write(data)
 
-    def dequeue(self) -> bytes:
-        with self._mutex:
-            return self._deque.popleft()
+    def dequeue(self) -> FrameView:
+        # The caller owns the returned view and must release it.
+        if self._ring is None:
+            raise IndexError("Frames are delivered to the target")
+        return self._ring.dequeue()
 
-    def dequeue_latest(self) -> bytes:
+    def dequeue_latest(self) -> Optional[FrameView]:
+        # The returned view remains valid until the next call of this method.
         try:
-            self._latest = self.dequeue()
+            latest = self.dequeue()
         except IndexError:
-            # pop from an empty deque
+            # pop from an empty ring
             pass
         else:
+            if self._latest is not None:
+                self._latest.release()
+            self._latest = latest
             self._latest_count += 1
+            self._latencies.append(monotonic() - latest.timestamp)
 
         return self._latest
 
@@ -1,25 +1,68 @@
 # -*- coding: utf-8 -*-
 
 from typing import Final, Mapping, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
 
 from cvp.config.sections.ffmpeg import FFmpegConfig
-from cvp.process.frame import FrameReaderProcess, FrameShape
+from cvp.ffmpeg.structs.planes import PLANAR_LAYOUTS
+from cvp.logging.logging import logger
+from cvp.process.frame import DEFAULT_PIX_FMT, FrameReaderProcess, FrameShape
+from cvp.process.profile import StreamProfile
 from cvp.process.stream import StreamBufferPair
 from cvp.resources.home import HomeDir
 
 RGB24_CHANNELS: Final[int] = 3
 PIPE_STDOUT: Final[str] = "pipe:1"
 
+SUPPORTED_PIXEL_FORMATS: Final[Sequence[str]] = (DEFAULT_PIX_FMT, *PLANAR_LAYOUTS)
+RTSP_SCHEMES: Final[Sequence[str]] = ("rtsp", "rtsps")
+
+
+def is_rtsp_url(source: str) -> bool:
+    return urlparse(source).scheme.lower() in RTSP_SCHEMES
+
+
+def negotiate_pixel_format(pixel_format: str, planar_supported=True) -> str:
+    if pixel_format in PLANAR_LAYOUTS and not planar_supported:
+        logger.warning(
+            f"Planar pixel format '{pixel_format}' needs a GPU converter, "
+            f"falling back to '{DEFAULT_PIX_FMT}'"
+        )
+        return DEFAULT_PIX_FMT
+
+    if pixel_format in SUPPORTED_PIXEL_FORMATS:
+        return pixel_format
+
+    logger.warning(
+        f"Unsupported pixel format '{pixel_format}', "
+        f"falling back to '{DEFAULT_PIX_FMT}'"
+    )
+    return DEFAULT_PIX_FMT
+
 
 class FFmpegProcessHelper:
     def __init__(self, config: FFmpegConfig, home: HomeDir):
         self._config = config
         self._home = home
+        self._planar_supported = False
 
     @property
     def ffmpeg(self) -> str:
         return self._config.ffmpeg
 
+    @property
+    def planar_supported(self) -> bool:
+        """Whether planar frames can be displayed; unknown until the GL is ready."""
+        return self._planar_supported
+
+    @planar_supported.setter
+    def planar_supported(self, value: bool) -> None:
+        self._planar_supported = value
+
+    @property
+    def pixel_format(self) -> str:
+        return negotiate_pixel_format(self._config.pixel_format, self._planar_supported)
+
     def _spawn(
         self,
         name: str,
@@ -53,6 +96,7 @@ class FFmpegProcessHelper:
             creation_flags=None,
             target=None,
             stream_buffers=stream_buffers,
+            shared_slots=self._config.shared_frame_slots,
         )
         if start_thread:
             process.thread.start()
@@ -67,9 +111,10 @@ class FFmpegProcessHelper:
         return "-map", f"{stream_index}:a", "-f", "directsound", "default"
 
     @staticmethod
-    def rgb24_pipe_stdout_args(
+    def rawvideo_pipe_stdout_args(
         width: int,
         height: int,
+        pixel_format: str,
         stream_index=0,
     ) -> Sequence[str]:
         return (
@@ -78,26 +123,59 @@ class FFmpegProcessHelper:
             "-f",
             "rawvideo",
             "-pix_fmt",
-            "rgb24",
+            pixel_format,
             "-s",
             f"{width}x{height}",
             PIPE_STDOUT,
         )
 
-    def spawn_with_file(self, key: str, file: str, width: int, height: int):
+    @classmethod
+    def rgb24_pipe_stdout_args(
+        cls,
+        width: int,
+        height: int,
+        stream_index=0,
+    ) -> Sequence[str]:
+        return cls.rawvideo_pipe_stdout_args(width, height, "rgb24", stream_index)
+
+    def spawn_with_file(
+        self,
+        key: str,
+        file: str,
+        width: int,
+        height: int,
+        profile: Optional[StreamProfile] = None,
+    ):
+        if profile is None:
+            profile = StreamProfile(width, height)
+
+        pixel_format = self.pixel_format
         args = (
             self.ffmpeg,
             "-hide_banner",
             "-re",
+            *profile.input_args(),
             "-i",
             file,
             *self.alsa_default_args(),
-            *self.rgb24_pipe_stdout_args(width, height),
+            *profile.filter_args(),
+            *self.rawvideo_pipe_stdout_args(*profile.size, pixel_format),
         )
-        frame_shape = width, height, RGB24_CHANNELS
+        frame_shape = FrameShape.from_pix_fmt(*profile.size, pixel_format)
         return self._spawn(key, args=args, frame_shape=frame_shape)
 
-    def spawn_with_rtsp(self, key: str, url: str, width: int, height: int):
+    def spawn_with_rtsp(
+        self,
+        key: str,
+        url: str,
+        width: int,
+        height: int,
+        profile: Optional[StreamProfile] = None,
+    ):
+        if profile is None:
+            profile = StreamProfile(width, height)
+
+        pixel_format = self.pixel_format
         args = (
             self.ffmpeg,
             "-hide_banner",
@@ -109,9 +187,11 @@ class FFmpegProcessHelper:
             "low_delay",
             "-rtsp_transport",
             "tcp",
+            *profile.input_args(),
             "-i",
             url,
-            *self.rgb24_pipe_stdout_args(width, height),
+            *profile.filter_args(),
+            *self.rawvideo_pipe_stdout_args(*profile.size, pixel_format),
         )
-        frame_shape = width, height, RGB24_CHANNELS
+        frame_shape = FrameShape.from_pix_fmt(*profile.size, pixel_format)
         return self._spawn(key, args=args, frame_shape=frame_shape)
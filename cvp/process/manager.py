@@ -1,16 +1,25 @@
 # -*- coding: utf-8 -*-
 
 from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
-from typing import Callable, Optional, ParamSpec, TypeVar
+from subprocess import TimeoutExpired
+from typing import Callable, Dict, Optional, ParamSpec, TypeVar
 
+from cvp.buffers.shared import start_resource_tracker
 from cvp.concurrency.threading.runnable import ThreadRunnable
 from cvp.config.sections.ffmpeg import FFmpegConfig
 from cvp.logging.logging import logger
-from cvp.process.helper.ffmpeg import FFmpegProcessHelper
+from cvp.process.frame import FrameReaderProcess, FrameStats
+from cvp.process.helper.ffmpeg import FFmpegProcessHelper, is_rtsp_url
 from cvp.process.mapper import ProcessMapper
 from cvp.process.process import Process
+from cvp.process.profile import StreamProfile
 from cvp.resources.home import HomeDir
-from cvp.variables import MAX_PROCESS_WORKERS, MAX_THREAD_WORKERS, THREAD_POOL_PREFIX
+from cvp.variables import (
+    MAX_PROCESS_WORKERS,
+    MAX_THREAD_WORKERS,
+    PROCESS_TEARDOWN_TIMEOUT,
+    THREAD_POOL_PREFIX,
+)
 
 SubmitResultT = TypeVar("SubmitResultT")
 SubmitParamT = ParamSpec("SubmitParamT")
@@ -37,12 +46,25 @@ class ProcessManager:
             thread_name_prefix=thread_name_prefix,
         )
 
+        start_resource_tracker()
         logger.info(f"Create ProcessPoolExecutor(max_workers={process_workers}) of PM")
         self._process_pool = ProcessPoolExecutor(max_workers=process_workers)
 
         self._processes = ProcessMapper[str, Process]()
         self._ffmpeg = FFmpegProcessHelper(config=config, home=home)
 
+    @property
+    def planar_supported(self) -> bool:
+        return self._ffmpeg.planar_supported
+
+    @planar_supported.setter
+    def planar_supported(self, value: bool) -> None:
+        self._ffmpeg.planar_supported = value
+
+    @property
+    def pixel_format(self) -> str:
+        return self._ffmpeg.pixel_format
+
     @property
     def thread_pool(self):
         return self._thread_pool
@@ -98,6 +120,19 @@ class ProcessManager:
     def get(self, key: str):
         return self._processes.get(key)
 
+    def frame_stats(self, key: str) -> Optional[FrameStats]:
+        process = self._processes.get(key)
+        if isinstance(process, FrameReaderProcess):
+            return process.frame_stats()
+        return None
+
+    def frame_stats_all(self) -> Dict[str, FrameStats]:
+        return {
+            key: process.frame_stats()
+            for key, process in self._processes.items()
+            if isinstance(process, FrameReaderProcess)
+        }
+
     def pop(self, key: str):
         if not self._processes.removable(key):
             raise ValueError(f"Non-removable process: '{key}'")
@@ -142,13 +177,103 @@ class ProcessManager:
         logger.info("Shutting down PM's process pool...")
         self._process_pool.shutdown(wait=True)
 
-    def spawn_ffmpeg_with_file(self, key: str, file: str, width: int, height: int):
+    def spawn_ffmpeg_with_file(
+        self,
+        key: str,
+        file: str,
+        width: int,
+        height: int,
+        profile: Optional[StreamProfile] = None,
+    ):
         if key in self._processes:
             raise KeyError(f"Key is exists: '{key}'")
 
-        process = self._ffmpeg.spawn_with_file(key, file, width, height)
+        process = self._ffmpeg.spawn_with_file(key, file, width, height, profile)
         self._processes[key] = process
         return process
 
+    def respawn_ffmpeg_with_file(
+        self,
+        key: str,
+        file: str,
+        width: int,
+        height: int,
+        profile: Optional[StreamProfile] = None,
+    ):
+        previous = self._processes.pop(key, None)
+        if previous is not None:
+            self.retire(previous)
+        return self.spawn_ffmpeg_with_file(key, file, width, height, profile)
+
+    def spawn_ffmpeg_with_rtsp(
+        self,
+        key: str,
+        url: str,
+        width: int,
+        height: int,
+        profile: Optional[StreamProfile] = None,
+    ):
+        if key in self._processes:
+            raise KeyError(f"Key is exists: '{key}'")
+
+        process = self._ffmpeg.spawn_with_rtsp(key, url, width, height, profile)
+        self._processes[key] = process
+        return process
+
+    def respawn_ffmpeg_with_rtsp(
+        self,
+        key: str,
+        url: str,
+        width: int,
+        height: int,
+        profile: Optional[StreamProfile] = None,
+    ):
+        previous = self._processes.pop(key, None)
+        if previous is not None:
+            self.retire(previous)
+        return self.spawn_ffmpeg_with_rtsp(key, url, width, height, profile)
+
+    def spawn_ffmpeg_with_source(
+        self,
+        key: str,
+        source: str,
+        width: int,
+        height: int,
+        profile: Optional[StreamProfile] = None,
+    ):
+        """Spawns with the RTSP options for RTSP URLs, otherwise as a file."""
+        if is_rtsp_url(source):
+            return self.spawn_ffmpeg_with_rtsp(key, source, width, height, profile)
+        return self.spawn_ffmpeg_with_file(key, source, width, height, profile)
+
+    def respawn_ffmpeg_with_source(
+        self,
+        key: str,
+        source: str,
+        width: int,
+        height: int,
+        profile: Optional[StreamProfile] = None,
+    ):
+        if is_rtsp_url(source):
+            return self.respawn_ffmpeg_with_rtsp(key, source, width, height, profile)
+        return self.respawn_ffmpeg_with_file(key, source, width, height, profile)
+
+    def retire(self, process: Process, timeout=PROCESS_TEARDOWN_TIMEOUT) -> None:
+        if process.poll() is None:
+            logger.info(f"Interrupt the retired process ({process.pid}) ...")
+            process.interrupt()
+        self._thread_pool.submit(self._teardown_retired, process, timeout)
+
+    @staticmethod
+    def _teardown_retired(process: Process, timeout: float) -> None:
+        try:
+            process.wait(timeout)
+        except TimeoutExpired:
+            logger.warning(f"Timeout raised! KILL retired process ({process.pid})")
+            process.kill()
+            process.wait()
+        finally:
+            process.teardown()
+
     def create_thread_runner(self, callback: Callable[SubmitParamT, SubmitResultT]):
         return ThreadRunnable[SubmitParamT, SubmitResultT](self._thread_pool, callback)
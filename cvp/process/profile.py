@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+
+def even(value: float) -> int:
+    # Chroma subsampled formats require even frame dimensions.
+    return max(2, int(value) // 2 * 2)
+
+
+class StreamProfile(NamedTuple):
+    width: int
+    height: int
+    fps: Optional[float] = None
+    keyframes_only: bool = False
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    def input_args(self) -> Sequence[str]:
+        if self.keyframes_only:
+            return "-skip_frame", "nokey"
+        else:
+            return tuple()
+
+    def filter_args(self) -> Sequence[str]:
+        filters: List[str] = list()
+        if self.fps is not None and self.fps > 0:
+            filters.append(f"fps={self.fps:g}")
+        if filters:
+            return "-vf", ",".join(filters)
+        else:
+            return tuple()
+
+    def scaled(self, factor: float, min_width: int):
+        if factor >= 1.0:
+            return self
+
+        aspect = self.height / self.width if self.width else 1.0
+        width = even(max(self.width * factor, min(min_width, self.width)))
+        height = even(width * aspect)
+        return self._replace(width=width, height=height)
+
+    def similar(self, other: "StreamProfile", tolerance: float) -> bool:
+        if self.keyframes_only != other.keyframes_only:
+            return False
+        if (self.fps is None) != (other.fps is None):
+            return False
+        if self.fps is not None and other.fps is not None:
+            if abs(self.fps - other.fps) > self.fps * tolerance:
+                return False
+        if abs(self.width - other.width) > self.width * tolerance:
+            return False
+        if abs(self.height - other.height) > self.height * tolerance:
+            return False
+        return True
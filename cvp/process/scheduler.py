@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass
+from math import sqrt
+from time import monotonic
+from typing import Callable, Dict, Optional
+
+from cvp.config.sections.scheduler import StreamSchedulerConfig
+from cvp.logging.logging import logger
+from cvp.process.frame import FrameShape
+from cvp.process.manager import ProcessManager
+from cvp.process.profile import StreamProfile, even
+
+
+@dataclass
+class StreamDemand:
+    file: str
+    """A file path, or a URL of a network stream such as RTSP."""
+
+    native_width: int
+    native_height: int
+    view_width: float = 0.0
+    view_height: float = 0.0
+    last_seen: float = 0.0
+
+    def visible(self, now: float, timeout: float) -> bool:
+        return now - self.last_seen <= timeout
+
+    def fit_size(self, min_width: int):
+        if self.native_width <= 0 or self.native_height <= 0:
+            return 0, 0
+
+        width = max(self.view_width, min(min_width, self.native_width))
+        scale = min(1.0, width / self.native_width)
+        return even(self.native_width * scale), even(self.native_height * scale)
+
+
+class StreamScheduler:
+    """
+    Re-parameterizes the ffmpeg streams of the media windows, files and RTSP
+    cameras alike, so that the total raw frame bandwidth stays within the budget.
+
+    Visible tiles are downscaled to their on-screen size (never upscaled), tiny
+    and hidden tiles only decode keyframes, and when the budget is still
+    exceeded, the resolution and then the frame rate of every visible stream are
+    reduced by the same factor.
+    """
+
+    _demands: Dict[str, StreamDemand]
+    _profiles: Dict[str, StreamProfile]
+
+    def __init__(
+        self,
+        pm: ProcessManager,
+        config: StreamSchedulerConfig,
+        pixel_format: Callable[[], str],
+        clock: Callable[[], float] = monotonic,
+    ):
+        self._pm = pm
+        self._config = config
+        self._pixel_format = pixel_format
+        self._clock = clock
+        self._demands = dict()
+        self._profiles = dict()
+        self._last_update = 0.0
+
+    @property
+    def config(self):
+        return self._config
+
+    @property
+    def demands(self):
+        return self._demands
+
+    @property
+    def profiles(self):
+        return self._profiles
+
+    def report(
+        self,
+        key: str,
+        file: str,
+        native_width: int,
+        native_height: int,
+        view_width: float,
+        view_height: float,
+    ) -> None:
+        demand = self._demands.get(key)
+        if demand is None:
+            demand = StreamDemand(file, native_width, native_height)
+            self._demands[key] = demand
+        else:
+            demand.file = file
+            demand.native_width = native_width
+            demand.native_height = native_height
+
+        demand.view_width = view_width
+        demand.view_height = view_height
+        demand.last_seen = self._clock()
+
+    def forget(self, key: str) -> None:
+        self._demands.pop(key, None)
+        self._profiles.pop(key, None)
+
+    def cost(self, profile: StreamProfile, pixel_format: str) -> float:
+        shape = FrameShape.from_pix_fmt(*profile.size, pixel_format)
+        fps = profile.fps if profile.fps is not None else self._config.nominal_fps
+        return shape.size * fps
+
+    def plan(self, now: Optional[float] = None) -> Dict[str, StreamProfile]:
+        if now is None:
+            now = self._clock()
+
+        config = self._config
+        pixel_format = self._pixel_format()
+        timeout = config.hidden_timeout
+        result: Dict[str, StreamProfile] = dict()
+        scalable: Dict[str, StreamProfile] = dict()
+
+        for key, demand in self._demands.items():
+            width, height = demand.fit_size(config.min_width)
+            if width <= 0 or height <= 0:
+                continue
+
+            if not demand.visible(now, timeout):
+                hidden = StreamProfile(width, height, config.hidden_fps, True)
+                factor = config.min_width / width
+                result[key] = hidden.scaled(factor, config.min_width)
+            elif demand.view_width < config.tiny_width:
+                result[key] = StreamProfile(width, height, config.hidden_fps, True)
+            else:
+                scalable[key] = StreamProfile(width, height)
+
+        fixed_cost = sum(self.cost(p, pixel_format) for p in result.values())
+        scalable_cost = sum(self.cost(p, pixel_format) for p in scalable.values())
+        budget = max(0.0, config.max_bandwidth - fixed_cost)
+
+        if scalable_cost > budget and scalable_cost > 0:
+            ratio = budget / scalable_cost
+            factor = sqrt(ratio)
+            scaled = {
+                k: p.scaled(factor, config.min_width) for k, p in scalable.items()
+            }
+            scaled_cost = sum(self.cost(p, pixel_format) for p in scaled.values())
+
+            if scaled_cost > budget and scaled_cost > 0:
+                fps = max(config.min_fps, config.nominal_fps * budget / scaled_cost)
+                scaled = {k: p._replace(fps=fps) for k, p in scaled.items()}
+
+            scalable = scaled
+
+        result.update(scalable)
+        return result
+
+    def update(self, force=False) -> None:
+        if not self._config.enable:
+            return
+
+        now = self._clock()
+        if not force and now - self._last_update < self._config.interval:
+            return
+        self._last_update = now
+
+        for key in list(self._demands.keys()):
+            if key not in self._pm.processes:
+                self.forget(key)
+
+        for key, profile in self.plan(now).items():
+            demand = self._demands[key]
+            native = StreamProfile(demand.native_width, demand.native_height)
+            current = self._profiles.get(key, native)
+            if current.similar(profile, self._config.hysteresis):
+                continue
+
+            process = self._pm.get(key)
+            if process is None or process.poll() is not None:
+                continue
+
+            logger.info(f"Reschedule the stream '{key}': {profile}")
+            self._pm.respawn_ffmpeg_with_source(
+                key=key,
+                source=demand.file,
+                width=demand.native_width,
+                height=demand.native_height,
+                profile=profile,
+            )
+            self._profiles[key] = profile
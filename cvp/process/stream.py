@@ -3,11 +3,11 @@
 from os import PathLike
 from typing import Optional, Union
 
-from cvp.buffers.lines import LinesBuffer
+from cvp.buffers.lines import LinesRing
 from cvp.types.override import override
 
 
-class StreamBuffer(LinesBuffer):
+class StreamBuffer(LinesRing):
     def __init__(
         self,
         path: Union[str, PathLike[str]],
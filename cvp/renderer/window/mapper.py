@@ -5,6 +5,7 @@ from typing import List, Optional, Sequence
 
 from pygame.event import Event
 
+from cvp.chrono.profiler import FrameProfiler
 from cvp.itertools.find_index import NOT_FOUND_INDEX, find_index
 from cvp.msgs.msg import Msg
 from cvp.pygame.constants.event_type import KEY_EVENTS
@@ -94,9 +95,15 @@ class WindowMapper(OrderedDict[str, WindowBase]):
             key, win = self.popitem(last=False)
             win.do_destroy()
 
-    def do_process(self):
+    def do_process(self, profiler: Optional[FrameProfiler] = None):
+        if profiler is None:
+            for win in self.as_windows():
+                win.do_process()
+            return
+
         for win in self.as_windows():
-            win.do_process()
+            with profiler.zone(win.title):
+                win.do_process()
 
     def do_next(self):
         for key in list(key for key, win in self.items() if win.removable):
@@ -1,18 +1,104 @@
 # -*- coding: utf-8 -*-
 
 import os
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
-from shutil import move, unpack_archive
+from shutil import copyfileobj, move, unpack_archive
 from ssl import SSLContext
+from tarfile import is_tarfile
 from tempfile import TemporaryDirectory
-from typing import List, Optional, Sequence, Tuple, Union
+from threading import Lock
+from typing import (
+    IO,
+    Callable,
+    Final,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from urllib.parse import ParseResult, urlparse, urlunparse
+from uuid import uuid4
+from zipfile import ZipFile, is_zipfile
 
 import httpx
 
-from cvp.hashfunc.checksum import Method
-from cvp.hashfunc.checksum import checksum as calc_checksum
+from cvp.hashfunc.checksum import Hasher, Method, new_verifier
+from cvp.hashfunc.files import update_file, verify_file
 from cvp.resources.download.links.tuples import Checksum, ExtractPair, LinkInfo
+from cvp.variables import (
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_MIN_RANGE_SIZE,
+    DOWNLOAD_PARTIAL_EXTENSION,
+)
+
+PARTIAL_CONTENT: Final[int] = 206
+RANGE_NOT_SATISFIABLE: Final[int] = 416
+
+
+class DownloadHead(NamedTuple):
+    content_length: int
+    accept_ranges: bool
+
+
+def split_ranges(size: int, count: int) -> List[Tuple[int, int]]:
+    """Splits ``size`` bytes into at most ``count`` inclusive byte ranges."""
+    if size <= 0:
+        return list()
+
+    count = max(min(count, size), 1)
+    step, remain = divmod(size, count)
+    result = list()
+    begin = 0
+    for i in range(count):
+        end = begin + step + (1 if i < remain else 0)
+        result.append((begin, end - 1))
+        begin = end
+    return result
+
+
+def _content_range_begin(response: httpx.Response) -> int:
+    # e.g. "bytes 100-199/1000"
+    value = response.headers.get("Content-Range", "")
+    unit, _, spec = value.partition(" ")
+    if unit != "bytes" or "-" not in spec:
+        return -1
+    return int(spec.split("-", 1)[0])
+
+
+def _content_range_total(response: httpx.Response) -> int:
+    # e.g. "bytes */1000"
+    value = response.headers.get("Content-Range", "")
+    total = value.rpartition("/")[2]
+    return int(total) if total.isdigit() else -1
+
+
+def _create_temp(dest: str) -> Tuple[int, str]:
+    # Unlike mkstemp(), the file is created 0666, so the kernel applies the umask.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        temp = f"{dest}.{uuid4().hex}{DOWNLOAD_PARTIAL_EXTENSION}"
+        try:
+            return os.open(temp, flags, 0o666), temp
+        except FileExistsError:
+            continue
+
+
+def _write_member(src: IO[bytes], dest: str, mode: int) -> None:
+    # Written next to the destination first, so a failure leaves no broken file.
+    fd, temp = _create_temp(dest)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            copyfileobj(src, f, DOWNLOAD_CHUNK_SIZE)
+        if mode:
+            os.chmod(temp, mode)
+        os.replace(temp, dest)
+    except BaseException:
+        os.remove(temp)
+        raise
 
 
 class DownloadArchive:
@@ -129,15 +215,50 @@ class DownloadArchive:
     def cache_path(self) -> str:
         return os.path.join(self._cache_dir, self.filename)
 
-    def request_content_length(
+    @property
+    def partial_path(self) -> str:
+        """The file being downloaded, moved to :attr:`cache_path` once complete."""
+        return self.cache_path + DOWNLOAD_PARTIAL_EXTENSION
+
+    @property
+    def partial_size(self) -> int:
+        try:
+            return os.path.getsize(self.partial_path)
+        except FileNotFoundError:
+            return 0
+
+    def new_hasher(self) -> Optional[Hasher]:
+        if self._checksum is None:
+            return None
+        return new_verifier(self._checksum.hash_method, self._checksum.hash_value)
+
+    def file_checksum(self, path: Union[str, PathLike[str]]) -> str:
+        hasher = self.new_hasher()
+        if hasher is None:
+            raise ValueError("Checksum cache is empty")
+        update_file(hasher, path)
+        return hasher.hexdigest()
+
+    def request_head(
         self,
         timeout: Optional[float] = None,
         follow_redirects=True,
         verify: Union[str, bool, SSLContext] = True,
-    ) -> int:
+    ) -> DownloadHead:
         with httpx.Client(follow_redirects=follow_redirects, verify=verify) as client:
             response = client.head(self._url, timeout=timeout)
-            return int(response.headers["Content-Length"])
+            response.raise_for_status()
+            content_length = int(response.headers["Content-Length"])
+            accept_ranges = response.headers.get("Accept-Ranges", "") == "bytes"
+            return DownloadHead(content_length, accept_ranges)
+
+    def request_content_length(
+        self,
+        timeout: Optional[float] = None,
+        follow_redirects=True,
+        verify: Union[str, bool, SSLContext] = True,
+    ) -> int:
+        return self.request_head(timeout, follow_redirects, verify).content_length
 
     def download_streaming(
         self,
@@ -160,25 +281,194 @@ class DownloadArchive:
         timeout: Optional[float] = None,
         follow_redirects=True,
         verify: Union[str, bool, SSLContext] = True,
-    ) -> None:
-        with open(self.cache_path, "wb") as f:
-            for data in self.download_streaming(timeout, follow_redirects, verify):
-                f.write(data)
+        *,
+        resume=True,
+        connections=1,
+        head: Optional[DownloadHead] = None,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Optional[str]:
+        """
+        Downloads the archive into :attr:`partial_path`, then moves it to
+        :attr:`cache_path`.
+
+        With ``resume``, an existing partial file is continued with an HTTP
+        Range request. With several ``connections``, a large archive is
+        fetched in parallel ranges when the server accepts them. The
+        ``on_progress`` callback receives the number of bytes downloaded so far.
+
+        :return: The checksum computed while downloading, if the archive has one.
+        """
+
+        if connections > 1:
+            if head is None:
+                head = self.request_head(timeout, follow_redirects, verify)
+            min_size = connections * DOWNLOAD_MIN_RANGE_SIZE
+            if head.accept_ranges and head.content_length >= min_size:
+                return self._download_ranges(
+                    head.content_length,
+                    connections,
+                    timeout,
+                    follow_redirects,
+                    verify,
+                    on_progress,
+                )
+
+        offset = self.partial_size if resume else 0
+        hasher = self.new_hasher()
+        if offset and hasher is not None:
+            update_file(hasher, self.partial_path)
+
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        with httpx.stream(
+            "GET",
+            self._url,
+            headers=headers,
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            verify=verify,
+        ) as response:
+            if offset and response.status_code == RANGE_NOT_SATISFIABLE:
+                # The partial file may already hold the whole archive.
+                if _content_range_total(response) != offset:
+                    os.remove(self.partial_path)
+                    raise ValueError("The partial file is larger than the archive")
+                return self._finish_partial(hasher)
+
+            response.raise_for_status()
+
+            if offset and response.status_code != PARTIAL_CONTENT:
+                # The server ignored the range, so the download starts over.
+                offset = 0
+                hasher = self.new_hasher()
+            elif offset and _content_range_begin(response) != offset:
+                raise ValueError("Unexpected Content-Range of the response")
+
+            with open(self.partial_path, "ab" if offset else "wb") as f:
+                if on_progress is not None:
+                    on_progress(offset)
+                for data in response.iter_bytes():
+                    f.write(data)
+                    if hasher is not None:
+                        hasher.update(data)
+                    offset += len(data)
+                    if on_progress is not None:
+                        on_progress(offset)
+
+        return self._finish_partial(hasher)
+
+    def _finish_partial(self, hasher: Optional[Hasher]) -> Optional[str]:
+        os.replace(self.partial_path, self.cache_path)
+        return hasher.hexdigest() if hasher is not None else None
+
+    def _download_ranges(
+        self,
+        content_length: int,
+        connections: int,
+        timeout: Optional[float],
+        follow_redirects: bool,
+        verify: Union[str, bool, SSLContext],
+        on_progress: Optional[Callable[[int], None]],
+    ) -> Optional[str]:
+        lock = Lock()
+        downloaded = [0]
+
+        def _fetch(begin: int, end: int) -> None:
+            headers = {"Range": f"bytes={begin}-{end}"}
+            with httpx.Client(follow_redirects=follow_redirects, verify=verify) as c:
+                with c.stream("GET", self._url, headers=headers, timeout=timeout) as r:
+                    r.raise_for_status()
+                    if r.status_code != PARTIAL_CONTENT:
+                        raise ValueError("The server ignored the Range request")
+
+                    position = begin
+                    with open(self.partial_path, "r+b") as f:
+                        f.seek(begin)
+                        for data in r.iter_bytes():
+                            if position + len(data) > end + 1:
+                                raise ValueError("The range response is too long")
+                            f.write(data)
+                            position += len(data)
+                            with lock:
+                                downloaded[0] += len(data)
+                                if on_progress is not None:
+                                    on_progress(downloaded[0])
+
+                    if position != end + 1:
+                        raise ValueError("The range response is incomplete")
+
+        with open(self.partial_path, "wb") as f:
+            f.truncate(content_length)
+
+        try:
+            ranges = split_ranges(content_length, connections)
+            with ThreadPoolExecutor(connections, "DownloadRange") as executor:
+                futures = [executor.submit(_fetch, b, e) for b, e in ranges]
+                for future in futures:
+                    future.result()
+        except BaseException:
+            # The file has holes, so it cannot be resumed as a prefix.
+            os.remove(self.partial_path)
+            raise
+
+        hexdigest = None
+        if self._checksum is not None:
+            hexdigest = self.file_checksum(self.partial_path)
+        os.replace(self.partial_path, self.cache_path)
+        return hexdigest
+
+    def verify_checksum(self, hexdigest: Optional[str] = None) -> bool:
+        """
+        :param hexdigest: The checksum computed while downloading. If omitted,
+            the cache file is hashed in chunks.
+        """
 
-    def verify_checksum(self) -> bool:
         if not self._checksum:
             raise ValueError("Checksum cache is empty")
 
-        with open(self.cache_path, "rb") as f:
-            method = self._checksum.hash_method
-            value = self._checksum.hash_value
-            return calc_checksum(method, f.read()) == value
+        method, expected = self._checksum
+        if hexdigest is None:
+            result = verify_file(self.cache_path, method, expected)
+            if result.error is not None:
+                raise result.error
+            return result.ok
+        return hexdigest == expected.lower()
 
     def extract(self) -> None:
+        """Extracts only the :attr:`paths` members, straight from the archive."""
+        if is_zipfile(self.cache_path):
+            self._extract_zip()
+        elif is_tarfile(self.cache_path):
+            self._extract_tar()
+        else:
+            self._extract_unpacked()
+
+    def _extract_dest(self, path: ExtractPair) -> str:
+        dest = os.path.join(self._extract_root, path.extract_path)
+        os.makedirs(os.path.dirname(dest) or os.curdir, exist_ok=True)
+        return dest
+
+    def _extract_zip(self) -> None:
+        with ZipFile(self.cache_path) as archive:
+            for path in self._paths:
+                info = archive.getinfo(path.archive_path)
+                mode = (info.external_attr >> 16) & 0o7777
+                with archive.open(info) as src:
+                    _write_member(src, self._extract_dest(path), mode)
+
+    def _extract_tar(self) -> None:
+        with tarfile.open(self.cache_path) as archive:
+            for path in self._paths:
+                member = archive.getmember(path.archive_path)
+                src = archive.extractfile(member)
+                if src is None:
+                    raise FileNotFoundError(f"'{path.archive_path}' is not a file")
+                with src:
+                    _write_member(src, self._extract_dest(path), member.mode)
+
+    def _extract_unpacked(self) -> None:
         with TemporaryDirectory(dir=self._temp_dir) as tmpdir:
             unpack_archive(self.cache_path, tmpdir)
 
             for path in self._paths:
                 src = os.path.join(tmpdir, path.archive_path)
-                dest = os.path.join(self._extract_root, path.extract_path)
-                move(src, dest)
+                move(src, self._extract_dest(path))
@@ -9,8 +9,11 @@ from threading import Lock
 from time import time
 from typing import NamedTuple, Optional, Union
 
+import httpx
+
 from cvp.logging.logging import download_logger as logger
-from cvp.resources.download.archive import DownloadArchive
+from cvp.resources.download.archive import DownloadArchive, DownloadHead
+from cvp.variables import DOWNLOAD_RETRIES
 
 
 @unique
@@ -43,14 +46,17 @@ class DownloadRunner:
         verify_checksum=True,
         follow_redirects=True,
         verify: Union[str, bool, SSLContext] = True,
+        retries=DOWNLOAD_RETRIES,
+        connections=1,
     ):
-        self._future = executor.submit(self._runner)
         self._downloader = downloader
 
         self._download_timeout = download_timeout
         self._verify_checksum = verify_checksum
         self._follow_redirects = follow_redirects
         self._verify = verify
+        self._retries = retries
+        self._connections = connections
 
         self._lock = Lock()
         self._step = DownloadStep.prepare
@@ -58,6 +64,9 @@ class DownloadRunner:
         self._download_bytes = 0
         self._exception = None
 
+        # Submitted last, so the worker never sees a half-initialized runner.
+        self._future = executor.submit(self._runner)
+
     @property
     def future(self):
         return self._future
@@ -89,12 +98,43 @@ class DownloadRunner:
                 self._step = DownloadStep.done
             logger.info(f"{type(self).__name__} done")
 
+    def _on_progress(self, download_bytes: int) -> None:
+        with self._lock:
+            self._download_bytes = download_bytes
+
+    def _download(
+        self,
+        head: DownloadHead,
+        timeout: Optional[float],
+    ) -> Optional[str]:
+        """Resumes the partial file after a transport error, up to the retries."""
+        retry = 0
+        while True:
+            try:
+                return self._downloader.download(
+                    timeout=timeout,
+                    follow_redirects=self._follow_redirects,
+                    verify=self._verify,
+                    connections=self._connections,
+                    head=head,
+                    on_progress=self._on_progress,
+                )
+            except httpx.TransportError as e:
+                if retry >= self._retries:
+                    raise
+                retry += 1
+                logger.warning(
+                    f"{type(self).__name__} resume the download "
+                    f"({retry}/{self._retries}): {e}"
+                )
+
     def _streaming_main(self) -> None:
         logger.debug(f"{type(self).__name__} any_extract_files check ...")
 
         if self._downloader.any_extract_files:
             raise FileExistsError("The result file exists")
 
+        hexdigest: Optional[str] = None
         if not os.path.exists(self._downloader.cache_path):
             with self._lock:
                 self._step = DownloadStep.request_content_length
@@ -114,15 +154,17 @@ class DownloadRunner:
             )
 
             begin = time()
-            content_length = self._downloader.request_content_length(
+            head = self._downloader.request_head(
                 timeout=download_timeout,
                 follow_redirects=self._follow_redirects,
                 verify=self._verify,
             )
             with self._lock:
-                self._content_length = content_length
+                self._content_length = head.content_length
 
-            logger.debug(f"{type(self).__name__} content_length: {content_length}byes")
+            logger.debug(
+                f"{type(self).__name__} content_length: {head.content_length}byes"
+            )
 
             if download_timeout is not None:
                 download_timeout -= time() - begin
@@ -139,20 +181,12 @@ class DownloadRunner:
                 f"{type(self).__name__} download_streaming ("
                 f"timeout={timeout_text},"
                 f"follow_redirects={self._follow_redirects},"
-                f"verify={self._verify}"
+                f"verify={self._verify},"
+                f"connections={self._connections}"
                 ") ..."
             )
 
-            with open(self._downloader.cache_path, "wb") as f:
-                for data in self._downloader.download_streaming(
-                    timeout=download_timeout,
-                    follow_redirects=self._follow_redirects,
-                    verify=self._verify,
-                ):
-                    f.write(data)
-                    size = len(data)
-                    with self._lock:
-                        self._download_bytes += size
+            hexdigest = self._download(head, download_timeout)
 
         logger.debug(f"{type(self).__name__} cache_path check ...")
 
@@ -164,7 +198,7 @@ class DownloadRunner:
 
         logger.debug(f"{type(self).__name__} checksum ...")
 
-        if self._verify_checksum and not self._downloader.verify_checksum():
+        if self._verify_checksum and not self._downloader.verify_checksum(hexdigest):
             raise ValueError("Invalid checksum")
 
         with self._lock:
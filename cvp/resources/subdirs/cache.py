@@ -1,11 +1,33 @@
 # -*- coding: utf-8 -*-
 
+import os
 from os import PathLike
+from pathlib import Path
 from typing import Union
 
 from cvp.system.path import PathFlavour
+from cvp.variables import STITCH_CALIBRATION_EXTENSION
 
 
 class Cache(PathFlavour):
     def __init__(self, path: Union[str, PathLike[str]]):
         super().__init__(path)
+
+    @property
+    def fonts_dirpath(self):
+        return Path(self / "fonts")
+
+    def stitching_filepath(self, key: str):
+        return Path(self / f"stitching-{key}{STITCH_CALIBRATION_EXTENSION}")
+
+    def has_stitching(self, key: str) -> bool:
+        return self.stitching_filepath(key).exists()
+
+    def save_stitching(self, key: str, data: bytes) -> None:
+        self.stitching_filepath(key).write_bytes(data)
+
+    def load_stitching(self, key: str) -> bytes:
+        return self.stitching_filepath(key).read_bytes()
+
+    def remove_stitching(self, key: str) -> None:
+        os.remove(self.stitching_filepath(key))
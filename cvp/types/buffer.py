@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+
+from typing import TypeAlias, Union
+
+from numpy.typing import NDArray
+
+BufferLike: TypeAlias = Union[bytes, bytearray, memoryview, NDArray]
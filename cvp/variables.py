@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from typing import Final
+from typing import Final, Sequence, Tuple
 
 from cvp.types.colors import RGBA
 from cvp.types.shapes import Size
@@ -22,11 +22,28 @@ NORMAL_ICON_FONT_SIZE: Final[int] = 14
 MEDIUM_ICON_FONT_SIZE: Final[int] = 18
 LARGE_ICON_FONT_SIZE: Final[int] = 24
 
+# Basic Latin, Hangul Jamo, Hangul Compatibility Jamo and Hangul Syllables.
+FONT_ATLAS_BASE_RANGES: Final[Sequence[Tuple[int, int]]] = (
+    (0x0020, 0x007E),
+    (0x1100, 0x11FF),
+    (0x3130, 0x318F),
+    (0xAC00, 0xD7A3),
+)
+
 CONFIG_VALUE_SEPARATOR: Final[str] = ","
 CHECKSUM_DELIMITER: Final[str] = ":"
+CHECKSUM_BUFFER_SIZE: Final[int] = 1024 * 1024
+CHECKSUM_MMAP_THRESHOLD: Final[int] = 16 * 1024 * 1024
+"""Files at least this large are hashed through :mod:`mmap`, without copies."""
+
+DOWNLOAD_PARTIAL_EXTENSION: Final[str] = ".part"
+DOWNLOAD_CHUNK_SIZE: Final[int] = 1024 * 1024
+DOWNLOAD_MIN_RANGE_SIZE: Final[int] = 4 * 1024 * 1024
+DOWNLOAD_RETRIES: Final[int] = 3
 
 CODEPOINT_RANGES_EXTENSION: Final[str] = ".ranges"
 CODEPOINT_GLYPHS_EXTENSION: Final[str] = ".glyphs"
+
 KEYRING_EXTENSION: Final[str] = ".cfg"
 
 LOCAL_DOTENV_FILENAME: Final[str] = ".env.local"
@@ -37,6 +54,10 @@ MAX_PROCESS_WORKERS: Final[int] = 5
 THREAD_POOL_PREFIX: Final[str] = "cvp.threadpool"
 
 LOGGING_STEP: Final[int] = 1000
+LOGGING_ASYNC_QUEUE_SIZE: Final[int] = 10000
+FRAME_PROFILER_MAX_FRAMES: Final[int] = 300
+FRAME_LATENCY_WINDOW: Final[int] = 120
+FRAME_RATE_WINDOW: Final[float] = 1.0
 SLOW_CALLBACK_DURATION: Final[float] = 0.05
 
 MIN_SIDEBAR_WIDTH: Final[float] = 160.0
@@ -52,6 +73,23 @@ API_SELECT_WIDTH: Final[float] = 180.0
 MIN_API_SELECT_WIDTH: Final[float] = 100.0
 MAX_API_SELECT_WIDTH: Final[float] = 300.0
 
+WSDL_OPERATION_TIMEOUT: Final[float] = 10.0
+WSDL_POOL_MAXSIZE: Final[int] = 4
+"""Number of keep-alive connections kept per host."""
+
+WSDL_CACHE_STATIC_TTL: Final[float] = 24 * 60 * 60.0
+WSDL_CACHE_VOLATILE_TTL: Final[float] = 2.0
+WSDL_CACHE_STALE_WHILE_REVALIDATE: Final[float] = 7 * 24 * 60 * 60.0
+WSDL_CACHE_MAX_ENTRIES: Final[int] = 1024
+WSDL_CACHE_MEMORY_ENTRIES: Final[int] = 16
+"""Responses kept in memory per operation."""
+
+WSDL_DOCUMENT_MAX_AGE: Final[float] = 30 * 24 * 60 * 60.0
+ZEEP_CACHE_MMAP_THRESHOLD: Final[int] = 256 * 1024
+
+ONVIF_BULK_MAX_CONCURRENCY: Final[int] = 16
+ONVIF_BULK_MAX_PER_HOST: Final[int] = 2
+
 MIN_POPUP_WIDTH: Final[int] = 120
 MIN_POPUP_HEIGHT: Final[int] = 50
 MIN_POPUP_CONFIRM_WIDTH: Final[int] = 280
@@ -68,6 +106,17 @@ PROCESS_TEARDOWN_TIMEOUT: Final[float] = 2.0
 
 STREAM_LOGGING_MAXSIZE: Final[int] = 65536
 STREAM_LOGGING_NEWLINE_SIZE: Final[int] = 88
+STREAM_LOGGING_POLL_INTERVAL: Final[float] = 0.1
+
+STREAM_SCHEDULER_MAX_BANDWIDTH: Final[int] = 512 * 1024 * 1024
+STREAM_SCHEDULER_NOMINAL_FPS: Final[float] = 30.0
+STREAM_SCHEDULER_MIN_FPS: Final[float] = 5.0
+STREAM_SCHEDULER_HIDDEN_FPS: Final[float] = 1.0
+STREAM_SCHEDULER_MIN_WIDTH: Final[int] = 160
+STREAM_SCHEDULER_TINY_WIDTH: Final[int] = 128
+STREAM_SCHEDULER_HIDDEN_TIMEOUT: Final[float] = 1.0
+STREAM_SCHEDULER_INTERVAL: Final[float] = 2.0
+STREAM_SCHEDULER_HYSTERESIS: Final[float] = 0.25
 
 WSD_IPV4_MULTICAST_ADDRESS: Final[str] = "239.255.255.250"
 WSD_IPV6_MULTICAST_ADDRESS: Final[str] = "ff02::c"
@@ -97,3 +146,9 @@ FLOW_GRID_THICKNESS: Final[float] = 1.0
 FLOW_GRID_COLOR: Final[RGBA] = 0.8, 0.8, 0.8, 0.2
 
 FLOW_ARCS_HOVERING_TOLERANCE: Final[float] = 0.4
+
+FLOW_SPATIAL_CELL_SIZE: Final[float] = 128.0
+"""Cell size of the grid used to hit-test nodes and arcs, in canvas units."""
+
+STITCH_CALIBRATION_VERSION: Final[int] = 1
+STITCH_CALIBRATION_EXTENSION: Final[str] = ".npz"
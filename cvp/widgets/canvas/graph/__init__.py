@@ -461,17 +461,11 @@ class CanvasGraph(CanvasController):
         y2 = self.my
         self._roi = x1, y1, x2, y2
 
-        x1, y1, x2, y2 = self.screen_to_canvas_roi(self._roi)
-        left = min(x1, x2)
-        right = max(x1, x2)
-        top = min(y1, y2)
-        bottom = max(y1, y2)
+        roi = self.screen_to_canvas_roi(self._roi)
+        inside = {id(node) for node in self.graph.find_nodes_in_roi(roi)}
 
         for node in self.graph.nodes:
-            nx1, ny1, nx2, ny2 = node.node_roi
-            x_in = left <= nx1 <= right or left <= nx2 <= right
-            y_in = top <= ny1 <= bottom or top <= ny2 <= bottom
-            if x_in and y_in:
+            if id(node) in inside:
                 node.selected = node not in self._selected_stash
             else:
                 node.selected = node in self._selected_stash
@@ -639,6 +633,8 @@ class CanvasGraph(CanvasController):
             name_y = icon_y + pin_name_y_diff
             pin.name_pos = name_x, name_y
 
+        self.graph.update_node_bounds(node)
+
     def draw_nodes(self) -> None:
         for node in reversed(self.graph.nodes):
             self.draw_node(node)
@@ -256,6 +256,7 @@ class FlowWindow(AuiWindow[FlowAuiConfig]):
                     node = self.context.fm.add_node(canvas.graph, node_path)
                     canvas.update_node_roi(node)
                     node.node_pos = canvas.mouse_to_canvas_coords()
+                    canvas.graph.update_node_bounds(node)
 
         if imgui.begin_popup_context_window().opened:
             try:
@@ -1,18 +1,21 @@
 # -*- coding: utf-8 -*-
 
-from collections import deque
+from dataclasses import dataclass
 from logging import CRITICAL, DEBUG, ERROR, INFO, NOTSET, WARNING, Handler, LogRecord
-from typing import Callable, Deque, NamedTuple
+from typing import Callable, NamedTuple, Optional
 from weakref import finalize
 
 import imgui
 
+from cvp.containers.filtered_ring import FilteredRing
 from cvp.context.context import Context
 from cvp.flow.datas.graph import Graph
 from cvp.imgui.begin_child import begin_child
 from cvp.imgui.checkbox import checkbox
 from cvp.imgui.combo import combo
+from cvp.imgui.fonts.atlas import request_glyphs
 from cvp.imgui.fonts.mapper import FontMapper
+from cvp.imgui.list_clipper import list_clipper
 from cvp.logging.logging import (
     SEVERITY_NAME_CRITICAL,
     SEVERITY_NAME_DEBUG,
@@ -54,6 +57,16 @@ class _LineRecord(NamedTuple):
     level: int
     levelname: str
     message: str
+    text: str
+
+
+@dataclass(frozen=True)
+class _LineFilter:
+    level: int
+    keyword: str
+
+    def __call__(self, line: _LineRecord) -> bool:
+        return self.level <= line.level and self.keyword in line.message
 
 
 def _unregister_handler(handler: _LoggingHandler) -> None:
@@ -61,7 +74,8 @@ def _unregister_handler(handler: _LoggingHandler) -> None:
 
 
 class LogsTab(TabItem[Graph]):
-    _records: Deque[_LineRecord]
+    _records: FilteredRing[_LineRecord]
+    _line_filter: Optional[_LineFilter]
 
     def __init__(self, context: Context, fonts: FontMapper, cursor: FlowCursor):
         super().__init__(context, "Logs")
@@ -69,7 +83,8 @@ class LogsTab(TabItem[Graph]):
         self._cursor = cursor
 
         assert 1 <= self.context.config.flow_aui.logs.lines
-        self._records = deque(maxlen=self.context.config.flow_aui.logs.lines)
+        self._records = FilteredRing(self.context.config.flow_aui.logs.lines)
+        self._line_filter = None
         self._handler = _LoggingHandler(self.on_logging)
         logger.addHandler(self._handler)
         self._finalizer = finalize(self, _unregister_handler, self._handler)
@@ -125,12 +140,19 @@ class LogsTab(TabItem[Graph]):
             return imgui.get_style().colors[imgui.COLOR_TEXT]
 
     def on_logging(self, record: LogRecord, message: str) -> None:
-        self._records.append(_LineRecord(record.levelno, record.levelname, message))
+        levelname = record.levelname
+        text = f"[{levelname}] {message}"
+        self._records.append(_LineRecord(record.levelno, levelname, message, text))
 
     def update_records_maxlen(self, maxlen: int) -> None:
-        new_lines = type(self._records)(maxlen=maxlen)
-        new_lines.extend(self._records)
-        self._records = new_lines
+        self._records.resize(maxlen)
+
+    def update_line_filter(self) -> None:
+        # The records are only scanned again when the filter changes.
+        line_filter = _LineFilter(self.get_level_number(), self.filter)
+        if line_filter != self._line_filter:
+            self._line_filter = line_filter
+            self._records.set_predicate(line_filter)
 
     @override
     def on_process(self) -> None:
@@ -153,17 +175,14 @@ class LogsTab(TabItem[Graph]):
 
         imgui.separator()
 
-        with begin_child("##Logging", border=False):
-            filter_level = self.get_level_number()
-
-            for line in self._records:
-                if line.level < filter_level:
-                    continue
-                if line.message.find(self.filter) == -1:
-                    continue
+        self.update_line_filter()
 
-                color = self.get_level_color(line.level)
-                imgui.text_colored(f"[{line.levelname}] {line.message}", *color)
+        with begin_child("##Logging", border=False):
+            with list_clipper(self._records.filtered_count) as indices:
+                for line in self._records.filtered_range(indices.start, indices.stop):
+                    color = self.get_level_color(line.level)
+                    request_glyphs(line.text)
+                    imgui.text_colored(line.text, *color)
 
             if self.autoscroll:
                 imgui.set_scroll_here_y(1.0)
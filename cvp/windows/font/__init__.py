@@ -122,12 +122,26 @@ class FontManager(Manager[FontManagerConfig, Font]):
             label = f"{begin:06X}-{end:06X}"
             if imgui.selectable(label, block == self.selected_block)[1]:
                 self.selected_block = block
+                self.prefetch_block(item, block)
+
+    def prefetch_block(self, item: Font, block: Tuple[int, int]):
+        begin, end = block
+        executor = self.context.pm.thread_pool
+        return item.prefetch_codepoint_infos(begin, end, executor)
 
     def draw_codepoint_matrix(self, item: Font) -> None:
         if self.selected_block not in item.blocks:
             text_centered("Please select a item")
             return
 
+        if self._fonts.atlas is not None:
+            self._fonts.atlas.request_range(self.selected_begin, self.selected_end)
+
+        prefetch = self.prefetch_block(item, self.selected_block)
+        if not prefetch.done():
+            text_centered("Loading ...")
+            return
+
         codepoint_begin = self.selected_begin
         normal_stroke_color = imgui.get_color_u32_rgba(*self.normal_stroke_color)
         error_stroke_color = imgui.get_color_u32_rgba(*self.error_stroke_color)
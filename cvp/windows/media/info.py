@@ -52,9 +52,9 @@ class MediaInfoTab(TabItem[MediaWindowConfig]):
         imgui.text(f"Process ({status})")
 
         if button("Spawn", disabled=not spawnable):
-            self.context.pm.spawn_ffmpeg_with_file(
+            self.context.pm.spawn_ffmpeg_with_source(
                 key=item.uuid,
-                file=item.file,
+                source=item.file,
                 width=item.frame_width,
                 height=item.frame_height,
             )
@@ -1,15 +1,19 @@
 # -*- coding: utf-8 -*-
 
-from ctypes import addressof, c_void_p, create_string_buffer, memmove
-from typing import Final, Tuple
+from typing import Final, Optional, Tuple
 
 import imgui
-from OpenGL import GL
 
 from cvp.config.sections.media import MediaWindowConfig
 from cvp.context.context import Context
+from cvp.gl.pbo import PixelBufferRing
+from cvp.gl.texture import Texture
+from cvp.gl.yuv import YuvConverter, has_yuv_converter
 from cvp.imgui.draw_list.get_draw_list import get_window_draw_list
 from cvp.imgui.menu_item_ex import menu_item
+from cvp.logging.logging import logger
+from cvp.process.frame import FrameShape
+from cvp.process.helper.ffmpeg import RGB24_CHANNELS
 from cvp.renderer.window.base import WindowBase
 from cvp.types.override import override
 
@@ -30,40 +34,28 @@ class MediaWindow(WindowBase[MediaWindowConfig]):
         )
 
         self._clear_color = 0.5, 0.5, 0.5, 1.0
-        self._texture = 0
-        self._pbo = 0
+        self._texture = Texture()
+        self._pbos = PixelBufferRing()
+        self._yuv = YuvConverter()
+        self._frame_shape = FrameShape(0, 0, RGB24_CHANNELS)
+        self._unsupported_frame_shape: Optional[FrameShape] = None
         self._prev_frame_index = 0
 
+    @property
+    def texture(self):
+        return self._texture
+
     @override
     def on_create(self) -> None:
-        assert self._texture == 0
-        assert self._pbo == 0
-
-        self._texture = GL.glGenTextures(1)
-        GL.glBindTexture(GL.GL_TEXTURE_2D, self._texture)
-        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_LINEAR)
-        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_LINEAR)
-        GL.glTexImage2D(
-            GL.GL_TEXTURE_2D,
-            0,
-            GL.GL_RGB,
-            self._min_width,
-            self._min_height,
-            0,
-            GL.GL_RGB,
-            GL.GL_UNSIGNED_BYTE,
-            None,
-        )
-        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+        assert not self._texture.opened
+        assert not self._pbos.opened
 
-        self._pbo = GL.glGenBuffers(1)
-        GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, self._pbo)
-        size = self._min_width * self._min_height * 3
-        GL.glBufferData(GL.GL_PIXEL_UNPACK_BUFFER, size, None, GL.GL_STREAM_DRAW)
-        GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, 0)
+        self.reset_texture(
+            FrameShape(self._min_width, self._min_height, RGB24_CHANNELS)
+        )
 
-        assert self._texture != 0
-        assert self._pbo != 0
+        assert self._texture.opened
+        assert self._pbos.opened
 
     @override
     def begin(self) -> Tuple[bool, bool]:
@@ -74,14 +66,10 @@ class MediaWindow(WindowBase[MediaWindowConfig]):
 
     @override
     def on_destroy(self) -> None:
-        assert self._texture != 0
-        assert self._pbo != 0
+        assert self._texture.opened
+        assert self._pbos.opened
 
-        GL.glDeleteTextures(1, self._texture)
-        self._texture = 0
-
-        GL.glDeleteBuffers(1, self._pbo)
-        self._pbo = 0
+        self.close_texture()
 
     @override
     def on_process(self) -> None:
@@ -92,10 +80,29 @@ class MediaWindow(WindowBase[MediaWindowConfig]):
         finally:
             imgui.end_child()
 
+    def close_texture(self) -> None:
+        if self._texture.opened:
+            self._texture.close()
+        if self._yuv.opened:
+            self._yuv.close()
+        self._pbos.close()
+
+    def reset_texture(self, frame_shape: FrameShape) -> None:
+        self.close_texture()
+        self._texture.open(frame_shape.width, frame_shape.height, immutable=True)
+        self._pbos.open(frame_shape.size)
+        if frame_shape.planar:
+            self._yuv.open(frame_shape.pix_fmt, frame_shape.planes)
+        self._frame_shape = frame_shape
+
     def update_texture(self) -> None:
-        if not self._texture:
+        if not self._texture.opened:
             return
 
+        # Transfers the frame written during the previous update.
+        # Since the source is a PBO, the upload does not stall the UI thread.
+        self.flush_pending_pbo()
+
         process = self.context.pm.get(self.window_config.uuid)
         if process is None:
             return
@@ -103,77 +110,44 @@ class MediaWindow(WindowBase[MediaWindowConfig]):
         if process.poll() is not None:
             return
 
-        pixels = process.dequeue_latest()
-        if not pixels:
+        frame = process.dequeue_latest()
+        if frame is None:
             return
 
-        if self._prev_frame_index == process.latest_count:
+        if self._prev_frame_index == frame.sequence:
             return
 
-        self._prev_frame_index = process.latest_count
-        width = process.frame_shape.width
-        height = process.frame_shape.height
-        channels = process.frame_shape.channels
+        self._prev_frame_index = frame.sequence
+        frame_shape = process.frame_shape
 
-        if width <= 0 or height <= 0:
+        if frame_shape.width <= 0 or frame_shape.height <= 0:
             return
 
-        assert isinstance(width, int)
-        assert isinstance(height, int)
-        assert isinstance(channels, int)
-        assert channels == 3
-
-        self.update_texture_image_2d(width, height, pixels)
-        # self.update_texture_with_pbo(width, height, channels, pixels)
-
-    def update_texture_image_2d(self, width: int, height: int, pixels: bytes) -> None:
-        GL.glBindTexture(GL.GL_TEXTURE_2D, self._texture)
-        GL.glTexImage2D(
-            GL.GL_TEXTURE_2D,
-            0,
-            GL.GL_RGB,
-            width,
-            height,
-            0,
-            GL.GL_RGB,
-            GL.GL_UNSIGNED_BYTE,
-            pixels,
-        )
-        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
-
-    def update_texture_with_pbo(
-        self,
-        width: int,
-        height: int,
-        channels: int,
-        pixels: bytes,
-    ) -> None:
-        GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, self._pbo)
-        GL.glBindTexture(GL.GL_TEXTURE_2D, self._texture)
-        GL.glTexSubImage2D(
-            GL.GL_TEXTURE_2D,
-            0,
-            0,
-            0,
-            width,
-            height,
-            GL.GL_RGB,
-            GL.GL_UNSIGNED_BYTE,
-            c_void_p(0),
-        )
+        if self._frame_shape != frame_shape:
+            if frame_shape.planar and not has_yuv_converter():
+                if self._unsupported_frame_shape != frame_shape:
+                    self._unsupported_frame_shape = frame_shape
+                    pix_fmt = frame_shape.pix_fmt
+                    logger.error(f"Planar frames are not supported: {pix_fmt}")
+                return
 
-        size = width * height * channels
+            assert frame_shape.planar or frame_shape.channels == RGB24_CHANNELS
+            self.reset_texture(frame_shape)
 
-        GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, self._pbo)
-        GL.glBufferData(GL.GL_PIXEL_UNPACK_BUFFER, size, None, GL.GL_STREAM_DRAW)
+        self._pbos.write(frame.data)
 
-        buffer_ptr = GL.glMapBuffer(GL.GL_PIXEL_UNPACK_BUFFER, GL.GL_WRITE_ONLY)
-        if buffer_ptr:
-            pixels_ptr = addressof(create_string_buffer(pixels, size))
-            memmove(buffer_ptr, pixels_ptr, size)
-            GL.glUnmapBuffer(GL.GL_PIXEL_UNPACK_BUFFER)
+    def flush_pending_pbo(self) -> None:
+        pbo = self._pbos.pop_pending()
+        if pbo is None:
+            return
 
-        GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, 0)
+        if self._yuv.opened:
+            with pbo:
+                self._yuv.upload_from_unpack_buffer()
+            self._yuv.render(self._texture)
+        else:
+            with pbo, self._texture as texture:
+                texture.update_rgb_sub_image()
 
     @staticmethod
     def begin_child_canvas() -> None:
@@ -192,11 +166,19 @@ class MediaWindow(WindowBase[MediaWindowConfig]):
         filled_color = imgui.get_color_u32_rgba(*self._clear_color)
         draw_list.add_rect_filled(cx, cy, cx + cw, cy + cy, filled_color)
 
+        self.context.scheduler.report(
+            key=self.window_config.uuid,
+            file=self.window_config.file,
+            native_width=self.window_config.frame_width,
+            native_height=self.window_config.frame_height,
+            view_width=cw,
+            view_height=ch,
+        )
         self.update_texture()
 
         p1 = cx, cy
         p2 = cx + cw, cy + ch
-        draw_list.add_image(self._texture, p1, p2, (0, 0), (1, 1))
+        draw_list.add_image(self._texture.texture, p1, p2, (0, 0), (1, 1))
 
     def on_popup_menu(self):
         if not imgui.begin_popup_context_window().opened:
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from traceback import format_exc
 from typing import Any, Dict, Final, Sequence, Tuple
 
@@ -13,11 +14,12 @@ from cvp.imgui.button import button
 from cvp.imgui.clipboard import put_clipboard_text
 from cvp.imgui.push_item_width import item_width
 from cvp.imgui.slider_float import slider_float
+from cvp.onvif.bulk import is_device_specific
 from cvp.onvif.client import OnvifClient
 from cvp.types.override import override
 from cvp.widgets.tab import TabItem
 from cvp.widgets.wsdl_operation import WsdlOperationWidget
-from cvp.wsdl.client import WsdlClient
+from cvp.wsdl.declaration import WsdlDeclaration
 from cvp.wsdl.operation import WsdlOperationProxy
 
 NOT_FOUND_INDEX: Final[int] = -1
@@ -39,6 +41,8 @@ class OnvifApisTab(TabItem[OnvifConfig]):
         super().__init__(context, "APIs")
         self._operation_widget = WsdlOperationWidget()
         self._request_runner = self.context.pm.create_thread_runner(self.on_api_request)
+        self._bulk_runner = self.context.pm.create_thread_runner(self.on_bulk_request)
+        self._bulk_summary = str()
         self._response_cache = dict()
         self._response_error = dict()
         self._show_copied_message = False
@@ -57,6 +61,37 @@ class OnvifApisTab(TabItem[OnvifConfig]):
             self._response_error[key] = error
             raise
 
+    def on_bulk_request(self, operation: WsdlOperationProxy) -> None:
+        config = self.context.config.onvif_manager
+        max_concurrency = config.bulk_max_concurrency
+        onvif = self.context.om[operation.uuid]
+        declaration = onvif.find_declaration(operation.binding_name)
+        device_specific = any(is_device_specific(n) for n in operation.arguments)
+
+        # The bulk calls must not wait on the pool that runs this callback.
+        with ThreadPoolExecutor(max_concurrency, "OnvifBulk") as executor:
+            runner = self.context.om.create_bulk_runner(
+                executor,
+                max_concurrency=max_concurrency,
+                max_per_host=config.bulk_max_per_host,
+            )
+            if device_specific:
+                # Each device gets the tokens entered in its own APIs tab.
+                calls, skipped = runner.device_calls(declaration, operation.name)
+            else:
+                kwargs = operation.arguments.kwargs()
+                calls = runner.calls(declaration, operation.name, kwargs)
+                skipped = list()
+
+            suffix = f", {len(skipped)} skipped without arguments" if skipped else ""
+            self._bulk_summary = f"0/{len(calls)} devices succeeded{suffix}"
+            succeeded = 0
+            for result in runner.run(calls):
+                if result.ok:
+                    succeeded += 1
+                summary = f"{succeeded}/{len(calls)} devices succeeded{suffix}"
+                self._bulk_summary = summary
+
     @property
     def api_select_width(self) -> float:
         return self.context.config.onvif_manager.api_select_width
@@ -121,8 +156,9 @@ class OnvifApisTab(TabItem[OnvifConfig]):
     def on_item(self, item: OnvifConfig) -> None:
         try:
             onvif = self.process_onvif_client(item)
-            binding_index, binding_name = self.process_binding_index(item, onvif.wsdls)
-            apis = self.process_apis(onvif.wsdls, binding_index)
+            declarations = onvif.declarations
+            binding_index, binding_name = self.process_binding_index(item, declarations)
+            apis = self.process_apis(onvif, declarations[binding_index])
             api_name = self.process_select_api(item, apis)
             imgui.same_line()
             self.process_api_details(apis, api_name)
@@ -142,9 +178,9 @@ class OnvifApisTab(TabItem[OnvifConfig]):
     def process_binding_index(
         self,
         item: OnvifConfig,
-        wsdls: Sequence[WsdlClient],
+        declarations: Sequence[WsdlDeclaration],
     ) -> Tuple[int, str]:
-        bindings = [wsdl.binding_name for wsdl in wsdls]
+        bindings = [declaration.binding for declaration in declarations]
 
         if not bindings:
             self.text_warning("There are no bindings to choose from")
@@ -178,10 +214,10 @@ class OnvifApisTab(TabItem[OnvifConfig]):
 
     def process_apis(
         self,
-        wsdls: Sequence[WsdlClient],
-        binding_index: int,
+        onvif: OnvifClient,
+        declaration: WsdlDeclaration,
     ) -> Dict[str, WsdlOperationProxy]:
-        apis = wsdls[binding_index].service_operations
+        apis = onvif.get_wsdl(declaration).service_operations
 
         if not apis:
             self.text_warning("There are no APIs to choose from")
@@ -235,6 +271,17 @@ class OnvifApisTab(TabItem[OnvifConfig]):
 
             imgui.same_line()
 
+            disable_bulk_request = disable_request or bool(self._bulk_runner)
+            if button("Request All Devices", disabled=disable_bulk_request):
+                self._bulk_summary = str()
+                self._bulk_runner(operation)
+
+            if self._bulk_summary:
+                imgui.same_line()
+                imgui.text(self._bulk_summary)
+
+            imgui.same_line()
+
             has_latest = operation.has_latest()
             has_cache = operation.has_cache()
             disable_remove_cache = not has_latest and not has_cache
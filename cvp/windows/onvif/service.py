@@ -85,9 +85,10 @@ class OnvifServiceTab(TabItem[OnvifConfig]):
                 imgui.table_headers_row()
 
                 with wsdl_table:
-                    for wsdl in onvif.wsdls:
+                    for declaration in onvif.declarations:
+                        address = onvif.get_address(declaration)
                         imgui.table_next_row()
                         imgui.table_set_column_index(0)
-                        imgui.text(wsdl.binding_name)
+                        imgui.text(declaration.binding)
                         imgui.table_set_column_index(1)
-                        imgui.text(wsdl.address if wsdl.address else str())
+                        imgui.text(address if address else str())
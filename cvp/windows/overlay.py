@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from math import floor
-from typing import Final, Tuple
+from typing import Final, Optional, Tuple
 
 import imgui
 
@@ -27,11 +27,18 @@ OVERLAY_WINDOW_FLAGS: Final[int] = (
 
 
 class OverlayWindow(WindowBase[OverlayWindowConfig]):
-    def __init__(self, context: Context):
+    def __init__(
+        self,
+        context: Context,
+        window_config: Optional[OverlayWindowConfig] = None,
+        title="Overlay",
+    ):
         super().__init__(
             context=context,
-            window_config=context.config.overlay_window,
-            title="Overlay",
+            window_config=(
+                window_config if window_config else context.config.overlay_window
+            ),
+            title=title,
             closable=False,
             flags=OVERLAY_WINDOW_FLAGS,
         )
@@ -99,6 +106,9 @@ class OverlayWindow(WindowBase[OverlayWindowConfig]):
         mouse_pos = imgui.get_mouse_pos()
         imgui.text(f"Mouse: {floor(mouse_pos.x)}, {floor(mouse_pos.y)}")
 
+        self.do_popup_context_window()
+
+    def do_popup_context_window(self) -> None:
         if begin_popup_context_window().opened:
             try:
                 self.on_popup_context_window()
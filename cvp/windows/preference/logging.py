@@ -6,9 +6,14 @@ from typing import Final, Sequence
 import imgui
 
 from cvp.context.context import Context
+from cvp.imgui.checkbox import checkbox
+from cvp.imgui.input_int import input_int
 from cvp.logging.logging import (
     SEVERITIES,
     convert_level_number,
+    disable_async_logging,
+    enable_async_logging,
+    get_async_logging,
     loads_logging_config,
     logger,
     set_root_level,
@@ -108,3 +113,31 @@ class LoggingPreference(PopupPropagator, PreferenceWidget):
             set_root_level(level)
             logger.log(level, f"Changed root severity: {severity_value}")
             self.root_severity = severity_value
+
+        imgui.separator()
+        if async_result := checkbox("Asynchronous logging", self._config.async_queue):
+            self._config.async_queue = async_result.state
+            if async_result.state:
+                enable_async_logging(self._config.async_queue_size)
+            else:
+                disable_async_logging()
+
+        imgui.text("Queue size:")
+        queue_size_result = input_int(
+            "##AsyncQueueSize",
+            self._config.async_queue_size,
+            step=1000,
+            step_fast=10000,
+            flags=imgui.INPUT_TEXT_ENTER_RETURNS_TRUE,
+        )
+        if queue_size_result and queue_size_result.value >= 1:
+            self._config.async_queue_size = queue_size_result.value
+            if get_async_logging() is not None:
+                enable_async_logging(queue_size_result.value)
+
+        async_logging = get_async_logging()
+        if async_logging is not None:
+            stats = async_logging.stats
+            imgui.text(f"Queued: {stats.queued}")
+            imgui.text(f"Handled: {stats.handled}")
+            imgui.text(f"Dropped: {stats.dropped}")
@@ -7,6 +7,7 @@ from cvp.context.context import Context
 from cvp.process.process import Process
 from cvp.types.override import override
 from cvp.widgets.manager_tabs import ManagerTabs
+from cvp.windows.process.frames import ProcessFramesTab
 from cvp.windows.process.info import ProcessInfoTab
 from cvp.windows.process.stream import ProcessStreamTab
 
@@ -21,6 +22,7 @@ class ProcessManager(ManagerTabs[ProcessManagerConfig, Process]):
             flags=None,
         )
         self.register(ProcessInfoTab(context))
+        self.register(ProcessFramesTab(context))
         self.register(ProcessStreamTab.from_stdout(context))
         self.register(ProcessStreamTab.from_stderr(context))
 
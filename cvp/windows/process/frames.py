@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import imgui
+
+from cvp.context.context import Context
+from cvp.imgui.input_text_disabled import input_text_disabled
+from cvp.imgui.text_centered import text_centered
+from cvp.process.process import Process
+from cvp.types.override import override
+from cvp.widgets.tab import TabItem
+
+
+class ProcessFramesTab(TabItem[Process]):
+    def __init__(self, context: Context):
+        super().__init__(context, "Frames")
+
+    @override
+    def on_item(self, item: Process) -> None:
+        stats = self.context.pm.frame_stats(item.name)
+        if stats is None:
+            text_centered("The process does not read frames")
+            return
+
+        imgui.text("Input FPS:")
+        input_text_disabled("## InputFPS", f"{stats.input_fps:.2f}")
+
+        imgui.text("Latency (mean/max):")
+        latency = f"{stats.latency_ms:.2f}ms / {stats.max_latency_ms:.2f}ms"
+        input_text_disabled("## Latency", latency)
+
+        imgui.separator()
+
+        imgui.text("Produced:")
+        input_text_disabled("## Produced", str(stats.produced))
+
+        imgui.text("Consumed:")
+        input_text_disabled("## Consumed", str(stats.consumed))
+
+        imgui.text("Pending:")
+        input_text_disabled("## Pending", str(stats.pending))
+
+        imgui.text("Dropped:")
+        dropped = f"{stats.dropped} ({stats.drop_ratio * 100.0:.1f}%)"
+        input_text_disabled("## Dropped", dropped)
@@ -6,9 +6,12 @@ import imgui
 
 from cvp.context.context import Context
 from cvp.imgui.begin_child import begin_child
+from cvp.imgui.fonts.atlas import request_glyphs
+from cvp.imgui.list_clipper import list_clipper
 from cvp.imgui.text_centered import text_centered
 from cvp.process.process import Process
 from cvp.types.override import override
+from cvp.variables import STREAM_LOGGING_POLL_INTERVAL
 from cvp.widgets.tab import TabItem
 
 
@@ -46,12 +49,16 @@ class ProcessStreamTab(TabItem[Process]):
             text_centered(f"The {self.label} buffer does not exist")
             return
 
-        buffer.update_safe()
+        buffer.poll(STREAM_LOGGING_POLL_INTERVAL)
 
         self._auto_scroll = imgui.checkbox("Auto Scroll", self._auto_scroll)[1]
 
         with begin_child("## Logging", border=True):
-            imgui.text_unformatted(buffer.getvalue())
+            with list_clipper(len(buffer)) as indices:
+                for index in indices:
+                    line = buffer[index]
+                    request_glyphs(line)
+                    imgui.text_unformatted(line)
 
             if self._auto_scroll:
                 # if imgui.get_scroll_y() >= imgui.get_scroll_max_y()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from typing import Final, Sequence, Tuple
+from zlib import crc32
+
+import imgui
+
+from cvp.chrono.filename import DATETIME_SHORT_FORMAT
+from cvp.chrono.profiler import FrameProfiler, FrameSample
+from cvp.config.sections.overlay import ProfilerWindowConfig
+from cvp.context.context import Context
+from cvp.imgui.draw_list.get_draw_list import get_window_draw_list
+from cvp.imgui.menu_item_ex import menu_item
+from cvp.logging.logging import logger
+from cvp.palette.basic import GREEN, NAVY, OLIVE, PURPLE, TEAL
+from cvp.types.override import override
+from cvp.windows.overlay import OverlayWindow
+
+ZONE_COLORS: Final[Sequence[Tuple[float, float, float]]] = (
+    GREEN,
+    NAVY,
+    OLIVE,
+    PURPLE,
+    TEAL,
+)
+
+
+class ProfilerWindow(OverlayWindow):
+    """Timeline of the zones of the latest frame, and the slowest zones."""
+
+    def __init__(self, context: Context, profiler: FrameProfiler):
+        super().__init__(context, context.config.profiler_window, "Profiler")
+        self._profiler_config = context.config.profiler_window
+        self._profiler = profiler
+
+    @property
+    def profiler_config(self) -> ProfilerWindowConfig:
+        return self._profiler_config
+
+    @staticmethod
+    def zone_color(name: str) -> int:
+        r, g, b = ZONE_COLORS[crc32(name.encode()) % len(ZONE_COLORS)]
+        return imgui.get_color_u32_rgba(r, g, b, 1.0)
+
+    def draw_timeline(self, frame: FrameSample) -> None:
+        width = self._profiler_config.timeline_width
+        zone_height = self._profiler_config.zone_height
+        depth = max((zone.depth for zone in frame.zones), default=0) + 1
+        span = max(frame.duration_ms, self._profiler_config.frame_budget)
+        scale = width / (span * 1_000_000.0)
+
+        x, y = imgui.get_cursor_screen_pos()
+        draw_list = get_window_draw_list()
+        text_color = imgui.get_color_u32_rgba(1.0, 1.0, 1.0, 1.0)
+        budget_x = x + self._profiler_config.frame_budget * 1_000_000.0 * scale
+
+        for zone in frame.zones:
+            x0 = x + (zone.begin - frame.begin) * scale
+            x1 = max(x0 + 1.0, x + (zone.end - frame.begin) * scale)
+            y0 = y + zone.depth * zone_height
+            y1 = y0 + zone_height - 1.0
+            draw_list.add_rect_filled(x0, y0, x1, y1, self.zone_color(zone.name))
+
+            label = f"{zone.name} {zone.duration_ms:.2f}"
+            if imgui.calc_text_size(label).x < x1 - x0:
+                draw_list.add_text(x0 + 1.0, y0, text_color, label)
+
+        budget_color = imgui.get_color_u32_rgba(*self.window_config.error_color)
+        draw_list.add_line(budget_x, y, budget_x, y + depth * zone_height, budget_color)
+        imgui.dummy(width, depth * zone_height)
+
+    @override
+    def on_process(self) -> None:
+        frame = self._profiler.latest
+        if frame is None:
+            imgui.text("No frames recorded")
+            self.do_popup_context_window()
+            return
+
+        durations = [f.duration_ms for f in self._profiler.frames]
+        mean = sum(durations) / len(durations)
+        color = self.get_framerate_color(1000.0 / mean if mean > 0 else 0.0)
+        imgui.text_colored(f"Frame: {mean:.2f}ms (max {max(durations):.2f}ms)", *color)
+
+        self.draw_timeline(frame)
+        imgui.separator()
+
+        for stats in self._profiler.stats()[: self._profiler_config.stats_count]:
+            imgui.text(f"{stats.mean_ms:6.2f} {stats.max_ms:6.2f}ms {stats.name}")
+
+        self.do_popup_context_window()
+
+    def save_chrome_trace(self) -> None:
+        name = f"trace-{datetime.now().strftime(DATETIME_SHORT_FORMAT)}.json"
+        path = self.context.home.logs / name
+        self._profiler.save_chrome_trace(path)
+        logger.info(f"Save the chrome trace file: '{str(path)}'")
+
+    @override
+    def on_popup_context_window(self) -> None:
+        if menu_item("Pause", self._profiler.paused):
+            self._profiler.paused = not self._profiler.paused
+        if menu_item("Save Chrome Trace"):
+            self.save_chrome_trace()
+
+        imgui.separator()
+        super().on_popup_context_window()
@@ -9,6 +9,7 @@ import imgui
 from cvp.config.sections.toast import ToastWindowConfig
 from cvp.context.context import Context
 from cvp.imgui.draw_list.get_draw_list import get_foreground_draw_list
+from cvp.imgui.fonts.atlas import request_glyphs
 from cvp.imgui.measure_window_roi import get_window_roi
 from cvp.logging.logging import INFO, convert_level_number
 from cvp.renderer.window.base import WindowBase
@@ -125,6 +126,7 @@ class ToastWindow(WindowBase[ToastWindowConfig]):
         current_item = self._items[0]
         message = current_item.message
         level = current_item.level
+        request_glyphs(message)
 
         br, bg, bb = self._window_config.background_color
         assert isinstance(br, float)
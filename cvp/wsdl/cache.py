@@ -1,19 +1,30 @@
 # -*- coding: utf-8 -*-
 
 import os
+from hashlib import sha256
+from mmap import ACCESS_READ, mmap
 from os import PathLike
 from pathlib import Path
 from sys import audit
-from typing import Any, Final, NamedTuple, Optional, Union
+from tempfile import mkstemp
+from threading import Lock
+from time import time
+from typing import Any, Dict, Final, NamedTuple, Optional, Set, Union
 from urllib.parse import urlparse
 
+import orjson
 from zeep.cache import Base as ZeepCacheBase
 
 from cvp.logging.logging import wsdl_logger as logger
 from cvp.types.override import override
+from cvp.variables import ZEEP_CACHE_MMAP_THRESHOLD
 
 CACHE_SET_AUDIT_EVENT: Final[str] = "cvp.wsdl.cache.set"
-CACHE_GET_AUDIT_EVENT: Final[str] = "cvp.wsdl.cache.set"
+CACHE_GET_AUDIT_EVENT: Final[str] = "cvp.wsdl.cache.get"
+
+_DIGEST_SIZE: Final[int] = 64
+_META_SUFFIX: Final[str] = ".json"
+_TEMP_SUFFIX: Final[str] = ".tmp"
 
 
 class CacheSetAuditArgs(NamedTuple):
@@ -28,28 +39,194 @@ class CacheGetAuditArgs(NamedTuple):
     error: Optional[BaseException]
 
 
+class ZeepCacheEntry(NamedTuple):
+    url: str
+    path: Path
+    created: float
+    """Time the content was fetched or last confirmed by the server."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        result = dict()
+        if self.etag:
+            result["If-None-Match"] = self.etag
+        if self.last_modified:
+            result["If-Modified-Since"] = self.last_modified
+        return result
+
+
+def url_digest(url: str) -> str:
+    return sha256(url.encode("utf-8")).hexdigest()
+
+
+def _is_digest(name: str) -> bool:
+    if len(name) != _DIGEST_SIZE:
+        return False
+    return all(c in "0123456789abcdef" for c in name)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Readers see either the previous file or the complete new one, never a
+    # partially written file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp = mkstemp(prefix=path.name, suffix=_TEMP_SUFFIX, dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 class ZeepFileCache(ZeepCacheBase):
-    def __init__(self, prefix: Union[str, PathLike[str]], *, readonly=False):
+    """
+    Documents fetched by zeep, stored by the SHA-256 of their URL.
+
+    The content of a URL is stored in ``<prefix>/<digest[:2]>/<digest>`` with
+    its metadata next to it. The directory is scanned once, on first use, so
+    lookups do not touch the filesystem. Files in the previous
+    ``<prefix>/<hostname>/<path>`` layout, like the package assets, are still
+    found, ignoring the query string as before.
+    """
+
+    _index: Optional[Dict[str, ZeepCacheEntry]]
+    _legacy: Set[str]
+
+    def __init__(
+        self,
+        prefix: Union[str, PathLike[str]],
+        *,
+        readonly=False,
+        max_age: Optional[float] = None,
+        use_mmap=False,
+    ):
         super().__init__()
         self._prefix = prefix
         self._readonly = readonly
+        self._max_age = max_age
+        self._use_mmap = use_mmap
+        self._index = None
+        self._legacy = set()
+        self._lock = Lock()
+
+    @property
+    def prefix(self):
+        return self._prefix
+
+    @property
+    def readonly(self) -> bool:
+        return self._readonly
+
+    @property
+    def max_age(self) -> Optional[float]:
+        """Seconds before an entry is revalidated. ``None`` never expires."""
+        return self._max_age
 
     def get_cache_path(self, url: str) -> Path:
+        digest = url_digest(url)
+        return Path(self._prefix, digest[:2], digest)
+
+    def get_legacy_path(self, url: str) -> Path:
         o = urlparse(url)
         hostname = o.hostname if o.hostname else "__unknown_host__"
         return Path(os.path.join(self._prefix, hostname, *o.path.split("/")))
 
+    def _load_index(self) -> Dict[str, ZeepCacheEntry]:
+        if self._index is not None:
+            return self._index
+
+        index: Dict[str, ZeepCacheEntry] = dict()
+        root = str(self._prefix)
+        for dirpath, _, filenames in os.walk(root):
+            names = set(filenames)
+            for filename in filenames:
+                path = Path(dirpath, filename)
+                if filename.endswith(_TEMP_SUFFIX):
+                    continue
+                if _is_digest(filename):
+                    if filename + _META_SUFFIX not in names:
+                        continue
+                    try:
+                        meta = orjson.loads(
+                            path.with_name(filename + _META_SUFFIX).read_bytes()
+                        )
+                        index[filename] = ZeepCacheEntry(path=path, **meta)
+                    except BaseException as e:  # noqa
+                        logger.warning(f"Broken cache metadata '{str(path)}': {e}")
+                elif filename.endswith(_META_SUFFIX) and _is_digest(
+                    filename[: -len(_META_SUFFIX)]
+                ):
+                    continue
+                else:
+                    self._legacy.add(os.path.relpath(path, root))
+
+        self._index = index
+        return index
+
+    def entry(self, url: str) -> Optional[ZeepCacheEntry]:
+        with self._lock:
+            return self._load_index().get(url_digest(url))
+
+    def is_expired(self, entry: ZeepCacheEntry) -> bool:
+        if self._max_age is None:
+            return False
+        return time() - entry.created > self._max_age
+
+    def _find_path(self, url: str) -> Optional[Path]:
+        with self._lock:
+            entry = self._load_index().get(url_digest(url))
+            if entry is not None:
+                return entry.path
+
+            legacy = self.get_legacy_path(url)
+            if os.path.relpath(legacy, str(self._prefix)) in self._legacy:
+                return legacy
+            return None
+
+    def _read(self, path: Path) -> bytes:
+        with path.open("rb") as f:
+            if (
+                self._use_mmap
+                and os.fstat(f.fileno()).st_size >= ZEEP_CACHE_MMAP_THRESHOLD
+            ):
+                with mmap(f.fileno(), 0, access=ACCESS_READ) as m:
+                    return m[:]
+            return f.read()
+
+    def _write_entry(self, entry: ZeepCacheEntry, content: Optional[bytes]) -> None:
+        meta = entry._asdict()
+        meta.pop("path")
+        if content is not None:
+            _write_atomic(entry.path, content)
+        _write_atomic(
+            entry.path.with_name(entry.path.name + _META_SUFFIX), orjson.dumps(meta)
+        )
+        with self._lock:
+            self._load_index()[entry.path.name] = entry
+
     @override
-    def add(self, url: str, content: Any):
+    def add(
+        self,
+        url: str,
+        content: Any,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
         if self._readonly:
             raise ValueError("Cannot add files to read-only storage")
 
         filepath = self.get_cache_path(url)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        entry = ZeepCacheEntry(url, filepath, time(), etag, last_modified)
         try:
-            if not filepath.exists():
-                with filepath.open("wb") as f:
-                    f.write(content)
+            self._write_entry(entry, content)
         except BaseException as e:  # noqa
             logger.error(f"{type(self).__name__}.add(url={url}) error: {e}")
             audit(CACHE_SET_AUDIT_EVENT, *CacheSetAuditArgs(url, filepath, e))
@@ -57,13 +234,21 @@ class ZeepFileCache(ZeepCacheBase):
             logger.debug(f"{type(self).__name__}.add(url={url}) ok")
             audit(CACHE_SET_AUDIT_EVENT, *CacheSetAuditArgs(url, filepath, None))
 
+    def touch(self, url: str) -> None:
+        """Marks the entry as fresh, after the server confirmed it is unchanged."""
+        if self._readonly:
+            raise ValueError("Cannot update files of read-only storage")
+
+        entry = self.entry(url)
+        if entry is None:
+            raise KeyError(f"Not cached URL: '{url}'")
+        self._write_entry(entry._replace(created=time()), None)
+
     @override
     def get(self, url: str):
-        filepath = self.get_cache_path(url)
         try:
-            if filepath.is_file():
-                with filepath.open("rb") as f:
-                    result = f.read()
+            filepath = self._find_path(url)
+            result = self._read(filepath) if filepath is not None else None
         except BaseException as e:  # noqa
             logger.warning(f"{type(self).__name__}.get(url={url}) error: {e}")
             audit(CACHE_GET_AUDIT_EVENT, *CacheGetAuditArgs(url, None, e))
@@ -7,9 +7,9 @@ from zeep.proxy import ServiceProxy
 from zeep.wsdl.definitions import Operation
 from zeep.wsse import UsernameToken
 
-from cvp.resources.formats.json import JsonFormatPath
 from cvp.wsdl.declaration import WsdlDeclaration
 from cvp.wsdl.operation import WsdlOperationProxy
+from cvp.wsdl.response_cache import WsdlResponseCache
 
 _ADDRESS_BINDING_OPTION_KEY: Final[str] = "address"
 
@@ -17,40 +17,36 @@ _ADDRESS_BINDING_OPTION_KEY: Final[str] = "address"
 class WsdlClient:
     def __init__(
         self,
-        jsons: JsonFormatPath,
-        uuid: str,
+        cache: WsdlResponseCache,
         declaration: WsdlDeclaration,
         wsse: Optional[UsernameToken] = None,
         transport: Optional[Transport] = None,
         address: Optional[str] = None,
     ):
-        self._jsons = jsons
-        self._uuid = uuid
+        self._cache = cache
         self._declaration = declaration
         self._client = Client(wsdl=declaration.wsdl, wsse=wsse, transport=transport)
         self._binding = self._client.wsdl.bindings[self.declaration.namespace_binding]
-        self._schema = declaration.schema
         binding_options = {_ADDRESS_BINDING_OPTION_KEY: address}
         self._service = ServiceProxy(self._client, self._binding, **binding_options)
         self._service._operations = self._create_wsdl_operation_proxies()
 
     def _create_wsdl_operation_proxies(self):
         result = dict()
-        for name, operation in self._binding.all().items():
-            assert isinstance(name, str)
-            assert isinstance(operation, Operation)
+        for name, spec in self._declaration.operations.items():
             operation_proxy = WsdlOperationProxy(
-                jsons=self._jsons,
-                uuid=self._uuid,
+                cache=self._cache,
                 binding_name=self._declaration.binding,
-                operation_name=name,
                 service_proxy=self._service,
-                operation=operation,
-                schema=self._schema,
+                spec=spec,
             )
             result[name] = operation_proxy
         return result
 
+    @property
+    def cache(self):
+        return self._cache
+
     @property
     def declaration(self):
         return self._declaration
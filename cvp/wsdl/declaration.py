@@ -1,15 +1,27 @@
 # -*- coding: utf-8 -*-
 
 from dataclasses import dataclass
-from typing import Optional
+from inspect import Parameter
+from threading import RLock
+from typing import Dict, Optional, Tuple
 
 from lxml.etree import QName
 from zeep.settings import Settings
 from zeep.wsdl import Document
+from zeep.wsdl.definitions import Operation
 
+from cvp.wsdl.annotation import ElementAnnotation
+from cvp.wsdl.operation import WsdlOperationSpec
 from cvp.wsdl.schema import XsdSchema
 from cvp.wsdl.transport import create_transport_with_package_asset
 
+_documents: Dict[str, Document] = dict()
+_schemas: Dict[Tuple[str, str], XsdSchema] = dict()
+
+# Several bindings are declared in the same WSDL document, and the documents may be
+# preloaded in a background thread.
+_lock = RLock()
+
 
 @dataclass
 class WsdlDeclaration:
@@ -20,6 +32,7 @@ class WsdlDeclaration:
 
     _document: Optional[Document] = None
     _schema: Optional[XsdSchema] = None
+    _operations: Optional[Dict[str, WsdlOperationSpec]] = None
 
     @property
     def namespace_binding(self) -> str:
@@ -38,7 +51,12 @@ class WsdlDeclaration:
         )
 
     def load_document(self) -> None:
-        self._document = self.create_document()
+        with _lock:
+            document = _documents.get(self.location)
+            if document is None:
+                document = self.create_document()
+                _documents[self.location] = document
+            self._document = document
 
     @property
     def wsdl(self):
@@ -55,7 +73,13 @@ class WsdlDeclaration:
         )
 
     def load_schema(self) -> None:
-        self._schema = self.create_schema()
+        with _lock:
+            key = self.location, self.namespace
+            schema = _schemas.get(key)
+            if schema is None:
+                schema = self.create_schema()
+                _schemas[key] = schema
+            self._schema = schema
 
     @property
     def schema(self):
@@ -63,3 +87,37 @@ class WsdlDeclaration:
             self.load_schema()
         assert self._schema is not None
         return self._schema
+
+    def create_operations(self) -> Dict[str, WsdlOperationSpec]:
+        binding = self.wsdl.bindings[self.namespace_binding]
+        schema = self.schema
+        result = dict()
+        for name, operation in binding.all().items():
+            assert isinstance(name, str)
+            assert isinstance(operation, Operation)
+            parameters = tuple(
+                Parameter(
+                    element_name,
+                    Parameter.POSITIONAL_OR_KEYWORD,
+                    annotation=ElementAnnotation(element, schema),
+                )
+                for element_name, element in operation.input.body.type.elements
+            )
+            result[name] = WsdlOperationSpec(name, operation, parameters)
+        return result
+
+    def load_operations(self) -> None:
+        with _lock:
+            if self._operations is None:
+                self._operations = self.create_operations()
+
+    @property
+    def operations(self) -> Dict[str, WsdlOperationSpec]:
+        """
+        The operation metadata of the binding, shared by every client of the
+        declaration. Only the address, wsse and transport are bound per device.
+        """
+        if self._operations is None:
+            self.load_operations()
+        assert self._operations is not None
+        return self._operations
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, List, Tuple
+from collections import OrderedDict
+from inspect import Parameter
+from threading import Lock
+from time import time
+from typing import Any, List, Mapping, NamedTuple, Optional, Set, Tuple
 
 from zeep.proxy import OperationProxy, ServiceProxy
 from zeep.wsdl.definitions import Operation
@@ -8,53 +12,80 @@ from zeep.xsd import Element
 
 from cvp.inspect.argument import Argument, ArgumentMapper
 from cvp.logging.logging import wsdl_logger as logger
-from cvp.resources.formats.json import JsonFormatPath
 from cvp.types.override import override
-from cvp.wsdl.annotation import ElementAnnotation
-from cvp.wsdl.schema import XsdSchema
+from cvp.variables import WSDL_CACHE_MEMORY_ENTRIES
+from cvp.wsdl.response_cache import (
+    WsdlCachePolicy,
+    WsdlResponseCache,
+    arguments_digest,
+    normalize_arguments,
+)
 from cvp.wsdl.serialize import serialize_object
 
 
+class WsdlOperationSpec(NamedTuple):
+    name: str
+    operation: Operation
+    parameters: Tuple[Parameter, ...]
+    """Input elements, annotated with :class:`cvp.wsdl.annotation.ElementAnnotation`."""
+
+
 class WsdlOperationProxy(OperationProxy):
+    """
+    Operation of a device, with its responses cached by arguments.
+
+    A fresh response is returned from memory or from the disk. A stale one is
+    returned while it is refreshed in the background, if the policy allows it,
+    and the operation is called otherwise.
+    """
+
+    _arguments: Optional[ArgumentMapper]
+    _memory: OrderedDict[str, Tuple[float, Any]]
+    _revalidating: Set[str]
+
     def __init__(
         self,
-        jsons: JsonFormatPath,
-        uuid: str,
+        cache: WsdlResponseCache,
         binding_name: str,
-        operation_name: str,
         service_proxy: ServiceProxy,
-        operation: Operation,
-        schema: XsdSchema,
+        spec: WsdlOperationSpec,
     ):
-        super().__init__(service_proxy, operation_name)
-        self._uuid = uuid
-        self._jsons = jsons
+        super().__init__(service_proxy, spec.name)
+        self._cache = cache
         self._binding_name = binding_name
-        self._operation = operation
-
-        input_elements = self._operation.input.body.type.elements
-        self._arguments = self._create_arguments(input_elements, schema)
+        self._spec = spec
+        self._operation = spec.operation
+        self._policy = cache.policy(spec.name)
+        self._arguments = None
         self._latest = None
+        self._memory = OrderedDict()
+        self._revalidating = set()
+        self._lock = Lock()
 
-    @staticmethod
-    def _create_arguments(input_elements: List[Tuple[str, Element]], schema: XsdSchema):
+    def _create_arguments(self):
+        # The arguments hold the values entered for this device only.
         result = ArgumentMapper()
-        for name, element in input_elements:
-            annotation = ElementAnnotation(element, schema)
-            result[name] = Argument.from_details(name, annotation=annotation)
+        for parameter in self._spec.parameters:
+            result[parameter.name] = Argument(parameter)
         return result
 
     @property
     def input_elements(self) -> List[Tuple[str, Element]]:
         return self._operation.input.body.type.elements
 
+    @property
+    def spec(self):
+        return self._spec
+
     @property
     def arguments(self):
+        if self._arguments is None:
+            self._arguments = self._create_arguments()
         return self._arguments
 
     @property
     def uuid(self) -> str:
-        return self._uuid
+        return self._cache.uuid
 
     @property
     def binding_name(self) -> str:
@@ -65,6 +96,14 @@ class WsdlOperationProxy(OperationProxy):
         assert isinstance(self._op_name, str)
         return self._op_name
 
+    @property
+    def policy(self) -> WsdlCachePolicy:
+        return self._policy
+
+    @policy.setter
+    def policy(self, value: WsdlCachePolicy) -> None:
+        self._policy = value
+
     @property
     def latest(self) -> Any:
         return self._latest
@@ -77,40 +116,108 @@ class WsdlOperationProxy(OperationProxy):
     def cache_args(self) -> Tuple[str, str, str]:
         return self.uuid, self.binding_name, self.name
 
+    def cache_key(self, *args, **kwargs) -> str:
+        names = [parameter.name for parameter in self._spec.parameters]
+        return arguments_digest(normalize_arguments(names, args, kwargs))
+
+    def _cache_paths(self, kwargs: Optional[Mapping[str, Any]]):
+        # Without arguments, the arguments entered for the device are used.
+        if kwargs is None:
+            kwargs = self.arguments.kwargs()
+        key = self.cache_key(**kwargs)
+        return self._cache.store.paths(self.binding_name, self.name, key)
+
     def has_latest(self) -> bool:
         return self._latest is not None
 
-    def has_cache(self) -> bool:
-        return self._jsons.has_object(*self.cache_args)
+    def has_cache(self, kwargs: Optional[Mapping[str, Any]] = None) -> bool:
+        return self._cache.store.has(*self._cache_paths(kwargs))
 
-    def read_cache(self) -> Any:
-        return self._jsons.read_object(*self.cache_args)
+    def read_cache(self, kwargs: Optional[Mapping[str, Any]] = None) -> Any:
+        entry = self._cache.store.read(*self._cache_paths(kwargs))
+        return entry[1] if entry is not None else None
 
-    def write_cache(self, o: Any) -> int:
-        return self._jsons.write_object(o, *self.cache_args)
+    def write_cache(self, o: Any, kwargs: Optional[Mapping[str, Any]] = None) -> None:
+        self._cache.store.write(o, *self._cache_paths(kwargs))
 
-    def remove_cache(self) -> None:
-        self._jsons.remove_object(*self.cache_args)
+    def remove_cache(self, kwargs: Optional[Mapping[str, Any]] = None) -> None:
+        self._cache.store.remove(*self._cache_paths(kwargs))
 
     def clear_latest(self) -> None:
-        self._latest = None
+        with self._lock:
+            self._latest = None
+            self._memory.clear()
+
+    def _remember(self, key: str, created: float, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = created, value
+            self._memory.move_to_end(key)
+            while len(self._memory) > WSDL_CACHE_MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        paths = self._cache.store.paths(self.binding_name, self.name, key)
+        entry = self._cache.store.read(*paths)
+        if entry is not None:
+            self._remember(key, *entry)
+        return entry
+
+    def request(self, *args, **kwargs):
+        """Always calls the operation, then updates the caches."""
+        response = serialize_object(super().__call__(*args, **kwargs))
+        if self._policy.cacheable:
+            key = self.cache_key(*args, **kwargs)
+            self._remember(key, time(), response)
+            paths = self._cache.store.paths(self.binding_name, self.name, key)
+            self._cache.store.write(response, *paths)
+        self._latest = response
+        return response
+
+    def _revalidate(self, key: str, *args, **kwargs) -> None:
+        try:
+            self.request(*args, **kwargs)
+        except BaseException as e:
+            logger.warning(f"Failed to revalidate {self.name}: {e}")
+        finally:
+            with self._lock:
+                self._revalidating.discard(key)
+
+    def revalidate(self, *args, **kwargs) -> bool:
+        key = self.cache_key(*args, **kwargs)
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+        self._cache.executor.submit(self._revalidate, key, *args, **kwargs)
+        return True
 
     @override
     def __call__(self, *args, **kwargs):
         prefix = f"Call {self.name}(args={args}, kwargs={kwargs})"
 
-        if self._latest is not None:
-            logger.info(f"{prefix} memory cache")
-        elif self.has_cache():
-            logger.info(f"{prefix} file cache")
-            self._latest = self.read_cache()
-        else:
-            logger.info(f"{prefix} operation")
-            response = super().__call__(*args, **kwargs)
-            self._latest = serialize_object(response)
-            self.write_cache(self._latest)
-
-        return self._latest
+        if self._policy.cacheable:
+            entry = self._lookup(self.cache_key(*args, **kwargs))
+            if entry is not None:
+                created, value = entry
+                age = time() - created
+                if self._policy.is_fresh(age):
+                    logger.info(f"{prefix} cache")
+                    self._latest = value
+                    return value
+                if self._policy.is_revalidatable(age):
+                    logger.info(f"{prefix} stale cache")
+                    self.revalidate(*args, **kwargs)
+                    self._latest = value
+                    return value
+
+        logger.info(f"{prefix} operation")
+        return self.request(*args, **kwargs)
 
     def call_with_arguments(self):
-        return self.__call__(**self._arguments.kwargs())
+        return self.__call__(**self.arguments.kwargs())
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from hashlib import sha256
+from inspect import Parameter
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any, Dict, Final, Mapping, Optional, Sequence, Tuple
+
+import orjson
+
+from cvp.config.sections.wsdl import WsdlConfig
+from cvp.logging.logging import wsdl_logger as logger
+from cvp.resources.formats.json import JsonFormatPath
+from cvp.wsdl.serialize import serialize_object
+
+WSDL_VOLATILE_OPERATIONS: Final[Sequence[str]] = (
+    "GetCurrentMessage",
+    "GetCurrentPreset",
+    "GetSystemDateAndTime",
+    "GetSystemLog",
+)
+WSDL_VOLATILE_SUFFIXES: Final[Sequence[str]] = ("Status", "State", "SearchResults")
+
+WSDL_RESPONSES_DIRNAME: Final[str] = "responses"
+"""Under the directory of a device, apart from the other documents stored there."""
+
+_ARGUMENTS_DIGEST_SIZE: Final[int] = 32
+
+_revalidate_executor: Optional[Executor] = None
+_revalidate_executor_lock = Lock()
+
+
+def get_revalidate_executor() -> Executor:
+    global _revalidate_executor
+    with _revalidate_executor_lock:
+        if _revalidate_executor is None:
+            _revalidate_executor = ThreadPoolExecutor(2, "WsdlRevalidate")
+        return _revalidate_executor
+
+
+def is_volatile_operation(operation_name: str) -> bool:
+    """The responses of these queries change without any request."""
+    if operation_name.endswith(tuple(WSDL_VOLATILE_SUFFIXES)):
+        return True
+    return operation_name in WSDL_VOLATILE_OPERATIONS
+
+
+def normalize_arguments(
+    names: Sequence[str],
+    args: Sequence[Any],
+    kwargs: Mapping[str, Any],
+) -> bytes:
+    """
+    Canonical JSON of the call arguments. Positional arguments are named after
+    the input parameters, and unset arguments are dropped.
+    """
+
+    values: Dict[str, Any] = dict(zip(names, args))
+    values.update(kwargs)
+    values = {
+        k: v for k, v in values.items() if v is not None and v is not Parameter.empty
+    }
+    return orjson.dumps(serialize_object(values), option=orjson.OPT_SORT_KEYS)
+
+
+def arguments_digest(normalized: bytes) -> str:
+    if normalized == b"{}":
+        return str()
+    return sha256(normalized).hexdigest()[:_ARGUMENTS_DIGEST_SIZE]
+
+
+@dataclass(frozen=True)
+class WsdlCachePolicy:
+    ttl: Optional[float] = None
+    """Seconds a response stays fresh. ``None`` never expires, ``0`` never caches."""
+
+    stale_while_revalidate: float = 0.0
+    """Seconds past the TTL a stale response is returned while it is refreshed."""
+
+    @property
+    def cacheable(self) -> bool:
+        return self.ttl is None or self.ttl > 0
+
+    def is_fresh(self, age: float) -> bool:
+        return self.ttl is None or age <= self.ttl
+
+    def is_revalidatable(self, age: float) -> bool:
+        if self.ttl is None:
+            return False
+        return age <= self.ttl + self.stale_while_revalidate
+
+
+WSDL_NO_CACHE_POLICY: Final[WsdlCachePolicy] = WsdlCachePolicy(ttl=0.0)
+
+
+class WsdlResponseStore:
+    """
+    JSON responses of one device on disk, evicted in least recently used order.
+
+    Only the files under ``<uuid>/responses`` belong to the store, so documents
+    kept next to it, like the GetServices response, are never evicted.
+
+    The modification time of a file is the time of the response, and its access
+    time, updated on every read, orders the eviction.
+    """
+
+    _index: Optional[Dict[Path, float]]
+
+    def __init__(self, jsons: JsonFormatPath, uuid: str, max_entries: int):
+        self._jsons = jsons
+        self._uuid = uuid
+        self._max_entries = max_entries
+        self._index = None
+        self._lock = Lock()
+
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    def paths(self, binding: str, operation: str, digest: str) -> Tuple[str, ...]:
+        root = self._uuid, WSDL_RESPONSES_DIRNAME
+        if digest:
+            return *root, binding, operation, digest
+        return *root, binding, operation
+
+    def _load_index(self) -> Dict[Path, float]:
+        if self._index is not None:
+            return self._index
+
+        self._index = dict()
+        root = Path(self._jsons, self._uuid, WSDL_RESPONSES_DIRNAME)
+        if root.is_dir():
+            for path in root.rglob("*.json"):
+                try:
+                    self._index[path] = path.stat().st_atime
+                except FileNotFoundError:
+                    continue
+        return self._index
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load_index())
+
+    def has(self, *paths: str) -> bool:
+        return self._jsons.has_object(*paths)
+
+    def read(self, *paths: str) -> Optional[Tuple[float, Any]]:
+        path = self._jsons.object_path(*paths)
+        with self._lock:
+            try:
+                mtime = path.stat().st_mtime
+                data = self._jsons.read_object(*paths)
+            except FileNotFoundError:
+                self._load_index().pop(path, None)
+                return None
+
+            now = time()
+            os.utime(path, (now, mtime))
+            self._load_index()[path] = now
+            return mtime, data
+
+    def write(self, o: Any, *paths: str) -> None:
+        path = self._jsons.object_path(*paths)
+        with self._lock:
+            self._jsons.write_object(o, *paths)
+            index = self._load_index()
+            index[path] = time()
+            self._evict(index)
+
+    def remove(self, *paths: str) -> None:
+        path = self._jsons.object_path(*paths)
+        with self._lock:
+            self._load_index().pop(path, None)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _evict(self, index: Dict[Path, float]) -> None:
+        if len(index) <= self._max_entries:
+            return
+
+        overflow = len(index) - self._max_entries
+        for path in sorted(index, key=index.__getitem__)[:overflow]:
+            index.pop(path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            logger.debug(f"Evict the cached response: '{str(path)}'")
+
+
+class WsdlResponseCache:
+    """The response cache policies and the response store of one device."""
+
+    def __init__(
+        self,
+        jsons: JsonFormatPath,
+        uuid: str,
+        config: Optional[WsdlConfig] = None,
+        executor: Optional[Executor] = None,
+    ):
+        self._uuid = uuid
+        self._config = config if config is not None else WsdlConfig()
+        self._executor = executor
+        self._store = WsdlResponseStore(jsons, uuid, self._config.cache_max_entries)
+
+    @property
+    def uuid(self):
+        return self._uuid
+
+    @property
+    def config(self):
+        return self._config
+
+    @property
+    def store(self):
+        return self._store
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            return get_revalidate_executor()
+        return self._executor
+
+    def policy(self, operation_name: str) -> WsdlCachePolicy:
+        # Only queries are cached; commands must always reach the device.
+        if not operation_name.startswith("Get"):
+            return WSDL_NO_CACHE_POLICY
+        if is_volatile_operation(operation_name):
+            return WsdlCachePolicy(ttl=self._config.cache_volatile_ttl)
+        return WsdlCachePolicy(
+            ttl=self._config.cache_static_ttl,
+            stale_while_revalidate=self._config.cache_stale_while_revalidate,
+        )
@@ -1,9 +1,59 @@
 # -*- coding: utf-8 -*-
 
+from urllib.parse import urlparse
+
 from zeep.transports import Transport
 
+from cvp.logging.logging import wsdl_logger as logger
+from cvp.types.override import override
 from cvp.wsdl.cache import ZeepFileCache
 
+_HTTP_NOT_MODIFIED = 304
+
+
+class ZeepTransport(Transport):
+    """
+    Revalidates the expired documents of a :class:`ZeepFileCache` with
+    conditional requests, so unchanged documents are not downloaded again.
+    """
+
+    @override
+    def load(self, url):
+        cache = self.cache
+        if not isinstance(cache, ZeepFileCache):
+            return super().load(url)
+        if urlparse(url).scheme not in ("http", "https"):
+            return super().load(url)
+
+        entry = cache.entry(url)
+        if entry is None or cache.readonly or not cache.is_expired(entry):
+            content = cache.get(url)
+            if content:
+                return content
+
+        headers = entry.conditional_headers if entry is not None else dict()
+        response = self.session.get(url, timeout=self.load_timeout, headers=headers)
+        if response.status_code == _HTTP_NOT_MODIFIED and entry is not None:
+            content = cache.get(url)
+            if content:
+                logger.debug(f"Not modified document: '{url}'")
+                cache.touch(url)
+                return content
+
+            # The file disappeared; fetch it again without conditions.
+            response = self.session.get(url, timeout=self.load_timeout)
+
+        response.raise_for_status()
+        content = response.content
+        if not cache.readonly:
+            cache.add(
+                url,
+                content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return content
+
 
 def create_transport_with_package_asset():
-    return Transport(cache=ZeepFileCache.with_package_asset())
+    return ZeepTransport(cache=ZeepFileCache.with_package_asset())
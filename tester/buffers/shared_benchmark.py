@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from cvp.buffers.shared import SharedFrameRing, start_resource_tracker
+
+_outputs: Dict[int, bytearray] = dict()
+
+
+def _output(size: int) -> bytearray:
+    out = _outputs.get(size)
+    if out is None:
+        out = bytearray(size)
+        _outputs[size] = out
+    return out
+
+
+def _pickled_task(data: bytes) -> int:
+    return data[-1]
+
+
+def _shared_task(ring: SharedFrameRing, sequence: int) -> int:
+    frame = ring.read(sequence, _output(ring.frame_size))
+    return frame.data[-1]
+
+
+class TransportBenchmark(NamedTuple):
+    frame_size: int
+    frames: int
+    pickle_seconds: float
+    shared_seconds: float
+
+    @property
+    def pickle_fps(self) -> float:
+        return self.frames / self.pickle_seconds
+
+    @property
+    def shared_fps(self) -> float:
+        return self.frames / self.shared_seconds
+
+    @property
+    def speedup(self) -> float:
+        return self.pickle_seconds / self.shared_seconds
+
+    def __str__(self):
+        mb = self.frame_size / (1024 * 1024)
+        return (
+            f"{self.frames} frames of {mb:.02f} MiB:"
+            f" pickle={self.pickle_fps:.01f}fps,"
+            f" shared={self.shared_fps:.01f}fps,"
+            f" speedup={self.speedup:.02f}x"
+        )
+
+
+def benchmark_transport(
+    width=1920,
+    height=1080,
+    channels=3,
+    frames=100,
+    workers=2,
+) -> TransportBenchmark:
+    frame_size = width * height * channels
+    payloads: List[bytes] = [bytes([i % 256]) * frame_size for i in range(2)]
+
+    start_resource_tracker()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Start the workers so that neither path pays for the process startup.
+        list(executor.map(_pickled_task, [b"\x00"] * workers))
+
+        begin = perf_counter()
+        for i in range(frames):
+            payload = payloads[i % 2]
+            assert executor.submit(_pickled_task, payload).result() == payload[-1]
+        pickle_seconds = perf_counter() - begin
+
+        with SharedFrameRing.create(frame_size) as ring:
+            begin = perf_counter()
+            for i in range(frames):
+                payload = payloads[i % 2]
+                sequence = ring.write(payload, width, height, channels, "rgb24")
+                future = executor.submit(_shared_task, ring, sequence)
+                assert future.result() == payload[-1]
+            shared_seconds = perf_counter() - begin
+
+    return TransportBenchmark(frame_size, frames, pickle_seconds, shared_seconds)
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    parser = ArgumentParser(description="Compare frame transports to worker processes")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--channels", type=int, default=3)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=2)
+    ns = parser.parse_args(args)
+
+    result = benchmark_transport(
+        width=ns.width,
+        height=ns.height,
+        channels=ns.channels,
+        frames=ns.frames,
+        workers=ns.workers,
+    )
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,8 @@ from collections import deque
 from io import BytesIO
 from unittest import TestCase, main
 
-from cvp.buffers.frame import FrameBuffer
+from cvp.buffers.frame import FrameBuffer, FrameRingBuffer
+from cvp.buffers.ring import FrameRing
 
 
 class FrameTestCase(TestCase):
@@ -69,6 +70,49 @@ class FrameTestCase(TestCase):
         self.assertEqual(0, len(frames))
         self.assertIsNone(reader.remain)
 
+    def test_ring(self):
+        pipe = BytesIO(bytearray(i for i in range(7)))
+        ring = FrameRing(5, maxsize=4)
+        reader = FrameRingBuffer(pipe, ring)
+
+        self.assertEqual(5, reader.read())
+        self.assertEqual(1, len(ring))
+        self.assertEqual(0, reader.remain)
+
+        with ring.dequeue() as frame0:
+            self.assertEqual(1, frame0.sequence)
+            self.assertEqual(b"\x00\x01\x02\x03\x04", frame0.data)
+
+        self.assertEqual(2, reader.read())
+        self.assertEqual(0, len(ring))
+        self.assertEqual(2, reader.remain)
+
+        pipe.seek(0)
+        pipe.write(bytearray(i for i in range(7, 27)))
+        pipe.seek(0)
+
+        self.assertEqual(3, reader.read())
+        self.assertEqual(1, len(ring))
+        self.assertEqual(0, reader.remain)
+
+        reader.flush()
+        reader.read_eof()
+        self.assertEqual(4, len(ring))
+        self.assertEqual(2, reader.remain)
+
+        frames = [ring.dequeue() for _ in range(4)]
+        self.assertEqual([2, 3, 4, 5], [f.sequence for f in frames])
+        self.assertEqual(b"\x05\x06\x07\x08\x09", frames[0].data)
+        self.assertEqual(b"\x0A\x0B\x0C\x0D\x0E", frames[1].data)
+        self.assertEqual(b"\x0F\x10\x11\x12\x13", frames[2].data)
+        self.assertEqual(b"\x14\x15\x16\x17\x18", frames[3].data)
+        for frame in frames:
+            frame.release()
+
+        reader.clear_remain()
+        self.assertEqual(0, reader.remain)
+        self.assertFalse(ring.writing)
+
 
 if __name__ == "__main__":
     main()
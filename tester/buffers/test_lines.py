@@ -4,7 +4,7 @@ import os
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest import TestCase, main
 
-from cvp.buffers.lines import LinesBuffer, LinesDeque
+from cvp.buffers.lines import LinesBuffer, LinesDeque, LinesRing
 
 
 class LinesTestCase(TestCase):
@@ -144,6 +144,48 @@ class LinesTestCase(TestCase):
                     self.assertEqual("", deque.lines[1])
                     self.assertEqual("qwer\n", deque.getvalue())
 
+    def test_lines_ring(self):
+        with TemporaryDirectory() as tmpdir:
+            with NamedTemporaryFile("wb", dir=tmpdir) as f:
+                with LinesRing(f.name, maxsize=15, newline_size=3) as ring:
+                    self.assertEqual("", ring.getvalue())
+                    self.assertEqual(1, len(ring))
+
+                    f.write(b"12345\n678")
+                    f.flush()
+                    self.assertEqual(9, ring.update_safe())
+                    self.assertEqual("123\\\n45\n678", ring.getvalue())
+                    self.assertEqual(["123\\", "45"], list(ring.lines))
+                    self.assertEqual("678", ring[len(ring) - 1])
+
+                    # A multibyte character split across two reads.
+                    data = "90\n\uac00\n".encode()
+                    f.write(data[:-2])
+                    f.flush()
+                    ring.update_safe()
+                    f.write(data[-2:])
+                    f.flush()
+                    ring.update_safe()
+                    self.assertEqual(9 + len(data), ring.cursor)
+                    self.assertEqual("45\n678\\\n90\n\uac00\n", ring.getvalue())
+                    self.assertEqual(len(ring.getvalue()), ring.size)
+                    self.assertLessEqual(ring.size, 15)
+
+                    version = ring.version
+                    self.assertIs(ring.getvalue(), ring.getvalue())
+                    self.assertEqual(0, ring.poll(60.0))
+                    self.assertEqual(version, ring.version)
+
+    def test_lines_ring_maxlen(self):
+        with TemporaryDirectory() as tmpdir:
+            with NamedTemporaryFile("wt", dir=tmpdir) as f:
+                with LinesRing(f.name, maxlen=3) as ring:
+                    f.write("a\nb\nc\nd")
+                    f.flush()
+                    ring.update()
+                    self.assertEqual(3, len(ring))
+                    self.assertEqual("b\nc\nd", ring.getvalue())
+
 
 if __name__ == "__main__":
     main()
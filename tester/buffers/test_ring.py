@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvp.buffers.ring import FrameArrivals, FrameRing
+
+
+class FrameRingTestCase(TestCase):
+    def test_default(self):
+        ring = FrameRing(3, maxsize=2, spare=1)
+        self.assertEqual(3, ring.slot_count)
+        self.assertFalse(ring)
+
+        with self.assertRaises(IndexError):
+            ring.dequeue()
+
+        self.assertEqual(1, ring.write(b"\x00\x01\x02"))
+        self.assertEqual(2, ring.write(b"\x03\x04\x05"))
+        self.assertEqual(3, ring.write(b"\x06\x07\x08"))
+        self.assertEqual(2, len(ring))
+        self.assertEqual(1, ring.dropped)
+        self.assertEqual(3, ring.produced)
+        self.assertEqual(0, ring.consumed)
+
+        frame0 = ring.dequeue()
+        self.assertEqual(2, frame0.sequence)
+        self.assertEqual(1, ring.consumed)
+        self.assertLess(0.0, frame0.timestamp)
+        self.assertEqual(b"\x03\x04\x05", frame0.data)
+        self.assertTrue(frame0.data.readonly)
+
+        with ring.dequeue() as frame1:
+            self.assertEqual(3, frame1.sequence)
+            self.assertLessEqual(frame0.timestamp, frame1.timestamp)
+            self.assertEqual(b"\x06\x07\x08", frame1.data)
+        self.assertTrue(frame1.released)
+
+        frame0.release()
+        self.assertTrue(frame0.released)
+        frame0.release()
+
+    def test_held_slots(self):
+        ring = FrameRing(2, maxsize=1, spare=1)
+        ring.write(b"\x00\x01")
+        frame0 = ring.dequeue()
+        ring.write(b"\x02\x03")
+        frame1 = ring.dequeue()
+
+        # Every slot is held by the readers, so the next frame is discarded.
+        self.assertIsNone(ring.write(b"\x04\x05"))
+        self.assertEqual(1, ring.dropped)
+        self.assertEqual(3, ring.produced)
+        self.assertEqual(b"\x00\x01", frame0.data)
+        self.assertEqual(b"\x02\x03", frame1.data)
+
+        frame0.release()
+        self.assertEqual(3, ring.write(b"\x06\x07"))
+        with ring.dequeue() as frame2:
+            self.assertEqual(frame0.index, frame2.index)
+            self.assertEqual(b"\x06\x07", frame2.data)
+        frame1.release()
+
+    def test_begin_write(self):
+        ring = FrameRing(4)
+        view = ring.begin_write()
+        self.assertTrue(ring.writing)
+        with self.assertRaises(BufferError):
+            ring.begin_write()
+
+        view[:2] = b"\x01\x02"
+        ring.cancel_write()
+        self.assertFalse(ring.writing)
+        self.assertFalse(ring)
+
+        with self.assertRaises(BufferError):
+            ring.end_write()
+
+    def test_arrivals(self):
+        ring = FrameRing(1, maxsize=1)
+        ring.write(b"\x00")
+        ring.write(b"\x01")
+        self.assertEqual(2, len(ring.arrivals))
+        self.assertEqual(ring.produced, len(ring.arrivals))
+
+        arrivals = FrameArrivals(maxlen=4)
+        self.assertEqual(0.0, arrivals.rate(1.0, now=0.0))
+        for timestamp in (10.0, 10.1, 10.2, 10.3, 10.4):
+            arrivals.append(timestamp)
+        self.assertEqual(4, len(arrivals))
+        self.assertAlmostEqual(10.0, arrivals.rate(1.0, now=10.5))
+        self.assertAlmostEqual(10.0, arrivals.rate(0.25, now=10.5))
+        self.assertEqual(0.0, arrivals.rate(1.0, now=20.0))
+
+        with self.assertRaises(ValueError):
+            arrivals.rate(0.0)
+        with self.assertRaises(ValueError):
+            FrameArrivals(maxlen=1)
+
+
+if __name__ == "__main__":
+    main()
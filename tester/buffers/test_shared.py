@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase, main
+
+from cvp.buffers.shared import SharedFrameRing, start_resource_tracker
+from tester.buffers.shared_benchmark import benchmark_transport
+
+
+def _read_frame(ring: SharedFrameRing, sequence: int):
+    header, data = ring.read(sequence)
+    return header, bytes(data)
+
+
+class SharedFrameRingTestCase(TestCase):
+    def test_default(self):
+        with SharedFrameRing.create(6, slot_count=2) as ring:
+            self.assertTrue(ring.owner)
+            self.assertEqual(0, ring.latest)
+
+            with self.assertRaises(IndexError):
+                ring.read_latest()
+            with self.assertRaises(ValueError):
+                ring.write(b"\x00", 2, 1, 3, "rgb24")
+
+            self.assertEqual(1, ring.write(b"abcdef", 2, 1, 3, "rgb24", 1.5))
+            header, data = ring.read_latest()
+            self.assertEqual(1, header.sequence)
+            self.assertEqual(1.5, header.timestamp)
+            self.assertEqual((2, 1, 3), header[2:5])
+            self.assertEqual("rgb24", header.pix_fmt)
+            self.assertEqual(b"abcdef", data)
+
+            out = bytearray(6)
+            self.assertIs(out, ring.read(1, out).data)
+
+            self.assertEqual(2, ring.write(b"ghijkl", 2, 1, 3, "rgb24"))
+            self.assertEqual(3, ring.write(b"mnopqr", 2, 1, 3, "rgb24"))
+            self.assertEqual(b"ghijkl", ring.read(2).data)
+            with self.assertRaises(BufferError):
+                ring.read(1)
+            with self.assertRaises(IndexError):
+                ring.read(4)
+
+        self.assertTrue(ring.closed)
+
+    def test_torn_frame(self):
+        with SharedFrameRing.create(2, slot_count=2) as ring:
+            ring.write(b"\x00\x01", 1, 1, 2, "ya8")
+            ring._slots[1]["lock"] += 1  # Pretend the writer is still copying.
+            with self.assertRaises(BufferError):
+                ring.read(1)
+
+    def test_pickle(self):
+        with SharedFrameRing.create(3, slot_count=2) as ring:
+            ring.write(b"xyz", 1, 1, 3, "rgb24")
+            attached = pickle.loads(pickle.dumps(ring))
+            self.assertFalse(attached.owner)
+            self.assertEqual(ring.name, attached.name)
+            self.assertEqual(b"xyz", attached.read(1).data)
+            with self.assertRaises(ValueError):
+                attached.write(b"xyz", 1, 1, 3, "rgb24")
+            attached.close()
+
+    def test_process_pool(self):
+        start_resource_tracker()
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with SharedFrameRing.create(4, slot_count=2) as ring:
+                sequence = ring.write(b"\x01\x02\x03\x04", 2, 2, 1, "gray")
+                header, data = executor.submit(_read_frame, ring, sequence).result()
+                self.assertEqual(sequence, header.sequence)
+                self.assertEqual("gray", header.pix_fmt)
+                self.assertEqual(b"\x01\x02\x03\x04", data)
+
+    def test_benchmark(self):
+        result = benchmark_transport(width=8, height=8, frames=4, workers=1)
+        self.assertEqual(8 * 8 * 3, result.frame_size)
+        self.assertEqual(4, result.frames)
+        self.assertLess(0, result.pickle_fps)
+        self.assertLess(0, result.shared_fps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+import orjson
+
+from cvp.chrono.benchmark import (
+    BenchmarkResult,
+    find_regressions,
+    load_baseline,
+    measure,
+    percentile,
+)
+
+
+class BenchmarkTestCase(TestCase):
+    def test_percentile(self):
+        values = [float(i) for i in range(1, 101)]
+        self.assertEqual(50.0, percentile(values, 50))
+        self.assertEqual(99.0, percentile(values, 99))
+        self.assertEqual(100.0, percentile(values, 100))
+        self.assertEqual(1.0, percentile(values, 0))
+        self.assertEqual(0.0, percentile([], 99))
+        with self.assertRaises(ValueError):
+            percentile(values, 101)
+
+    def test_measure(self):
+        calls = [0]
+        retained = list()
+
+        def _func() -> None:
+            calls[0] += 1
+            retained.append(bytearray(1024))
+
+        result = measure(
+            "test", _func, 10, warmup=2, bytes_per_call=4, allocation_samples=5
+        )
+        self.assertEqual(17, calls[0])
+        self.assertEqual("test", result.name)
+        self.assertEqual(10, result.iterations)
+        self.assertEqual(10, result.items)
+        self.assertEqual(40, result.nbytes)
+        self.assertLessEqual(result.p50_ms, result.p99_ms)
+        self.assertLessEqual(result.p99_ms, result.max_ms)
+        self.assertLessEqual(1024, result.allocated)
+        self.assertLessEqual(5 * 1024, result.retained)
+        self.assertLess(0, result.items_per_second)
+        self.assertIn("megabytes_per_second", result.as_dict())
+
+        with self.assertRaises(ValueError):
+            measure("test", _func, 0)
+
+    def test_find_regressions(self):
+        def _result(name: str, seconds: float, p99_ms: float) -> BenchmarkResult:
+            return BenchmarkResult(name, 10, seconds, 10, 0, 0.0, p99_ms, 0.0, 0, 0)
+
+        baseline = [_result("a", 1.0, 1.0), _result("b", 1.0, 1.0)]
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "baseline.jsonl")
+            with open(path, "wb") as f:
+                for result in baseline:
+                    f.write(orjson.dumps(result.as_dict()) + b"\n")
+            loaded = load_baseline(path)
+        self.assertEqual(["a", "b"], list(loaded))
+
+        results = [
+            _result("a", 1.1, 1.1),
+            _result("b", 2.0, 1.5),
+            _result("c", 9.0, 9.0),
+        ]
+        regressions = find_regressions(results, loaded, 0.2)
+        self.assertEqual(
+            [("b", "items_per_second"), ("b", "p99_ms")],
+            [(r.name, r.metric) for r in regressions],
+        )
+
+        regressions = find_regressions(results, loaded, 0.05)
+        self.assertEqual(
+            [
+                ("a", "items_per_second"),
+                ("a", "p99_ms"),
+                ("b", "items_per_second"),
+                ("b", "p99_ms"),
+            ],
+            [(r.name, r.metric) for r in regressions],
+        )
+        self.assertAlmostEqual(0.5, regressions[2].ratio)
+        self.assertAlmostEqual(0.5, regressions[3].ratio)
+
+        with self.assertRaises(ValueError):
+            find_regressions(results, loaded, -1.0)
+
+
+if __name__ == "__main__":
+    main()
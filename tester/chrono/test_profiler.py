@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import os
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, main
+
+import orjson
+
+from cvp.chrono.profiler import FrameProfiler
+
+
+class FrameProfilerTestCase(TestCase):
+    def test_disabled(self):
+        profiler = FrameProfiler()
+        with profiler.frame():
+            with profiler.zone("a"):
+                pass
+        self.assertEqual(0, len(profiler.frames))
+
+    @staticmethod
+    def _enter_and_exit(profiler: FrameProfiler) -> None:
+        with profiler.zone("other"):
+            pass
+
+    def test_zones(self):
+        profiler = FrameProfiler(max_frames=2, enabled=True)
+        for _ in range(3):
+            with profiler.frame():
+                with profiler.zone("outer"):
+                    with profiler.zone("inner"):
+                        pass
+                    # Zones of other threads are ignored while the frame records.
+                    other = Thread(target=self._enter_and_exit, args=(profiler,))
+                    other.start()
+                    other.join()
+                profiler.push("unclosed")
+
+        self.assertEqual(2, len(profiler.frames))
+        frame = profiler.latest
+        assert frame is not None
+        self.assertEqual(2, frame.number)
+        names = [(zone.name, zone.depth) for zone in frame.zones]
+        self.assertEqual([("inner", 1), ("outer", 0), ("unclosed", 0)], names)
+        for zone in frame.zones:
+            self.assertLessEqual(frame.begin, zone.begin)
+            self.assertLessEqual(zone.begin, zone.end)
+            self.assertLessEqual(zone.end, frame.end)
+
+        stats = {s.name: s for s in profiler.stats()}
+        self.assertEqual(2, stats["outer"].samples)
+        self.assertGreaterEqual(stats["outer"].mean_ms, stats["inner"].mean_ms)
+
+        profiler.paused = True
+        with profiler.frame():
+            pass
+        self.assertEqual(2, profiler.latest.number)  # type: ignore[union-attr]
+
+    def test_chrome_trace(self):
+        profiler = FrameProfiler(enabled=True)
+        with profiler.frame():
+            with profiler.zone("a"):
+                pass
+
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.json")
+            profiler.save_chrome_trace(path)
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+
+        events = data["traceEvents"]
+        self.assertEqual(["Frame #0", "a"], [e["name"] for e in events])
+        self.assertTrue(all(e["ph"] == "X" for e in events))
+        self.assertGreaterEqual(events[1]["ts"], events[0]["ts"])
+
+
+if __name__ == "__main__":
+    main()
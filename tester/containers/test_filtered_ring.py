@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvp.containers.filtered_ring import FilteredRing
+
+
+def _is_even(value: int) -> bool:
+    return value % 2 == 0
+
+
+class FilteredRingTestCase(TestCase):
+    def test_append(self):
+        ring = FilteredRing[int](4, _is_even)
+        for i in range(10):
+            ring.append(i)
+
+        self.assertEqual(4, len(ring))
+        self.assertEqual(10, ring.total)
+        self.assertEqual([6, 7, 8, 9], [ring[i] for i in range(len(ring))])
+        self.assertEqual(2, ring.filtered_count)
+        self.assertEqual([6, 8], ring.filtered_range(0, 100))
+        self.assertEqual(8, ring.filtered(1))
+        with self.assertRaises(IndexError):
+            ring.filtered(2)
+
+    def test_set_predicate(self):
+        ring = FilteredRing[int](8)
+        for i in range(8):
+            ring.append(i)
+        self.assertEqual(8, ring.filtered_count)
+
+        ring.set_predicate(_is_even)
+        self.assertEqual([0, 2, 4, 6], ring.filtered_range(0, 4))
+        ring.set_predicate(lambda x: x > 5)
+        self.assertEqual([6, 7], ring.filtered_range(0, 4))
+
+    def test_resize(self):
+        ring = FilteredRing[int](8, _is_even)
+        for i in range(8):
+            ring.append(i)
+
+        ring.resize(3)
+        self.assertEqual([5, 6, 7], [ring[i] for i in range(len(ring))])
+        self.assertEqual([6], ring.filtered_range(0, 10))
+
+        ring.append(8)
+        ring.resize(10)
+        ring.append(9)
+        self.assertEqual([6, 7, 8, 9], [ring[i] for i in range(len(ring))])
+        self.assertEqual([6, 8], ring.filtered_range(0, 10))
+
+        ring.clear()
+        self.assertEqual(0, len(ring))
+        self.assertEqual(0, ring.filtered_count)
+
+    def test_compact(self):
+        ring = FilteredRing[int](10)
+        for i in range(5000):
+            ring.append(i)
+        self.assertEqual(list(range(4990, 5000)), ring.filtered_range(0, 10))
+
+
+if __name__ == "__main__":
+    main()
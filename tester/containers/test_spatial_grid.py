@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvp.containers.spatial_grid import SpatialGrid
+
+
+class SpatialGridTestCase(TestCase):
+    def test_default(self):
+        grid = SpatialGrid[str](10.0)
+        grid.insert("a", (0, 0, 5, 5))
+        grid.insert("b", (25, 25, 8, 8))
+        grid.insert("c", (-30, -30, -20, -20))
+        self.assertEqual(3, len(grid))
+        self.assertEqual((8, 8, 25, 25), grid.get("b"))
+
+        self.assertEqual(["a"], grid.query_point(1, 1))
+        self.assertEqual(["b"], grid.query_point(20, 20))
+        self.assertEqual([], grid.query_point(6, 6))
+        self.assertEqual(["c"], grid.query_point(-25, -25))
+
+        self.assertEqual({"a", "b"}, grid.query_rect((4, 4, 9, 9)))
+        self.assertEqual({"a", "b", "c"}, grid.query_rect((-100, -100, 100, 100)))
+        self.assertEqual(set(), grid.query_rect((100, 100, 200, 200)))
+
+    def test_move_and_remove(self):
+        grid = SpatialGrid[str](10.0)
+        grid.insert("a", (0, 0, 5, 5))
+        cells = grid.cell_count
+
+        grid.insert("a", (100, 100, 105, 105))
+        self.assertEqual(cells, grid.cell_count)
+        self.assertEqual([], grid.query_point(1, 1))
+        self.assertEqual(["a"], grid.query_point(101, 101))
+
+        self.assertTrue(grid.remove("a"))
+        self.assertFalse(grid.remove("a"))
+        self.assertEqual(0, len(grid))
+        self.assertEqual(0, grid.cell_count)
+
+
+if __name__ == "__main__":
+    main()
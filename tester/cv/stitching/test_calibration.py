@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+import cv2
+import numpy as np
+
+from cvp.cv.stitching.calibration import (
+    StitchCalibration,
+    calibrate,
+    compose_megapixel_scale,
+)
+from cvp.cv.stitching.props import StitcherProps
+from cvp.cv.stitching.stitcher import Stitcher
+from cvp.resources.subdirs.cache import Cache
+
+
+def _scene(width=900, height=480, seed=0):
+    rng = np.random.default_rng(seed)
+    noise = (rng.random((height, width, 3)) * 255).astype(np.uint8)
+    image = cv2.GaussianBlur(noise, (0, 0), 3)
+    for _ in range(300):
+        x, y = (int(v) for v in rng.integers(0, (width, height)))
+        radius = int(rng.integers(5, 40))
+        color = tuple(int(v) for v in rng.integers(0, 255, 3))
+        cv2.circle(image, (x, y), radius, color, -1)
+    return image
+
+
+class CalibrationTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        scene = _scene()
+        cls.frames = [scene[:, :520].copy(), scene[:, 380:].copy()]
+        cls.props = StitcherProps()
+        cls.calibration = calibrate(cls.frames, ["left", "right"], cls.props)
+
+    def test_compose(self):
+        calibration = self.calibration
+        self.assertEqual([0, 1], calibration.indices)
+        self.assertLess(0.0, calibration.confidence)
+
+        result = calibration.compose(self.frames)
+        width, height = calibration.panorama_size
+        self.assertEqual((height, width, 3), result.shape)
+        self.assertLess(700, width)
+        self.assertLess(0.0, result.mean())
+
+    def test_validate(self):
+        with self.assertRaises(ValueError):
+            self.calibration.compose(self.frames[:1])
+        with self.assertRaises(ValueError):
+            self.calibration.compose([self.frames[0], self.frames[0][:, :100]])
+
+    def test_bytes(self):
+        calibration = StitchCalibration.from_bytes(self.calibration.to_bytes())
+        self.assertEqual(self.calibration.key, calibration.key)
+        self.assertEqual(self.calibration.pairs, calibration.pairs)
+        self.assertEqual(self.calibration.panorama_size, calibration.panorama_size)
+        expected = self.calibration.compose(self.frames)
+        self.assertTrue(np.array_equal(expected, calibration.compose(self.frames)))
+
+    def test_measure_confidence(self):
+        confidence = self.calibration.measure_confidence(self.frames, self.props)
+        self.assertLess(self.calibration.confidence * 0.5, confidence)
+
+        rng = np.random.default_rng(1)
+        noise = [(rng.random(f.shape) * 255).astype(np.uint8) for f in self.frames]
+        confidence = self.calibration.measure_confidence(noise, self.props)
+        self.assertLess(confidence, self.calibration.confidence * 0.5)
+
+
+class StitcherComposeTestCase(TestCase):
+    def setUp(self):
+        scene = _scene()
+        self.frames = [scene[:, :520].copy(), scene[:, 380:].copy()]
+        self.temp = TemporaryDirectory()
+        self.cache = Cache(self.temp.name)
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def test_compose_cache(self):
+        stitcher = Stitcher(StitcherProps(drift_check_interval=0), self.cache)
+        stitcher.compose(self.frames)
+        calibration = stitcher.calibration
+        assert calibration is not None
+        self.assertTrue(self.cache.has_stitching(calibration.key))
+
+        stitcher.compose(self.frames)
+        self.assertIs(calibration, stitcher.calibration)
+        self.assertEqual(2, stitcher.composed_frames)
+
+        other = Stitcher(StitcherProps(drift_check_interval=0), self.cache)
+        self.assertEqual(calibration.key, other.frames_key(self.frames))
+        other.compose(self.frames)
+        assert other.calibration is not None
+        self.assertEqual(calibration.pairs, other.calibration.pairs)
+
+    def test_drift(self):
+        stitcher = Stitcher(StitcherProps(drift_check_interval=2))
+        stitcher.compose(self.frames)
+        first = stitcher.calibration
+
+        stitcher.compose(self.frames)
+        stitcher.compose(self.frames)
+        self.assertIs(first, stitcher.calibration)
+
+        rng = np.random.default_rng(2)
+        noise = [(rng.random(f.shape) * 255).astype(np.uint8) for f in self.frames]
+        stitcher.composed_frames = 4
+        self.assertTrue(stitcher.is_drifted(noise))
+
+    def test_compose_details(self):
+        # 0.225 mega pixels scales the 520x480 frames by about 0.95.
+        props = StitcherProps(compose_mega_pixel=0.225)
+        self.assertEqual(1.0, compose_megapixel_scale(0.225, 520 * 480))
+        self.assertAlmostEqual(0.775, compose_megapixel_scale(0.15, 520 * 480), 3)
+
+        # The estimators draw from the random generator of OpenCV.
+        cv2.setRNGSeed(0)
+        calibration = calibrate(self.frames, ["left", "right"], props)
+        self.assertEqual(1.0, calibration.compose_scale)
+        composed = calibration.compose(self.frames)
+
+        stitcher = Stitcher(props)
+        for i, frame in enumerate(self.frames):
+            path = os.path.join(self.temp.name, f"{i}.png")
+            cv2.imwrite(path, frame)
+            stitcher.add_image(path)
+        cv2.setRNGSeed(0)
+        details = stitcher.stitch_details()
+
+        self.assertEqual(details.shape, composed.shape)
+        diff = np.abs(composed.astype(np.int16) - details.astype(np.int16))
+        self.assertLess(diff.mean(), 4.0)
+
+
+if __name__ == "__main__":
+    main()
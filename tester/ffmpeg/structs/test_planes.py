@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvp.ffmpeg.structs.pix_fmt import find_default_pix_fmt
+from cvp.ffmpeg.structs.planes import PlaneShape, frame_size, plane_shapes
+from cvp.process.frame import FrameShape
+
+
+class PlanesTestCase(TestCase):
+    def test_default_pix_fmt(self):
+        yuv420p = find_default_pix_fmt("yuv420p")
+        self.assertEqual(3, yuv420p.nb_components)
+        self.assertEqual(12, yuv420p.bits_per_pixel)
+
+        with self.assertRaises(IndexError):
+            find_default_pix_fmt("unknown")
+
+    def test_plane_shapes(self):
+        self.assertEqual((PlaneShape(4, 2, 3),), plane_shapes("rgb24", 4, 2))
+        self.assertEqual(
+            (PlaneShape(4, 2, 1), PlaneShape(2, 1, 1), PlaneShape(2, 1, 1)),
+            plane_shapes("yuv420p", 4, 2),
+        )
+        self.assertEqual(
+            (PlaneShape(5, 3, 1), PlaneShape(3, 2, 2)),
+            plane_shapes("nv12", 5, 3),
+        )
+
+        with self.assertRaises(ValueError):
+            plane_shapes("monow", 8, 8)
+
+    def test_frame_size(self):
+        for pix_fmt in ("yuv420p", "yuv422p", "yuv444p", "nv12", "rgb24", "rgba"):
+            bits_per_pixel = find_default_pix_fmt(pix_fmt).bits_per_pixel
+            expected = 1920 * 1080 * bits_per_pixel // 8
+            self.assertEqual(expected, frame_size(pix_fmt, 1920, 1080))
+
+    def test_frame_shape(self):
+        self.assertEqual(4 * 2 * 3, FrameShape(4, 2, 3).size)
+        self.assertFalse(FrameShape(4, 2, 3).planar)
+
+        shape = FrameShape.from_pix_fmt(1920, 1080, "yuv420p")
+        self.assertTrue(shape.planar)
+        self.assertEqual(3, shape.channels)
+        self.assertEqual(1920 * 1080 * 3 // 2, shape.size)
+        self.assertEqual(3, len(shape.planes))
+
+
+if __name__ == "__main__":
+    main()
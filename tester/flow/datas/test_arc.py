@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvp.flow.datas.graph import Graph, zoom_level_scale
+from cvp.flow.datas.node_pin import NodePin
+from tester.flow.nodes import new_node
+
+
+class ArcTessellationTestCase(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        self.a = new_node("A", 0.0, 0.0)
+        self.b = new_node("B", 300.0, 200.0)
+        self.c = new_node("C", 600.0, 0.0)
+        self.graph.nodes.extend([self.a, self.b, self.c])
+
+        self.ab = self.graph.connect_pins(
+            NodePin(self.a, self.a.data_outputs[0]),
+            NodePin(self.b, self.b.data_inputs[0]),
+        )
+        self.bc = self.graph.connect_pins(
+            NodePin(self.b, self.b.data_outputs[0]),
+            NodePin(self.c, self.c.data_inputs[0]),
+        )
+
+    def test_zoom_level_scale(self):
+        self.assertEqual(1.0, zoom_level_scale(1.0))
+        self.assertEqual(2.0, zoom_level_scale(1.5))
+        self.assertEqual(0.5, zoom_level_scale(0.4))
+        self.assertEqual(1.0, zoom_level_scale(0.0))
+
+    def test_cache(self):
+        ab_polyline = list(self.ab.polyline)
+        bc_polyline = list(self.bc.polyline)
+        self.assertFalse(self.ab.is_polyline_expired(self.graph.tess_tol))
+
+        self.graph.select_item(self.c)
+        self.graph.move_on_selected_nodes((10.0, 0.0))
+        self.assertEqual(ab_polyline, self.ab.polyline)
+        self.assertNotEqual(bc_polyline, self.bc.polyline)
+        self.assertEqual(612.5, self.bc.polyline[-1][0])
+
+    def test_zoom(self):
+        segments = len(self.ab.polyline)
+        key = self.ab.polyline_key
+
+        self.graph.view.zoom = 1.1
+        self.graph.update_arcs_polyline()
+        self.assertNotEqual(key, self.ab.polyline_key)
+        self.assertLess(segments, len(self.ab.polyline))
+
+        key = self.ab.polyline_key
+        self.graph.view.zoom = 1.2
+        self.graph.update_arcs_polyline()
+        self.assertEqual(key, self.ab.polyline_key)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from type_serialize import deserialize, serialize
+
+from cvp.flow.datas.graph import Graph
+from cvp.flow.datas.node_pin import NodePin
+from tester.flow.nodes import new_node
+
+
+class GraphSpatialIndexTestCase(TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        self.a = new_node("A", 0.0, 0.0)
+        self.b = new_node("B", 500.0, 0.0)
+        self.graph.nodes.extend([self.a, self.b])
+
+    def test_hovering_node(self):
+        self.assertIs(self.a, self.graph.find_hovering_node_with_mouse((10, 10)))
+        self.assertIs(self.b, self.graph.find_hovering_node_with_mouse((510, 10)))
+        self.assertIsNone(self.graph.find_hovering_node_with_mouse((200, 10)))
+
+        self.graph.select_item(self.b)
+        self.graph.move_on_selected_nodes((-300.0, 0.0))
+        self.assertIs(self.b, self.graph.find_hovering_node_with_mouse((210, 10)))
+        self.assertIsNone(self.graph.find_hovering_node_with_mouse((510, 10)))
+
+        self.graph.remove_node(self.b)
+        self.assertIsNone(self.graph.find_hovering_node_with_mouse((210, 10)))
+
+    def test_added_directly(self):
+        self.assertIsNotNone(self.graph.find_hovering_node_with_mouse((10, 10)))
+        c = new_node("C", 1000.0, 1000.0)
+        self.graph.nodes.append(c)
+        self.assertIs(c, self.graph.find_hovering_node_with_mouse((1010, 1010)))
+
+    def test_nodes_in_roi(self):
+        self.assertEqual([self.a], self.graph.find_nodes_in_roi((-10, -10, 60, 60)))
+        self.assertEqual([], self.graph.find_nodes_in_roi((100, 100, 200, 200)))
+        nodes = self.graph.find_nodes_in_roi((600, 100, -10, -10))
+        self.assertEqual([self.a, self.b], nodes)
+
+    def test_hovering_arc(self):
+        out_conn = NodePin(self.a, self.a.data_outputs[0])
+        in_conn = NodePin(self.b, self.b.data_inputs[0])
+        arc = self.graph.connect_pins(out_conn, in_conn)
+
+        x1, y1, x2, y2 = arc.get_polyline_roi()
+        mid = (x1 + x2) / 2, (y1 + y2) / 2
+        self.assertIs(arc, self.graph.find_hovering_arc_with_mouse(mid, 1.0))
+        self.assertIsNone(self.graph.find_hovering_arc_with_mouse((250, 300), 1.0))
+
+        self.graph.remove_arc(arc)
+        self.assertIsNone(self.graph.find_hovering_arc_with_mouse(mid, 1.0))
+
+    def test_serialize(self):
+        self.graph.find_hovering_node_with_mouse((10, 10))
+        data = serialize(self.graph)
+        self.assertNotIn("_spatial_index", data)
+        graph = deserialize(data, Graph)
+        self.assertEqual(self.graph, graph)
+        self.assertIsNotNone(graph.find_hovering_node_with_mouse((10, 10)))
+
+
+if __name__ == "__main__":
+    main()
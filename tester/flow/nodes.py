@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+from cvp.flow.datas.action import Action
+from cvp.flow.datas.node import Node
+from cvp.flow.datas.pin import Pin
+from cvp.flow.datas.stream import Stream
+
+
+def new_node(name: str, x: float, y: float) -> Node:
+    """A 50x30 node with one data input on the left and one data output on the right."""
+    in_pin = Pin(name="In", action=Action.data, stream=Stream.input)
+    in_pin.icon_roi = 0.0, 10.0, 5.0, 15.0
+    out_pin = Pin(name="Out", action=Action.data, stream=Stream.output)
+    out_pin.icon_roi = 45.0, 10.0, 50.0, 15.0
+    return Node(
+        name=name,
+        node_pos=(x, y),
+        node_size=(50.0, 30.0),
+        data_inputs=[in_pin],
+        data_outputs=[out_pin],
+    )
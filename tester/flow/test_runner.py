@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from threading import Barrier, Event
+from unittest import TestCase, main
+
+from cvp.flow.datas.action import Action
+from cvp.flow.datas.graph import Graph
+from cvp.flow.datas.node import Node
+from cvp.flow.datas.node_pin import NodePin
+from cvp.flow.datas.pin import Pin
+from cvp.flow.datas.stream import Stream
+from cvp.flow.runner import FlowRunner
+
+
+def _node(name: str, inputs=(), outputs=()) -> Node:
+    return Node(
+        name=name,
+        data_inputs=[
+            Pin(name=n, action=Action.data, stream=Stream.input) for n in inputs
+        ],
+        data_outputs=[
+            Pin(name=n, action=Action.data, stream=Stream.output) for n in outputs
+        ],
+    )
+
+
+def _connect(graph: Graph, out_node: Node, out_pin: str, in_node: Node, in_pin: str):
+    out_conn = NodePin(out_node, next(p for p in out_node.pins if p.name == out_pin))
+    in_conn = NodePin(in_node, next(p for p in in_node.pins if p.name == in_pin))
+    return graph.connect_pins(out_conn, in_conn)
+
+
+class FlowRunnerTestCase(TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.runner = FlowRunner(self.executor)
+
+        self.graph = Graph()
+        self.source = _node("Source", inputs=["In"], outputs=["Out"])
+        self.left = _node("Left", inputs=["In"], outputs=["Out"])
+        self.right = _node("Right", inputs=["In"], outputs=["Out"])
+        self.sink = _node("Sink", inputs=["Left", "Right"], outputs=["Sum"])
+        self.graph.nodes.extend([self.sink, self.right, self.left, self.source])
+
+        _connect(self.graph, self.source, "Out", self.left, "In")
+        _connect(self.graph, self.source, "Out", self.right, "In")
+        _connect(self.graph, self.left, "Out", self.sink, "Left")
+        _connect(self.graph, self.right, "Out", self.sink, "Right")
+
+        barrier = Barrier(2, timeout=5.0)
+
+        def _branch(factor: int):
+            def _fn(values):
+                # Both branches must be running at the same time to pass.
+                barrier.wait()
+                return {"Out": values["In"] * factor}
+
+            return _fn
+
+        self.runner.bind("Source", lambda v: {"Out": v["In"]})
+        self.runner.bind("Left", _branch(2))
+        self.runner.bind("Right", _branch(3))
+        self.runner.bind("Sink", lambda v: {"Sum": v["Left"] + v["Right"]})
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def test_compile(self):
+        plan = self.runner.compile(self.graph)
+        names = [plan.steps[uuid].node.name for uuid in plan.order]
+        self.assertEqual("Source", names[0])
+        self.assertEqual("Sink", names[-1])
+        self.assertEqual(3, len(plan.levels))
+        self.assertEqual([self.source.uuid], plan.roots)
+        self.assertIs(plan, self.runner.compile(self.graph))
+
+        extra = _node("Extra", inputs=["In"])
+        self.graph.nodes.append(extra)
+        self.runner.bind("Extra", lambda v: None)
+        _connect(self.graph, self.sink, "Sum", extra, "In")
+        self.assertIsNot(plan, self.runner.compile(self.graph))
+
+    def test_cycle(self):
+        a = _node("A", inputs=["In"], outputs=["Out"])
+        b = _node("B", inputs=["In"], outputs=["Out"])
+        graph = Graph(nodes=[a, b])
+        a.data_outputs[0].arcs.append("ab")
+        b.data_inputs[0].arcs.append("ab")
+        b.data_outputs[0].arcs.append("ba")
+        a.data_inputs[0].arcs.append("ba")
+        self.runner.bind("A", lambda v: None)
+        self.runner.bind("B", lambda v: None)
+        with self.assertRaises(ValueError):
+            self.runner.compile(graph)
+
+    def test_unbound(self):
+        self.runner.unbind("Sink")
+        with self.assertRaises(KeyError):
+            self.runner.compile(self.graph)
+
+    def test_run(self):
+        result = self.runner.run(self.graph, {"Source": {"In": 10}}, timeout=10.0)
+        self.assertEqual({"Sum": 50}, result[self.sink.uuid])
+        self.assertEqual({"Out": 20}, result[self.left.uuid])
+
+    def test_error(self):
+        self.runner.bind(self.sink.uuid, lambda v: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            self.runner.run(self.graph, {"Source": {"In": 1}}, timeout=10.0)
+
+    def test_stream(self):
+        pulled = list()
+
+        def _frames():
+            for i in range(6):
+                pulled.append(i)
+                yield {"Source": {"In": i}}
+
+        results = list()
+        for frame, result in self.runner.stream(self.graph, _frames(), max_inflight=2):
+            # The source is never more than 'max_inflight' frames ahead.
+            self.assertLessEqual(len(pulled) - len(results), 2)
+            results.append(result[self.sink.uuid]["Sum"])
+            self.assertEqual(frame["Source"]["In"] * 5, results[-1])
+
+        self.assertEqual([i * 5 for i in range(6)], results)
+
+    def _bind_blocking(self, release: Event, sinks: list) -> None:
+        def _source(values):
+            if values["In"] > 0:
+                release.wait(5.0)
+            return {"Out": values["In"]}
+
+        self.runner.bind("Source", _source)
+        self.runner.bind("Left", lambda v: {"Out": v["In"]})
+        self.runner.bind("Right", lambda v: {"Out": v["In"]})
+
+        def _sink(values):
+            sinks.append(values)
+            return {"Sum": 0}
+
+        self.runner.bind("Sink", _sink)
+
+    def test_cancel(self):
+        release = Event()
+        sinks: list = list()
+        self._bind_blocking(release, sinks)
+
+        execution = self.runner.execute(self.graph, {"Source": {"In": 1}})
+        execution.cancel()
+        release.set()
+        self.executor.shutdown(wait=True)
+
+        self.assertTrue(execution.cancelled)
+        with self.assertRaises(CancelledError):
+            execution.future.result()
+        self.assertListEqual([], sinks)
+
+    def test_stream_close(self):
+        release = Event()
+        sinks: list = list()
+        self._bind_blocking(release, sinks)
+
+        frames = ({"Source": {"In": i}} for i in range(4))
+        stream = self.runner.stream(self.graph, frames, max_inflight=2)
+        next(stream)
+
+        # The second pass is blocked in its source node while the stream closes.
+        stream.close()
+        release.set()
+        self.executor.shutdown(wait=True)
+        self.assertEqual(1, len(sinks))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 
 from unittest import TestCase, main
 
-from cvp.fonts.ranges import CodepointRange
+from cvp.fonts.ranges import CodepointRange, CodepointRangeIndex
 
 
 class RangesTestCase(TestCase):
@@ -34,6 +34,37 @@ class RangesTestCase(TestCase):
         block6 = CodepointRange(0x100, 0x300).as_blocks()
         self.assertListEqual([(0x100, 0x1FF), (0x200, 0x2FF), (0x300, 0x3FF)], block6)
 
+    def test_index(self):
+        ranges = [
+            (0x30, 0x39),
+            (0x10, 0x20),
+            (0x21, 0x22),
+            (0x40, 0x35),
+            (0x100, 0x100),
+        ]
+        index = CodepointRangeIndex(ranges)
+        self.assertEqual(3, len(index))
+        self.assertListEqual(
+            [(0x10, 0x22), (0x30, 0x40), (0x100, 0x100)],
+            list(index),
+        )
+
+        for codepoint in range(0x200):
+            expected = any(min(r) <= codepoint <= max(r) for r in ranges)
+            self.assertEqual(expected, codepoint in index, hex(codepoint))
+
+        self.assertNotIn(0, CodepointRangeIndex([]))
+
+    def test_intersect(self):
+        index = CodepointRangeIndex([(0x20, 0x7E), (0xAC00, 0xD7A3)])
+        self.assertListEqual(
+            [(0x20, 0x7E), (0xAC00, 0xAC10)],
+            index.intersect([(0x00, 0xFF), (0xAC00, 0xAC10)]),
+        )
+        self.assertListEqual([(0x41, 0x41)], index.intersect([(0x41, 0x41)]))
+        self.assertListEqual([], index.intersect([(0x80, 0xABFF)]))
+        self.assertListEqual([], CodepointRangeIndex([]).intersect([(0, 0xFF)]))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from cvp.fonts.defaults import create_mdi_ttf
+from cvp.fonts.ranges_cache import RangesCache, file_digest
+
+
+class RangesCacheTestCase(TestCase):
+    def test_default(self):
+        mdi = create_mdi_ttf()
+        expected = mdi.read_default_ranges()
+
+        with TemporaryDirectory() as tmpdir:
+            cache = RangesCache(os.path.join(tmpdir, "fonts"))
+            digest = cache.digest(mdi.path)
+            self.assertEqual(file_digest(mdi.path), digest)
+            self.assertFalse(cache.ranges_path(digest).exists())
+
+            self.assertListEqual(expected, cache.get_ranges(mdi))
+            self.assertTrue(cache.ranges_path(digest).is_file())
+
+            with patch.object(mdi, "get_glyph_ranges") as get_glyph_ranges:
+                self.assertListEqual(expected, cache.get_ranges(mdi))
+                get_glyph_ranges.assert_not_called()
+
+            cache.ranges_path(digest).write_text("broken")
+            self.assertListEqual(expected, cache.get_ranges(mdi))
+            self.assertListEqual(expected, RangesCache(cache.prefix).get_ranges(mdi))
+
+
+if __name__ == "__main__":
+    main()
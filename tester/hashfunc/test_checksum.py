@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
 from unittest import TestCase, main
 
-from cvp.hashfunc.checksum import Method, checksum
+from cvp.hashfunc.checksum import Method, checksum, new_hasher, new_verifier
 
 
 class ChecksumTestCase(TestCase):
@@ -13,6 +14,30 @@ class ChecksumTestCase(TestCase):
             checksum(Method.sha1, b"12345"),
         )
 
+    def test_new_hasher(self):
+        for method in (Method.crc32, Method.sha256):
+            hasher = new_hasher(method)
+            hasher.update(b"12")
+            hasher.update(b"345")
+            self.assertEqual(checksum(method, b"12345"), hasher.hexdigest())
+
+    def test_shake(self):
+        self.assertEqual(
+            hashlib.shake_128(b"12345").hexdigest(32),
+            checksum(Method.shake_128, b"12345"),
+        )
+        self.assertEqual(
+            hashlib.shake_256(b"12345").hexdigest(8),
+            checksum(Method.shake_256, b"12345", length=8),
+        )
+
+        hasher = new_verifier(Method.shake_128, "ab" * 5)
+        hasher.update(b"12345")
+        self.assertEqual(10, len(hasher.hexdigest()))
+
+        with self.assertRaises(ValueError):
+            new_hasher(Method.sha256, length=8)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from cvp.hashfunc.checksum import Method, checksum, new_hasher
+from cvp.hashfunc.files import (
+    checksum_files,
+    file_checksum,
+    update_file,
+    verify_file,
+    verify_files,
+)
+
+
+class FilesTestCase(TestCase):
+    def setUp(self):
+        self.temp = TemporaryDirectory()
+        self.paths = list()
+        self.contents = list()
+        for i, size in enumerate((0, 1, 1000, 100_000)):
+            path = os.path.join(self.temp.name, f"file{i}")
+            content = os.urandom(size)
+            with open(path, "wb") as f:
+                f.write(content)
+            self.paths.append(path)
+            self.contents.append(content)
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def test_update_file(self):
+        for path, content in zip(self.paths, self.contents):
+            for mmap_threshold in (None, 1):
+                hasher = new_hasher(Method.crc32)
+                size = update_file(
+                    hasher, path, buffer_size=333, mmap_threshold=mmap_threshold
+                )
+                self.assertEqual(len(content), size)
+                self.assertEqual(checksum(Method.crc32, content), hasher.hexdigest())
+
+    def test_file_checksum(self):
+        path, content = self.paths[-1], self.contents[-1]
+        self.assertEqual(
+            sha256(content).hexdigest(), file_checksum(Method.sha256, path)
+        )
+        self.assertEqual(
+            checksum(Method.shake_128, content, length=10),
+            file_checksum(Method.shake_128, path, length=10),
+        )
+
+    def test_verify_file(self):
+        path, content = self.paths[-1], self.contents[-1]
+        expected = checksum(Method.shake_256, content, length=16)
+        self.assertEqual(32, len(expected))
+        self.assertTrue(verify_file(path, Method.shake_256, expected.upper()).ok)
+        self.assertFalse(verify_file(path, Method.shake_256, "00" * 16).ok)
+
+        missing = verify_file(path + ".missing", Method.sha256, expected)
+        self.assertFalse(missing.ok)
+        self.assertIsInstance(missing.error, FileNotFoundError)
+
+    def test_verify_files(self):
+        items = [
+            (path, Method.sha1, checksum(Method.sha1, content))
+            for path, content in zip(self.paths, self.contents)
+        ]
+        items.append((self.paths[0], Method.sha1, "0" * 40))
+
+        results = verify_files(items, max_workers=3)
+        self.assertListEqual(
+            [True] * len(self.paths) + [False], [r.ok for r in results]
+        )
+
+        with ThreadPoolExecutor(2) as executor:
+            results = verify_files(items, executor=executor)
+        self.assertListEqual(self.paths + self.paths[:1], [r.path for r in results])
+
+    def test_checksum_files(self):
+        expected = [checksum(Method.md5, content) for content in self.contents]
+        self.assertListEqual(expected, checksum_files(Method.md5, self.paths))
+        self.assertListEqual(list(), checksum_files(Method.md5, []))
+
+
+if __name__ == "__main__":
+    main()
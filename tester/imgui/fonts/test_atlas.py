@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvp.fonts.glyphs.mdi import MDI_LABEL
+from cvp.imgui.fonts.atlas import GlyphAtlas, default_base_ranges
+
+
+class GlyphAtlasTestCase(TestCase):
+    def test_default(self):
+        atlas = GlyphAtlas([(0x20, 0x7E)])
+        atlas.add_available([(0x20, 0x7E), (0xAC00, 0xD7A3)])
+        self.assertIn(0x41, atlas)
+        self.assertFalse(atlas.dirty)
+
+        self.assertEqual(
+            [(0x20, 0x7E)],
+            atlas.bake_ranges([(0x0, 0xFF), (0xAC00, 0xD7A3)]),
+        )
+
+        self.assertFalse(atlas.request("ABC"))
+        self.assertTrue(atlas.request("A가\U0001F600"))
+        self.assertTrue(atlas.dirty)
+        self.assertSetEqual({0xAC00}, atlas.pending)
+        self.assertFalse(atlas.request("가"))
+
+        self.assertTrue(atlas.commit())
+        self.assertFalse(atlas.commit())
+        self.assertEqual(1, atlas.version)
+        self.assertIn(0xAC00, atlas)
+        self.assertNotIn(0x1F600, atlas)
+        self.assertEqual(
+            [(0x20, 0x7E), (0xAC00, 0xAC00)],
+            atlas.bake_ranges([(0x0, 0xFF), (0xAC00, 0xD7A3)]),
+        )
+
+        self.assertTrue(atlas.request_range(0xAC01, 0xAC02))
+        self.assertTrue(atlas.commit())
+        self.assertEqual([(0xAC00, 0xAC02)], atlas.bake_ranges([(0xAC00, 0xD7A3)]))
+
+    def test_default_base_ranges(self):
+        ranges = default_base_ranges()
+        self.assertIn((0xAC00, 0xD7A3), ranges)
+        self.assertIn((ord(MDI_LABEL), ord(MDI_LABEL)), ranges)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, main
+
+from cvp.fonts.cached_ttf import CachedTTF
+from cvp.fonts.defaults import create_mdi_ttf
+from cvp.imgui.fonts.font import Font
+
+
+class FontTestCase(TestCase):
+    def test_codepoint_infos(self):
+        mdi = create_mdi_ttf()
+        ranges = mdi.read_default_ranges()
+        font = Font(None, "mdi", 16, 0x100, [CachedTTF(mdi, ranges, 16)])
+        begin = ranges[0].begin
+        block = (begin // 0x100) * 0x100, (begin // 0x100) * 0x100 + 0xFF
+
+        self.assertIs(font.ttfs[0], font.find_cached_ttf(begin))
+        self.assertIsNone(font.get_cached_ttf(0x41))
+
+        with ThreadPoolExecutor(1) as executor:
+            future = font.prefetch_codepoint_infos(*block, executor)
+            self.assertIs(future, font.prefetch_codepoint_infos(*block, executor))
+            self.assertIsNone(future.result())
+
+        self.assertEqual(0x100, len(font.cp_infos))
+        info = font.cp_infos[begin]
+        self.assertIs(info, font.get_codepoint_info(begin))
+        self.assertTrue(info)
+        self.assertEqual(mdi.get_best_camp()[begin], info.glyph)
+        self.assertFalse(font.get_codepoint_info(0x41))
+
+
+if __name__ == "__main__":
+    main()
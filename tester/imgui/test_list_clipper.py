@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvp.imgui.list_clipper import calc_clipped_range
+
+
+class ListClipperTestCase(TestCase):
+    def test_calc_clipped_range(self):
+        self.assertEqual((0, 0), calc_clipped_range(0, 10.0, 0.0, 100.0))
+        self.assertEqual((0, 10), calc_clipped_range(100, 10.0, 0.0, 100.0))
+        self.assertEqual((2, 13), calc_clipped_range(100, 10.0, 25.0, 100.0))
+        self.assertEqual((95, 100), calc_clipped_range(100, 10.0, 950.0, 100.0))
+        self.assertEqual((5, 5), calc_clipped_range(5, 10.0, 500.0, 100.0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+from logging import DEBUG, WARNING, Handler, LogRecord, getLogger
+from threading import current_thread
+from typing import List, Tuple
+from unittest import TestCase, main
+
+from cvp.logging.handlers.queue import AsyncLogging, DropOldestQueue, RoutedQueueHandler
+
+
+class _ListHandler(Handler):
+    def __init__(self, level=DEBUG) -> None:
+        super().__init__(level)
+        self.records: List[Tuple[str, str]] = list()
+
+    def emit(self, record: LogRecord) -> None:
+        self.records.append((self.format(record), current_thread().name))
+
+
+class DropOldestQueueTestCase(TestCase):
+    def test_put(self):
+        queue = DropOldestQueue(2)
+        for i in range(5):
+            queue.put_nowait(i)
+        self.assertEqual(3, queue.dropped)
+        self.assertEqual([3, 4], [queue.get_nowait(), queue.get_nowait()])
+        queue.task_done()
+        queue.task_done()
+        queue.join()
+        queue.put(5)
+        self.assertEqual(1, queue.qsize())
+
+        with self.assertRaises(ValueError):
+            DropOldestQueue(0)
+
+
+class AsyncLoggingTestCase(TestCase):
+    def setUp(self):
+        self.root = getLogger("cvp_test_queue")
+        self.root.propagate = False
+        self.root.setLevel(DEBUG)
+        self.child = getLogger("cvp_test_queue.child")
+        self.child.propagate = False
+        self.root_handler = _ListHandler()
+        self.child_handler = _ListHandler(WARNING)
+        self.root.addHandler(self.root_handler)
+        self.child.addHandler(self.child_handler)
+
+    def tearDown(self):
+        self.root.removeHandler(self.root_handler)
+        self.child.removeHandler(self.child_handler)
+
+    def test_routes(self):
+        pipeline = AsyncLogging(100, "cvp_test_queue")
+        pipeline.start()
+        self.assertTrue(pipeline.started)
+        self.assertIsInstance(self.root.handlers[0], RoutedQueueHandler)
+        self.assertIsInstance(self.child.handlers[0], RoutedQueueHandler)
+
+        args = ["a"]
+        self.root.info("root %s", args)
+        args.append("b")
+        self.child.info("hidden")
+        self.child.warning("child")
+        pipeline.stop()
+
+        self.assertEqual([self.root_handler], self.root.handlers)
+        self.assertEqual([self.child_handler], self.child.handlers)
+        self.assertEqual(["root ['a']"], [r[0] for r in self.root_handler.records])
+        self.assertEqual(["child"], [r[0] for r in self.child_handler.records])
+        self.assertNotEqual(current_thread().name, self.root_handler.records[0][1])
+        self.assertEqual(0, pipeline.stats.dropped)
+
+    def test_dropped(self):
+        pipeline = AsyncLogging(1, "cvp_test_queue")
+        pipeline.start()
+        for i in range(1000):
+            self.root.info(str(i))
+        pipeline.stop()
+        dropped = pipeline.stats.dropped
+
+        messages = [r[0] for r in self.root_handler.records]
+        self.assertEqual(1000, len(messages) + dropped)
+        self.assertEqual("999", messages[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+import numpy as np
+
+from cvp.maths.bezier.cubic import (
+    bezier_cubic_array,
+    bezier_cubic_batch,
+    bezier_cubic_points,
+    bezier_cubic_segments,
+    bezier_cubic_weights,
+)
+
+
+class CubicTestCase(TestCase):
+    def setUp(self):
+        self.controls = (0.0, 0.0), (50.0, 0.0), (50.0, 100.0), (100.0, 100.0)
+
+    def test_array(self):
+        expected = bezier_cubic_points(*self.controls, num_segments=8)
+        points = bezier_cubic_array(self.controls, 8)
+        self.assertEqual((9, 2), points.shape)
+        self.assertTrue(np.allclose(expected, points))
+
+    def test_weights(self):
+        weights = bezier_cubic_weights(4)
+        self.assertIs(weights, bezier_cubic_weights(4))
+        self.assertFalse(weights.flags.writeable)
+        self.assertTrue(np.allclose(1.0, weights.sum(axis=1)))
+        with self.assertRaises(ValueError):
+            bezier_cubic_weights(0)
+
+    def test_segments(self):
+        line = (0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (3.0, 0.0)
+        self.assertEqual(1, int(bezier_cubic_segments(line, 1.0)))
+
+        coarse = int(bezier_cubic_segments(self.controls, 1.0))
+        fine = int(bezier_cubic_segments(self.controls, 0.25))
+        self.assertLess(coarse, fine)
+
+        points = bezier_cubic_array(self.controls, coarse)
+        dense = bezier_cubic_array(self.controls, 1000)
+        # Every point of the curve is close to one of the polyline segments.
+        a = points[:-1, None, :]
+        b = points[1:, None, :]
+        ab = b - a
+        t = np.clip(((dense - a) * ab).sum(axis=2) / (ab * ab).sum(axis=2), 0, 1)
+        distances = np.hypot(*(a + t[..., None] * ab - dense).transpose(2, 0, 1))
+        self.assertLessEqual(distances.min(axis=0).max(), 1.0)
+
+    def test_batch(self):
+        line = (0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (3.0, 0.0)
+        controls = np.array([self.controls, line, self.controls])
+        curves = bezier_cubic_batch(controls, 1.0)
+        self.assertEqual(3, len(curves))
+        self.assertEqual((2, 2), curves[1].shape)
+        self.assertTrue(np.array_equal(curves[0], curves[2]))
+        self.assertTrue(np.allclose(self.controls[0], curves[0][0]))
+        self.assertTrue(np.allclose(self.controls[-1], curves[0][-1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from tempfile import TemporaryDirectory
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import Dict, List
+from unittest import TestCase, main
+
+from cvp.config.sections.onvif import OnvifConfig
+from cvp.config.sections.wsdl import WsdlConfig
+from cvp.onvif.bulk import OnvifBulkRunner, is_device_specific
+from cvp.onvif.client import OnvifClient
+from cvp.onvif.declarations import ONVIF_DEVICEMGMT
+from cvp.resources.home import HomeDir
+
+_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<env:Envelope
+    xmlns:env="http://www.w3.org/2003/05/soap-envelope"
+    xmlns:tds="http://www.onvif.org/ver10/device/wsdl"
+    xmlns:tt="http://www.onvif.org/ver10/schema">
+  <env:Body>
+    <tds:GetHostnameResponse>
+      <tds:HostnameInformation>
+        <tt:FromDHCP>false</tt:FromDHCP>
+        <tt:Name>{name}</tt:Name>
+      </tds:HostnameInformation>
+    </tds:GetHostnameResponse>
+  </env:Body>
+</env:Envelope>
+"""
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, name: str, delay: float):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.name = name
+        self.delay = delay
+        self.lock = Lock()
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+
+    @property
+    def address(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/onvif/device_service"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: _StubServer
+
+    def log_message(self, format, *args):  # noqa
+        pass
+
+    def do_POST(self):  # noqa
+        server = self.server
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with server.lock:
+            server.active += 1
+            server.requests += 1
+            server.max_active = max(server.max_active, server.active)
+
+        try:
+            sleep(server.delay)
+            body = _RESPONSE.format(name=server.name).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/soap+xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+
+class BulkTestCase(TestCase):
+    servers: List[_StubServer]
+    clients: Dict[str, OnvifClient]
+
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.home = HomeDir(self.tmpdir.name)
+        self.servers = list()
+        self.clients = dict()
+        self.executor = ThreadPoolExecutor(16)
+
+    def tearDown(self):
+        self.executor.shutdown(cancel_futures=True)
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        self.tmpdir.cleanup()
+
+    def start_server(self, name: str, delay: float) -> _StubServer:
+        server = _StubServer(name, delay)
+        Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        self.servers.append(server)
+        return server
+
+    def add_client(self, server: _StubServer) -> OnvifClient:
+        config = OnvifConfig(name=server.name, address=server.address)
+        client = OnvifClient(config, WsdlConfig(no_cache=True), self.home)
+        self.clients[client.uuid] = client
+        return client
+
+    def test_concurrent(self):
+        for i in range(8):
+            self.add_client(self.start_server(f"camera{i}", 0.2))
+
+        runner = OnvifBulkRunner(self.clients, self.executor, max_concurrency=8)
+        calls = runner.calls(ONVIF_DEVICEMGMT, "GetHostname")
+
+        begin = monotonic()
+        results = list(runner.run(calls))
+        elapsed = monotonic() - begin
+
+        self.assertEqual(8, len(results))
+        self.assertTrue(all(result.ok for result in results))
+        names = {result.call.uuid: result.response["Name"] for result in results}
+        expected = {
+            uuid: client.onvif_config.name for uuid, client in self.clients.items()
+        }
+        self.assertEqual(expected, names)
+        self.assertLess(elapsed, 8 * 0.2)
+
+        client = next(iter(self.clients.values()))
+        self.assertEqual(
+            expected[client.uuid], client.devicemgmt.GetHostname.latest["Name"]
+        )
+
+    def test_max_per_host(self):
+        server = self.start_server("shared", 0.1)
+        for _ in range(6):
+            self.add_client(server)
+
+        runner = OnvifBulkRunner(self.clients, self.executor, max_per_host=2)
+        results = list(runner.run(runner.calls(ONVIF_DEVICEMGMT, "GetHostname")))
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(6, server.requests)
+        self.assertEqual(2, server.max_active)
+
+    def test_timeout(self):
+        fast = self.add_client(self.start_server("fast", 0.0))
+        slow = self.add_client(self.start_server("slow", 0.6))
+        fast.devicemgmt.GetHostname.arguments  # Parse the WSDL before timing.
+
+        runner = OnvifBulkRunner(self.clients, self.executor)
+        calls = runner.calls(ONVIF_DEVICEMGMT, "GetHostname")
+        results = {r.call.uuid: r for r in runner.run(calls, timeout=0.3)}
+
+        self.assertEqual(2, len(results))
+        self.assertIsInstance(results[slow.uuid].error, TimeoutError)
+        self.assertTrue(results[fast.uuid].ok)
+
+    def test_error(self):
+        runner = OnvifBulkRunner(self.clients, self.executor)
+        calls = runner.calls(ONVIF_DEVICEMGMT, "GetHostname", uuids=["unknown"])
+        results = list(runner.run(calls))
+        self.assertEqual(1, len(results))
+        self.assertIsInstance(results[0].error, KeyError)
+
+    def test_device_calls(self):
+        self.assertTrue(is_device_specific("ProfileToken"))
+        self.assertFalse(is_device_specific("Name"))
+
+        entered = self.add_client(self.start_server("entered", 0.0))
+        empty = self.add_client(self.start_server("empty", 0.0))
+        entered.devicemgmt.SetHostname.arguments["Name"].value = "camera"
+
+        runner = OnvifBulkRunner(self.clients, self.executor)
+        calls, skipped = runner.device_calls(ONVIF_DEVICEMGMT, "SetHostname")
+        self.assertEqual([entered.uuid], [call.uuid for call in calls])
+        self.assertEqual({"Name": "camera"}, dict(calls[0].kwargs))
+        self.assertEqual([empty.uuid], list(skipped))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,12 @@ from zeep.xsd import Element
 from cvp.config.sections.onvif import OnvifConfig
 from cvp.config.sections.wsdl import WsdlConfig
 from cvp.onvif.client import OnvifClient
+from cvp.onvif.declarations import (
+    ONVIF_DEVICEMGMT,
+    ONVIF_EVENTS,
+    ONVIF_MEDIA,
+    ONVIF_PULLPOINT,
+)
 from cvp.resources.home import HomeDir
 from cvp.wsdl.operation import WsdlOperationProxy
 
@@ -23,6 +29,32 @@ class ClientTestCase(TestCase):
     def tearDown(self):
         self.tmpdir.cleanup()
 
+    def test_lazy_wsdls(self):
+        self.assertEqual(0, len(self.client.created_wsdls))
+        address = self.onvif_config.address
+        self.assertEqual(address, self.client.get_address(ONVIF_DEVICEMGMT))
+
+        media = self.client.media
+        self.assertIs(media, self.client.media)
+        self.assertIs(media, self.client.get_wsdl(ONVIF_MEDIA))
+        self.assertEqual(1, len(self.client.created_wsdls))
+
+        self.assertEqual(len(self.client.declarations), len(self.client.wsdls))
+        self.assertEqual(len(self.client.declarations), len(self.client.created_wsdls))
+
+    def test_shared_declarations(self):
+        other = OnvifClient(self.onvif_config, self.wsdl_config, self.home)
+        self.assertIsNot(self.client.media, other.media)
+
+        operation0 = self.client.media.GetStreamUri
+        operation1 = other.media.GetStreamUri
+        self.assertIs(operation0.spec, operation1.spec)
+        self.assertIsNot(operation0.arguments, operation1.arguments)
+        self.assertEqual(["StreamSetup", "ProfileToken"], list(operation0.arguments))
+
+        self.assertIs(ONVIF_EVENTS.wsdl, ONVIF_PULLPOINT.wsdl)
+        self.assertIs(ONVIF_EVENTS.schema, ONVIF_PULLPOINT.schema)
+
     def test_devicemgmt_get_services(self):
         devicemgmt_operation = self.client.devicemgmt.service_operations
         get_services0 = devicemgmt_operation["GetServices"]
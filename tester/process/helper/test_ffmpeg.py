@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvp.process.helper.ffmpeg import is_rtsp_url, negotiate_pixel_format
+
+
+class FFmpegHelperTestCase(TestCase):
+    def test_negotiate_pixel_format(self):
+        self.assertEqual("rgb24", negotiate_pixel_format("rgb24", False))
+        self.assertEqual("yuv420p", negotiate_pixel_format("yuv420p", True))
+        self.assertEqual("rgb24", negotiate_pixel_format("yuv420p", False))
+        self.assertEqual("rgb24", negotiate_pixel_format("unknown", True))
+
+    def test_is_rtsp_url(self):
+        self.assertTrue(is_rtsp_url("rtsp://192.168.0.10/stream1"))
+        self.assertTrue(is_rtsp_url("RTSPS://camera/stream"))
+        self.assertFalse(is_rtsp_url("http://camera/stream"))
+        self.assertFalse(is_rtsp_url("/videos/sample.mp4"))
+
+
+if __name__ == "__main__":
+    main()
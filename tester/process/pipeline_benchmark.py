@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from argparse import ArgumentParser
+from io import RawIOBase
+from time import perf_counter_ns
+from typing import Callable, Dict, Final, List, Optional, Sequence, Tuple
+
+import orjson
+
+from cvp.buffers.frame import FrameBuffer, FrameRingBuffer
+from cvp.buffers.lines import LinesBuffer, LinesRing
+from cvp.buffers.ring import FrameRing
+from cvp.chrono.benchmark import (
+    BenchmarkResult,
+    find_regressions,
+    load_baseline,
+    measure,
+    summarize,
+    trace_allocations,
+)
+from cvp.containers.mapping_deque import MappingDeque
+from cvp.process.frame import FrameReaderProcess
+
+DEFAULT_FRAME_SHAPE: Final[Tuple[int, int, int]] = 640, 480, 3
+UNALIGNED_CHUNK_RATIO: Final[float] = 0.37
+"""Pipe chunks that never line up with the frames, like a busy ffmpeg."""
+
+LINE_TEXT: Final[str] = "frame=  120 fps= 30 q=-0.0 size=  108000kB time=00:00:04\n"
+MAPPING_DEQUE_CAPACITY: Final[int] = 1024
+DEFAULT_MAX_REGRESSION: Final[float] = 0.2
+
+_NS_PER_SECOND: Final[float] = 1_000_000_000.0
+
+
+class SyntheticPipe(RawIOBase):
+    """An endless pipe that returns at most ``chunk_size`` bytes per read."""
+
+    def __init__(self, chunk_size: int):
+        super().__init__()
+        self._chunk = memoryview(bytes(i % 256 for i in range(chunk_size)))
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        return size
+
+
+def synthetic_ffmpeg_args(frame_size: int, frames: int) -> Tuple[str, ...]:
+    """A Python process writing raw frames to its stdout, in place of ffmpeg."""
+    script = (
+        "import sys\n"
+        f"data = bytes(i % 256 for i in range({frame_size}))\n"
+        "write = sys.stdout.buffer.write\n"
+        f"for _ in range({frames}):\n"
+        "    write(data)\n"
+    )
+    return sys.executable, "-c", script
+
+
+def _frame_reader(read: Callable[[], object], counter: List[int]):
+    def _read_frame() -> None:
+        expected = counter[0] + 1
+        while counter[0] < expected:
+            read()
+
+    return _read_frame
+
+
+def benchmark_frame_buffer(
+    frame_size: int,
+    iterations: int,
+    chunk_size: Optional[int] = None,
+) -> BenchmarkResult:
+    counter = [0]
+
+    def _on_frame(_: bytes) -> None:
+        counter[0] += 1
+
+    chunk = chunk_size if chunk_size else frame_size
+    pipe = SyntheticPipe(chunk)
+    reader = FrameBuffer(pipe, frame_size, target=_on_frame)  # type: ignore[arg-type]
+    name = "FrameBuffer.read" + (".aligned" if chunk == frame_size else ".unaligned")
+    return measure(
+        name,
+        _frame_reader(reader.read, counter),
+        iterations,
+        warmup=2,
+        bytes_per_call=frame_size,
+    )
+
+
+def benchmark_frame_ring_buffer(
+    frame_size: int,
+    iterations: int,
+    chunk_size: Optional[int] = None,
+) -> BenchmarkResult:
+    counter = [0]
+
+    def _on_frame(_: memoryview) -> None:
+        counter[0] += 1
+
+    chunk = chunk_size if chunk_size else frame_size
+    pipe = SyntheticPipe(chunk)
+    ring = FrameRing(frame_size)
+    reader = FrameRingBuffer(pipe, ring, _on_frame)  # type: ignore[arg-type]
+    suffix = ".aligned" if chunk == frame_size else ".unaligned"
+    return measure(
+        "FrameRingBuffer.read" + suffix,
+        _frame_reader(reader.read, counter),
+        iterations,
+        warmup=2,
+        bytes_per_call=frame_size,
+    )
+
+
+def benchmark_frame_reader_process(
+    frame_shape: Sequence[int],
+    frames: int,
+) -> BenchmarkResult:
+    """
+    Runs the synthetic producer twice: once timing the arrival of each frame,
+    and once tracing the allocations of the whole run.
+    """
+
+    width, height, channels = frame_shape
+    frame_size = width * height * channels
+    args = synthetic_ffmpeg_args(frame_size, frames)
+    arrivals: List[int] = list()
+
+    def _on_frame(_: bytes) -> None:
+        arrivals.append(perf_counter_ns())
+
+    def _run() -> None:
+        popen = FrameReaderProcess(
+            "PipelineBenchmark",
+            args,
+            (width, height, channels),
+            target=_on_frame,
+        )
+        popen.thread.start()
+        popen.thread.join()
+        popen.wait()
+        popen.raise_if_thread_error()
+
+    begin = perf_counter_ns()
+    _run()
+    if len(arrivals) != frames:
+        raise ValueError(f"Expected {frames} frames, but received {len(arrivals)}")
+
+    # The startup of the interpreter is not part of the frame latency.
+    durations = [b - a for a, b in zip(arrivals, arrivals[1:])]
+    seconds = (arrivals[-1] - begin) / _NS_PER_SECOND
+
+    arrivals.clear()
+    allocated, retained = trace_allocations(_run, 1)
+
+    return summarize(
+        "FrameReaderProcess",
+        durations,
+        items=frames,
+        nbytes=frames * frame_size,
+        seconds=seconds,
+        allocated=allocated,
+        retained=retained,
+    )
+
+
+def benchmark_lines_buffer(iterations: int) -> BenchmarkResult:
+    buffer = LinesBuffer(str(), maxsize=64 * 1024, newline_size=200)
+    return measure(
+        "LinesBuffer.write",
+        lambda: buffer.write(LINE_TEXT),
+        iterations,
+        bytes_per_call=len(LINE_TEXT),
+    )
+
+
+def benchmark_lines_ring(iterations: int) -> BenchmarkResult:
+    ring = LinesRing(str(), maxsize=64 * 1024, newline_size=200)
+    return measure(
+        "LinesRing.write",
+        lambda: ring.write(LINE_TEXT),
+        iterations,
+        bytes_per_call=len(LINE_TEXT),
+    )
+
+
+def benchmark_mapping_deque(iterations: int) -> BenchmarkResult:
+    """Appends a new item, looks it up by key and evicts the oldest one."""
+
+    keys = [f"item-{i}" for i in range(MAPPING_DEQUE_CAPACITY * 2)]
+    items: MappingDeque[str, str] = MappingDeque(keys[:MAPPING_DEQUE_CAPACITY])
+    cursor = [MAPPING_DEQUE_CAPACITY]
+
+    def _cycle() -> None:
+        key = keys[cursor[0] % len(keys)]
+        cursor[0] += 1
+        items.append(key)
+        assert items.get(key) is key
+        items.popleft()
+
+    return measure("MappingDeque.cycle", _cycle, iterations)
+
+
+def run_pipeline_benchmarks(
+    frame_shape: Sequence[int] = DEFAULT_FRAME_SHAPE,
+    iterations=1000,
+    frames=300,
+    names: Optional[Sequence[str]] = None,
+) -> List[BenchmarkResult]:
+    """Runs the benchmarks whose name contains one of the ``names``."""
+
+    width, height, channels = frame_shape
+    frame_size = width * height * channels
+    unaligned = max(int(frame_size * UNALIGNED_CHUNK_RATIO), 1)
+    frame_iterations = max(iterations // 10, 1)
+
+    benchmarks: Dict[str, Callable[[], BenchmarkResult]] = {
+        "FrameBuffer.read.aligned": lambda: benchmark_frame_buffer(
+            frame_size, frame_iterations
+        ),
+        "FrameBuffer.read.unaligned": lambda: benchmark_frame_buffer(
+            frame_size, frame_iterations, unaligned
+        ),
+        "FrameRingBuffer.read.aligned": lambda: benchmark_frame_ring_buffer(
+            frame_size, frame_iterations
+        ),
+        "FrameRingBuffer.read.unaligned": lambda: benchmark_frame_ring_buffer(
+            frame_size, frame_iterations, unaligned
+        ),
+        "FrameReaderProcess": lambda: benchmark_frame_reader_process(
+            frame_shape, frames
+        ),
+        "LinesBuffer.write": lambda: benchmark_lines_buffer(iterations),
+        "LinesRing.write": lambda: benchmark_lines_ring(iterations),
+        "MappingDeque.cycle": lambda: benchmark_mapping_deque(iterations),
+    }
+
+    results = list()
+    for name, benchmark in benchmarks.items():
+        if names and not any(n in name for n in names):
+            continue
+        results.append(benchmark())
+    return results
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    parser = ArgumentParser(description="Benchmark the frame pipeline without a GPU")
+    parser.add_argument("--width", type=int, default=DEFAULT_FRAME_SHAPE[0])
+    parser.add_argument("--height", type=int, default=DEFAULT_FRAME_SHAPE[1])
+    parser.add_argument("--channels", type=int, default=DEFAULT_FRAME_SHAPE[2])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--json", action="store_true", help="Print JSON lines")
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="JSON lines of a previous '--json' run to compare with",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Allowed slowdown against the baseline, as a ratio",
+    )
+    parser.add_argument("names", nargs="*", help="Substrings of benchmark names")
+    ns = parser.parse_args(args)
+
+    results = run_pipeline_benchmarks(
+        frame_shape=(ns.width, ns.height, ns.channels),
+        iterations=ns.iterations,
+        frames=ns.frames,
+        names=ns.names,
+    )
+    for result in results:
+        if ns.json:
+            print(orjson.dumps(result.as_dict()).decode("utf-8"))
+        else:
+            print(result)
+
+    if not ns.baseline:
+        return 0
+
+    regressions = find_regressions(
+        results, load_baseline(ns.baseline), ns.max_regression
+    )
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
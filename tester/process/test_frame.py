@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import sys
 from io import StringIO
 from shutil import which
 from unittest import TestCase, main, skipIf
@@ -8,6 +9,25 @@ import numpy as np
 
 from cvp.process.frame import FrameReaderProcess
 
+_WIDTH = 4
+_HEIGHT = 2
+_CHANNELS = 3
+_FRAME_SIZE = _WIDTH * _HEIGHT * _CHANNELS
+
+
+def _read_indexed_frames(name: str, total_frames: int, **kwargs) -> FrameReaderProcess:
+    """Reads ``total_frames`` raw frames, each filled with its own index."""
+    script = (
+        "import sys\n"
+        f"for i in range({total_frames}):\n"
+        f"    sys.stdout.buffer.write(bytes([i]) * {_FRAME_SIZE})\n"
+    )
+    args = sys.executable, "-c", script
+    popen = FrameReaderProcess(name, args, (_WIDTH, _HEIGHT, _CHANNELS), **kwargs)
+    popen.thread.start()
+    popen.thread.join()
+    return popen
+
 
 class FrameTestCase(TestCase):
     @skipIf(not which("ffmpeg"), "Not found ffmpeg executable")
@@ -67,6 +87,133 @@ class FrameTestCase(TestCase):
         for frame in frames:
             self.assertTrue(np.all(frame[:, :] == color))
 
+    def test_ring(self):
+        frame_size = _FRAME_SIZE
+        total_frames = 5
+        popen = _read_indexed_frames(
+            type(self).__name__,
+            total_frames,
+            deque_maxsize=total_frames,
+        )
+
+        self.assertIsNone(popen.thread_error)
+        latest = popen.dequeue_latest()
+        self.assertEqual(1, popen.latest_count)
+        self.assertIs(latest, popen.latest)
+        assert latest is not None
+        self.assertEqual(1, latest.sequence)
+        self.assertEqual(bytes([0]) * frame_size, latest.data)
+
+        for i in range(1, total_frames):
+            frame = popen.dequeue_latest()
+            assert frame is not None
+            self.assertEqual(i + 1, frame.sequence)
+            self.assertEqual(bytes([i]) * frame_size, frame.data)
+            self.assertTrue(latest.released)
+            latest = frame
+
+        self.assertIs(latest, popen.dequeue_latest())
+        self.assertEqual(total_frames, popen.latest_sequence)
+        self.assertEqual(0, popen.ring.dropped)
+
+        stats = popen.frame_stats()
+        self.assertEqual(total_frames, stats.produced)
+        self.assertEqual(total_frames, stats.consumed)
+        self.assertEqual(0, stats.dropped)
+        self.assertEqual(0, stats.pending)
+        self.assertLessEqual(0.0, stats.latency_ms)
+        self.assertLessEqual(stats.latency_ms, stats.max_latency_ms)
+        self.assertLess(0.0, stats.input_fps)
+
+        # Reading the statistics has no side effects.
+        self.assertEqual(stats, popen.frame_stats())
+
+    def test_dropped(self):
+        total_frames = 5
+        popen = _read_indexed_frames(type(self).__name__, total_frames, deque_maxsize=2)
+
+        latest = popen.dequeue_latest()
+        assert latest is not None
+        self.assertEqual(total_frames - 1, latest.sequence)
+
+        stats = popen.frame_stats()
+        self.assertEqual(total_frames, stats.produced)
+        self.assertEqual(1, stats.consumed)
+        self.assertEqual(total_frames - 2, stats.dropped)
+        self.assertEqual(1, stats.pending)
+        self.assertAlmostEqual(0.6, stats.drop_ratio)
+
+    def test_target(self):
+        total_frames = 5
+        frames = list()
+        popen = _read_indexed_frames(
+            type(self).__name__,
+            total_frames,
+            target=frames.append,
+        )
+
+        self.assertIsNone(popen.thread_error)
+        self.assertIsNone(popen.ring)
+        self.assertEqual(total_frames, len(frames))
+        self.assertEqual(bytes([total_frames - 1]) * _FRAME_SIZE, frames[-1])
+        self.assertIsNone(popen.dequeue_latest())
+
+        stats = popen.frame_stats()
+        self.assertEqual(total_frames, stats.produced)
+        self.assertEqual(total_frames, stats.consumed)
+        self.assertEqual(0, stats.dropped)
+        self.assertLess(0.0, stats.input_fps)
+
+    def test_shared(self):
+        total_frames = 5
+        popen = _read_indexed_frames(
+            type(self).__name__,
+            total_frames,
+            deque_maxsize=total_frames,
+            shared_slots=2,
+        )
+        shared = popen.shared
+        assert shared is not None
+        popen.wait()
+
+        self.assertIsNone(popen.thread_error)
+        self.assertEqual(total_frames, shared.latest)
+
+        header, data = shared.read_latest()
+        self.assertEqual(total_frames, header.sequence)
+        self.assertEqual((_WIDTH, _HEIGHT, _CHANNELS), header[2:5])
+        self.assertEqual("rgb24", header.pix_fmt)
+        self.assertEqual(bytes([total_frames - 1]) * _FRAME_SIZE, data)
+
+        popen.teardown()
+        self.assertIsNone(popen.shared)
+        self.assertTrue(shared.closed)
+
+    def test_teardown_alive(self):
+        script = (
+            "import sys, time\n"
+            "while True:\n"
+            f"    sys.stdout.buffer.write(bytes({_FRAME_SIZE}))\n"
+            "    sys.stdout.buffer.flush()\n"
+            "    time.sleep(0.01)\n"
+        )
+        popen = FrameReaderProcess(
+            type(self).__name__,
+            (sys.executable, "-c", script),
+            (_WIDTH, _HEIGHT, _CHANNELS),
+            shared_slots=2,
+        )
+        shared = popen.shared
+        assert shared is not None
+        popen.thread.start()
+
+        # The child is still writing while the shared ring is torn down.
+        popen.teardown()
+        self.assertIsNotNone(popen.poll())
+        self.assertFalse(popen.thread.is_alive())
+        self.assertIsNone(popen.shared)
+        self.assertTrue(shared.closed)
+
 
 if __name__ == "__main__":
     main()
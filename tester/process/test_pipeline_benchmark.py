@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import os
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+import orjson
+
+from tester.process.pipeline_benchmark import main as benchmark_main
+from tester.process.pipeline_benchmark import run_pipeline_benchmarks
+
+
+class PipelineBenchmarkTestCase(TestCase):
+    def test_default(self):
+        results = run_pipeline_benchmarks((8, 4, 3), iterations=20, frames=5)
+        names = [result.name for result in results]
+        self.assertEqual(8, len(names))
+        self.assertIn("FrameBuffer.read.unaligned", names)
+        self.assertIn("FrameReaderProcess", names)
+
+        for result in results:
+            self.assertLess(0, result.items, result.name)
+            self.assertLess(0, result.items_per_second, result.name)
+
+        process = results[names.index("FrameReaderProcess")]
+        self.assertEqual(5, process.items)
+        self.assertEqual(5 * 8 * 4 * 3, process.nbytes)
+
+    def test_names(self):
+        results = run_pipeline_benchmarks((8, 4, 3), iterations=10, names=["Lines"])
+        self.assertEqual(
+            ["LinesBuffer.write", "LinesRing.write"], [r.name for r in results]
+        )
+
+    def test_baseline(self):
+        args = ["--width=8", "--height=4", "--iterations=10", "LinesRing"]
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            self.assertEqual(0, benchmark_main(args + ["--json"]))
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(1, len(lines))
+
+        # A baseline that is impossibly fast must be reported as a regression.
+        item = orjson.loads(lines[0])
+        item["items_per_second"] *= 1000.0
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "baseline.jsonl")
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(item) + b"\n")
+            stderr = StringIO()
+            with redirect_stdout(StringIO()), redirect_stderr(stderr):
+                code = benchmark_main(args + [f"--baseline={path}"])
+        self.assertEqual(1, code)
+        self.assertIn("LinesRing.write: items_per_second", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    main()
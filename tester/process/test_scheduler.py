@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+
+from cvp.config.sections.scheduler import StreamSchedulerConfig
+from cvp.process.profile import StreamProfile
+from cvp.process.scheduler import StreamScheduler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Process:
+    def poll(self):
+        return None
+
+
+class _ProcessManager:
+    def __init__(self):
+        self.processes = dict()
+        self.respawns = list()
+
+    def get(self, key: str):
+        return self.processes.get(key)
+
+    def respawn_ffmpeg_with_source(self, key: str, source: str, **kwargs):
+        self.respawns.append((key, source, kwargs["profile"]))
+
+
+class StreamProfileTestCase(TestCase):
+    def test_args(self):
+        self.assertEqual(tuple(), tuple(StreamProfile(640, 480).input_args()))
+        self.assertEqual(tuple(), tuple(StreamProfile(640, 480).filter_args()))
+
+        profile = StreamProfile(640, 480, 2.5, True)
+        self.assertEqual(("-skip_frame", "nokey"), tuple(profile.input_args()))
+        self.assertEqual(("-vf", "fps=2.5"), tuple(profile.filter_args()))
+
+    def test_scaled(self):
+        profile = StreamProfile(1920, 1080)
+        self.assertIs(profile, profile.scaled(1.0, 160))
+        self.assertEqual(StreamProfile(960, 540), profile.scaled(0.5, 160))
+        self.assertEqual(160, profile.scaled(0.01, 160).width)
+
+    def test_similar(self):
+        profile = StreamProfile(1000, 500)
+        self.assertTrue(profile.similar(StreamProfile(1040, 520), 0.1))
+        self.assertFalse(profile.similar(StreamProfile(800, 400), 0.1))
+        self.assertFalse(profile.similar(StreamProfile(1000, 500, 10), 0.1))
+        self.assertFalse(profile.similar(StreamProfile(1000, 500, None, True), 0.1))
+
+
+class StreamSchedulerTestCase(TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        self.config = StreamSchedulerConfig(
+            max_bandwidth=10**12,
+            nominal_fps=30,
+            min_fps=5,
+            hidden_fps=1,
+            min_width=160,
+            tiny_width=200,
+            hidden_timeout=1.0,
+        )
+        self.scheduler = StreamScheduler(
+            pm=None,  # type: ignore[arg-type]
+            config=self.config,
+            pixel_format=lambda: "rgb24",
+            clock=self.clock,
+        )
+
+    def test_fit_view(self):
+        self.scheduler.report("a", "a.mp4", 1920, 1080, 960, 540)
+        self.scheduler.report("b", "b.mp4", 640, 480, 1280, 960)
+        plan = self.scheduler.plan()
+        self.assertEqual(StreamProfile(960, 540), plan["a"])
+        self.assertEqual(StreamProfile(640, 480), plan["b"])
+
+    def test_hidden_and_tiny(self):
+        self.scheduler.report("hidden", "a.mp4", 1920, 1080, 960, 540)
+        self.clock.now = 10.0
+        self.scheduler.report("tiny", "b.mp4", 1920, 1080, 100, 56)
+        plan = self.scheduler.plan()
+
+        hidden = plan["hidden"]
+        self.assertEqual(160, hidden.width)
+        self.assertEqual(1, hidden.fps)
+        self.assertTrue(hidden.keyframes_only)
+
+        tiny = plan["tiny"]
+        self.assertEqual(160, tiny.width)
+        self.assertEqual(1, tiny.fps)
+        self.assertTrue(tiny.keyframes_only)
+
+    def test_budget(self):
+        keys = [f"stream{i}" for i in range(4)]
+        for key in keys:
+            self.scheduler.report(key, f"{key}.mp4", 1920, 1080, 1920, 1080)
+
+        full = self.scheduler.cost(StreamProfile(1920, 1080), "rgb24")
+        self.config.max_bandwidth = int(full)
+        plan = self.scheduler.plan()
+
+        self.assertEqual(set(keys), set(plan.keys()))
+        total = sum(self.scheduler.cost(p, "rgb24") for p in plan.values())
+        self.assertLessEqual(total, self.config.max_bandwidth * 1.05)
+        for profile in plan.values():
+            self.assertLess(profile.width, 1920)
+            self.assertFalse(profile.keyframes_only)
+
+    def test_budget_min_fps(self):
+        self.scheduler.report("a", "a.mp4", 1920, 1080, 1920, 1080)
+        self.config.max_bandwidth = 1
+        profile = self.scheduler.plan()["a"]
+        self.assertEqual(160, profile.width)
+        self.assertEqual(self.config.min_fps, profile.fps)
+
+    def test_update_disabled(self):
+        self.scheduler.report("a", "a.mp4", 1920, 1080, 960, 540)
+        self.scheduler.update(force=True)
+        self.assertEqual(0, len(self.scheduler.profiles))
+
+    def test_update_rtsp(self):
+        pm = _ProcessManager()
+        pm.processes["cam"] = _Process()
+        self.config.enable = True
+        scheduler = StreamScheduler(
+            pm=pm,  # type: ignore[arg-type]
+            config=self.config,
+            pixel_format=lambda: "rgb24",
+            clock=self.clock,
+        )
+
+        url = "rtsp://192.168.0.10/stream1"
+        scheduler.report("cam", url, 1920, 1080, 100, 56)
+        scheduler.update(force=True)
+
+        self.assertEqual(1, len(pm.respawns))
+        key, source, profile = pm.respawns[0]
+        self.assertEqual(("cam", url), (key, source))
+        self.assertTrue(profile.keyframes_only)
+        self.assertEqual(160, profile.width)
+
+
+if __name__ == "__main__":
+    main()
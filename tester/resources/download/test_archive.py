@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tarfile
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from threading import Thread
+from typing import List, Optional
+from unittest import TestCase, main
+from zipfile import ZipFile
+
+from cvp.resources.download.archive import DownloadArchive, split_ranges
+from cvp.variables import DOWNLOAD_MIN_RANGE_SIZE
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def log_message(self, format, *args):  # noqa
+        pass
+
+    def _send_headers(self, status: int, length: int, content_range=""):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        if content_range:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+
+    def do_HEAD(self):  # noqa
+        self._send_headers(200, len(self.server.content))
+
+    def do_GET(self):  # noqa
+        content = self.server.content
+        size = len(content)
+        value = self.headers.get("Range")
+        self.server.ranges.append(value)
+
+        if value:
+            begin_text, end_text = value.removeprefix("bytes=").split("-")
+            begin = int(begin_text)
+            end = int(end_text) if end_text else size - 1
+            if begin >= size:
+                self._send_headers(416, 0, f"bytes */{size}")
+                return
+            body = content[begin : end + 1]
+            self._send_headers(206, len(body), f"bytes {begin}-{end}/{size}")
+        else:
+            body = content
+            self._send_headers(200, size)
+
+        if self.server.cut_once:
+            # Declares the whole body but closes the connection halfway.
+            self.server.cut_once = False
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, content: bytes):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.content = content
+        self.cut_once = False
+        self.ranges: List[Optional[str]] = list()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/archive"
+
+
+def _zip_bytes(files):
+    buffer = BytesIO()
+    with ZipFile(buffer, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _tar_bytes(files):
+    buffer = BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o755
+            archive.addfile(info, BytesIO(data))
+    return buffer.getvalue()
+
+
+class DownloadArchiveTestCase(TestCase):
+    def setUp(self):
+        self.temp = TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp.name, "cache")
+        self.extract_root = os.path.join(self.temp.name, "extract")
+        os.mkdir(self.cache_dir)
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def serve(self, content: bytes) -> _Server:
+        server = _Server(content)
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def archive(self, server: _Server, content: bytes, paths=(("a", "a"),)):
+        checksum = "sha256:" + sha256(content).hexdigest()
+        return DownloadArchive(
+            server.url + ".zip",
+            list(paths),
+            self.extract_root,
+            self.cache_dir,
+            checksum=checksum,
+        )
+
+    def test_split_ranges(self):
+        self.assertListEqual([], split_ranges(0, 4))
+        self.assertListEqual([(0, 2)], split_ranges(3, 1))
+        self.assertListEqual([(0, 3), (4, 6), (7, 9)], split_ranges(10, 3))
+        self.assertListEqual([(0, 0), (1, 1)], split_ranges(2, 5))
+
+    def test_download_and_hash(self):
+        content = os.urandom(100_000)
+        server = self.serve(content)
+        archive = self.archive(server, content)
+        progress = list()
+
+        head = archive.request_head()
+        self.assertEqual(len(content), head.content_length)
+        self.assertTrue(head.accept_ranges)
+
+        hexdigest = archive.download(on_progress=progress.append)
+        self.assertEqual(sha256(content).hexdigest(), hexdigest)
+        self.assertTrue(archive.verify_checksum(hexdigest))
+        self.assertTrue(archive.verify_checksum())
+        self.assertFalse(os.path.exists(archive.partial_path))
+        self.assertEqual(len(content), progress[-1])
+        with open(archive.cache_path, "rb") as f:
+            self.assertEqual(content, f.read())
+
+    def test_resume(self):
+        content = os.urandom(100_000)
+        server = self.serve(content)
+        server.cut_once = True
+        archive = self.archive(server, content)
+
+        with self.assertRaises(Exception):
+            archive.download()
+        partial_size = archive.partial_size
+        self.assertLess(0, partial_size)
+        self.assertLess(partial_size, len(content))
+
+        hexdigest = archive.download()
+        self.assertEqual(f"bytes={partial_size}-", server.ranges[-1])
+        self.assertTrue(archive.verify_checksum(hexdigest))
+        with open(archive.cache_path, "rb") as f:
+            self.assertEqual(content, f.read())
+
+    def test_resume_complete_partial(self):
+        content = os.urandom(1000)
+        server = self.serve(content)
+        archive = self.archive(server, content)
+        with open(archive.partial_path, "wb") as f:
+            f.write(content)
+
+        self.assertTrue(archive.verify_checksum(archive.download()))
+        self.assertEqual(f"bytes={len(content)}-", server.ranges[-1])
+
+    def test_connections(self):
+        content = os.urandom(2 * DOWNLOAD_MIN_RANGE_SIZE + 1)
+        server = self.serve(content)
+        archive = self.archive(server, content)
+        progress = list()
+
+        hexdigest = archive.download(connections=2, on_progress=progress.append)
+        self.assertTrue(archive.verify_checksum(hexdigest))
+        self.assertEqual(2, len(server.ranges))
+        self.assertEqual(len(content), progress[-1])
+        with open(archive.cache_path, "rb") as f:
+            self.assertEqual(content, f.read())
+
+    def _test_extract(self, content: bytes):
+        server = self.serve(content)
+        paths = [("dir/a", "x/a"), ("b", "b")]
+        archive = self.archive(server, content, paths)
+        archive.download()
+        archive.extract()
+
+        with open(os.path.join(self.extract_root, "x", "a"), "rb") as f:
+            self.assertEqual(b"A", f.read())
+        with open(os.path.join(self.extract_root, "b"), "rb") as f:
+            self.assertEqual(b"B", f.read())
+        self.assertFalse(os.path.exists(os.path.join(self.extract_root, "c")))
+        self.assertListEqual(["b", "x"], sorted(os.listdir(self.extract_root)))
+        return archive
+
+    def test_extract_zip(self):
+        files = {"dir/a": b"A", "b": b"B", "c": b"C"}
+        self._test_extract(_zip_bytes(files))
+
+    def test_extract_zip_without_mode(self):
+        buffer = BytesIO()
+        with ZipFile(buffer, "w") as archive:
+            for name, data in {"dir/a": b"A", "b": b"B"}.items():
+                archive.writestr(name, data)
+            # writestr() always sets a mode; the central directory is written last.
+            for info in archive.infolist():
+                info.external_attr = 0
+
+        umask = os.umask(0o022)
+        try:
+            self._test_extract(buffer.getvalue())
+        finally:
+            os.umask(umask)
+        mode = os.stat(os.path.join(self.extract_root, "b")).st_mode & 0o777
+        self.assertEqual(0o644, mode)
+
+    def test_extract_tar(self):
+        files = {"dir/a": b"A", "b": b"B", "c": b"C"}
+        self._test_extract(_tar_bytes(files))
+        mode = os.stat(os.path.join(self.extract_root, "b")).st_mode & 0o777
+        self.assertEqual(0o755, mode)
+
+
+if __name__ == "__main__":
+    main()
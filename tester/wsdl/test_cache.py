@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+import os
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, main
+
+from cvp.wsdl.cache import ZeepFileCache
+from cvp.wsdl.transport import ZeepTransport
+
+_ETAG = '"v1"'
+
+
+class _StubServer(HTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.requests = 0
+        self.not_modified = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/schema.xsd"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: _StubServer
+
+    def log_message(self, format, *args):  # noqa
+        pass
+
+    def do_GET(self):  # noqa
+        self.server.requests += 1
+        if self.headers.get("If-None-Match") == _ETAG:
+            self.server.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = b"<schema/>"
+        self.send_response(200)
+        self.send_header("ETag", _ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ZeepFileCacheTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.prefix = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_query_strings(self):
+        cache = ZeepFileCache(self.prefix)
+        cache.add("http://host/a.xsd?v=1", b"1")
+        cache.add("http://host/a.xsd?v=2", b"2")
+        self.assertEqual(b"1", cache.get("http://host/a.xsd?v=1"))
+        self.assertEqual(b"2", cache.get("http://host/a.xsd?v=2"))
+        self.assertIsNone(cache.get("http://host/a.xsd"))
+
+        # Nothing is left behind by the temporary files of the atomic writes.
+        names = [name for _, _, files in os.walk(self.prefix) for name in files]
+        self.assertEqual(4, len(names))
+        self.assertFalse(any(name.endswith(".tmp") for name in names))
+
+    def test_index(self):
+        ZeepFileCache(self.prefix).add("http://host/a.xsd", b"a", etag=_ETAG)
+        legacy = Path(self.prefix, "legacy", "dir", "b.xsd")
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(b"b")
+
+        cache = ZeepFileCache(self.prefix, use_mmap=True)
+        entry = cache.entry("http://host/a.xsd")
+        self.assertIsNotNone(entry)
+        assert entry is not None
+        self.assertEqual(_ETAG, entry.etag)
+        self.assertEqual({"If-None-Match": _ETAG}, entry.conditional_headers)
+        self.assertEqual(b"a", cache.get("http://host/a.xsd"))
+        self.assertEqual(b"b", cache.get("https://legacy/dir/b.xsd?q=1"))
+        self.assertIsNone(cache.entry("https://legacy/dir/b.xsd"))
+
+    def test_readonly(self):
+        cache = ZeepFileCache(self.prefix, readonly=True)
+        with self.assertRaises(ValueError):
+            cache.add("http://host/a.xsd", b"a")
+
+    def test_package_asset(self):
+        cache = ZeepFileCache.with_package_asset()
+        url = "http://www.onvif.org/ver10/schema/onvif.xsd"
+        content = cache.get(url)
+        self.assertIsNotNone(content)
+        assert content is not None
+        self.assertIn(b"schema", content)
+
+
+class ZeepTransportTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.server = _StubServer()
+        self.thread = Thread(target=self.server.serve_forever, args=(0.05,))
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmpdir.cleanup()
+
+    def test_revalidate(self):
+        cache = ZeepFileCache(self.tmpdir.name, max_age=60.0)
+        transport = ZeepTransport(cache=cache)
+        url = self.server.url
+
+        self.assertEqual(b"<schema/>", transport.load(url))
+        self.assertEqual(b"<schema/>", transport.load(url))
+        self.assertEqual(1, self.server.requests)
+
+        entry = cache.entry(url)
+        assert entry is not None
+        cache._write_entry(entry._replace(created=entry.created - 120), None)
+        self.assertTrue(cache.is_expired(cache.entry(url)))  # type: ignore[arg-type]
+
+        self.assertEqual(b"<schema/>", transport.load(url))
+        self.assertEqual(2, self.server.requests)
+        self.assertEqual(1, self.server.not_modified)
+        self.assertFalse(cache.is_expired(cache.entry(url)))  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import Executor, Future
+from inspect import Parameter
+from tempfile import TemporaryDirectory
+from time import time
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from zeep.proxy import OperationProxy
+
+from cvp.config.sections.onvif import OnvifConfig
+from cvp.config.sections.wsdl import WsdlConfig
+from cvp.onvif.client import OnvifClient
+from cvp.resources.home import HomeDir
+from cvp.wsdl.response_cache import (
+    WsdlCachePolicy,
+    WsdlResponseCache,
+    WsdlResponseStore,
+    arguments_digest,
+    normalize_arguments,
+)
+
+
+class _InlineExecutor(Executor):
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        future = Future()  # type: ignore[var-annotated]
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class NormalizeTestCase(TestCase):
+    def test_normalize_arguments(self):
+        names = ["ProfileToken", "Limit"]
+        a = normalize_arguments(names, ["main"], {"Limit": 1})
+        b = normalize_arguments(names, [], {"Limit": 1, "ProfileToken": "main"})
+        c = normalize_arguments(names, ["main", None], {"Other": Parameter.empty})
+        self.assertEqual(a, b)
+        self.assertEqual(b'{"ProfileToken":"main"}', c)
+        self.assertEqual(str(), arguments_digest(normalize_arguments(names, [], {})))
+        self.assertNotEqual(arguments_digest(a), arguments_digest(c))
+
+
+class PolicyTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.home = HomeDir(self.tmpdir.name)
+        self.config = WsdlConfig(cache_static_ttl=10.0, cache_volatile_ttl=1.0)
+        self.cache = WsdlResponseCache(self.home.onvifs, "uuid", self.config)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_policy(self):
+        self.assertFalse(self.cache.policy("SetHostname").cacheable)
+        self.assertFalse(self.cache.policy("SystemReboot").cacheable)
+
+        volatile = self.cache.policy("GetStatus")
+        self.assertEqual(1.0, volatile.ttl)
+        self.assertEqual(0.0, volatile.stale_while_revalidate)
+        self.assertEqual(volatile, self.cache.policy("GetSystemDateAndTime"))
+
+        static = self.cache.policy("GetDeviceInformation")
+        self.assertEqual(10.0, static.ttl)
+        self.assertTrue(static.is_fresh(10.0))
+        self.assertFalse(static.is_fresh(10.5))
+        self.assertTrue(static.is_revalidatable(10.5))
+        self.assertTrue(WsdlCachePolicy().is_fresh(1e9))
+        self.assertFalse(WsdlCachePolicy().is_revalidatable(1e9))
+
+    def test_store_eviction(self):
+        services = ("uuid", "B", "GetServices")
+        self.home.onvifs.write_object([], *services)
+
+        store = WsdlResponseStore(self.home.onvifs, "uuid", max_entries=2)
+        a = store.paths("B", "GetA", "")
+        b = store.paths("B", "GetB", "x")
+        store.write(1, *a)
+        store.write(2, *b)
+        self.assertEqual(("uuid", "responses", "B", "GetA"), a)
+        self.assertEqual(2, len(store))
+
+        # Reading an entry makes it the most recently used one.
+        past = time() - 100
+        os.utime(self.home.onvifs.object_path(*a), (past, past))
+        os.utime(self.home.onvifs.object_path(*b), (past, past))
+        store = WsdlResponseStore(self.home.onvifs, "uuid", max_entries=2)
+        entry = store.read(*a)
+        self.assertIsNotNone(entry)
+        assert entry is not None
+        self.assertAlmostEqual(past, entry[0], places=3)
+        self.assertEqual(1, entry[1])
+
+        store.write(3, *store.paths("B", "GetC", ""))
+        self.assertEqual(2, len(store))
+        self.assertTrue(store.has(*a))
+        self.assertFalse(store.has(*b))
+        self.assertTrue(store.has(*store.paths("B", "GetC", "")))
+
+        # The documents next to the store are not responses.
+        self.assertTrue(self.home.onvifs.has_object(*services))
+
+
+class OperationCacheTestCase(TestCase):
+    def setUp(self):
+        self.tmpdir = TemporaryDirectory()
+        self.home = HomeDir(self.tmpdir.name)
+        self.wsdl_config = WsdlConfig(cache_static_ttl=10.0)
+        self.client = OnvifClient(OnvifConfig(), self.wsdl_config, self.home)
+        self.executor = _InlineExecutor()
+        self.client.responses._executor = self.executor
+        self.calls = 0
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _call(self, *args, **kwargs):
+        self.calls += 1
+        return {"Call": self.calls, "Arguments": kwargs}
+
+    def test_arguments(self):
+        operation = self.client.media.GetVideoEncoderConfiguration
+        with patch.object(OperationProxy, "__call__", self._call):
+            a = operation(ConfigurationToken="a")
+            b = operation(ConfigurationToken="b")
+            self.assertEqual(2, self.calls)
+            self.assertEqual(a, operation(ConfigurationToken="a"))
+            self.assertEqual(b, operation("b"))
+            self.assertEqual(2, self.calls)
+
+        self.assertTrue(operation.has_cache({"ConfigurationToken": "a"}))
+        operation.remove_cache({"ConfigurationToken": "a"})
+        self.assertFalse(operation.has_cache({"ConfigurationToken": "a"}))
+        self.assertTrue(operation.has_cache({"ConfigurationToken": "b"}))
+
+    def test_stale_while_revalidate(self):
+        operation = self.client.devicemgmt.GetDeviceInformation
+        with patch.object(OperationProxy, "__call__", self._call):
+            self.assertEqual(1, operation()["Call"])
+
+            operation.clear_latest()
+            past = time() - 20
+            paths = self.client.responses.store.paths(
+                operation.binding_name, operation.name, ""
+            )
+            path = self.home.onvifs.object_path(*paths)
+            os.utime(path, (past, past))
+
+            # The stale response is returned, then refreshed in the background.
+            self.assertEqual(1, operation()["Call"])
+            self.assertEqual(1, self.executor.submitted)
+            self.assertEqual(2, self.calls)
+            self.assertEqual(2, operation()["Call"])
+            self.assertEqual(2, operation.read_cache()["Call"])
+
+    def test_no_cache(self):
+        operation = self.client.devicemgmt.SetHostname
+        with patch.object(OperationProxy, "__call__", self._call):
+            operation(Name="a")
+            operation(Name="a")
+        self.assertEqual(2, self.calls)
+        self.assertFalse(operation.has_cache({"Name": "a"}))
+
+    def test_expired(self):
+        operation = self.client.devicemgmt.GetSystemDateAndTime
+        operation.policy = WsdlCachePolicy(ttl=1.0)
+        with patch.object(OperationProxy, "__call__", self._call):
+            operation()
+            operation.clear_latest()
+            past = time() - 5
+            paths = self.client.responses.store.paths(
+                operation.binding_name, operation.name, ""
+            )
+            path = self.home.onvifs.object_path(*paths)
+            os.utime(path, (past, past))
+            self.assertEqual(2, operation()["Call"])
+        self.assertEqual(0, self.executor.submitted)
+
+
+if __name__ == "__main__":
+    main()